@@ -8,8 +8,19 @@ from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
-from src.core.config import settings
+from src.core.config import get_settings
 from src.infrastructure.orm import Base
+from src.infrastructure.orm.auth_event_model import AuthEventModel  # noqa: F401
+from src.infrastructure.orm.cart_model import CartModel  # noqa: F401
+from src.infrastructure.orm.category_model import CategoryModel  # noqa: F401
+from src.infrastructure.orm.delivery_zone_model import DeliveryZoneModel  # noqa: F401
+from src.infrastructure.orm.inventory_model import InventoryShardModel  # noqa: F401
+from src.infrastructure.orm.job_model import JobModel  # noqa: F401
+from src.infrastructure.orm.order_model import OrderModel  # noqa: F401
+from src.infrastructure.orm.outbox_model import OutboxModel  # noqa: F401
+from src.infrastructure.orm.product_model import ProductModel  # noqa: F401
+from src.infrastructure.orm.report_model import ReportWatermarkModel  # noqa: F401
+from src.infrastructure.orm.user_directory_model import UserDirectoryModel  # noqa: F401
 from src.infrastructure.orm.user_model import UserModel  # noqa: F401
 
 # this is the Alembic Config object, which provides
@@ -17,7 +28,7 @@ from src.infrastructure.orm.user_model import UserModel  # noqa: F401
 config = context.config
 
 # Override sqlalchemy.url from our settings (ignore alembic.ini value)
-config.set_main_option("sqlalchemy.url", settings.database.url)
+config.set_main_option("sqlalchemy.url", get_settings().database.url)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -0,0 +1,104 @@
+"""backfill uuidv7 user ids
+
+Revision ID: ad6ca39df31e
+Revises: 0db9aa345f9c
+Create Date: 2026-10-19 09:50:12.418305
+
+New rows get UUIDv7 keys from the application. Existing random UUIDv4 keys
+are rewritten to UUIDv7 values whose timestamp is taken from created_at, so
+primary-key order matches creation order for every row and keyset pagination
+can order by id alone. Nothing references users.id yet, so the keys can be
+rewritten in place; the rewrite is not reversed on downgrade since v7 keys
+remain valid UUIDs.
+
+Keys are rewritten BATCH_SIZE at a time in key order, each batch committed
+on its own, so only those rows are locked at once and signups and logins
+carry on meanwhile.
+
+Access and refresh tokens carry the user id as `sub`, so tokens issued
+before the upgrade no longer resolve to a user: every user has to log in
+again once it has run.
+
+"""
+
+from collections.abc import Sequence
+from uuid import UUID
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ad6ca39df31e"
+down_revision: str | Sequence[str] | None = "0db9aa345f9c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Rows rewritten, and locked, per transaction
+BATCH_SIZE = 10_000
+
+# Overlay the 48-bit millisecond timestamp onto a random UUID, then set the
+# version nibble to 7 (bits 52 and 53; the variant bits are already RFC 4122).
+NEW_ID = """
+    encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    placing substring(
+                        int8send(floor(extract(epoch FROM created_at) * 1000)::bigint)
+                        FROM 3
+                    )
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid
+"""
+NOT_V7 = "substring(id::text FROM 15 FOR 1) <> '7'"
+
+# Upper key of the next batch of keys still to rewrite
+NEXT_BATCH_END = sa.text(
+    f"""
+    SELECT id FROM (
+        SELECT id FROM users WHERE id > :after AND {NOT_V7} ORDER BY id LIMIT :batch_size
+    ) AS batch
+    ORDER BY id DESC
+    LIMIT 1
+    """
+)
+REWRITE_BATCH = sa.text(
+    f"UPDATE users SET id = {NEW_ID} WHERE id > :after AND id <= :until AND {NOT_V7}"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    context = op.get_context()
+    if context.as_sql:
+        # Offline SQL scripts cannot loop over batches
+        op.execute(sa.text(f"UPDATE users SET id = {NEW_ID} WHERE {NOT_V7}"))
+        return
+
+    bind = op.get_bind()
+    after = UUID(int=0)
+    with context.autocommit_block():
+        while True:
+            until = bind.execute(
+                NEXT_BATCH_END, {"after": after, "batch_size": BATCH_SIZE}
+            ).scalar()
+            if until is None:
+                break
+            # Rewritten keys are v7 and skipped if they land in a later range
+            bind.execute(REWRITE_BATCH, {"after": after, "until": until})
+            after = until
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # UUIDv7 keys are valid for the previous revision; nothing to undo.
+    pass
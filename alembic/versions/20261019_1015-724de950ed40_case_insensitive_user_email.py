@@ -0,0 +1,68 @@
+"""case insensitive user email
+
+Revision ID: 724de950ed40
+Revises: ad6ca39df31e
+Create Date: 2026-10-19 10:15:40.902117
+
+Replaces the plain unique index on users.email with a unique index on
+lower(email), built CONCURRENTLY so the table stays writable. If existing
+rows differ only by case the index build fails (leaving an INVALID index to
+drop) and the duplicates must be merged before re-running.
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "724de950ed40"
+down_revision: str | Sequence[str] | None = "ad6ca39df31e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_email_lower",
+            "users",
+            [sa.text("lower(email)")],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_users_email",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    # Store emails in the same normalized form the application writes
+    op.execute(
+        sa.text("UPDATE users SET email = lower(trim(email)) WHERE email <> lower(trim(email))")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_email",
+            "users",
+            ["email"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_users_email_lower",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
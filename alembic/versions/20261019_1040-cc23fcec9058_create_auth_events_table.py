@@ -0,0 +1,53 @@
+"""create auth events table
+
+Revision ID: cc23fcec9058
+Revises: 724de950ed40
+Create Date: 2026-10-19 10:40:27.551930
+
+Append-only audit log, range-partitioned by month on occurred_at. The
+application creates the current and next month's partitions on its first
+flush each month; the default partition catches anything outside them.
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "cc23fcec9058"
+down_revision: str | Sequence[str] | None = "724de950ed40"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "auth_events",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("event_type", sa.String(length=30), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=True),
+        sa.Column("reason", sa.String(length=100), nullable=True),
+        sa.PrimaryKeyConstraint("id", "occurred_at"),
+        postgresql_partition_by="RANGE (occurred_at)",
+    )
+    op.create_index(
+        "ix_auth_events_failures_email",
+        "auth_events",
+        ["email", sa.text("occurred_at DESC")],
+        unique=False,
+        postgresql_where=sa.text("event_type = 'LOGIN_FAILED'"),
+    )
+    op.execute("CREATE TABLE auth_events_default PARTITION OF auth_events DEFAULT")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Dropping the parent drops every partition with it
+    op.drop_index("ix_auth_events_failures_email", table_name="auth_events")
+    op.drop_table("auth_events")
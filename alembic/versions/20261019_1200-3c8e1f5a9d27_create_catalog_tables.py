@@ -0,0 +1,137 @@
+"""create catalog tables
+
+Revision ID: 3c8e1f5a9d27
+Revises: b7f3a9c2e614
+Create Date: 2026-10-19 12:00:36.720158
+
+Categories and products. Products carry a stored tsvector (GIN) for
+full-text search and pg_trgm GIN indexes on both names for typo-tolerant
+matching. pg_trgm only extracts trigrams from letters the database's
+LC_CTYPE classifies as alphanumeric, so Bangla names need a UTF-8 locale
+(not C/POSIX).
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c8e1f5a9d27"
+down_revision: str | Sequence[str] | None = "b7f3a9c2e614"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(name_bn, '')), 'A')"
+    " || setweight(to_tsvector('english', coalesce(name, '')), 'B')"
+    " || setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_table(
+        "categories",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("slug", sa.String(length=100), nullable=False),
+        sa.Column("parent_id", sa.Uuid(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["parent_id"], ["categories.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("slug"),
+    )
+    op.create_index("ix_categories_updated_at", "categories", ["updated_at"], unique=False)
+
+    op.create_table(
+        "products",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("name_bn", sa.String(length=255), nullable=True),
+        sa.Column("slug", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("price", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("category_id", sa.Uuid(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("slug"),
+    )
+    op.create_index(
+        "ix_products_search_vector",
+        "products",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_products_name_trgm",
+        "products",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_products_name_bn_trgm",
+        "products",
+        ["name_bn"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name_bn": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_products_category_id_id",
+        "products",
+        ["category_id", sa.text("id DESC")],
+        unique=False,
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_products_category_id_id", table_name="products")
+    op.drop_index("ix_products_name_bn_trgm", table_name="products")
+    op.drop_index("ix_products_name_trgm", table_name="products")
+    op.drop_index("ix_products_search_vector", table_name="products")
+    op.drop_table("products")
+    op.drop_index("ix_categories_updated_at", table_name="categories")
+    op.drop_table("categories")
+    # pg_trgm is left installed; other objects may depend on it
@@ -0,0 +1,132 @@
+"""create report tables
+
+Revision ID: d41c8a7e2b93
+Revises: 5e7b2d9c4a16
+Create Date: 2026-10-19 13:30:44.918204
+
+Summary tables for the admin reports with one watermark per source, and
+the indexes their incremental refresh reads: users by created_at and
+confirmed orders by updated_at.
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d41c8a7e2b93"
+down_revision: str | Sequence[str] | None = "5e7b2d9c4a16"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_users_created_at", "users", ["created_at"])
+    op.create_index(
+        "ix_orders_confirmed_updated_at",
+        "orders",
+        ["updated_at"],
+        postgresql_where=sa.text("status = 'CONFIRMED'"),
+    )
+
+    op.create_table(
+        "report_watermarks",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("watermark", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    # Start from the epoch; the first refresh folds in the existing history
+    op.execute(
+        "INSERT INTO report_watermarks (name, watermark) "
+        "VALUES ('sales', 'epoch'), ('registrations', 'epoch')"
+    )
+
+    op.create_table(
+        "report_daily_sales",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("orders", sa.Integer(), nullable=False),
+        sa.Column("units", sa.BigInteger(), nullable=False),
+        sa.Column("revenue", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("day"),
+    )
+    op.create_table(
+        "report_daily_registrations",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("users", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("day"),
+    )
+    op.create_table(
+        "report_customer_sales",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("orders", sa.Integer(), nullable=False),
+        sa.Column("revenue", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("last_order_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_index(
+        "ix_report_customer_sales_revenue", "report_customer_sales", ["revenue"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_report_customer_sales_revenue", table_name="report_customer_sales")
+    op.drop_table("report_customer_sales")
+    op.drop_table("report_daily_registrations")
+    op.drop_table("report_daily_sales")
+    op.drop_table("report_watermarks")
+    op.drop_index("ix_orders_confirmed_updated_at", table_name="orders")
+    op.drop_index("ix_users_created_at", table_name="users")
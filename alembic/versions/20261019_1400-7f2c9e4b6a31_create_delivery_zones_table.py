@@ -0,0 +1,56 @@
+"""create delivery zones table
+
+Revision ID: 7f2c9e4b6a31
+Revises: d41c8a7e2b93
+Create Date: 2026-10-19 14:00:12.518204
+
+Delivery zone polygons, loaded into the in-process serviceability index and
+refreshed from updated_at.
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7f2c9e4b6a31"
+down_revision: str | Sequence[str] | None = "d41c8a7e2b93"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "delivery_zones",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("hub_code", sa.String(length=50), nullable=False),
+        sa.Column("rings", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_delivery_zones_updated_at", "delivery_zones", ["updated_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_delivery_zones_updated_at", table_name="delivery_zones")
+    op.drop_table("delivery_zones")
@@ -0,0 +1,74 @@
+"""unique user phone
+
+Revision ID: 2b8e5d7c1f49
+Revises: 7f2c9e4b6a31
+Create Date: 2026-10-19 14:30:05.731886
+
+Normalizes stored phone numbers to the +880 form the application writes,
+then adds a partial unique index on users.phone for OTP login lookups,
+built CONCURRENTLY so the table stays writable. If two accounts share a
+number the index build fails (leaving an INVALID index to drop) and one of
+them must be changed before re-running.
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2b8e5d7c1f49"
+down_revision: str | Sequence[str] | None = "7f2c9e4b6a31"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Same rules as domain.entities.user.normalize_phone
+NORMALIZE_PHONES_SQL = """
+UPDATE users
+SET phone = normalized.phone
+FROM (
+    SELECT id,
+           CASE
+               WHEN stripped LIKE '00%' THEN '+' || substr(stripped, 3)
+               WHEN stripped LIKE '01%' THEN '+88' || stripped
+               WHEN stripped LIKE '880%' THEN '+' || stripped
+               ELSE stripped
+           END AS phone
+    FROM (
+        SELECT id, regexp_replace(phone, '[[:space:]().-]', '', 'g') AS stripped
+        FROM users
+        WHERE phone IS NOT NULL
+    ) AS raw
+) AS normalized
+WHERE users.id = normalized.id AND users.phone <> normalized.phone
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.text(NORMALIZE_PHONES_SQL))
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_phone",
+            "users",
+            ["phone"],
+            unique=True,
+            postgresql_where=sa.text("phone IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_phone",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
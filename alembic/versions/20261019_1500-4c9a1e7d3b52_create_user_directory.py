@@ -0,0 +1,133 @@
+"""create user directory
+
+Revision ID: 4c9a1e7d3b52
+Revises: 2b8e5d7c1f49
+Create Date: 2026-10-19 15:00:12.418305
+
+Prepares user storage for sharding. user_directory holds every user's id
+and normalized email on the primary database, backfilled from users; the
+orders, carts and customer sales foreign keys move from users to it, since
+a foreign key cannot reach a user row stored in another database. The new
+constraints are added NOT VALID and validated separately, so writes to
+those tables are not blocked while existing rows are checked.
+
+user_shard_slots maps each of the 1024 user slots to a shard, starting with
+every slot on shard 0 (this database). ix_users_shard_slot lets the
+resharding tool select a slot's users. Downgrading requires every slot back on shard 0.
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c9a1e7d3b52"
+down_revision: str | Sequence[str] | None = "2b8e5d7c1f49"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Same as orm.user_model.SHARD_SLOTS and SHARD_SLOT_SQL
+SHARD_SLOTS = 1024
+SHARD_SLOT_SQL = f"(('x' || substr(md5(id::text), 1, 4))::bit(16)::integer % {SHARD_SLOTS})"
+
+# (table, ondelete) of every foreign key to users.id
+USER_REFERENCES = [
+    ("orders", None),
+    ("carts", "CASCADE"),
+    ("report_customer_sales", "CASCADE"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_directory",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.execute(
+        sa.text(
+            "INSERT INTO user_directory (user_id, email, created_at, updated_at) "
+            "SELECT id, lower(btrim(email)), created_at, updated_at FROM users"
+        )
+    )
+    op.create_index("ix_user_directory_email", "user_directory", ["email"], unique=True)
+    op.create_index("ix_user_directory_created_at", "user_directory", ["created_at"])
+
+    for table, ondelete in USER_REFERENCES:
+        op.drop_constraint(f"{table}_user_id_fkey", table, type_="foreignkey")
+        op.execute(
+            sa.text(
+                f"ALTER TABLE {table} ADD CONSTRAINT {table}_user_id_fkey "
+                "FOREIGN KEY (user_id) REFERENCES user_directory (user_id)"
+                f"{f' ON DELETE {ondelete}' if ondelete else ''} NOT VALID"
+            )
+        )
+        op.execute(sa.text(f"ALTER TABLE {table} VALIDATE CONSTRAINT {table}_user_id_fkey"))
+
+    op.create_table(
+        "user_shard_slots",
+        sa.Column("slot", sa.Integer(), nullable=False),
+        sa.Column("shard", sa.Integer(), nullable=False),
+        sa.Column("state", sa.String(length=10), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("slot"),
+    )
+    op.execute(
+        sa.text(
+            "INSERT INTO user_shard_slots (slot, shard, state) "
+            f"SELECT slot, 0, 'active' FROM generate_series(0, {SHARD_SLOTS - 1}) AS slot"
+        )
+    )
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_shard_slot",
+            "users",
+            [sa.text(SHARD_SLOT_SQL)],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_shard_slot",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    op.drop_table("user_shard_slots")
+    for table, ondelete in USER_REFERENCES:
+        op.drop_constraint(f"{table}_user_id_fkey", table, type_="foreignkey")
+        op.create_foreign_key(
+            f"{table}_user_id_fkey", table, "users", ["user_id"], ["id"], ondelete=ondelete
+        )
+    op.drop_index("ix_user_directory_created_at", table_name="user_directory")
+    op.drop_index("ix_user_directory_email", table_name="user_directory")
+    op.drop_table("user_directory")
@@ -0,0 +1,46 @@
+"""index user directory updated_at
+
+Revision ID: 8d3f6a2c9e71
+Revises: 4c9a1e7d3b52
+Create Date: 2026-10-19 15:30:41.206573
+
+ix_user_directory_updated_at lets every worker's email filter read the
+directory entries added or changed since its last refresh: updated_at is
+set when a user registers and bumped when their email changes. Built
+CONCURRENTLY so the directory stays writable.
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3f6a2c9e71"
+down_revision: str | Sequence[str] | None = "4c9a1e7d3b52"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_directory_updated_at",
+            "user_directory",
+            ["updated_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_directory_updated_at",
+            table_name="user_directory",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -1,6 +1,16 @@
 """Authentication request DTOs."""
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, field_validator
+
+from src.domain.entities.user import BD_MOBILE_PATTERN, normalize_phone
+
+
+def _mobile_number(phone: str) -> str:
+    """Normalize a phone number and require a Bangladeshi mobile number."""
+    phone = normalize_phone(phone)
+    if not BD_MOBILE_PATTERN.match(phone):
+        raise ValueError("Must be a Bangladeshi mobile number, e.g. +8801712345678")
+    return phone
 
 
 class LoginRequest(BaseModel):
@@ -25,3 +35,32 @@ class RefreshTokenRequest(BaseModel):
     """DTO for token refresh request."""
 
     refresh_token: str = Field(..., min_length=1)
+
+
+class VerifyEmailRequest(BaseModel):
+    """DTO for email verification request."""
+
+    token: str = Field(..., min_length=1)
+
+
+class RequestOtpRequest(BaseModel):
+    """DTO for requesting a login code by SMS."""
+
+    phone: str = Field(..., min_length=11, max_length=20)
+
+    _validate_phone = field_validator("phone")(_mobile_number)
+
+    model_config = {"json_schema_extra": {"examples": [{"phone": "+8801712345678"}]}}
+
+
+class VerifyOtpRequest(BaseModel):
+    """DTO for logging in with a code received by SMS."""
+
+    phone: str = Field(..., min_length=11, max_length=20)
+    code: str = Field(..., pattern=r"^\d{4,8}$")
+
+    _validate_phone = field_validator("phone")(_mobile_number)
+
+    model_config = {
+        "json_schema_extra": {"examples": [{"phone": "+8801712345678", "code": "482913"}]}
+    }
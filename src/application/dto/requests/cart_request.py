@@ -0,0 +1,20 @@
+"""Shopping cart request DTOs."""
+
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.domain.entities.cart import MAX_ITEM_QUANTITY
+
+
+class AddCartItemRequest(BaseModel):
+    """DTO for adding a product to the cart."""
+
+    product_id: UUID
+    quantity: int = Field(default=1, ge=1, le=MAX_ITEM_QUANTITY)
+
+
+class UpdateCartItemRequest(BaseModel):
+    """DTO for changing a cart item's quantity; zero removes the item."""
+
+    quantity: int = Field(..., ge=0, le=MAX_ITEM_QUANTITY)
@@ -0,0 +1,53 @@
+"""Product catalog request DTOs."""
+
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+SLUG_PATTERN = r"^[a-z0-9]+(?:-[a-z0-9]+)*$"
+
+
+class CreateCategoryRequest(BaseModel):
+    """DTO for category creation request."""
+
+    name: str = Field(..., min_length=1, max_length=100)
+    slug: str = Field(..., min_length=1, max_length=100, pattern=SLUG_PATTERN)
+    parent_id: UUID | None = None
+
+
+class CreateProductRequest(BaseModel):
+    """DTO for product creation request."""
+
+    name: str = Field(..., min_length=1, max_length=255)
+    name_bn: str | None = Field(default=None, max_length=255)
+    slug: str = Field(..., min_length=1, max_length=255, pattern=SLUG_PATTERN)
+    description: str | None = None
+    price: Decimal = Field(..., gt=0, max_digits=12, decimal_places=2)
+    category_id: UUID | None = None
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "name": "Miniket Rice 5kg",
+                    "name_bn": "মিনিকেট চাল ৫ কেজি",
+                    "slug": "miniket-rice-5kg",
+                    "description": "Premium polished miniket rice.",
+                    "price": "420.00",
+                }
+            ]
+        }
+    }
+
+
+class UpdateProductRequest(BaseModel):
+    """DTO for partial product update request. Omitted fields are unchanged."""
+
+    name: str | None = Field(default=None, min_length=1, max_length=255)
+    name_bn: str | None = Field(default=None, max_length=255)
+    slug: str | None = Field(default=None, min_length=1, max_length=255, pattern=SLUG_PATTERN)
+    description: str | None = None
+    price: Decimal | None = Field(default=None, gt=0, max_digits=12, decimal_places=2)
+    category_id: UUID | None = None
+    is_active: bool | None = None
@@ -0,0 +1,61 @@
+"""Delivery coverage request DTOs."""
+
+from typing import Annotated
+
+from pydantic import BaseModel, Field, field_validator
+
+# [longitude, latitude], GeoJSON order
+Coordinate = tuple[Annotated[float, Field(ge=-180, le=180)], Annotated[float, Field(ge=-90, le=90)]]
+RingInput = Annotated[list[Coordinate], Field(min_length=3, max_length=10_000)]
+
+
+def _open_rings(rings: list[list[Coordinate]] | None) -> list[list[Coordinate]] | None:
+    """Drop the repeated closing vertex GeoJSON rings carry and reject degenerate rings."""
+    if rings is None:
+        return None
+    opened = []
+    for ring in rings:
+        if ring[0] == ring[-1]:
+            ring = ring[:-1]
+        if len(set(ring)) < 3:
+            raise ValueError("Each ring needs at least three distinct vertices")
+        opened.append(ring)
+    return opened
+
+
+class CreateDeliveryZoneRequest(BaseModel):
+    """DTO for creating a delivery zone. The first ring is the outline, the rest are holes."""
+
+    name: str = Field(..., min_length=1, max_length=100)
+    hub_code: str = Field(..., min_length=1, max_length=50)
+    rings: list[RingInput] = Field(..., min_length=1, max_length=100)
+    priority: int = Field(default=0, ge=-1000, le=1000)
+
+    _validate_rings = field_validator("rings")(_open_rings)
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "name": "Gulshan",
+                    "hub_code": "DHK-GUL",
+                    "rings": [
+                        [[90.405, 23.775], [90.425, 23.775], [90.425, 23.800], [90.405, 23.800]]
+                    ],
+                    "priority": 0,
+                }
+            ]
+        }
+    }
+
+
+class UpdateDeliveryZoneRequest(BaseModel):
+    """DTO for partial delivery zone update request. Omitted fields are unchanged."""
+
+    name: str | None = Field(default=None, min_length=1, max_length=100)
+    hub_code: str | None = Field(default=None, min_length=1, max_length=50)
+    rings: list[RingInput] | None = Field(default=None, min_length=1, max_length=100)
+    priority: int | None = Field(default=None, ge=-1000, le=1000)
+    is_active: bool | None = None
+
+    _validate_rings = field_validator("rings")(_open_rings)
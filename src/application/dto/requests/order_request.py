@@ -0,0 +1,9 @@
+"""Order and inventory request DTOs."""
+
+from pydantic import BaseModel, Field
+
+
+class SetStockRequest(BaseModel):
+    """DTO for replacing a product's sellable stock."""
+
+    available: int = Field(..., ge=0, le=10_000_000)
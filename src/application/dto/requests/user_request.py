@@ -1,7 +1,11 @@
 """User request DTOs for API input validation."""
 
+from datetime import datetime
+
 from pydantic import BaseModel, EmailStr, Field
 
+from src.domain.entities.user import Role
+
 
 class RegisterUserRequest(BaseModel):
     """DTO for user registration request."""
@@ -23,3 +27,45 @@ class RegisterUserRequest(BaseModel):
             ]
         }
     }
+
+
+class UserFilterRequest(BaseModel):
+    """
+    DTO selecting the users of a bulk operation. Omitted criteria match anyone.
+
+    created_from is inclusive and created_to exclusive; times without a zone are UTC.
+    """
+
+    role: Role | None = None
+    is_active: bool | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+
+class BulkUserUpdateRequest(BaseModel):
+    """DTO for a bulk user operation; a dry run only counts the users it would change."""
+
+    filter: UserFilterRequest
+    dry_run: bool = False
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "filter": {
+                        "role": "CUSTOMER",
+                        "is_active": True,
+                        "created_from": "2026-10-18T02:00:00Z",
+                        "created_to": "2026-10-18T03:00:00Z",
+                    },
+                    "dry_run": True,
+                }
+            ]
+        }
+    }
+
+
+class BulkRoleChangeRequest(BulkUserUpdateRequest):
+    """DTO for giving every selected user a role."""
+
+    role: Role
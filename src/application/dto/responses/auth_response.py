@@ -1,5 +1,8 @@
 """Authentication response DTOs."""
 
+from datetime import datetime
+from uuid import UUID
+
 from pydantic import BaseModel, Field
 
 
@@ -19,3 +22,29 @@ class TokenResponse(BaseModel):
             }
         }
     }
+
+
+class OtpSentResponse(BaseModel):
+    """DTO for a login code request. The same answer is given for unknown numbers."""
+
+    detail: str = Field(default="If the number is registered, a login code has been sent.")
+    expires_in: int
+
+
+class EmailAvailabilityResponse(BaseModel):
+    """DTO for an email availability check made while a signup form is filled in."""
+
+    email: str
+    available: bool
+
+
+class LoginFailureResponse(BaseModel):
+    """DTO for one failed login of an account."""
+
+    occurred_at: datetime
+    email: str
+    # Set when the account exists
+    user_id: UUID | None
+    reason: str | None
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,26 @@
+"""Shopping cart response DTOs."""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class CartItemResponse(BaseModel):
+    """DTO for a cart line."""
+
+    product_id: UUID
+    quantity: int
+    added_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class CartResponse(BaseModel):
+    """DTO for cart response."""
+
+    items: list[CartItemResponse]
+    version: int
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
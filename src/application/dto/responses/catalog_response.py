@@ -0,0 +1,64 @@
+"""Product catalog response DTOs."""
+
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.application.interfaces.category_tree import CategoryNode
+
+
+class CategoryResponse(BaseModel):
+    """DTO for category response."""
+
+    id: UUID
+    name: str
+    slug: str
+    parent_id: UUID | None
+    is_active: bool
+
+    model_config = {"from_attributes": True}
+
+
+class CategoryTreeResponse(BaseModel):
+    """DTO for a category with its subcategories."""
+
+    id: UUID
+    name: str
+    slug: str
+    children: list[CategoryTreeResponse]
+
+    @classmethod
+    def from_node(cls, node: CategoryNode) -> CategoryTreeResponse:
+        """Build the nested response from a category tree node."""
+        return cls(
+            id=node.category.id,
+            name=node.category.name,
+            slug=node.category.slug,
+            children=[cls.from_node(child) for child in node.children],
+        )
+
+
+class ProductResponse(BaseModel):
+    """DTO for product response."""
+
+    id: UUID
+    name: str
+    name_bn: str | None
+    slug: str
+    description: str | None
+    price: Decimal
+    category_id: UUID | None
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ProductPageResponse(BaseModel):
+    """DTO for one page of products; pass next_cursor back to get the next page."""
+
+    items: list[ProductResponse]
+    next_cursor: str | None
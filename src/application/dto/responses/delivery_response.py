@@ -0,0 +1,37 @@
+"""Delivery coverage response DTOs."""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class DeliveryZoneResponse(BaseModel):
+    """DTO for delivery zone response."""
+
+    id: UUID
+    name: str
+    hub_code: str
+    rings: list[list[tuple[float, float]]]
+    priority: int
+    is_active: bool
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ServingZoneResponse(BaseModel):
+    """DTO for the zone and hub that serve a location."""
+
+    id: UUID
+    name: str
+    hub_code: str
+
+    model_config = {"from_attributes": True}
+
+
+class ServiceabilityResponse(BaseModel):
+    """DTO for a serviceability check."""
+
+    serviceable: bool
+    zone: ServingZoneResponse | None
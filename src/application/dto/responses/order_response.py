@@ -0,0 +1,47 @@
+"""Order and inventory response DTOs."""
+
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.domain.entities.order import OrderStatus
+
+
+class OrderItemResponse(BaseModel):
+    """DTO for an order line."""
+
+    product_id: UUID
+    quantity: int
+    unit_price: Decimal
+    subtotal: Decimal
+
+    model_config = {"from_attributes": True}
+
+
+class OrderResponse(BaseModel):
+    """DTO for order response."""
+
+    id: UUID
+    status: OrderStatus
+    items: list[OrderItemResponse]
+    total: Decimal
+    reserved_until: datetime
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class OrderPageResponse(BaseModel):
+    """DTO for one page of orders with the cursor of the next page."""
+
+    items: list[OrderResponse]
+    next_cursor: str | None
+
+
+class StockResponse(BaseModel):
+    """DTO for a product's sellable stock."""
+
+    product_id: UUID
+    available: int
@@ -0,0 +1,14 @@
+"""Product recommendation response DTOs."""
+
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class RecommendationResponse(BaseModel):
+    """DTO for a product frequently bought together with another."""
+
+    product_id: UUID
+    score: float
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,69 @@
+"""Report response DTOs."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class DailySalesResponse(BaseModel):
+    """DTO for one day of confirmed sales."""
+
+    day: date
+    orders: int
+    units: int
+    revenue: Decimal
+
+    model_config = {"from_attributes": True}
+
+
+class SalesReportResponse(BaseModel):
+    """DTO for sales per day over a date range."""
+
+    start: date
+    end: date
+    # Orders confirmed up to this time are included
+    as_of: datetime
+    orders: int
+    units: int
+    revenue: Decimal
+    days: list[DailySalesResponse]
+
+
+class DailyRegistrationsResponse(BaseModel):
+    """DTO for one day of registrations."""
+
+    day: date
+    users: int
+
+    model_config = {"from_attributes": True}
+
+
+class RegistrationsReportResponse(BaseModel):
+    """DTO for registrations per day over a date range."""
+
+    start: date
+    end: date
+    # Users registered up to this time are included
+    as_of: datetime
+    users: int
+    days: list[DailyRegistrationsResponse]
+
+
+class CustomerSalesResponse(BaseModel):
+    """DTO for a customer's confirmed orders."""
+
+    user_id: UUID
+    orders: int
+    revenue: Decimal
+    last_order_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class TopCustomersResponse(BaseModel):
+    """DTO for the customers with the highest revenue."""
+
+    as_of: datetime
+    customers: list[CustomerSalesResponse]
@@ -15,7 +15,18 @@ class UserResponse(BaseModel):
     phone: str | None
     role: str
     is_active: bool
+    is_verified: bool
     created_at: datetime
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class BulkUserUpdateResponse(BaseModel):
+    """DTO for the outcome of a bulk user operation."""
+
+    dry_run: bool
+    # Users the filter selects; dry runs only
+    matched: int | None = None
+    # Users changed, or that would be in a dry run
+    updated: int
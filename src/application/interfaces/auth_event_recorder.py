@@ -0,0 +1,14 @@
+"""Authentication event recorder interface."""
+
+from abc import ABC, abstractmethod
+
+from src.domain.entities.auth_event import AuthEvent
+
+
+class IAuthEventRecorder(ABC):
+    """Abstract interface for recording authentication events."""
+
+    @abstractmethod
+    async def record(self, event: AuthEvent) -> None:
+        """Record an event. Implementations must not block on persistence."""
+        pass
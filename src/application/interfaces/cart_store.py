@@ -0,0 +1,61 @@
+"""Hot cart store interface."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.entities.cart import Cart
+
+
+@dataclass(frozen=True)
+class DirtyCart:
+    """A cart changed in the hot store but not yet persisted."""
+
+    cart: Cart
+    # Wall-clock time (epoch seconds) of the first unpersisted change
+    dirty_since: float
+
+
+class ICartStore(ABC):
+    """
+    Abstract interface for the key-value store holding active carts.
+
+    Every change goes here first and is marked dirty; a write-behind flusher
+    persists dirty carts to the database and marks them clean.
+    """
+
+    @abstractmethod
+    async def get(self, user_id: UUID) -> Cart | None:
+        """Get a cached cart."""
+        pass
+
+    @abstractmethod
+    async def add(self, cart: Cart) -> bool:
+        """Cache a cart loaded from the database unless one is cached. Not marked dirty."""
+        pass
+
+    @abstractmethod
+    async def save(self, cart: Cart, expected_version: int) -> bool:
+        """
+        Replace a cached cart and mark it dirty.
+
+        Returns False, leaving the store unchanged, if the cached version is
+        no longer `expected_version` (another writer got there first).
+        """
+        pass
+
+    @abstractmethod
+    async def dirty(self, limit: int, before: float) -> list[DirtyCart]:
+        """Get up to `limit` carts first dirtied before `before`, oldest first."""
+        pass
+
+    @abstractmethod
+    async def mark_clean(self, carts: Sequence[Cart]) -> None:
+        """
+        Clear the dirty mark of carts that were persisted.
+
+        A cart changed since it was read stays dirty, with its dirty time
+        reset so it is persisted on the next flush.
+        """
+        pass
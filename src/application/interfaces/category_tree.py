@@ -0,0 +1,44 @@
+"""Category tree interface."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.entities.product import Category
+
+
+@dataclass(frozen=True)
+class CategoryNode:
+    """An active category with its active subcategories."""
+
+    category: Category
+    children: tuple[CategoryNode, ...]
+
+
+class ICategoryTree(ABC):
+    """Read access to the category hierarchy without a database round trip."""
+
+    @abstractmethod
+    def get(self, category_id: UUID) -> Category | None:
+        """Get an active category by ID."""
+        pass
+
+    @abstractmethod
+    def get_by_slug(self, slug: str) -> Category | None:
+        """Get an active category by slug."""
+        pass
+
+    @abstractmethod
+    def descendant_ids(self, category_id: UUID) -> list[UUID]:
+        """IDs of an active category and all its active descendants."""
+        pass
+
+    @abstractmethod
+    def roots(self) -> list[CategoryNode]:
+        """Active top-level categories with their subtrees, sorted by name."""
+        pass
+
+    @abstractmethod
+    def version(self) -> str:
+        """Opaque tag that changes whenever the tree does, equal across processes."""
+        pass
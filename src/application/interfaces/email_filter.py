@@ -0,0 +1,22 @@
+"""Registered email filter interface."""
+
+from abc import ABC, abstractmethod
+
+
+class IRegisteredEmailFilter(ABC):
+    """
+    Membership test for registered emails, answered from memory.
+
+    A negative answer is definite; a positive one may be a false positive
+    and has to be confirmed by the database.
+    """
+
+    @abstractmethod
+    def might_be_registered(self, email: str) -> bool:
+        """False only if no user has this email. True when the filter is not loaded yet."""
+        pass
+
+    @abstractmethod
+    def add(self, email: str) -> None:
+        """Record the email of a user this process just registered or moved to it."""
+        pass
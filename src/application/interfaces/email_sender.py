@@ -0,0 +1,12 @@
+"""Email sender interface."""
+
+from abc import ABC, abstractmethod
+
+
+class IEmailSender(ABC):
+    """Abstract interface for sending transactional email."""
+
+    @abstractmethod
+    async def send(self, to: str, subject: str, body: str) -> None:
+        """Send a plain-text email. Raises on delivery failure."""
+        pass
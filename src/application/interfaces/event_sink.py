@@ -0,0 +1,46 @@
+"""Event sink interface for publishing domain events."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class EventEnvelope:
+    """A serialized domain event as read from the outbox."""
+
+    sequence: int
+    event_id: UUID
+    event_type: str
+    aggregate_type: str
+    aggregate_id: UUID
+    payload: dict[str, Any]
+    occurred_at: datetime
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-compatible representation published to consumers."""
+        return {
+            "event_id": str(self.event_id),
+            "event_type": self.event_type,
+            "aggregate_type": self.aggregate_type,
+            "aggregate_id": str(self.aggregate_id),
+            "occurred_at": self.occurred_at.isoformat(),
+            "payload": self.payload,
+        }
+
+
+class IEventSink(ABC):
+    """Abstract interface for delivering domain events downstream."""
+
+    @abstractmethod
+    async def publish(self, events: Sequence[EventEnvelope]) -> None:
+        """
+        Deliver a batch of events in order. Raises if any could not be delivered.
+
+        Delivery is at-least-once: after a failure or crash the same events may
+        be published again, so consumers should de-duplicate on event_id.
+        """
+        pass
@@ -0,0 +1,48 @@
+"""Idempotency store interface."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """A completed response saved for replay under an idempotency key."""
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    fingerprint: str
+
+
+class IIdempotencyStore(ABC):
+    """Abstract interface for storing responses keyed by idempotency key."""
+
+    @abstractmethod
+    async def get(self, key: str) -> StoredResponse | None:
+        """Get the completed response for a key, if any."""
+        pass
+
+    @abstractmethod
+    async def reserve(self, key: str, ttl: int) -> bool:
+        """Mark a key as in flight. Returns False if it is already in flight or completed."""
+        pass
+
+    @abstractmethod
+    async def save(self, key: str, response: StoredResponse, ttl: int) -> None:
+        """Store the completed response for a reserved key."""
+        pass
+
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        """Drop an in-flight reservation without storing a response."""
+        pass
+
+    @abstractmethod
+    async def wait_for(self, key: str, timeout: float) -> StoredResponse | None:
+        """Wait for an in-flight key to complete. Returns None on timeout or release."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release connections held by the store."""
+        pass
@@ -0,0 +1,26 @@
+"""Background job queue interface."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+from uuid import UUID
+
+
+class IJobQueue(ABC):
+    """Abstract interface for deferring work to background workers."""
+
+    @abstractmethod
+    async def enqueue(
+        self,
+        name: str,
+        payload: dict[str, Any],
+        *,
+        delay_seconds: float = 0,
+        max_attempts: int | None = None,
+    ) -> UUID:
+        """
+        Enqueue a job for the handler registered under `name`.
+
+        The job is written in the caller's transaction, so it only runs if
+        that transaction commits.
+        """
+        pass
@@ -0,0 +1,55 @@
+"""One-time login code store interface."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+
+
+@dataclass(frozen=True)
+class OtpPolicy:
+    """Limits applied to login codes."""
+
+    secret_key: str
+    length: int = 6
+    ttl: int = 300
+    max_attempts: int = 5
+    max_sends: int = 3
+    send_window: int = 900
+
+
+class OtpCheck(Enum):
+    """Outcome of checking a submitted code."""
+
+    VALID = "valid"
+    INVALID = "invalid"
+    EXHAUSTED = "exhausted"
+    MISSING = "missing"
+
+
+class IOtpStore(ABC):
+    """
+    Abstract interface for short-lived login codes, keyed by phone number.
+
+    Only a hash of each code is stored. Every operation is atomic per number,
+    so concurrent guesses cannot exceed the attempt limit.
+    """
+
+    @abstractmethod
+    async def count_send(self, phone: str, window: int) -> int:
+        """Count a code sent to the number. Returns the sends in this window, including it."""
+        pass
+
+    @abstractmethod
+    async def save(self, phone: str, code_hash: str, ttl: int, attempts: int) -> None:
+        """Store a code for the number, replacing any previous one."""
+        pass
+
+    @abstractmethod
+    async def check(self, phone: str, code_hash: str) -> OtpCheck:
+        """
+        Check a submitted code.
+
+        A valid code is consumed. A wrong one uses up an attempt, and the code
+        is discarded (EXHAUSTED) once no attempts are left.
+        """
+        pass
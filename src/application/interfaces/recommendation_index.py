@@ -0,0 +1,22 @@
+"""Product recommendation index interface."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class Recommendation:
+    """A product often bought together with another, with its similarity score."""
+
+    product_id: UUID
+    score: float
+
+
+class IRecommendationIndex(ABC):
+    """Precomputed "frequently bought together" neighbours, read without the database."""
+
+    @abstractmethod
+    def neighbours(self, product_id: UUID, limit: int) -> list[Recommendation]:
+        """Most similar products first. Empty for unknown products."""
+        pass
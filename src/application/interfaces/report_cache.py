@@ -0,0 +1,17 @@
+"""Report cache interface."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+
+class IReportCache(ABC):
+    """Short-lived cache of serialized report responses."""
+
+    @abstractmethod
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[bytes]]) -> bytes:
+        """
+        Get the cached body for a key, or build it with the loader.
+
+        Concurrent misses for the same key share one loader call.
+        """
+        pass
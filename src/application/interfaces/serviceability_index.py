@@ -0,0 +1,14 @@
+"""Delivery serviceability index interface."""
+
+from abc import ABC, abstractmethod
+
+from src.domain.entities.delivery import DeliveryZone
+
+
+class IServiceabilityIndex(ABC):
+    """Point-in-zone lookups for delivery coverage without a database round trip."""
+
+    @abstractmethod
+    def locate(self, lat: float, lng: float) -> DeliveryZone | None:
+        """Get the active zone serving a location, or None if it is not served."""
+        pass
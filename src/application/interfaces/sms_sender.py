@@ -0,0 +1,12 @@
+"""SMS sender interface."""
+
+from abc import ABC, abstractmethod
+
+
+class ISmsSender(ABC):
+    """Abstract interface for sending text messages."""
+
+    @abstractmethod
+    async def send(self, to: str, body: str) -> None:
+        """Send a text message to a normalized phone number. Raises on delivery failure."""
+        pass
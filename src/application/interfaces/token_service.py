@@ -1,6 +1,7 @@
 """Token service interface."""
 
 from abc import ABC, abstractmethod
+from typing import Any
 from uuid import UUID
 
 
@@ -18,11 +19,21 @@ class ITokenService(ABC):
         pass
 
     @abstractmethod
-    def verify_access_token(self, token: str) -> dict:
+    def verify_access_token(self, token: str) -> dict[str, Any]:
         """Verify and decode an access token. Raises TokenError if invalid."""
         pass
 
     @abstractmethod
-    def verify_refresh_token(self, token: str) -> dict:
+    def verify_refresh_token(self, token: str) -> dict[str, Any]:
         """Verify and decode a refresh token. Raises TokenError if invalid."""
         pass
+
+    @abstractmethod
+    def create_email_verification_token(self, user_id: UUID, email: str) -> str:
+        """Generate a token proving ownership of an email address."""
+        pass
+
+    @abstractmethod
+    def verify_email_verification_token(self, token: str) -> dict[str, Any]:
+        """Verify and decode an email verification token. Raises TokenError if invalid."""
+        pass
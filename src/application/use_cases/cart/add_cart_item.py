@@ -0,0 +1,33 @@
+"""Add-to-cart use case."""
+
+from uuid import UUID
+
+from src.application.dto.requests.cart_request import AddCartItemRequest
+from src.application.dto.responses.cart_response import CartResponse
+from src.application.interfaces.cart_store import ICartStore
+from src.application.use_cases.cart.base import CartUseCase
+from src.domain.exceptions.catalog import ProductNotFoundError
+from src.domain.repositories.cart_repository import ICartRepository
+from src.domain.repositories.product_repository import IProductRepository
+
+
+class AddCartItem(CartUseCase):
+    """Use case for adding an available product to the cart."""
+
+    def __init__(
+        self,
+        cart_store: ICartStore,
+        cart_repository: ICartRepository,
+        product_repository: IProductRepository,
+    ) -> None:
+        super().__init__(cart_store, cart_repository)
+        self._product_repository = product_repository
+
+    async def execute(self, user_id: UUID, request: AddCartItemRequest) -> CartResponse:
+        product = await self._product_repository.get_by_id(request.product_id)
+        if not product or not product.is_available():
+            raise ProductNotFoundError()
+
+        return await self._modify(
+            user_id, lambda cart: cart.add_item(request.product_id, request.quantity)
+        )
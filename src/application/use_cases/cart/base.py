@@ -0,0 +1,47 @@
+"""Shared cart loading and optimistic update."""
+
+from collections.abc import Callable
+from uuid import UUID
+
+from src.application.dto.responses.cart_response import CartResponse
+from src.application.interfaces.cart_store import ICartStore
+from src.domain.entities.cart import Cart
+from src.domain.exceptions.cart import CartConflictError
+from src.domain.repositories.cart_repository import ICartRepository
+
+# Attempts at a compare-and-set before giving up on a contended cart
+MAX_UPDATE_ATTEMPTS = 5
+
+
+class CartUseCase:
+    """
+    Base for cart use cases.
+
+    Carts are read from the hot store, falling back to the database (and
+    caching the result) on a miss. Changes are written to the store only,
+    with a version check; the cart flusher persists them later.
+    """
+
+    def __init__(self, cart_store: ICartStore, cart_repository: ICartRepository) -> None:
+        self._cart_store = cart_store
+        self._cart_repository = cart_repository
+
+    async def _load(self, user_id: UUID) -> Cart:
+        cart = await self._cart_store.get(user_id)
+        if cart is not None:
+            return cart
+        cart = await self._cart_repository.get(user_id) or Cart(user_id=user_id)
+        if not await self._cart_store.add(cart):
+            # Another request cached it first; theirs may already be newer
+            return await self._cart_store.get(user_id) or cart
+        return cart
+
+    async def _modify(self, user_id: UUID, change: Callable[[Cart], None]) -> CartResponse:
+        """Apply a change, retrying from a fresh copy if a concurrent write wins."""
+        for _ in range(MAX_UPDATE_ATTEMPTS):
+            cart = await self._load(user_id)
+            expected_version = cart.version
+            change(cart)
+            if await self._cart_store.save(cart, expected_version):
+                return CartResponse.model_validate(cart)
+        raise CartConflictError()
@@ -0,0 +1,13 @@
+"""Cart clearing use case."""
+
+from uuid import UUID
+
+from src.application.dto.responses.cart_response import CartResponse
+from src.application.use_cases.cart.base import CartUseCase
+
+
+class ClearCart(CartUseCase):
+    """Use case for emptying the cart."""
+
+    async def execute(self, user_id: UUID) -> CartResponse:
+        return await self._modify(user_id, lambda cart: cart.clear())
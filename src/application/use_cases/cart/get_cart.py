@@ -0,0 +1,13 @@
+"""Cart lookup use case."""
+
+from uuid import UUID
+
+from src.application.dto.responses.cart_response import CartResponse
+from src.application.use_cases.cart.base import CartUseCase
+
+
+class GetCart(CartUseCase):
+    """Use case for reading the current user's cart."""
+
+    async def execute(self, user_id: UUID) -> CartResponse:
+        return CartResponse.model_validate(await self._load(user_id))
@@ -0,0 +1,49 @@
+"""Cart recommendations use case."""
+
+import heapq
+from collections import defaultdict
+from uuid import UUID
+
+from src.application.dto.responses.recommendation_response import RecommendationResponse
+from src.application.interfaces.cart_store import ICartStore
+from src.application.interfaces.recommendation_index import IRecommendationIndex
+from src.application.use_cases.cart.base import CartUseCase
+from src.core.constants import MAX_RECOMMENDATIONS
+from src.domain.repositories.cart_repository import ICartRepository
+
+
+class GetCartRecommendations(CartUseCase):
+    """
+    Use case for products to suggest alongside the current user's cart.
+
+    Each cart line contributes its product's precomputed neighbours; a
+    product's score is the sum over the lines that recommend it, so products
+    that go with several items rank first. Products already in the cart are
+    left out.
+    """
+
+    def __init__(
+        self,
+        cart_store: ICartStore,
+        cart_repository: ICartRepository,
+        recommendation_index: IRecommendationIndex,
+    ) -> None:
+        super().__init__(cart_store, cart_repository)
+        self._recommendation_index = recommendation_index
+
+    async def execute(self, user_id: UUID, limit: int) -> list[RecommendationResponse]:
+        cart = await self._load(user_id)
+        in_cart = {item.product_id for item in cart.items}
+
+        scores: defaultdict[UUID, float] = defaultdict(float)
+        for product_id in in_cart:
+            for neighbour in self._recommendation_index.neighbours(product_id, MAX_RECOMMENDATIONS):
+                if neighbour.product_id not in in_cart:
+                    scores[neighbour.product_id] += neighbour.score
+
+        return [
+            RecommendationResponse(product_id=product_id, score=score)
+            for product_id, score in heapq.nlargest(
+                limit, scores.items(), key=lambda entry: entry[1]
+            )
+        ]
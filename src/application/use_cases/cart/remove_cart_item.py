@@ -0,0 +1,13 @@
+"""Remove-from-cart use case."""
+
+from uuid import UUID
+
+from src.application.dto.responses.cart_response import CartResponse
+from src.application.use_cases.cart.base import CartUseCase
+
+
+class RemoveCartItem(CartUseCase):
+    """Use case for removing a product from the cart."""
+
+    async def execute(self, user_id: UUID, product_id: UUID) -> CartResponse:
+        return await self._modify(user_id, lambda cart: cart.remove_item(product_id))
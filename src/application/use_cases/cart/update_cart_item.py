@@ -0,0 +1,18 @@
+"""Cart item quantity use case."""
+
+from uuid import UUID
+
+from src.application.dto.requests.cart_request import UpdateCartItemRequest
+from src.application.dto.responses.cart_response import CartResponse
+from src.application.use_cases.cart.base import CartUseCase
+
+
+class UpdateCartItem(CartUseCase):
+    """Use case for setting the quantity of a product already in the cart."""
+
+    async def execute(
+        self, user_id: UUID, product_id: UUID, request: UpdateCartItemRequest
+    ) -> CartResponse:
+        return await self._modify(
+            user_id, lambda cart: cart.set_quantity(product_id, request.quantity)
+        )
@@ -0,0 +1,25 @@
+"""Category creation use case."""
+
+from src.application.dto.requests.catalog_request import CreateCategoryRequest
+from src.application.dto.responses.catalog_response import CategoryResponse
+from src.domain.entities.product import Category
+from src.domain.exceptions.catalog import CategoryNotFoundError
+from src.domain.repositories.category_repository import ICategoryRepository
+
+
+class CreateCategory:
+    """Use case for adding a category to the catalog."""
+
+    def __init__(self, category_repository: ICategoryRepository) -> None:
+        self._category_repository = category_repository
+
+    async def execute(self, request: CreateCategoryRequest) -> CategoryResponse:
+        if request.parent_id is not None:
+            parent = await self._category_repository.get_by_id(request.parent_id)
+            if not parent or not parent.is_active:
+                raise CategoryNotFoundError(f"Parent category {request.parent_id} not found.")
+
+        category = await self._category_repository.create(
+            Category(name=request.name, slug=request.slug, parent_id=request.parent_id)
+        )
+        return CategoryResponse.model_validate(category)
@@ -0,0 +1,39 @@
+"""Product creation use case."""
+
+from src.application.dto.requests.catalog_request import CreateProductRequest
+from src.application.dto.responses.catalog_response import ProductResponse
+from src.domain.entities.product import Product
+from src.domain.exceptions.catalog import CategoryNotFoundError, ProductAlreadyExistsError
+from src.domain.repositories.category_repository import ICategoryRepository
+from src.domain.repositories.product_repository import IProductRepository
+
+
+class CreateProduct:
+    """Use case for adding a product to the catalog."""
+
+    def __init__(
+        self, product_repository: IProductRepository, category_repository: ICategoryRepository
+    ) -> None:
+        self._product_repository = product_repository
+        self._category_repository = category_repository
+
+    async def execute(self, request: CreateProductRequest) -> ProductResponse:
+        if await self._product_repository.get_by_slug(request.slug):
+            raise ProductAlreadyExistsError(f"Product with slug {request.slug} already exists.")
+
+        if request.category_id is not None:
+            category = await self._category_repository.get_by_id(request.category_id)
+            if not category or not category.is_active:
+                raise CategoryNotFoundError(f"Category {request.category_id} not found.")
+
+        product = await self._product_repository.create(
+            Product(
+                name=request.name,
+                name_bn=request.name_bn,
+                slug=request.slug,
+                description=request.description,
+                price=request.price,
+                category_id=request.category_id,
+            )
+        )
+        return ProductResponse.model_validate(product)
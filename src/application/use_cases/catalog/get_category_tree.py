@@ -0,0 +1,18 @@
+"""Category tree use case."""
+
+from src.application.dto.responses.catalog_response import CategoryTreeResponse
+from src.application.interfaces.category_tree import ICategoryTree
+
+
+class GetCategoryTree:
+    """Use case for reading the active category hierarchy."""
+
+    def __init__(self, category_tree: ICategoryTree) -> None:
+        self._category_tree = category_tree
+
+    def execute(self) -> list[CategoryTreeResponse]:
+        return [CategoryTreeResponse.from_node(node) for node in self._category_tree.roots()]
+
+    def version(self) -> str:
+        """Changes whenever execute's result may; used as its ETag."""
+        return self._category_tree.version()
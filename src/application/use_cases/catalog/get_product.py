@@ -0,0 +1,20 @@
+"""Product lookup use case."""
+
+from uuid import UUID
+
+from src.application.dto.responses.catalog_response import ProductResponse
+from src.domain.exceptions.catalog import ProductNotFoundError
+from src.domain.repositories.product_repository import IProductRepository
+
+
+class GetProduct:
+    """Use case for reading one active product."""
+
+    def __init__(self, product_repository: IProductRepository) -> None:
+        self._product_repository = product_repository
+
+    async def execute(self, product_id: UUID) -> ProductResponse:
+        product = await self._product_repository.get_by_id(product_id)
+        if not product or not product.is_available():
+            raise ProductNotFoundError()
+        return ProductResponse.model_validate(product)
@@ -0,0 +1,19 @@
+"""Product recommendations use case."""
+
+from uuid import UUID
+
+from src.application.dto.responses.recommendation_response import RecommendationResponse
+from src.application.interfaces.recommendation_index import IRecommendationIndex
+
+
+class GetProductRecommendations:
+    """Use case for products frequently bought together with a product."""
+
+    def __init__(self, recommendation_index: IRecommendationIndex) -> None:
+        self._recommendation_index = recommendation_index
+
+    def execute(self, product_id: UUID, limit: int) -> list[RecommendationResponse]:
+        return [
+            RecommendationResponse.model_validate(recommendation)
+            for recommendation in self._recommendation_index.neighbours(product_id, limit)
+        ]
@@ -0,0 +1,49 @@
+"""Product listing use case."""
+
+from uuid import UUID
+
+from src.application.dto.responses.catalog_response import ProductPageResponse, ProductResponse
+from src.application.interfaces.category_tree import ICategoryTree
+from src.core.constants import DEFAULT_PAGE_SIZE
+from src.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from src.domain.exceptions.catalog import CategoryNotFoundError
+from src.domain.repositories.product_repository import IProductRepository
+
+
+class ListProducts:
+    """Use case for browsing products, optionally within a category and its subcategories."""
+
+    def __init__(
+        self, product_repository: IProductRepository, category_tree: ICategoryTree
+    ) -> None:
+        self._product_repository = product_repository
+        self._category_tree = category_tree
+
+    async def execute(
+        self,
+        category_slug: str | None = None,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> ProductPageResponse:
+        category_ids = None
+        if category_slug is not None:
+            category = self._category_tree.get_by_slug(category_slug)
+            if not category:
+                raise CategoryNotFoundError()
+            # Subtree comes from memory; the query only filters on a list of IDs
+            category_ids = self._category_tree.descendant_ids(category.id)
+
+        after_id = None
+        if cursor is not None:
+            (raw_id,) = decode_cursor(cursor, 1)
+            try:
+                after_id = UUID(raw_id)
+            except (TypeError, ValueError) as e:
+                raise InvalidCursorError("Invalid cursor") from e
+
+        products = await self._product_repository.list_after(category_ids, after_id, limit)
+        next_cursor = encode_cursor(str(products[-1].id)) if len(products) == limit else None
+        return ProductPageResponse(
+            items=[ProductResponse.model_validate(product) for product in products],
+            next_cursor=next_cursor,
+        )
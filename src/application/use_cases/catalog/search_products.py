@@ -0,0 +1,35 @@
+"""Product search use case."""
+
+from uuid import UUID
+
+from src.application.dto.responses.catalog_response import ProductPageResponse, ProductResponse
+from src.core.constants import DEFAULT_PAGE_SIZE
+from src.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from src.domain.repositories.product_repository import IProductRepository
+
+
+class SearchProducts:
+    """Use case for relevance-ranked product search in English and Bangla."""
+
+    def __init__(self, product_repository: IProductRepository) -> None:
+        self._product_repository = product_repository
+
+    async def execute(
+        self, query: str, cursor: str | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> ProductPageResponse:
+        after = None
+        if cursor is not None:
+            raw_score, raw_id = decode_cursor(cursor, 2)
+            try:
+                after = (float(raw_score), UUID(raw_id))
+            except (TypeError, ValueError) as e:
+                raise InvalidCursorError("Invalid cursor") from e
+
+        hits = await self._product_repository.search(query.strip(), after, limit)
+        next_cursor = (
+            encode_cursor(hits[-1].score, str(hits[-1].product.id)) if len(hits) == limit else None
+        )
+        return ProductPageResponse(
+            items=[ProductResponse.model_validate(hit.product) for hit in hits],
+            next_cursor=next_cursor,
+        )
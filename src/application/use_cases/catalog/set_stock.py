@@ -0,0 +1,49 @@
+"""Product stock use cases."""
+
+from uuid import UUID
+
+from src.application.dto.requests.order_request import SetStockRequest
+from src.application.dto.responses.order_response import StockResponse
+from src.domain.exceptions.catalog import ProductNotFoundError
+from src.domain.repositories.inventory_repository import IInventoryRepository
+from src.domain.repositories.product_repository import IProductRepository
+
+
+class SetStock:
+    """Use case for replacing a product's sellable stock (units not already reserved)."""
+
+    def __init__(
+        self,
+        product_repository: IProductRepository,
+        inventory_repository: IInventoryRepository,
+        shards: int,
+    ) -> None:
+        self._product_repository = product_repository
+        self._inventory_repository = inventory_repository
+        self._shards = shards
+
+    async def execute(self, product_id: UUID, request: SetStockRequest) -> StockResponse:
+        product = await self._product_repository.get_by_id(product_id)
+        if not product:
+            raise ProductNotFoundError()
+
+        await self._inventory_repository.set_stock(product_id, request.available, self._shards)
+        return StockResponse(product_id=product_id, available=request.available)
+
+
+class GetStock:
+    """Use case for reading a product's sellable stock."""
+
+    def __init__(
+        self, product_repository: IProductRepository, inventory_repository: IInventoryRepository
+    ) -> None:
+        self._product_repository = product_repository
+        self._inventory_repository = inventory_repository
+
+    async def execute(self, product_id: UUID) -> StockResponse:
+        product = await self._product_repository.get_by_id(product_id)
+        if not product:
+            raise ProductNotFoundError()
+
+        available = await self._inventory_repository.get_available(product_id)
+        return StockResponse(product_id=product_id, available=available)
@@ -0,0 +1,44 @@
+"""Product update use case."""
+
+from dataclasses import replace
+from datetime import UTC, datetime
+from uuid import UUID
+
+from src.application.dto.requests.catalog_request import UpdateProductRequest
+from src.application.dto.responses.catalog_response import ProductResponse
+from src.domain.exceptions.catalog import CategoryNotFoundError, ProductNotFoundError
+from src.domain.repositories.category_repository import ICategoryRepository
+from src.domain.repositories.product_repository import IProductRepository
+
+# Fields a client may clear by sending null; null is ignored for the rest
+CLEARABLE_FIELDS = frozenset({"name_bn", "description", "category_id"})
+
+
+class UpdateProduct:
+    """Use case for changing a product's details, price or visibility."""
+
+    def __init__(
+        self, product_repository: IProductRepository, category_repository: ICategoryRepository
+    ) -> None:
+        self._product_repository = product_repository
+        self._category_repository = category_repository
+
+    async def execute(self, product_id: UUID, request: UpdateProductRequest) -> ProductResponse:
+        product = await self._product_repository.get_by_id(product_id)
+        if not product:
+            raise ProductNotFoundError()
+
+        changes = {
+            field: value
+            for field, value in request.model_dump(exclude_unset=True).items()
+            if value is not None or field in CLEARABLE_FIELDS
+        }
+        if changes.get("category_id") is not None:
+            category = await self._category_repository.get_by_id(changes["category_id"])
+            if not category or not category.is_active:
+                raise CategoryNotFoundError(f"Category {changes['category_id']} not found.")
+
+        updated = await self._product_repository.update(
+            replace(product, **changes, updated_at=datetime.now(UTC))
+        )
+        return ProductResponse.model_validate(updated)
@@ -0,0 +1,21 @@
+"""Delivery serviceability use case."""
+
+from src.application.dto.responses.delivery_response import (
+    ServiceabilityResponse,
+    ServingZoneResponse,
+)
+from src.application.interfaces.serviceability_index import IServiceabilityIndex
+
+
+class CheckServiceability:
+    """Use case for finding the delivery zone that serves a location."""
+
+    def __init__(self, serviceability_index: IServiceabilityIndex) -> None:
+        self._serviceability_index = serviceability_index
+
+    def execute(self, lat: float, lng: float) -> ServiceabilityResponse:
+        zone = self._serviceability_index.locate(lat, lng)
+        return ServiceabilityResponse(
+            serviceable=zone is not None,
+            zone=ServingZoneResponse.model_validate(zone) if zone else None,
+        )
@@ -0,0 +1,24 @@
+"""Delivery zone creation use case."""
+
+from src.application.dto.requests.delivery_request import CreateDeliveryZoneRequest
+from src.application.dto.responses.delivery_response import DeliveryZoneResponse
+from src.domain.entities.delivery import DeliveryZone
+from src.domain.repositories.delivery_zone_repository import IDeliveryZoneRepository
+
+
+class CreateDeliveryZone:
+    """Use case for adding an area served by a delivery hub."""
+
+    def __init__(self, zone_repository: IDeliveryZoneRepository) -> None:
+        self._zone_repository = zone_repository
+
+    async def execute(self, request: CreateDeliveryZoneRequest) -> DeliveryZoneResponse:
+        zone = await self._zone_repository.create(
+            DeliveryZone(
+                name=request.name,
+                hub_code=request.hub_code,
+                rings=request.rings,
+                priority=request.priority,
+            )
+        )
+        return DeliveryZoneResponse.model_validate(zone)
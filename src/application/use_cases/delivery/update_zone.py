@@ -0,0 +1,34 @@
+"""Delivery zone update use case."""
+
+from dataclasses import replace
+from datetime import UTC, datetime
+from uuid import UUID
+
+from src.application.dto.requests.delivery_request import UpdateDeliveryZoneRequest
+from src.application.dto.responses.delivery_response import DeliveryZoneResponse
+from src.domain.exceptions.delivery import DeliveryZoneNotFoundError
+from src.domain.repositories.delivery_zone_repository import IDeliveryZoneRepository
+
+
+class UpdateDeliveryZone:
+    """Use case for reshaping, reassigning or deactivating a delivery zone."""
+
+    def __init__(self, zone_repository: IDeliveryZoneRepository) -> None:
+        self._zone_repository = zone_repository
+
+    async def execute(
+        self, zone_id: UUID, request: UpdateDeliveryZoneRequest
+    ) -> DeliveryZoneResponse:
+        zone = await self._zone_repository.get_by_id(zone_id)
+        if not zone:
+            raise DeliveryZoneNotFoundError()
+
+        changes = {
+            field: value
+            for field, value in request.model_dump(exclude_unset=True).items()
+            if value is not None
+        }
+        updated = await self._zone_repository.update(
+            replace(zone, **changes, updated_at=datetime.now(UTC))
+        )
+        return DeliveryZoneResponse.model_validate(updated)
@@ -0,0 +1,38 @@
+"""Shared loading and state changes of a user's pending order."""
+
+from datetime import UTC, datetime
+from uuid import UUID
+
+from src.domain.entities.order import Order
+from src.domain.exceptions.order import InvalidOrderStateError, OrderNotFoundError
+from src.domain.repositories.inventory_repository import IInventoryRepository
+from src.domain.repositories.order_repository import IOrderRepository
+from src.domain.repositories.outbox_repository import IOutboxRepository
+
+
+class PendingOrderUseCase:
+    """
+    Base for use cases that end a pending order.
+
+    The order row is locked before its status is checked, so a confirmation,
+    a cancellation and the reservation sweeper cannot both act on one order.
+    """
+
+    def __init__(
+        self,
+        order_repository: IOrderRepository,
+        inventory_repository: IInventoryRepository,
+        outbox: IOutboxRepository,
+    ) -> None:
+        self._order_repository = order_repository
+        self._inventory_repository = inventory_repository
+        self._outbox = outbox
+
+    async def _lock_pending(self, user_id: UUID, order_id: UUID) -> Order:
+        order = await self._order_repository.get_by_id(order_id, for_update=True)
+        # Other users' orders are reported as missing rather than forbidden
+        if not order or order.user_id != user_id:
+            raise OrderNotFoundError()
+        if not order.is_pending(datetime.now(UTC)):
+            raise InvalidOrderStateError()
+        return order
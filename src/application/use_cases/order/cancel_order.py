@@ -0,0 +1,22 @@
+"""Order cancellation use case."""
+
+from uuid import UUID
+
+from src.application.dto.responses.order_response import OrderResponse
+from src.application.use_cases.order.base import PendingOrderUseCase
+from src.domain.entities.order import OrderStatus
+from src.domain.events.order import OrderCancelled
+
+
+class CancelOrder(PendingOrderUseCase):
+    """Use case for cancelling a pending order and returning its stock."""
+
+    async def execute(self, user_id: UUID, order_id: UUID) -> OrderResponse:
+        order = await self._lock_pending(user_id, order_id)
+
+        await self._inventory_repository.release([order.id])
+        await self._order_repository.set_status([order.id], OrderStatus.CANCELLED)
+        await self._outbox.add([OrderCancelled(aggregate_id=order.id)])
+
+        order.status = OrderStatus.CANCELLED
+        return OrderResponse.model_validate(order)
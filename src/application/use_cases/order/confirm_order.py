@@ -0,0 +1,22 @@
+"""Order confirmation use case."""
+
+from uuid import UUID
+
+from src.application.dto.responses.order_response import OrderResponse
+from src.application.use_cases.order.base import PendingOrderUseCase
+from src.domain.entities.order import OrderStatus
+from src.domain.events.order import OrderConfirmed
+
+
+class ConfirmOrder(PendingOrderUseCase):
+    """Use case for confirming a pending order, keeping its reserved stock as sold."""
+
+    async def execute(self, user_id: UUID, order_id: UUID) -> OrderResponse:
+        order = await self._lock_pending(user_id, order_id)
+
+        await self._inventory_repository.commit([order.id])
+        await self._order_repository.set_status([order.id], OrderStatus.CONFIRMED)
+        await self._outbox.add([OrderConfirmed(aggregate_id=order.id)])
+
+        order.status = OrderStatus.CONFIRMED
+        return OrderResponse.model_validate(order)
@@ -0,0 +1,34 @@
+"""Reservation expiry use case."""
+
+from datetime import UTC, datetime
+
+from src.domain.entities.order import OrderStatus
+from src.domain.events.order import OrderExpired
+from src.domain.repositories.inventory_repository import IInventoryRepository
+from src.domain.repositories.order_repository import IOrderRepository
+from src.domain.repositories.outbox_repository import IOutboxRepository
+
+
+class ExpireOrders:
+    """Use case for expiring pending orders whose reservation ran out."""
+
+    def __init__(
+        self,
+        order_repository: IOrderRepository,
+        inventory_repository: IInventoryRepository,
+        outbox: IOutboxRepository,
+    ) -> None:
+        self._order_repository = order_repository
+        self._inventory_repository = inventory_repository
+        self._outbox = outbox
+
+    async def execute(self, limit: int) -> int:
+        """Expire up to `limit` orders and release their stock. Returns how many."""
+        order_ids = await self._order_repository.lock_expired(datetime.now(UTC), limit)
+        if not order_ids:
+            return 0
+
+        await self._inventory_repository.release(order_ids)
+        await self._order_repository.set_status(order_ids, OrderStatus.EXPIRED)
+        await self._outbox.add([OrderExpired(aggregate_id=order_id) for order_id in order_ids])
+        return len(order_ids)
@@ -0,0 +1,20 @@
+"""Order detail use case."""
+
+from uuid import UUID
+
+from src.application.dto.responses.order_response import OrderResponse
+from src.domain.exceptions.order import OrderNotFoundError
+from src.domain.repositories.order_repository import IOrderRepository
+
+
+class GetOrder:
+    """Use case for fetching one of the user's orders."""
+
+    def __init__(self, order_repository: IOrderRepository) -> None:
+        self._order_repository = order_repository
+
+    async def execute(self, user_id: UUID, order_id: UUID) -> OrderResponse:
+        order = await self._order_repository.get_by_id(order_id)
+        if not order or order.user_id != user_id:
+            raise OrderNotFoundError()
+        return OrderResponse.model_validate(order)
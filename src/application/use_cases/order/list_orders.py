@@ -0,0 +1,33 @@
+"""Order history use case."""
+
+from uuid import UUID
+
+from src.application.dto.responses.order_response import OrderPageResponse, OrderResponse
+from src.core.constants import DEFAULT_PAGE_SIZE
+from src.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from src.domain.repositories.order_repository import IOrderRepository
+
+
+class ListOrders:
+    """Use case for paging through the user's orders, newest first."""
+
+    def __init__(self, order_repository: IOrderRepository) -> None:
+        self._order_repository = order_repository
+
+    async def execute(
+        self, user_id: UUID, cursor: str | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> OrderPageResponse:
+        after_id = None
+        if cursor is not None:
+            (raw_id,) = decode_cursor(cursor, 1)
+            try:
+                after_id = UUID(raw_id)
+            except (TypeError, ValueError) as e:
+                raise InvalidCursorError("Invalid cursor") from e
+
+        orders = await self._order_repository.list_by_user(user_id, after_id, limit)
+        next_cursor = encode_cursor(str(orders[-1].id)) if len(orders) == limit else None
+        return OrderPageResponse(
+            items=[OrderResponse.model_validate(order) for order in orders],
+            next_cursor=next_cursor,
+        )
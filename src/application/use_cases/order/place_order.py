@@ -0,0 +1,109 @@
+"""Order placement use case."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from src.application.dto.responses.order_response import OrderResponse
+from src.application.interfaces.cart_store import ICartStore
+from src.application.use_cases.cart.base import CartUseCase
+from src.domain.entities.order import Order, OrderItem
+from src.domain.events.order import OrderPlaced
+from src.domain.exceptions.catalog import ProductNotFoundError
+from src.domain.exceptions.order import EmptyCartError, OutOfStockError
+from src.domain.repositories.cart_repository import ICartRepository
+from src.domain.repositories.inventory_repository import IInventoryRepository
+from src.domain.repositories.order_repository import IOrderRepository
+from src.domain.repositories.outbox_repository import IOutboxRepository
+from src.domain.repositories.product_repository import IProductRepository
+
+
+class PlaceOrder(CartUseCase):
+    """
+    Use case for turning the cart into a pending order with reserved stock.
+
+    Most checkouts in a flash sale arrive after the stock is gone, so an
+    unlocked stock check turns them away before anything is written. Stock
+    is reserved last, after every write that does not contend with other
+    checkouts, so the inventory row locks are held only until commit.
+    """
+
+    def __init__(
+        self,
+        cart_store: ICartStore,
+        cart_repository: ICartRepository,
+        product_repository: IProductRepository,
+        order_repository: IOrderRepository,
+        inventory_repository: IInventoryRepository,
+        outbox: IOutboxRepository,
+        reservation_ttl: int,
+    ) -> None:
+        super().__init__(cart_store, cart_repository)
+        self._product_repository = product_repository
+        self._order_repository = order_repository
+        self._inventory_repository = inventory_repository
+        self._outbox = outbox
+        self._reservation_ttl = reservation_ttl
+
+    async def execute(self, user_id: UUID) -> OrderResponse:
+        cart = await self._load(user_id)
+        if not cart.items:
+            raise EmptyCartError()
+
+        products = {
+            product.id: product
+            for product in await self._product_repository.get_many_by_ids(
+                [item.product_id for item in cart.items]
+            )
+        }
+        items: list[OrderItem] = []
+        for cart_item in cart.items:
+            product = products.get(cart_item.product_id)
+            if not product or not product.is_available():
+                raise ProductNotFoundError(f"Product {cart_item.product_id} is not available")
+            items.append(
+                OrderItem(
+                    product_id=product.id, quantity=cart_item.quantity, unit_price=product.price
+                )
+            )
+
+        available = await self._inventory_repository.get_available_many(
+            [item.product_id for item in items]
+        )
+        for item in items:
+            if available.get(item.product_id, 0) < item.quantity:
+                raise OutOfStockError(item.product_id)
+
+        order = await self._order_repository.create(
+            Order(
+                user_id=user_id,
+                items=items,
+                reserved_until=datetime.now(UTC) + timedelta(seconds=self._reservation_ttl),
+            )
+        )
+        await self._outbox.add(
+            [
+                OrderPlaced(
+                    aggregate_id=order.id,
+                    user_id=user_id,
+                    total=str(order.total),
+                    items=[
+                        {
+                            "product_id": str(item.product_id),
+                            "quantity": item.quantity,
+                            "unit_price": str(item.unit_price),
+                        }
+                        for item in order.items
+                    ],
+                )
+            ]
+        )
+        await self._inventory_repository.reserve(
+            order.id, [(item.product_id, item.quantity) for item in order.items]
+        )
+
+        # Empty the cart that was ordered; a cart changed meanwhile is kept as is
+        expected_version = cart.version
+        cart.clear()
+        await self._cart_store.save(cart, expected_version)
+
+        return OrderResponse.model_validate(order)
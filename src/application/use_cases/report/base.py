@@ -0,0 +1,23 @@
+"""Shared date range handling of daily reports."""
+
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from src.core.constants import DEFAULT_REPORT_DAYS, MAX_REPORT_DAYS
+from src.domain.exceptions.report import InvalidReportRangeError
+
+
+def resolve_range(start: date | None, end: date | None, time_zone: str) -> tuple[date, date]:
+    """
+    Fill in a missing end (today in the reporting time zone) and start.
+
+    Raises InvalidReportRangeError if start is after end or the range is
+    longer than MAX_REPORT_DAYS.
+    """
+    end = end or datetime.now(ZoneInfo(time_zone)).date()
+    start = start or end - timedelta(days=DEFAULT_REPORT_DAYS - 1)
+    if start > end:
+        raise InvalidReportRangeError("start must not be after end")
+    if (end - start).days + 1 > MAX_REPORT_DAYS:
+        raise InvalidReportRangeError(f"Reports cover at most {MAX_REPORT_DAYS} days")
+    return start, end
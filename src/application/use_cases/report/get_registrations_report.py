@@ -0,0 +1,31 @@
+"""Registrations report use case."""
+
+from datetime import date
+
+from src.application.dto.responses.report_response import (
+    DailyRegistrationsResponse,
+    RegistrationsReportResponse,
+)
+from src.application.use_cases.report.base import resolve_range
+from src.domain.entities.report import REGISTRATIONS_REPORT
+from src.domain.repositories.report_repository import IReportRepository
+
+
+class GetRegistrationsReport:
+    """Use case for new user registrations per day."""
+
+    def __init__(self, report_repository: IReportRepository, time_zone: str) -> None:
+        self._report_repository = report_repository
+        self._time_zone = time_zone
+
+    async def execute(self, start: date | None, end: date | None) -> RegistrationsReportResponse:
+        start, end = resolve_range(start, end, self._time_zone)
+        days = await self._report_repository.daily_registrations(start, end)
+        watermarks = await self._report_repository.watermarks()
+        return RegistrationsReportResponse(
+            start=start,
+            end=end,
+            as_of=watermarks[REGISTRATIONS_REPORT],
+            users=sum(day.users for day in days),
+            days=[DailyRegistrationsResponse.model_validate(day) for day in days],
+        )
@@ -0,0 +1,31 @@
+"""Sales report use case."""
+
+from datetime import date
+from decimal import Decimal
+
+from src.application.dto.responses.report_response import DailySalesResponse, SalesReportResponse
+from src.application.use_cases.report.base import resolve_range
+from src.domain.entities.report import SALES_REPORT
+from src.domain.repositories.report_repository import IReportRepository
+
+
+class GetSalesReport:
+    """Use case for confirmed orders, units and revenue per day."""
+
+    def __init__(self, report_repository: IReportRepository, time_zone: str) -> None:
+        self._report_repository = report_repository
+        self._time_zone = time_zone
+
+    async def execute(self, start: date | None, end: date | None) -> SalesReportResponse:
+        start, end = resolve_range(start, end, self._time_zone)
+        days = await self._report_repository.daily_sales(start, end)
+        watermarks = await self._report_repository.watermarks()
+        return SalesReportResponse(
+            start=start,
+            end=end,
+            as_of=watermarks[SALES_REPORT],
+            orders=sum(day.orders for day in days),
+            units=sum(day.units for day in days),
+            revenue=sum((day.revenue for day in days), Decimal("0")),
+            days=[DailySalesResponse.model_validate(day) for day in days],
+        )
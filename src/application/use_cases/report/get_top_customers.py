@@ -0,0 +1,23 @@
+"""Top customers report use case."""
+
+from src.application.dto.responses.report_response import (
+    CustomerSalesResponse,
+    TopCustomersResponse,
+)
+from src.domain.entities.report import SALES_REPORT
+from src.domain.repositories.report_repository import IReportRepository
+
+
+class GetTopCustomers:
+    """Use case for the customers with the most confirmed revenue."""
+
+    def __init__(self, report_repository: IReportRepository) -> None:
+        self._report_repository = report_repository
+
+    async def execute(self, limit: int) -> TopCustomersResponse:
+        customers = await self._report_repository.top_customers(limit)
+        watermarks = await self._report_repository.watermarks()
+        return TopCustomersResponse(
+            as_of=watermarks[SALES_REPORT],
+            customers=[CustomerSalesResponse.model_validate(c) for c in customers],
+        )
@@ -0,0 +1,74 @@
+"""Bulk user update use case."""
+
+from uuid import UUID
+
+from src.domain.events.base import DomainEvent
+from src.domain.events.user import UserDeactivated, UserRoleChanged, UserVerified
+from src.domain.exceptions.user import InvalidUserFilterError
+from src.domain.repositories.outbox_repository import IOutboxRepository
+from src.domain.repositories.user_repository import (
+    IUserRepository,
+    UserChanges,
+    UserFilter,
+    UserRow,
+)
+
+
+class BulkUpdateUsers:
+    """
+    Use case for changing every user a filter selects, one chunk per call.
+
+    execute() changes at most `chunk_size` users with one set-based update
+    and stages their events in the same transaction. Callers commit after
+    each call, so row locks are held for one chunk at a time, and call again
+    until fewer than `chunk_size` users come back. The acting admin is never
+    changed, and an empty filter is refused rather than taken to mean
+    everyone.
+    """
+
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        outbox: IOutboxRepository,
+        chunk_size: int = 1000,
+    ) -> None:
+        self._user_repository = user_repository
+        self._outbox = outbox
+        self.chunk_size = chunk_size
+
+    async def count(
+        self, user_filter: UserFilter, changes: UserChanges, actor_id: UUID
+    ) -> tuple[int, int]:
+        """Dry run: users the filter selects, and how many of them would change."""
+        _check(user_filter, changes)
+        return await self._user_repository.count_matching(user_filter, changes, actor_id)
+
+    async def execute(
+        self, user_filter: UserFilter, changes: UserChanges, actor_id: UUID
+    ) -> list[UUID]:
+        """Change the next chunk of users; returns their ids."""
+        _check(user_filter, changes)
+        rows = await self._user_repository.update_matching(
+            user_filter, changes, self.chunk_size, actor_id
+        )
+        await self._outbox.add(_events(rows, changes))
+        return [row.id for row in rows]
+
+
+def _check(user_filter: UserFilter, changes: UserChanges) -> None:
+    if user_filter == UserFilter():
+        raise InvalidUserFilterError("A bulk update needs at least one filter criterion")
+    if changes == UserChanges():
+        raise ValueError("A bulk update needs at least one change")
+
+
+def _events(rows: list[UserRow], changes: UserChanges) -> list[DomainEvent]:
+    events: list[DomainEvent] = []
+    for row in rows:
+        if changes.is_active is False:
+            events.append(UserDeactivated(aggregate_id=row.id))
+        if changes.is_verified:
+            events.append(UserVerified(aggregate_id=row.id, email=row.email))
+        if changes.role is not None:
+            events.append(UserRoleChanged(aggregate_id=row.id, role=row.role))
+    return events
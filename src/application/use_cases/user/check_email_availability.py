@@ -0,0 +1,25 @@
+"""Email availability use case."""
+
+from src.application.interfaces.email_filter import IRegisteredEmailFilter
+from src.domain.repositories.user_repository import IUserRepository
+
+
+class CheckEmailAvailability:
+    """
+    Use case for telling a signup form whether an email is still free.
+
+    Most candidate emails are not registered, and the filter says so
+    without the database; only its possible matches are looked up.
+    """
+
+    def __init__(
+        self, user_repository: IUserRepository, email_filter: IRegisteredEmailFilter
+    ) -> None:
+        self._user_repository = user_repository
+        self._email_filter = email_filter
+
+    async def execute(self, email: str) -> bool:
+        """True if no user has this email."""
+        if not self._email_filter.might_be_registered(email):
+            return True
+        return not await self._user_repository.exists_by_email(email)
@@ -0,0 +1,33 @@
+"""Recent login failures use case."""
+
+from datetime import UTC, datetime, timedelta
+
+from src.application.dto.responses.auth_response import LoginFailureResponse
+from src.domain.repositories.auth_event_repository import IAuthEventRepository
+
+# How far back failures are listed when no start time is given
+DEFAULT_WINDOW = timedelta(hours=24)
+
+
+class GetLoginFailures:
+    """
+    Use case for reviewing an account's failed logins, e.g. when it is
+    suspected of being brute-forced.
+
+    Reads the authentication event log, which is written in batches, so the
+    last second or so of failures may not be listed yet.
+    """
+
+    def __init__(self, auth_event_repository: IAuthEventRepository) -> None:
+        self._auth_event_repository = auth_event_repository
+
+    async def execute(
+        self, email: str, since: datetime | None, limit: int
+    ) -> list[LoginFailureResponse]:
+        """Failures since `since` (naive times are UTC; default the last day), newest first."""
+        if since is None:
+            since = datetime.now(UTC) - DEFAULT_WINDOW
+        elif since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        events = await self._auth_event_repository.get_recent_failures(email, since, limit)
+        return [LoginFailureResponse.model_validate(event) for event in events]
@@ -2,8 +2,11 @@
 
 from src.application.dto.requests.auth_request import LoginRequest
 from src.application.dto.responses.auth_response import TokenResponse
+from src.application.interfaces.auth_event_recorder import IAuthEventRecorder
 from src.application.interfaces.token_service import ITokenService
 from src.core.security import verify_password
+from src.domain.entities.auth_event import AuthEvent, AuthEventType
+from src.domain.entities.user import User, normalize_email
 from src.domain.exceptions.auth import InvalidCredentialError
 from src.domain.repositories.user_repository import IUserRepository
 
@@ -15,25 +18,44 @@ class LoginUser:
         self,
         user_repository: IUserRepository,
         token_service: ITokenService,
+        event_recorder: IAuthEventRecorder,
     ) -> None:
         self._user_repository = user_repository
         self._token_service = token_service
+        self._event_recorder = event_recorder
 
     async def execute(self, request: LoginRequest) -> TokenResponse:
         user = await self._user_repository.get_by_email(request.email)
         if not user:
+            await self._record_failure(request.email, None, "unknown_email")
             raise InvalidCredentialError()
 
         if not verify_password(request.password, user.hashed_password):
+            await self._record_failure(user.email, user, "invalid_password")
             raise InvalidCredentialError()
 
         if not user.is_active:
+            await self._record_failure(user.email, user, "inactive")
             raise InvalidCredentialError("Account is deactivated")
 
         access_token = self._token_service.create_access_token(user.id, user.role)
         refresh_token = self._token_service.create_refresh_token(user.id)
 
+        await self._event_recorder.record(
+            AuthEvent(AuthEventType.LOGIN_SUCCEEDED, email=user.email, user_id=user.id)
+        )
+
         return TokenResponse(
             access_token=access_token,
             refresh_token=refresh_token,
         )
+
+    async def _record_failure(self, email: str, user: User | None, reason: str) -> None:
+        await self._event_recorder.record(
+            AuthEvent(
+                AuthEventType.LOGIN_FAILED,
+                email=normalize_email(email),
+                user_id=user.id if user else None,
+                reason=reason,
+            )
+        )
@@ -2,34 +2,59 @@
 
 from src.application.dto.requests.user_request import RegisterUserRequest
 from src.application.dto.responses.user_response import UserResponse
+from src.application.interfaces.auth_event_recorder import IAuthEventRecorder
+from src.application.interfaces.email_filter import IRegisteredEmailFilter
+from src.application.interfaces.job_queue import IJobQueue
+from src.application.use_cases.user.send_verification_email import SEND_VERIFICATION_EMAIL_JOB
 from src.core.security import hash_password
+from src.domain.entities.auth_event import AuthEvent, AuthEventType
 from src.domain.entities.user import Role, User
+from src.domain.events.user import UserRegistered
 from src.domain.exceptions.user import UserAlreadyExistsError
+from src.domain.repositories.outbox_repository import IOutboxRepository
 from src.domain.repositories.user_repository import IUserRepository
 
 
 class RegisterUser:
     """Use case for registering a new user."""
 
-    def __init__(self, user_repository: IUserRepository):
-        """Initialize with repository dependency."""
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        event_recorder: IAuthEventRecorder,
+        job_queue: IJobQueue,
+        outbox: IOutboxRepository,
+        email_filter: IRegisteredEmailFilter,
+    ):
+        """Initialize with repository, event recorder, job queue, outbox and email filter."""
         self.user_repository = user_repository
+        self.event_recorder = event_recorder
+        self.job_queue = job_queue
+        self.outbox = outbox
+        self.email_filter = email_filter
 
     async def execute(self, request: RegisterUserRequest) -> UserResponse:
         """
         Register a new user.
 
         Steps:
-        1. check if user already exists
+        1. check if user already exists (by email, or by phone if given);
+           emails the filter has never seen skip the database
         2. Hash the password
         3. Create domain entity
         4. Save via repository
-        5. Return DTO response
+        5. Enqueue the verification email and stage the UserRegistered event
+           (same transaction as the user)
+        6. Record the registration audit event
+        7. Return DTO response
         """
         # Check if email already exists
-        existing_user = await self.user_repository.get_by_email(request.email)
-        if existing_user:
+        maybe_registered = self.email_filter.might_be_registered(request.email)
+        if maybe_registered and await self.user_repository.get_by_email(request.email):
             raise UserAlreadyExistsError(f"User with email {request.email} already exists.")
+        # Phone numbers identify accounts for OTP login, so they are unique too
+        if request.phone and await self.user_repository.get_by_phone(request.phone):
+            raise UserAlreadyExistsError("User with this phone number already exists.")
 
         # Hash password
         hashed_password = hash_password(request.password)
@@ -44,8 +69,37 @@ class RegisterUser:
             is_active=True,
         )
 
-        # Persist to database
-        created_user = await self.user_repository.create(user)
+        # Persist to database; the unique email index catches a registration
+        # the filter has not seen yet
+        try:
+            created_user = await self.user_repository.create(user)
+        except ValueError:
+            raise UserAlreadyExistsError(
+                f"User with email {request.email} already exists."
+            ) from None
+        self.email_filter.add(created_user.email)
+
+        # Verification email is sent by a background worker once this commits
+        await self.job_queue.enqueue(
+            SEND_VERIFICATION_EMAIL_JOB,
+            {"user_id": str(created_user.id), "email": created_user.email},
+        )
+
+        # Published to other services by the outbox dispatcher once this commits
+        await self.outbox.add(
+            [
+                UserRegistered(
+                    aggregate_id=created_user.id,
+                    email=created_user.email,
+                    role=created_user.role.value,
+                )
+            ]
+        )
+
+        # Audit trail (buffered, written asynchronously)
+        await self.event_recorder.record(
+            AuthEvent(AuthEventType.REGISTERED, email=created_user.email, user_id=created_user.id)
+        )
 
         # Convert to response DTO
         return UserResponse.model_validate(created_user)
@@ -0,0 +1,58 @@
+"""Login code request use case."""
+
+from src.application.dto.requests.auth_request import RequestOtpRequest
+from src.application.dto.responses.auth_response import OtpSentResponse
+from src.application.interfaces.otp_store import IOtpStore, OtpPolicy
+from src.application.interfaces.sms_sender import ISmsSender
+from src.core.security import generate_otp, hash_otp
+from src.domain.exceptions.auth import OtpRateLimitedError
+from src.domain.repositories.user_repository import IUserRepository
+
+
+class RequestLoginOtp:
+    """Use case for texting a one-time login code to a registered phone number."""
+
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        otp_store: IOtpStore,
+        sms_sender: ISmsSender,
+        policy: OtpPolicy,
+    ) -> None:
+        self._user_repository = user_repository
+        self._otp_store = otp_store
+        self._sms_sender = sms_sender
+        self._policy = policy
+
+    async def execute(self, request: RequestOtpRequest) -> OtpSentResponse:
+        """
+        Send a login code.
+
+        Sends are counted per number before the user lookup, so repeated
+        requests cost no database work once the limit is hit. Unknown and
+        inactive numbers get the same response but no code, so the endpoint
+        does not reveal which numbers have accounts.
+        """
+        phone = request.phone
+        if await self._otp_store.count_send(phone, self._policy.send_window) > (
+            self._policy.max_sends
+        ):
+            raise OtpRateLimitedError()
+
+        response = OtpSentResponse(expires_in=self._policy.ttl)
+        user = await self._user_repository.get_by_phone(phone)
+        if not user or not user.can_login():
+            return response
+
+        code = generate_otp(self._policy.length)
+        await self._otp_store.save(
+            phone,
+            hash_otp(code, phone, self._policy.secret_key),
+            ttl=self._policy.ttl,
+            attempts=self._policy.max_attempts,
+        )
+        minutes = max(self._policy.ttl // 60, 1)
+        await self._sms_sender.send(
+            phone, f"{code} is your Dhakacart login code. It expires in {minutes} minutes."
+        )
+        return response
@@ -0,0 +1,30 @@
+"""Verification email use case, run as a background job."""
+
+from urllib.parse import urlencode
+from uuid import UUID
+
+from src.application.interfaces.email_sender import IEmailSender
+from src.application.interfaces.token_service import ITokenService
+
+# Job name used when enqueuing this work
+SEND_VERIFICATION_EMAIL_JOB = "send_verification_email"
+
+
+class SendVerificationEmail:
+    """Use case for emailing a user a link that verifies their address."""
+
+    def __init__(
+        self, token_service: ITokenService, email_sender: IEmailSender, verification_url: str
+    ) -> None:
+        self._token_service = token_service
+        self._email_sender = email_sender
+        self._verification_url = verification_url
+
+    async def execute(self, user_id: UUID, email: str) -> None:
+        token = self._token_service.create_email_verification_token(user_id, email)
+        link = f"{self._verification_url}?{urlencode({'token': token})}"
+        await self._email_sender.send(
+            to=email,
+            subject="Verify your Dhakacart email",
+            body=f"Confirm your email address by opening this link:\n\n{link}\n",
+        )
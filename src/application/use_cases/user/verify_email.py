@@ -0,0 +1,42 @@
+"""Email verification use case."""
+
+from datetime import UTC, datetime
+from uuid import UUID
+
+from src.application.dto.requests.auth_request import VerifyEmailRequest
+from src.application.dto.responses.user_response import UserResponse
+from src.application.interfaces.token_service import ITokenService
+from src.domain.events.user import UserVerified
+from src.domain.exceptions.auth import TokenError
+from src.domain.repositories.outbox_repository import IOutboxRepository
+from src.domain.repositories.user_repository import IUserRepository
+
+
+class VerifyEmail:
+    """Use case for marking a user's email as verified from an emailed token."""
+
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        token_service: ITokenService,
+        outbox: IOutboxRepository,
+    ) -> None:
+        self._user_repository = user_repository
+        self._token_service = token_service
+        self._outbox = outbox
+
+    async def execute(self, request: VerifyEmailRequest) -> UserResponse:
+        payload = self._token_service.verify_email_verification_token(request.token)
+
+        user = await self._user_repository.get_by_id(UUID(payload["sub"]))
+        # A token issued for an address the user no longer has proves nothing
+        if not user or user.email != payload.get("email"):
+            raise TokenError("Invalid verification token")
+
+        if not user.is_verified:
+            user.is_verified = True
+            user.updated_at = datetime.now(UTC)
+            user = await self._user_repository.update(user)
+            await self._outbox.add([UserVerified(aggregate_id=user.id, email=user.email)])
+
+        return UserResponse.model_validate(user)
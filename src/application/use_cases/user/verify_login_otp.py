@@ -0,0 +1,62 @@
+"""Login code verification use case."""
+
+from src.application.dto.requests.auth_request import VerifyOtpRequest
+from src.application.dto.responses.auth_response import TokenResponse
+from src.application.interfaces.auth_event_recorder import IAuthEventRecorder
+from src.application.interfaces.otp_store import IOtpStore, OtpCheck, OtpPolicy
+from src.application.interfaces.token_service import ITokenService
+from src.core.security import hash_otp
+from src.domain.entities.auth_event import AuthEvent, AuthEventType
+from src.domain.exceptions.auth import InvalidCredentialError
+from src.domain.repositories.user_repository import IUserRepository
+
+
+class VerifyLoginOtp:
+    """Use case for exchanging a texted login code for tokens."""
+
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        otp_store: IOtpStore,
+        token_service: ITokenService,
+        event_recorder: IAuthEventRecorder,
+        policy: OtpPolicy,
+    ) -> None:
+        self._user_repository = user_repository
+        self._otp_store = otp_store
+        self._token_service = token_service
+        self._event_recorder = event_recorder
+        self._policy = policy
+
+    async def execute(self, request: VerifyOtpRequest) -> TokenResponse:
+        # The store is checked first, so guesses for numbers with no pending
+        # code cost no database work
+        result = await self._otp_store.check(
+            request.phone, hash_otp(request.code, request.phone, self._policy.secret_key)
+        )
+        if result is not OtpCheck.VALID:
+            if result is not OtpCheck.MISSING:
+                await self._record_failure(request.phone, f"otp_{result.value}")
+            raise InvalidCredentialError("Invalid or expired code")
+
+        user = await self._user_repository.get_by_phone(request.phone)
+        if not user or not user.can_login():
+            raise InvalidCredentialError("Invalid or expired code")
+
+        access_token = self._token_service.create_access_token(user.id, user.role)
+        refresh_token = self._token_service.create_refresh_token(user.id)
+
+        await self._event_recorder.record(
+            AuthEvent(AuthEventType.LOGIN_SUCCEEDED, email=user.email, user_id=user.id)
+        )
+
+        return TokenResponse(access_token=access_token, refresh_token=refresh_token)
+
+    async def _record_failure(self, phone: str, reason: str) -> None:
+        user = await self._user_repository.get_by_phone(phone)
+        if user:
+            await self._event_recorder.record(
+                AuthEvent(
+                    AuthEventType.LOGIN_FAILED, email=user.email, user_id=user.id, reason=reason
+                )
+            )
@@ -0,0 +1 @@
+"""Operational command-line tools (seeding, benchmarks)."""
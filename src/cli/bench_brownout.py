@@ -0,0 +1,237 @@
+"""
+Measure API latency through a database brownout, with and without the circuit breaker.
+
+Usage: python -m src.cli.bench_brownout --rate 150 --delay 3.0
+
+The app is called in process and reaches Postgres through a TCP proxy
+started by the bench. Requests for the signed-in profile, product pages
+and the first catalog page start at a steady `--rate`, however long earlier
+ones take, as they would from real clients. After a healthy phase the proxy
+holds back every reply from the database by `--delay` seconds (a
+brownout), then lets them through again. The whole run happens twice: with
+DB_BREAKER_ENABLED off and on. For each phase it reports latency
+percentiles and how requests ended; for the breaker run also when the
+breaker changed state and how many reads were served stale. Needs active
+products; run `python -m src.cli.seed_catalog` first on an empty database.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+from collections import Counter as Tally
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from sqlalchemy import text
+
+from src.cli.bench_conditional import Client, log_in
+from src.core.config import get_settings
+from src.infrastructure.cache.stale_cache import stale_reads_total
+from src.infrastructure.database import get_session_maker
+from src.infrastructure.database.circuit_breaker import BREAKERS
+from src.infrastructure.repositories.sharded_user_repository import UserRepositoryFactory
+from src.main import create_app
+
+SELECT_PRODUCTS = text("SELECT id FROM products WHERE is_active ORDER BY id DESC LIMIT :limit")
+
+
+class BrownoutProxy:
+    """TCP proxy in front of Postgres that can delay everything the server sends."""
+
+    def __init__(self, host: str, port: int) -> None:
+        self._host = host
+        self._port = port
+        self.delay = 0.0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> int:
+        """Start listening on a free local port and return it."""
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port: int = self._server.sockets[0].getsockname()[1]
+        return port
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+
+    async def _handle(self, client: asyncio.StreamReader, to_client: asyncio.StreamWriter) -> None:
+        try:
+            server, to_server = await asyncio.open_connection(self._host, self._port)
+        except OSError:
+            to_client.close()
+            return
+        await asyncio.gather(
+            self._pipe(client, to_server, delayed=False),
+            self._pipe(server, to_client, delayed=True),
+            return_exceptions=True,
+        )
+
+    async def _pipe(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, delayed: bool
+    ) -> None:
+        try:
+            while data := await reader.read(65_536):
+                if delayed and self.delay:
+                    await asyncio.sleep(self.delay)
+                writer.write(data)
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+@dataclass
+class Phase:
+    """Outcomes of the requests started during one phase."""
+
+    name: str
+    latencies: list[float] = field(default_factory=list)
+    statuses: Tally[int] = field(default_factory=Tally)
+
+
+async def request(client: Client, path: str, headers: dict[str, str], current: list[Phase]) -> None:
+    phase = current[0]
+    started = time.perf_counter()
+    status, _, _ = await client.request("GET", path, headers)
+    if phase.name == "healthy":
+        # Caught by the brownout if it ended after that began
+        phase = current[0]
+    phase.latencies.append(time.perf_counter() - started)
+    phase.statuses[status] += 1
+
+
+async def generate_load(
+    client: Client,
+    paths: list[str],
+    token: str,
+    rate: float,
+    current: list[Phase],
+    stop: asyncio.Event,
+) -> None:
+    """Start `rate` requests a second, whether or not earlier ones have finished."""
+    headers = {"authorization": f"Bearer {token}"}
+    rng = random.Random(11)
+    running: set[asyncio.Task[None]] = set()
+    next_at = time.perf_counter()
+    while not stop.is_set():
+        task = asyncio.create_task(request(client, rng.choice(paths), headers, current))
+        running.add(task)
+        task.add_done_callback(running.discard)
+        next_at += 1 / rate
+        await asyncio.sleep(max(next_at - time.perf_counter(), 0))
+    await asyncio.gather(*running)
+
+
+async def watch_breaker(started: float, stop: asyncio.Event, timeline: list[str]) -> None:
+    """Note every state change of the primary breaker, with its time into the run."""
+    last = None
+    while not stop.is_set():
+        breaker = BREAKERS.get("primary")
+        state = breaker.state.value if breaker else None
+        if state != last:
+            timeline.append(f"{time.perf_counter() - started:5.1f}s {state}")
+            last = state
+        await asyncio.sleep(0.05)
+
+
+async def run_pass(
+    proxy: BrownoutProxy, breaker: bool, rate: float, delay: float, durations: list[float]
+) -> tuple[list[Phase], list[str], float]:
+    os.environ["DB_BREAKER_ENABLED"] = str(breaker).lower()
+    get_settings.cache_clear()
+    prefix = get_settings().api_prefix
+    app = create_app()
+    stale_before = sum(stale_reads_total.value(cache=name) for name in ("users", "products"))
+    async with app.router.lifespan_context(app):
+        client = Client(app)
+        async with get_session_maker()() as session:
+            products = list((await session.execute(SELECT_PRODUCTS, {"limit": 200})).scalars())
+        if not products:
+            raise SystemExit("No active products; seed the catalog first")
+        user_id, token = await log_in(client, prefix)
+        paths = [f"{prefix}/users/me"] * 10 + [f"{prefix}/products?limit=20"] * 5
+        paths += [f"{prefix}/products/{product_id}" for product_id in products[:20]]
+
+        phases = [Phase("healthy"), Phase("brownout"), Phase("recovered")]
+        current = [phases[0]]
+        stop = asyncio.Event()
+        timeline: list[str] = []
+        started = time.perf_counter()
+        tasks = [
+            asyncio.create_task(generate_load(client, paths, token, rate, current, stop)),
+            asyncio.create_task(watch_breaker(started, stop, timeline)),
+        ]
+        try:
+            for index, duration in enumerate(durations):
+                current[0] = phases[index]
+                proxy.delay = delay if phases[index].name == "brownout" else 0.0
+                timeline.append(f"{time.perf_counter() - started:5.1f}s -> {phases[index].name}")
+                await asyncio.sleep(duration)
+            stop.set()
+            await asyncio.gather(*tasks)
+        finally:
+            proxy.delay = 0.0
+            await _delete_user(app.state.user_repository_factory, user_id)
+    stale = sum(stale_reads_total.value(cache=name) for name in ("users", "products"))
+    return phases, timeline, stale - stale_before
+
+
+async def _delete_user(repository_factory: UserRepositoryFactory, user_id: UUID) -> None:
+    async with get_session_maker()() as session:
+        await repository_factory(session).delete(user_id)
+        await session.commit()
+
+
+def report(phase: Phase) -> None:
+    latencies = sorted(phase.latencies)
+    total = len(latencies)
+    statuses = ", ".join(
+        f"{status}: {count / total:.0%}" for status, count in sorted(phase.statuses.items())
+    )
+    p50 = statistics.median(latencies) * 1000
+    p99 = statistics.quantiles(latencies, n=100)[98] * 1000
+    print(
+        f"  {phase.name:<10} {total:>6} requests  p50 {p50:>7.1f} ms  p99 {p99:>7.1f} ms"
+        f"  max {latencies[-1] * 1000:>7.1f} ms  ({statuses})"
+    )
+
+
+async def bench(
+    rate: float, delay: float, healthy: float, brownout: float, recovered: float
+) -> None:
+    settings = get_settings()
+    proxy = BrownoutProxy(settings.database.host, settings.database.port)
+    os.environ["DB_HOST"] = "127.0.0.1"
+    os.environ["DB_PORT"] = str(await proxy.start())
+    try:
+        for breaker in (False, True):
+            phases, timeline, stale = await run_pass(
+                proxy, breaker, rate, delay, [healthy, brownout, recovered]
+            )
+            state = "on" if breaker else "off"
+            print(f"breaker {state}: {rate:.0f} requests/s, {delay:.1f}s reply delay")
+            for phase in phases:
+                report(phase)
+            if breaker:
+                print(f"  stale reads served: {stale:.0f}")
+                print("  timeline: " + "; ".join(timeline))
+    finally:
+        await proxy.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark a database brownout.")
+    parser.add_argument("--rate", type=float, default=150.0, help="Requests started per second")
+    parser.add_argument("--delay", type=float, default=3.0, help="Seconds each reply is held back")
+    parser.add_argument("--healthy", type=float, default=5.0, help="Seconds before the brownout")
+    parser.add_argument("--brownout", type=float, default=20.0)
+    parser.add_argument("--recovered", type=float, default=15.0)
+    args = parser.parse_args()
+    asyncio.run(bench(args.rate, args.delay, args.healthy, args.brownout, args.recovered))
+
+
+if __name__ == "__main__":
+    main()
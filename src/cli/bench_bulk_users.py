@@ -0,0 +1,203 @@
+"""
+Compare set-based bulk user updates with updating users one at a time.
+
+Usage: python -m src.cli.bench_bulk_users --users 200000 --chunk-sizes 1000,10000,0
+
+Seeds throwaway customers created over the past year, then:
+
+- deactivates `--sample` of them one by one through the repository's
+  update(), as a loop over users would, and reports users per second;
+- deactivates those older than a week through POST /users/bulk/deactivate, called in
+  process, once per chunk size (0 is a single UPDATE for everyone), after a
+  dry run. Meanwhile another session keeps updating one of the selected
+  users, and the longest time it waited on row locks is reported.
+
+Published events are counted with the in-memory event sink. The seeded
+users are deleted afterwards.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, select, text
+
+from src.cli.bench_conditional import Client, log_in
+from src.cli.bench_user_export import DAYS, SEED_USERS, delete_user, promote_to_admin
+from src.core.config import get_settings
+from src.infrastructure.database import dispose_engine, get_session_maker
+from src.infrastructure.orm.user_model import UserModel
+from src.infrastructure.repositories.sharded_user_repository import UserRepositoryFactory
+from src.main import create_app
+from src.presentation.api.wiring import build_container
+
+BENCH_EMAIL = "bulk-bench-%s@example.com"
+SEEDED = UserModel.email.like("bulk-bench-%@example.com")
+REACTIVATE_SEEDED = text(
+    "UPDATE users SET is_active = true WHERE email LIKE 'bulk-bench-%@example.com'"
+)
+DELETE_SEEDED = text("DELETE FROM users WHERE email LIKE 'bulk-bench-%@example.com'")
+PROBE = text("UPDATE users SET full_name = full_name WHERE id = :user_id")
+
+
+async def per_user_pass(repository_factory: UserRepositoryFactory, sample: int) -> float:
+    """Users per second deactivated one at a time with get_by_id and update."""
+    async with get_session_maker()() as session:
+        stmt = select(UserModel.id).where(SEEDED, UserModel.is_active).limit(sample)
+        user_ids = list((await session.execute(stmt)).scalars())
+        repository = repository_factory(session)
+        started = time.perf_counter()
+        for user_id in user_ids:
+            user = await repository.get_by_id(user_id)
+            assert user is not None
+            await repository.update(replace(user, is_active=False, updated_at=datetime.now(UTC)))
+        await session.commit()
+        return len(user_ids) / (time.perf_counter() - started)
+
+
+async def probe(user_id: UUID, stop: asyncio.Event) -> list[float]:
+    """Keep updating one user until stopped; seconds each update took."""
+    waits = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        async with get_session_maker()() as session, session.begin():
+            await session.execute(PROBE, {"user_id": user_id})
+        waits.append(time.perf_counter() - started)
+        await asyncio.sleep(0.001)
+    return waits
+
+
+async def published(events: list[Any], expected: int, timeout: float = 60.0) -> int:
+    """Wait for the outbox dispatcher to publish `expected` events; how many it did."""
+    deadline = time.monotonic() + timeout
+    while len(events) < expected and time.monotonic() < deadline:
+        await asyncio.sleep(0.1)
+    return len(events)
+
+
+async def deactivate(
+    client: Client, token: str, user_filter: dict[str, Any], dry_run: bool
+) -> dict[str, Any]:
+    status, _, body = await client.request(
+        "POST",
+        f"{get_settings().api_prefix}/users/bulk/deactivate",
+        {"authorization": f"Bearer {token}", "content-type": "application/json"},
+        json.dumps({"filter": user_filter, "dry_run": dry_run}).encode(),
+    )
+    if status != 200:
+        raise SystemExit(f"Bulk deactivation answered {status}: {body!r}")
+    result: dict[str, Any] = json.loads(body)
+    return result
+
+
+async def bench(users: int, sample: int, chunk_sizes: list[int]) -> None:
+    started = time.perf_counter()
+    async with get_session_maker()() as session, session.begin():
+        await session.execute(
+            SEED_USERS, {"email_format": BENCH_EMAIL, "users": users, "days": DAYS}
+        )
+    async with get_session_maker()() as session:
+        await session.execute(text("ANALYZE users"))
+    print(f"seeded {users} users in {time.perf_counter() - started:.1f}s")
+
+    now = datetime.now(UTC)
+    # Seeded users older than a week, leaving out anyone who just signed up
+    user_filter = {
+        "role": "CUSTOMER",
+        "created_from": (now - timedelta(days=DAYS + 2)).isoformat(),
+        "created_to": (now - timedelta(days=7)).isoformat(),
+    }
+    async with get_session_maker()() as session:
+        selected = (
+            await session.execute(
+                select(func.count()).where(SEEDED, UserModel.created_at < now - timedelta(days=7))
+            )
+        ).scalar_one()
+        probe_id = (
+            await session.execute(
+                select(UserModel.id).where(SEEDED).order_by(UserModel.created_at).limit(1)
+            )
+        ).scalar_one()
+    app = create_app()
+    try:
+        async with app.router.lifespan_context(app):
+            client = Client(app)
+            admin_id, token = await log_in(client, get_settings().api_prefix)
+            repository_factory: UserRepositoryFactory = app.state.user_repository_factory
+            try:
+                await promote_to_admin(repository_factory, admin_id)
+                matched = (await deactivate(client, token, user_filter, dry_run=True))["matched"]
+                if matched != selected:
+                    raise SystemExit(
+                        f"{matched - selected} customers besides the seeded ones match; "
+                        "run on a database without older customers"
+                    )
+                rate = await per_user_pass(repository_factory, sample)
+                print(
+                    f"one at a time: {rate:.0f} users/s, "
+                    f"{selected / rate:.0f}s for {selected} users"
+                )
+                async with get_session_maker()() as session, session.begin():
+                    await session.execute(REACTIVATE_SEEDED)
+
+                print(
+                    f"{'chunk':>8} {'matched':>8} {'updated':>8} {'s':>7} {'users/s':>8} "
+                    f"{'events':>8} {'probe p50 ms':>13} {'probe max ms':>13}"
+                )
+                for chunk_size in chunk_sizes:
+                    os.environ["USER_BULK_CHUNK_SIZE"] = str(chunk_size or users)
+                    get_settings.cache_clear()
+                    app.state.container = build_container(app.state)
+                    app.state.event_sink.events.clear()
+
+                    dry_run = await deactivate(client, token, user_filter, dry_run=True)
+                    stop = asyncio.Event()
+                    prober = asyncio.create_task(probe(probe_id, stop))
+                    started = time.perf_counter()
+                    result = await deactivate(client, token, user_filter, dry_run=False)
+                    elapsed = time.perf_counter() - started
+                    stop.set()
+                    waits = await prober
+                    events = await published(app.state.event_sink.events, result["updated"])
+                    print(
+                        f"{chunk_size or 'all':>8} {dry_run['matched']:>8} "
+                        f"{result['updated']:>8} {elapsed:>7.1f} "
+                        f"{result['updated'] / elapsed:>8.0f} "
+                        f"{events:>8} "
+                        f"{statistics.median(waits) * 1000:>13.1f} {max(waits) * 1000:>13.1f}"
+                    )
+                    async with get_session_maker()() as session, session.begin():
+                        await session.execute(REACTIVATE_SEEDED)
+            finally:
+                await delete_user(repository_factory, admin_id)
+    finally:
+        async with get_session_maker()() as session, session.begin():
+            await session.execute(DELETE_SEEDED)
+        await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark bulk user updates.")
+    parser.add_argument("--users", type=int, default=200_000, help="Users to seed")
+    parser.add_argument("--sample", type=int, default=2000, help="Users updated one at a time")
+    parser.add_argument(
+        "--chunk-sizes",
+        default="1000,10000,0",
+        help="Comma-separated USER_BULK_CHUNK_SIZE values; 0 updates everyone at once",
+    )
+    args = parser.parse_args()
+    # Keeps the events of hundreds of thousands of users out of the log
+    os.environ["EVENT_SINK"] = "memory"
+    chunk_sizes = [int(size) for size in args.chunk_sizes.split(",")]
+    asyncio.run(bench(args.users, args.sample, chunk_sizes))
+
+
+if __name__ == "__main__":
+    main()
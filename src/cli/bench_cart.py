@@ -0,0 +1,150 @@
+"""
+Measure cart operation throughput with write-behind persistence running.
+
+Usage: python -m src.cli.bench_cart --operations 50000 --users 1000
+
+Creates throwaway users, runs a mix of add-to-cart (which reads the product)
+and quantity changes through the cart use cases against the configured cart
+store, then reports operations per second and how many database writes the
+flusher needed. Needs active products; run `python -m src.cli.seed_catalog`
+first on an empty database.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from uuid import UUID
+
+from sqlalchemy import text
+
+from src.application.dto.requests.cart_request import AddCartItemRequest, UpdateCartItemRequest
+from src.application.interfaces.cart_store import ICartStore
+from src.application.use_cases.cart.add_cart_item import AddCartItem
+from src.application.use_cases.cart.update_cart_item import UpdateCartItem
+from src.core.config import get_settings
+from src.infrastructure.cache.cart_flusher import CartFlusher, carts_flushed_total
+from src.infrastructure.cache.memory_cart_store import InMemoryCartStore
+from src.infrastructure.database import dispose_engine, get_session_maker
+from src.infrastructure.repositories.sqlalchemy.cart_repository_impl import (
+    SQLAlchemyCartRepository,
+)
+from src.infrastructure.repositories.sqlalchemy.product_repository_impl import (
+    SQLAlchemyProductRepository,
+)
+
+BENCH_EMAIL = "cart-bench-{}@example.com"
+
+INSERT_USERS = text(
+    """
+    WITH created AS (
+        INSERT INTO users (id, email, hashed_password, full_name, role, is_active, is_verified)
+        SELECT gen_random_uuid(), format(:email_format, n), '!', 'Cart Bench', 'CUSTOMER',
+               true, true
+        FROM generate_series(1, :users) AS n
+        ON CONFLICT DO NOTHING
+        RETURNING id, email, created_at
+    )
+    INSERT INTO user_directory (user_id, email, created_at, updated_at)
+    SELECT id, email, created_at, created_at FROM created
+    """
+)
+SELECT_USERS = text("SELECT id FROM users WHERE email LIKE 'cart-bench-%@example.com'")
+DELETE_USERS = text(
+    """
+    WITH removed AS (
+        DELETE FROM users WHERE email LIKE 'cart-bench-%@example.com' RETURNING id
+    )
+    DELETE FROM user_directory WHERE user_id IN (SELECT id FROM removed)
+    """
+)
+SELECT_PRODUCTS = text("SELECT id FROM products WHERE is_active ORDER BY id DESC LIMIT :limit")
+
+
+async def bench(operations: int, users: int, concurrency: int) -> None:
+    """Run `operations` cart changes from `concurrency` workers and report throughput."""
+    settings = get_settings()
+    session_maker = get_session_maker()
+    async with session_maker() as session, session.begin():
+        await session.execute(
+            INSERT_USERS, {"email_format": BENCH_EMAIL.replace("{}", "%s"), "users": users}
+        )
+        user_ids = list((await session.execute(SELECT_USERS)).scalars())
+        product_ids = list((await session.execute(SELECT_PRODUCTS, {"limit": 500})).scalars())
+    if not product_ids:
+        raise SystemExit("No active products; seed the catalog first")
+
+    store: ICartStore
+    if settings.cart_backend == "redis":
+        from src.infrastructure.cache.redis_cart_store import RedisCartStore
+
+        store = RedisCartStore(settings.redis_url, ttl=settings.cart_ttl)
+    else:
+        store = InMemoryCartStore(max_entries=settings.cart_max_entries)
+    flusher = CartFlusher(
+        store,
+        session_maker,
+        flush_interval=settings.cart_flush_interval,
+        batch_size=settings.cart_flush_batch_size,
+    )
+    await flusher.start()
+    flushed_before = carts_flushed_total.value()
+
+    rng = random.Random(37)
+    remaining = iter(range(operations))
+    latencies: list[float] = []
+    in_cart: dict[UUID, list[UUID]] = {user_id: [] for user_id in user_ids}
+
+    async def worker() -> None:
+        for _ in remaining:
+            user_id = rng.choice(user_ids)
+            lines = in_cart[user_id]
+            started = time.perf_counter()
+            async with session_maker() as session:
+                cart_repository = SQLAlchemyCartRepository(session)
+                if not lines or (len(lines) < 20 and rng.random() < 0.25):
+                    product_id = rng.choice(product_ids)
+                    await AddCartItem(
+                        store, cart_repository, SQLAlchemyProductRepository(session)
+                    ).execute(user_id, AddCartItemRequest(product_id=product_id, quantity=1))
+                    if product_id not in lines:
+                        lines.append(product_id)
+                else:
+                    await UpdateCartItem(store, cart_repository).execute(
+                        user_id,
+                        rng.choice(lines),
+                        UpdateCartItemRequest(quantity=rng.randint(1, 10)),
+                    )
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    await flusher.stop()
+    flushed = carts_flushed_total.value() - flushed_before
+
+    async with session_maker() as session, session.begin():
+        await session.execute(DELETE_USERS)
+    await dispose_engine()
+
+    latencies.sort()
+    print(f"backend={settings.cart_backend} operations={operations} users={len(user_ids)}")
+    print(f"throughput={operations / elapsed:.0f} ops/s mean={statistics.fmean(latencies):.2f}ms")
+    p50, p99 = latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+    print(f"p50={p50:.2f}ms p99={p99:.2f}ms")
+    coalesced = operations / max(flushed, 1)
+    print(f"cart rows written={flushed:.0f} ({coalesced:.1f} changes per write)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure cart operation throughput.")
+    parser.add_argument("--operations", type=int, default=50_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(bench(args.operations, args.users, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
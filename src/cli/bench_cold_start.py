@@ -0,0 +1,116 @@
+"""
+Measure how long a fresh API process takes to serve its first responses.
+
+Usage: python -m src.cli.bench_cold_start --runs 10
+
+Each run starts a new interpreter that imports src.main, builds the app
+with create_app(), runs its lifespan startup (background services, caches
+loaded from the database) and then sends its first requests in process:
+GET /health, which needs nothing from the database, and the first product
+page, which does. The parent times the run from spawning the interpreter
+to the first product page, so interpreter start-up is included. Reported
+are the median and slowest time of each phase over `--runs` runs, and the
+child's lifespan shutdown.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+PHASES = ("import", "create_app", "startup", "first health", "first products", "shutdown")
+# Markers on the child's stdout, which also carries the app's log lines
+READY = "cold-start: first response"
+PHASES_PREFIX = "cold-start: phases "
+
+
+async def child() -> None:
+    """One cold start, run in the spawned interpreter; prints phase seconds as JSON."""
+    times: dict[str, float] = {}
+    started = time.perf_counter()
+    from src.main import create_app
+
+    times["import"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    app = create_app()
+    times["create_app"] = time.perf_counter() - started
+
+    from src.cli.bench_conditional import Client
+    from src.core.config import get_settings
+
+    started = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        times["startup"] = time.perf_counter() - started
+        client = Client(app)
+        for phase, path in (
+            ("first health", "/health"),
+            ("first products", f"{get_settings().api_prefix}/products?limit=20"),
+        ):
+            started = time.perf_counter()
+            status, _, body = await client.request("GET", path, {})
+            if status != 200:
+                raise SystemExit(f"GET {path} answered {status}: {body!r}")
+            times[phase] = time.perf_counter() - started
+        print(READY, flush=True)
+        started = time.perf_counter()
+    times["shutdown"] = time.perf_counter() - started
+    print(PHASES_PREFIX + json.dumps(times), flush=True)
+
+
+def run_once() -> tuple[float, dict[str, float]]:
+    """Spawn one cold start; seconds to its first product page, and its phases."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.cli.bench_cold_start", "--child"],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert process.stdout is not None
+    to_first_response = 0.0
+    phases: dict[str, float] = {}
+    for line in process.stdout:
+        if line.strip() == READY:
+            to_first_response = time.perf_counter() - started
+        elif line.startswith(PHASES_PREFIX):
+            phases = json.loads(line.removeprefix(PHASES_PREFIX))
+    if process.wait() != 0 or not phases:
+        raise SystemExit(f"Cold start exited with {process.returncode}")
+    return to_first_response, phases
+
+
+def bench(runs: int) -> None:
+    totals: list[float] = []
+    phases: dict[str, list[float]] = {phase: [] for phase in PHASES}
+    # The first run may compile bytecode; it is not counted
+    run_once()
+    for _ in range(runs):
+        total, times = run_once()
+        totals.append(total)
+        for phase in PHASES:
+            phases[phase].append(times[phase])
+
+    print(f"runs={runs}")
+    print(f"{'phase':<24} {'median ms':>10} {'max ms':>10}")
+    for phase, seconds in [*phases.items(), ("spawn to first products", totals)]:
+        print(
+            f"{phase:<24} {statistics.median(seconds) * 1000:>10.1f} {max(seconds) * 1000:>10.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time cold starts to the first response.")
+    parser.add_argument("--runs", type=int, default=10, help="Cold starts measured")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        asyncio.run(child())
+    else:
+        bench(args.runs)
+
+
+if __name__ == "__main__":
+    main()
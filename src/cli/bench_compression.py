@@ -0,0 +1,246 @@
+"""
+Measure response compression per encoding on representative payloads.
+
+Usage: python -m src.cli.bench_compression --runs 200
+
+Payloads are real API responses (a page of 100 products, a search page and
+the category tree) plus up to 4 MiB of products as NDJSON sent in 64 KiB
+chunks, like an export. Each is sent through CompressionMiddleware once per
+encoding the interpreter offers, and the bench reports the compressed size,
+latency and CPU time per response, checking that every body decompresses
+back to the original. For the stream it also reports the longest event loop
+stall with compression on and off the loop. Needs active products; run
+`python -m src.cli.seed_catalog` first on an empty database.
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import statistics
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import get_settings
+from src.main import create_app
+from src.presentation.middleware.compression import CompressionMiddleware, available_encoders
+
+STREAM_CHUNK = 65_536
+
+
+def decompress(encoding: str, body: bytes) -> bytes:
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "br":
+        import brotli
+
+        return bytes(brotli.decompress(body))
+    if encoding == "zstd":
+        from compression.zstd import decompress as zstd_decompress
+
+        return zstd_decompress(body)
+    return body
+
+
+def payload_app(body: bytes, chunk: int | None) -> ASGIApp:
+    """ASGI app answering every request with `body`, in chunks if `chunk` is set."""
+
+    async def app(_scope: Scope, _receive: Receive, send: Send) -> None:
+        content_type = b"application/x-ndjson" if chunk else b"application/json"
+        headers = [(b"content-type", content_type)]
+        if chunk is None:
+            headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        if chunk is None:
+            await send({"type": "http.response.body", "body": body})
+            return
+        for start in range(0, len(body), chunk):
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": body[start : start + chunk],
+                    "more_body": start + chunk < len(body),
+                }
+            )
+
+    return app
+
+
+async def call(app: ASGIApp, encoding: str) -> tuple[dict[bytes, bytes], bytes]:
+    """One GET through `app`; returns the response headers and body."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", encoding.encode())],
+    }
+    headers: dict[bytes, bytes] = {}
+    chunks: list[bytes] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers.update(message["headers"])
+        else:
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return headers, b"".join(chunks)
+
+
+async def fetch_payloads(stream_size: int) -> dict[str, bytes]:
+    """Real responses from the app, uncompressed."""
+    prefix = get_settings().api_prefix
+    app = create_app()
+
+    async def get(path: str, query: str) -> bytes:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "headers": [(b"host", b"bench")],
+            "client": ("127.0.0.1", 0),
+            "server": ("bench", 80),
+        }
+        chunks: list[bytes] = []
+
+        async def receive() -> Message:
+            # The client stays connected until the response is complete
+            await asyncio.Event().wait()
+            raise AssertionError
+
+        async def send(message: Message) -> None:
+            if message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await app(scope, receive, send)
+        return b"".join(chunks)
+
+    async with app.router.lifespan_context(app):
+        payloads = {
+            "product page (100)": await get(f"{prefix}/products", "limit=100"),
+            "search page (50)": await get(f"{prefix}/products/search", "q=rice&limit=50"),
+            "category tree": await get(f"{prefix}/categories", ""),
+        }
+        # Distinct products, newest first, as an export would send them
+        lines: list[bytes] = []
+        size = 0
+        cursor = None
+        while size < stream_size:
+            query = f"limit=100&cursor={cursor}" if cursor else "limit=100"
+            page = json.loads(await get(f"{prefix}/products", query))
+            for item in page["items"]:
+                lines.append(json.dumps(item).encode() + b"\n")
+                size += len(lines[-1])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+    if not lines:
+        raise SystemExit("No active products; seed the catalog first")
+    payloads["NDJSON stream"] = b"".join(lines)
+    return payloads
+
+
+def compressing_app(payload: bytes, chunk: int | None, offload_size: int) -> ASGIApp:
+    settings = get_settings()
+    return CompressionMiddleware(
+        payload_app(payload, chunk),
+        encoders=available_encoders(
+            gzip_level=settings.compression_gzip_level,
+            brotli_quality=settings.compression_brotli_quality,
+            zstd_level=settings.compression_zstd_level,
+        ),
+        minimum_size=settings.compression_minimum_size,
+        offload_size=offload_size,
+    )
+
+
+async def measure(
+    payload: bytes, chunk: int | None, encoding: str, runs: int, offload_size: int
+) -> tuple[int, list[float], float]:
+    """Compressed size, latencies (ms) and CPU seconds per response."""
+    app = compressing_app(payload, chunk, offload_size)
+    headers, body = await call(app, encoding)
+    if decompress(headers.get(b"content-encoding", b"identity").decode(), body) != payload:
+        raise SystemExit(f"{encoding} round trip failed")
+
+    latencies = []
+    cpu_started = time.process_time()
+    for _ in range(runs):
+        started = time.perf_counter()
+        await call(app, encoding)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return len(body), latencies, (time.process_time() - cpu_started) / runs
+
+
+async def loop_stall(payload: bytes, encoding: str, offload_size: int) -> float:
+    """Longest gap (ms) a 1 ms ticker sees while responses of `payload` compress."""
+    app = compressing_app(payload, None, offload_size)
+    gaps = [0.0]
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            gaps.append((now - last) * 1000)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    for _ in range(10):
+        await asyncio.sleep(0.005)
+        await call(app, encoding)
+    done.set()
+    await task
+    return max(gaps)
+
+
+async def bench(runs: int) -> None:
+    payloads = await fetch_payloads(4 * 2**20)
+    offload_size = get_settings().compression_offload_size
+    encodings = ["identity", *available_encoders()]
+    print(
+        f"{'payload':<20} {'encoding':<9} {'bytes':>10} {'ratio':>7} {'p50 ms':>8} "
+        f"{'p99 ms':>8} {'CPU us':>8}"
+    )
+    for name, payload in payloads.items():
+        streamed = name == "NDJSON stream"
+        chunk = STREAM_CHUNK if streamed else None
+        count = max(runs // 20, 5) if streamed else runs
+        for encoding in encodings:
+            size, latencies, cpu = await measure(payload, chunk, encoding, count, offload_size)
+            print(
+                f"{name:<20} {encoding:<9} {size:>10} {size / len(payload):>7.1%} "
+                f"{statistics.median(latencies):>8.3f} "
+                f"{statistics.quantiles(latencies, n=100)[98]:>8.3f} {cpu * 1e6:>8.0f}"
+            )
+
+    # The whole stream in one message, the case offloading is for
+    stream = payloads["NDJSON stream"]
+    for encoding in encodings[1:]:
+        on_loop = await loop_stall(stream, encoding, offload_size=len(stream) + 1)
+        off_loop = await loop_stall(stream, encoding, offload_size=offload_size)
+        print(
+            f"{len(stream) / 2**20:.1f} MiB body, {encoding:<5} longest event loop stall: "
+            f"{on_loop:.1f} ms on the loop, {off_loop:.1f} ms offloaded"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark response compression.")
+    parser.add_argument("--runs", type=int, default=200, help="Responses per payload and encoding")
+    args = parser.parse_args()
+    asyncio.run(bench(args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Measure what conditional GETs save on a polling workload.
+
+Usage: python -m src.cli.bench_conditional --clients 200 --rounds 10 --change-rate 0.02
+
+Each simulated client polls its profile, the category tree, the first
+product page and a handful of products it watches, once per round. Between
+rounds a share of the watched products change. The same request sequence
+runs twice through the app, called in process without a server: once as
+clients that never revalidate, once as clients that send back the last ETag
+in If-None-Match. For each it reports response body bytes and the API
+process's CPU time per request. Needs active products; run
+`python -m src.cli.seed_catalog` first on an empty database.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import text
+from starlette.types import ASGIApp, Message
+
+from src.core.config import get_settings
+from src.infrastructure.database import get_session_maker
+from src.main import create_app
+
+BENCH_EMAIL = "etag-bench-{}@example.com"
+BENCH_PASSWORD = "EtagBench123"
+
+SELECT_PRODUCTS = text("SELECT id FROM products WHERE is_active ORDER BY id DESC LIMIT :limit")
+TOUCH_PRODUCTS = text("UPDATE products SET updated_at = now() WHERE id = ANY(:ids)")
+
+
+@dataclass
+class Totals:
+    """Counters for one pass over the request sequence."""
+
+    requests: int = 0
+    not_modified: int = 0
+    body_bytes: int = 0
+    cpu_seconds: float = 0.0
+
+
+class Client:
+    """Calls the ASGI app directly and collects status, headers and body size."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+
+    async def request(
+        self, method: str, path: str, headers: dict[str, str], body: bytes = b""
+    ) -> tuple[int, dict[str, str], bytes]:
+        path, _, query = path.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "headers": [(b"host", b"bench")]
+            + [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+            "client": ("127.0.0.1", 0),
+            "server": ("bench", 80),
+        }
+        sent = False
+        response: dict[str, object] = {"status": 0, "headers": {}}
+        chunks: list[bytes] = []
+
+        async def receive() -> Message:
+            nonlocal sent
+            if sent:
+                # The client stays connected until the response is complete
+                await asyncio.Event().wait()
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["headers"] = {
+                    name.decode(): value.decode() for name, value in message["headers"]
+                }
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self._app(scope, receive, send)
+        status = response["status"]
+        response_headers = response["headers"]
+        assert isinstance(status, int) and isinstance(response_headers, dict)
+        return status, response_headers, b"".join(chunks)
+
+
+async def log_in(client: Client, prefix: str) -> tuple[UUID, str]:
+    """Register a throwaway user and return its id and an access token."""
+    credentials = {"email": BENCH_EMAIL.format(time.time_ns()), "password": BENCH_PASSWORD}
+    json_headers = {"content-type": "application/json"}
+    status, _, body = await client.request(
+        "POST",
+        f"{prefix}/auth/register",
+        json_headers,
+        json.dumps({**credentials, "full_name": "Etag Bench", "phone": None}).encode(),
+    )
+    if status != 201:
+        raise SystemExit(f"Registering the bench user failed: {status} {body!r}")
+    user_id = UUID(json.loads(body)["id"])
+    status, _, body = await client.request(
+        "POST", f"{prefix}/auth/login", json_headers, json.dumps(credentials).encode()
+    )
+    if status != 200:
+        raise SystemExit(f"Logging in failed: {status} {body!r}")
+    return user_id, json.loads(body)["access_token"]
+
+
+async def run_pass(
+    client: Client,
+    schedule: list[list[tuple[int, str]]],
+    changes: list[list[UUID]],
+    token: str,
+    revalidate: bool,
+) -> Totals:
+    """Play the schedule; `revalidate` clients send back the ETags they were given."""
+    totals = Totals()
+    etags: dict[tuple[int, str], str] = {}
+    auth = {"authorization": f"Bearer {token}"}
+    session_maker = get_session_maker()
+    for polls, changed in zip(schedule, changes, strict=True):
+        async with session_maker() as session, session.begin():
+            await session.execute(TOUCH_PRODUCTS, {"ids": changed})
+        started = time.process_time()
+        for client_id, path in polls:
+            headers = dict(auth)
+            etag = etags.get((client_id, path))
+            if revalidate and etag is not None:
+                headers["if-none-match"] = etag
+            status, response_headers, body = await client.request("GET", path, headers)
+            if status not in (200, 304):
+                raise SystemExit(f"GET {path} answered {status}: {body!r}")
+            totals.requests += 1
+            totals.not_modified += status == 304
+            totals.body_bytes += len(body)
+            if "etag" in response_headers:
+                etags[(client_id, path)] = response_headers["etag"]
+        totals.cpu_seconds += time.process_time() - started
+    return totals
+
+
+def report(label: str, totals: Totals) -> None:
+    print(
+        f"{label:<14} {totals.requests:>7} requests  "
+        f"{totals.not_modified / totals.requests:>6.1%} 304  "
+        f"{totals.body_bytes / 2**20:>8.2f} MiB body  "
+        f"{totals.body_bytes / totals.requests:>8.0f} B/request  "
+        f"{totals.cpu_seconds / totals.requests * 1e6:>6.0f} us CPU/request"
+    )
+
+
+async def bench(clients: int, rounds: int, watched: int, change_rate: float) -> None:
+    prefix = get_settings().api_prefix
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        client = Client(app)
+        async with get_session_maker()() as session:
+            products = list((await session.execute(SELECT_PRODUCTS, {"limit": 500})).scalars())
+        if not products:
+            raise SystemExit("No active products; seed the catalog first")
+        user_id, token = await log_in(client, prefix)
+
+        rng = random.Random(7)
+        # Popular products are watched by more clients
+        weights = [1 / (rank + 1) for rank in range(len(products))]
+        paths = {
+            client_id: [f"{prefix}/users/me", f"{prefix}/categories", f"{prefix}/products"]
+            + [
+                f"{prefix}/products/{product_id}"
+                for product_id in set(rng.choices(products, weights, k=watched))
+            ]
+            for client_id in range(clients)
+        }
+        schedule = []
+        changes = []
+        for _ in range(rounds):
+            polls = [(client_id, path) for client_id in paths for path in paths[client_id]]
+            rng.shuffle(polls)
+            schedule.append(polls)
+            changes.append(rng.sample(products, int(len(products) * change_rate)))
+
+        try:
+            # Warm up connections and caches before either measured pass
+            await run_pass(client, schedule[:1], changes[:1], token, revalidate=True)
+            baseline = await run_pass(client, schedule, changes, token, revalidate=False)
+            conditional = await run_pass(client, schedule, changes, token, revalidate=True)
+        finally:
+            async with get_session_maker()() as session:
+                await app.state.user_repository_factory(session).delete(user_id)
+                await session.commit()
+
+    print(
+        f"{clients} clients x {rounds} rounds, {watched} watched products each, "
+        f"{change_rate:.0%} of {len(products)} products changed per round"
+    )
+    report("unconditional", baseline)
+    report("If-None-Match", conditional)
+    saved = 1 - conditional.body_bytes / baseline.body_bytes
+    cpu = 1 - conditional.cpu_seconds / baseline.cpu_seconds
+    print(f"saved: {saved:.1%} of body bytes, {cpu:.1%} of CPU per request")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark conditional GETs.")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--watched", type=int, default=5, help="Products each client polls")
+    parser.add_argument("--change-rate", type=float, default=0.02)
+    args = parser.parse_args()
+    asyncio.run(bench(args.clients, args.rounds, args.watched, args.change_rate))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Measure the registered email filter: memory, false positives and what it saves.
+
+Usage: python -m src.cli.bench_email_filter --emails 1000000 --users 200000
+
+In memory, for each false-positive rate, a filter sized for `--emails`
+synthetic emails is filled; reported are add and lookup costs, bytes per
+million emails against a set of the same strings, the false-positive rate
+measured over as many emails never added, and the snapshot's write and
+read time.
+
+Against the database, `--users` throwaway users are seeded, then:
+
+- cold start: the app starts without a snapshot; time until the filter has
+  read every user;
+- warm start: the app starts again from the snapshot the first one wrote
+  on shutdown; time until it has caught up;
+- GET /auth/email-available, called in process for `--checks` unregistered
+  and then registered emails, with the filter and with every email looked
+  up in the database. Database lookups are counted from the filter's
+  answers, and registered emails must never come back available.
+
+The seeded users and the snapshot are deleted afterwards.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+
+from src.cli.bench_conditional import Client
+from src.cli.bench_user_export import DAYS, SEED_USERS
+from src.core.config import get_settings
+from src.infrastructure.cache.email_filter import (
+    BloomEmailFilter,
+    BloomFilter,
+    email_filter_lookups_total,
+    read_snapshot,
+    write_snapshot,
+)
+from src.infrastructure.database import dispose_engine, get_session_maker
+from src.main import create_app
+from src.presentation.api.wiring import build_container
+
+BENCH_EMAIL = "filter-bench-%s@example.com"
+DELETE_SEEDED = text("DELETE FROM users WHERE email LIKE 'filter-bench-%@example.com'")
+MIB = 1024 * 1024
+
+
+def in_memory(emails: int, rates: list[float], snapshot: Path) -> None:
+    added = [f"user{n}@example.com" for n in range(emails)]
+    unseen = [f"unseen{n}@example.com" for n in range(emails)]
+    as_set = sys.getsizeof(set(added)) + sum(sys.getsizeof(email) for email in added)
+    print(f"set of {emails} emails: {as_set / emails * 1e6 / MIB:.1f} MiB per million")
+    print(
+        f"{'target':>8} {'hashes':>6} {'MiB/1M':>7} {'bits/email':>10} {'measured':>9} "
+        f"{'add us':>7} {'lookup us':>9} {'write ms':>8} {'read ms':>8}"
+    )
+    for rate in rates:
+        bloom = BloomFilter.sized(emails, rate)
+        started = time.perf_counter()
+        for email in added:
+            bloom.add(email)
+        add_us = (time.perf_counter() - started) / emails * 1e6
+
+        started = time.perf_counter()
+        false_positives = sum(email in bloom for email in unseen)
+        lookup_us = (time.perf_counter() - started) / emails * 1e6
+        assert all(email in bloom for email in added[:10_000])
+
+        started = time.perf_counter()
+        write_snapshot(snapshot, bloom, emails, None)
+        write_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        read_snapshot(snapshot)
+        read_ms = (time.perf_counter() - started) * 1000
+        snapshot.unlink()
+
+        print(
+            f"{rate:>8.2%} {bloom.hash_count:>6} {len(bloom.bits) / emails * 1e6 / MIB:>7.2f} "
+            f"{bloom.bit_count / emails:>10.1f} {false_positives / emails:>9.3%} "
+            f"{add_us:>7.2f} {lookup_us:>9.2f} {write_ms:>8.1f} {read_ms:>8.1f}"
+        )
+
+
+async def start_until_ready() -> float:
+    """Run the app until its email filter is ready; seconds that took."""
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        started = time.perf_counter()
+        email_filter: BloomEmailFilter = app.state.email_filter
+        while not email_filter.ready:
+            await asyncio.sleep(0.01)
+        return time.perf_counter() - started
+
+
+def database_lookups() -> float:
+    """Email checks the filter could not answer so far."""
+    return email_filter_lookups_total.value(answer="maybe") + email_filter_lookups_total.value(
+        answer="not_loaded"
+    )
+
+
+async def check(client: Client, emails: list[str], concurrency: int) -> tuple[float, int]:
+    """Requests per second and how many emails came back available."""
+    path = f"{get_settings().api_prefix}/auth/email-available?email="
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(email: str) -> bool:
+        async with semaphore:
+            status, _, body = await client.request("GET", path + email, {})
+        if status != 200:
+            raise SystemExit(f"Email check answered {status}: {body!r}")
+        available: bool = json.loads(body)["available"]
+        return available
+
+    started = time.perf_counter()
+    answers = await asyncio.gather(*(one(email) for email in emails))
+    return len(emails) / (time.perf_counter() - started), sum(answers)
+
+
+async def against_database(users: int, checks: int, concurrency: int, snapshot: Path) -> None:
+    started = time.perf_counter()
+    async with get_session_maker()() as session, session.begin():
+        await session.execute(
+            SEED_USERS, {"email_format": BENCH_EMAIL, "users": users, "days": DAYS}
+        )
+    print(f"seeded {users} users in {time.perf_counter() - started:.1f}s")
+
+    try:
+        print(f"cold start: filter ready after {await start_until_ready():.2f}s")
+        print(f"snapshot: {snapshot.stat().st_size / MIB:.2f} MiB")
+        print(f"warm start: filter ready after {await start_until_ready():.2f}s")
+
+        unregistered = [f"nobody-{n}-{time.time_ns()}@example.com" for n in range(checks)]
+        registered = [BENCH_EMAIL % n for n in range(1, users + 1, max(1, users // checks))]
+        app = create_app()
+        async with app.router.lifespan_context(app):
+            client = Client(app)
+            while not app.state.email_filter.ready:
+                await asyncio.sleep(0.01)
+            print(
+                f"{'filter':>8} {'emails':>12} {'checks':>7} {'req/s':>7} "
+                f"{'db lookups':>10} {'available':>9}"
+            )
+            for name in ("bloom", "none"):
+                if name == "none":
+                    # Never started, so every email might be registered
+                    app.state.email_filter = BloomEmailFilter(
+                        get_session_maker(), app.state.user_repository_factory, str(snapshot)
+                    )
+                    app.state.container = build_container(app.state)
+                for kind, emails in (("unregistered", unregistered), ("registered", registered)):
+                    lookups = -database_lookups()
+                    rate, available = await check(client, emails, concurrency)
+                    lookups += database_lookups()
+                    print(
+                        f"{name:>8} {kind:>12} {len(emails):>7} {rate:>7.0f} "
+                        f"{lookups:>10.0f} {available:>9}"
+                    )
+                    if kind == "registered" and available:
+                        raise SystemExit(f"{available} registered emails came back available")
+    finally:
+        async with get_session_maker()() as session, session.begin():
+            await session.execute(DELETE_SEEDED)
+        await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the registered email filter.")
+    parser.add_argument("--emails", type=int, default=1_000_000, help="Emails in memory")
+    parser.add_argument(
+        "--rates", default="0.01,0.001", help="Comma-separated target false-positive rates"
+    )
+    parser.add_argument("--users", type=int, default=200_000, help="Users to seed")
+    parser.add_argument("--checks", type=int, default=5000, help="Emails checked per pass")
+    parser.add_argument("--concurrency", type=int, default=20, help="Checks in flight")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot = Path(directory, "email_filter.bin")
+        # The app writes its snapshot here rather than over EMAIL_FILTER_PATH
+        os.environ["EMAIL_FILTER_PATH"] = str(snapshot)
+        os.environ["EVENT_SINK"] = "memory"
+        in_memory(args.emails, [float(rate) for rate in args.rates.split(",")], snapshot)
+        asyncio.run(against_database(args.users, args.checks, args.concurrency, snapshot))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Measure how fast the job runner drains the PostgreSQL job queue.
+
+Usage: python -m src.cli.bench_jobs --jobs 20000 --concurrency 1,4,16 --batch-size 20
+
+For each worker count, enqueues `--jobs` throwaway jobs in one transaction
+and runs a JobRunner on them until every job has succeeded. Each handler
+call waits `--work` milliseconds, standing in for a mail or API call, and
+`--failure-rate` of the jobs fail their first attempt so retries go
+through the backoff path. Reported are jobs per second, the time jobs
+waited in the queue before their first attempt, retries and the jobs left
+behind. Stop the API first: its own workers would claim the bench's jobs
+and fail them for want of a handler. Leftover jobs are deleted afterwards.
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import time
+from typing import Any
+from uuid import uuid7
+
+from sqlalchemy import delete, func, insert, select
+
+from src.infrastructure.database import dispose_engine, get_session_maker
+from src.infrastructure.jobs.queue import JobStatus
+from src.infrastructure.jobs.registry import JobRegistry
+from src.infrastructure.jobs.runner import JobRunner
+from src.infrastructure.orm.job_model import JobModel
+
+BENCH_JOB = "bench-jobs"
+# Bench jobs are retried almost at once, so a pass is not dominated by backoff sleeps
+RETRY_BACKOFF = 0.05
+
+
+class Handler:
+    """Bench job handler: records first attempts and fails the chosen jobs once."""
+
+    def __init__(self, work: float, expected: int) -> None:
+        self.work = work
+        self.expected = expected
+        self.first_attempts: dict[int, float] = {}
+        self.retries = 0
+        self.succeeded = 0
+        self.done = asyncio.Event()
+
+    async def __call__(self, payload: dict[str, Any]) -> None:
+        n = payload["n"]
+        if n not in self.first_attempts:
+            self.first_attempts[n] = time.perf_counter()
+            if payload["fail_once"]:
+                raise RuntimeError("first attempt fails")
+        else:
+            self.retries += 1
+        await asyncio.sleep(self.work)
+        self.succeeded += 1
+        if self.succeeded == self.expected:
+            self.done.set()
+
+
+async def run_pass(
+    jobs: int, concurrency: int, batch_size: int, work: float, failure_rate: float
+) -> None:
+    session_maker = get_session_maker()
+    handler = Handler(work, jobs)
+    registry = JobRegistry()
+    registry.register(BENCH_JOB, handler)
+    runner = JobRunner(
+        session_maker,
+        registry,
+        concurrency=concurrency,
+        batch_size=batch_size,
+        poll_interval=0.05,
+        retry_backoff=RETRY_BACKOFF,
+        max_retry_backoff=RETRY_BACKOFF,
+    )
+    rng = random.Random(0)
+    rows = [
+        {
+            "id": uuid7(),
+            "name": BENCH_JOB,
+            "payload": {"n": n, "fail_once": rng.random() < failure_rate},
+            "status": JobStatus.PENDING.value,
+            "max_attempts": 3,
+        }
+        for n in range(jobs)
+    ]
+    async with session_maker() as session, session.begin():
+        await session.execute(insert(JobModel), rows)
+    enqueued = time.perf_counter()
+
+    await runner.start()
+    try:
+        await handler.done.wait()
+    finally:
+        # Lets the last batches settle their jobs
+        await runner.stop()
+    elapsed = time.perf_counter() - enqueued
+
+    async with session_maker() as session:
+        stmt = select(func.count()).select_from(JobModel).where(JobModel.name == BENCH_JOB)
+        left = (await session.execute(stmt)).scalar_one()
+    waits = sorted(started - enqueued for started in handler.first_attempts.values())
+    cuts = statistics.quantiles(waits, n=100)
+    print(
+        f"{concurrency:>8} {elapsed:>8.2f} {jobs / elapsed:>8.0f} "
+        f"{cuts[49] * 1000:>11.1f} {cuts[98] * 1000:>11.1f} {handler.retries:>8} {left:>6}"
+    )
+
+
+async def bench(
+    jobs: int, concurrencies: list[int], batch_size: int, work: float, failure_rate: float
+) -> None:
+    try:
+        print(f"jobs={jobs} batch_size={batch_size} work={work * 1000:.0f}ms")
+        print(
+            f"{'workers':>8} {'seconds':>8} {'jobs/s':>8} "
+            f"{'wait p50 ms':>11} {'wait p99 ms':>11} {'retries':>8} {'left':>6}"
+        )
+        for concurrency in concurrencies:
+            await run_pass(jobs, concurrency, batch_size, work, failure_rate)
+    finally:
+        async with get_session_maker()() as session, session.begin():
+            await session.execute(delete(JobModel).where(JobModel.name == BENCH_JOB))
+        await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the background job runner.")
+    parser.add_argument("--jobs", type=int, default=20_000, help="Jobs enqueued per pass")
+    parser.add_argument(
+        "--concurrency", default="1,4,16", help="Comma-separated worker counts, one pass each"
+    )
+    parser.add_argument("--batch-size", type=int, default=20, help="Jobs claimed per batch")
+    parser.add_argument("--work", type=float, default=1.0, help="Milliseconds per handler call")
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.05, help="Share of jobs failing their first try"
+    )
+    args = parser.parse_args()
+    # Keeps the warnings of the deliberately failed attempts out of the report
+    logging.basicConfig(level=logging.ERROR)
+    concurrencies = [int(workers) for workers in args.concurrency.split(",")]
+    asyncio.run(
+        bench(args.jobs, concurrencies, args.batch_size, args.work / 1000, args.failure_rate)
+    )
+
+
+if __name__ == "__main__":
+    main()
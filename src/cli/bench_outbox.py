@@ -0,0 +1,208 @@
+"""
+Measure outbox throughput and the lag from commit to publish.
+
+Usage: python -m src.cli.bench_outbox --backlog 100000 --rate 2000 --batch-sizes 100,500,2000
+
+For each dispatcher batch size, two passes with an OutboxDispatcher
+publishing to a sink that records when each event arrives:
+
+- backlog: `--backlog` events already in the outbox are drained, as after
+  an outage or a bulk update; reported is events published per second;
+- live: writers commit `--events-per-tx` events per transaction at
+  `--rate` events per second for `--seconds`, with the dispatcher
+  running, as requests do. Reported is the throughput and the publish lag
+  of each event from its transaction's commit to the sink: median, p99
+  and max.
+
+`--sink-delay` milliseconds per batch stand in for a broker round trip.
+Stop the API first: only one process publishes at a time, and the API's
+dispatcher would hold the lock and publish the bench's events itself.
+Leftover bench events are deleted afterwards.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from uuid import UUID, uuid7
+
+from sqlalchemy import delete
+
+from src.application.interfaces.event_sink import EventEnvelope, IEventSink
+from src.core.config import get_settings
+from src.domain.events.base import DomainEvent
+from src.infrastructure.database import dispose_engine, get_engine, get_session_maker
+from src.infrastructure.events.dispatcher import OutboxDispatcher
+from src.infrastructure.orm.outbox_model import OutboxModel
+from src.infrastructure.repositories.sqlalchemy.outbox_repository_impl import (
+    SQLAlchemyOutboxRepository,
+)
+
+# Seconds to wait for the dispatcher beyond the expected run time
+DRAIN_TIMEOUT = 60.0
+INSERT_CHUNK = 5000
+
+
+@dataclass(frozen=True, kw_only=True)
+class BenchEvent(DomainEvent):
+    """Throwaway event written by this bench."""
+
+    aggregate_type = "bench"
+
+    n: int
+
+
+class TimingSink(IEventSink):
+    """Records when each bench event arrives; other events are ignored."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.received: dict[UUID, float] = {}
+        self.expected = 0
+        self.done = asyncio.Event()
+
+    async def publish(self, events: Sequence[EventEnvelope]) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        now = time.perf_counter()
+        for event in events:
+            if event.aggregate_type == BenchEvent.aggregate_type:
+                self.received.setdefault(event.event_id, now)
+        if len(self.received) >= self.expected:
+            self.done.set()
+
+    def expect(self, events: int) -> None:
+        self.received.clear()
+        self.expected = events
+        self.done.clear()
+
+
+async def write(events: int) -> tuple[list[UUID], float]:
+    """Commit `events` bench events in one transaction; their ids and commit time."""
+    batch = [BenchEvent(aggregate_id=uuid7(), n=n) for n in range(events)]
+    async with get_session_maker()() as session, session.begin():
+        await SQLAlchemyOutboxRepository(session).add(batch)
+    return [event.event_id for event in batch], time.perf_counter()
+
+
+async def drained(sink: TimingSink, timeout: float) -> None:
+    try:
+        await asyncio.wait_for(sink.done.wait(), timeout=timeout)
+    except TimeoutError:
+        raise SystemExit(
+            f"Only {len(sink.received)} of {sink.expected} events published; "
+            "is another process (the API) holding the outbox lock?"
+        ) from None
+
+
+async def backlog_pass(dispatcher: OutboxDispatcher, sink: TimingSink, backlog: int) -> None:
+    for start in range(0, backlog, INSERT_CHUNK):
+        await write(min(INSERT_CHUNK, backlog - start))
+    sink.expect(backlog)
+    started = time.perf_counter()
+    await dispatcher.start()
+    try:
+        await drained(sink, DRAIN_TIMEOUT + backlog / 1000)
+    finally:
+        await dispatcher.stop()
+    elapsed = max(sink.received.values()) - started
+    print(f"{'backlog':<8} {backlog:>8} {backlog / elapsed:>9.0f}")
+
+
+async def live_pass(
+    dispatcher: OutboxDispatcher,
+    sink: TimingSink,
+    rate: float,
+    seconds: float,
+    events_per_tx: int,
+) -> None:
+    transactions = int(rate * seconds / events_per_tx)
+    sink.expect(transactions * events_per_tx)
+    await dispatcher.start()
+    try:
+        started = time.perf_counter()
+        writers = []
+        for i in range(transactions):
+            await asyncio.sleep(max(0.0, started + i * events_per_tx / rate - time.perf_counter()))
+            writers.append(asyncio.create_task(write(events_per_tx)))
+        committed = await asyncio.gather(*writers)
+        await drained(sink, DRAIN_TIMEOUT)
+    finally:
+        await dispatcher.stop()
+
+    lags = [sink.received[event_id] - at for event_ids, at in committed for event_id in event_ids]
+    elapsed = max(sink.received.values()) - started
+    cuts = statistics.quantiles(lags, n=100)
+    print(
+        f"{'live':<8} {len(lags):>8} {len(lags) / elapsed:>9.0f} "
+        f"{statistics.median(lags) * 1000:>9.1f} {cuts[98] * 1000:>9.1f} "
+        f"{max(lags) * 1000:>9.1f}"
+    )
+
+
+async def bench(
+    backlog: int,
+    rate: float,
+    seconds: float,
+    events_per_tx: int,
+    batch_sizes: list[int],
+    sink_delay: float,
+) -> None:
+    settings = get_settings()
+    try:
+        print(
+            f"backlog={backlog} rate={rate:.0f}/s seconds={seconds:.0f} "
+            f"events_per_tx={events_per_tx} sink_delay={sink_delay * 1000:.0f}ms"
+        )
+        for batch_size in batch_sizes:
+            sink = TimingSink(sink_delay)
+            dispatcher = OutboxDispatcher(
+                get_engine(),
+                sink,
+                batch_size=batch_size,
+                poll_interval=settings.outbox_poll_interval,
+                leader_retry_interval=1.0,
+            )
+            print(f"\nbatch_size={batch_size}")
+            print(
+                f"{'pass':<8} {'events':>8} {'events/s':>9} "
+                f"{'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+            )
+            await backlog_pass(dispatcher, sink, backlog)
+            await live_pass(dispatcher, sink, rate, seconds, events_per_tx)
+    finally:
+        async with get_session_maker()() as session, session.begin():
+            await session.execute(
+                delete(OutboxModel).where(OutboxModel.aggregate_type == BenchEvent.aggregate_type)
+            )
+        await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark outbox publishing.")
+    parser.add_argument("--backlog", type=int, default=100_000, help="Events drained at once")
+    parser.add_argument("--rate", type=float, default=2000.0, help="Live events per second")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Length of the live pass")
+    parser.add_argument("--events-per-tx", type=int, default=1, help="Events per transaction")
+    parser.add_argument(
+        "--batch-sizes", default="100,500,2000", help="Comma-separated dispatcher batch sizes"
+    )
+    parser.add_argument("--sink-delay", type=float, default=0.0, help="Milliseconds per batch")
+    args = parser.parse_args()
+    batch_sizes = [int(size) for size in args.batch_sizes.split(",")]
+    asyncio.run(
+        bench(
+            args.backlog,
+            args.rate,
+            args.seconds,
+            args.events_per_tx,
+            batch_sizes,
+            args.sink_delay / 1000,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Measure the recommendation build on synthetic orders and lookups against its file.
+
+Usage: python -m src.cli.bench_recommendations --lines 10000000 --products 100000
+
+Generates order lines in which products belong to small planted bundles
+(products usually bought together) and baskets mix a bundle with popular
+products drawn from a Zipf distribution. It times the build and the file
+write, then reports lookup latency straight from the mapped file and through
+the endpoint, called in process without a server. It also reports how many top neighbours come
+from the product's own bundle, a sanity check that the scoring finds them.
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+from starlette.types import Message
+
+from src.core.config import get_settings
+from src.infrastructure.cache.recommendation_index import MmapRecommendationIndex, NeighbourFile
+from src.infrastructure.jobs.recommendation_builder import (
+    OrderLines,
+    build_neighbours,
+    write_neighbour_file,
+)
+from src.main import create_app
+
+BUNDLE_SIZE = 8
+
+
+def synthetic_order_lines(lines: int, products: int, seed: int) -> OrderLines:
+    """
+    About `lines` order lines; product i belongs to bundle i // BUNDLE_SIZE.
+
+    Basket sizes are geometric (mean 3). Each basket picks a bundle and takes
+    most of its items from it; the rest are popular products.
+    """
+    rng = np.random.default_rng(seed)
+    # Oversample: repeats within a basket are dropped below
+    target = lines * 6 // 5
+    sizes = rng.geometric(1 / 3, size=target // 3 + 1)
+    sizes = sizes[: np.searchsorted(np.cumsum(sizes), target) + 1]
+    baskets = np.repeat(np.arange(len(sizes)), sizes)[:target]
+
+    bundles = products // BUNDLE_SIZE
+    bundle = (rng.zipf(1.3, size=len(sizes)) - 1) % bundles
+    from_bundle = bundle[baskets] * BUNDLE_SIZE + rng.integers(0, BUNDLE_SIZE, size=len(baskets))
+    popular = (rng.zipf(1.2, size=len(baskets)) - 1) % products
+    items = np.where(rng.random(len(baskets)) < 0.8, from_bundle, popular)
+
+    # One line per product per order, as in order_items
+    keys = np.unique(baskets * products + items)[:lines]
+    return OrderLines(
+        baskets=keys // products,
+        items=keys % products,
+        product_ids=sorted((uuid.uuid4() for _ in range(products)), key=lambda u: u.bytes),
+    )
+
+
+def percentile(samples: list[float], q: int) -> float:
+    return statistics.quantiles(samples, n=100)[q - 1]
+
+
+def bench_file(path: Path, product_ids: list[uuid.UUID], lookups: int, limit: int) -> None:
+    neighbour_file = NeighbourFile(path)
+    rng = np.random.default_rng(3)
+    picks = [product_ids[i] for i in rng.integers(0, len(product_ids), size=lookups)]
+
+    samples = []
+    for product_id in picks:
+        started = time.perf_counter()
+        neighbour_file.neighbours(product_id, limit)
+        samples.append((time.perf_counter() - started) * 1e6)
+    print(
+        f"file lookups:     {lookups} of {limit}, p50 {percentile(samples, 50):.1f} us, "
+        f"p99 {percentile(samples, 99):.1f} us"
+    )
+
+
+async def bench_endpoint(
+    path: Path, product_ids: list[uuid.UUID], requests: int, limit: int
+) -> None:
+    # The lifespan is skipped: only the index this route reads is attached
+    app = create_app()
+    index = MmapRecommendationIndex(str(path))
+    index.reload()
+    app.state.recommendation_index = index
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"Unexpected status {message['status']}")
+
+    prefix = get_settings().api_prefix
+    rng = np.random.default_rng(4)
+    picks = [product_ids[i] for i in rng.integers(0, len(product_ids), size=requests)]
+    samples = []
+    for product_id in picks:
+        # Called in-process, without a server, so this is the app's own latency
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": f"{prefix}/products/{product_id}/recommendations",
+            "raw_path": f"{prefix}/products/{product_id}/recommendations".encode(),
+            "query_string": f"limit={limit}".encode(),
+            "headers": [(b"host", b"bench")],
+            "client": ("127.0.0.1", 0),
+            "server": ("bench", 80),
+        }
+        started = time.perf_counter()
+        await app(scope, receive, send)
+        samples.append((time.perf_counter() - started) * 1000)
+    print(
+        f"endpoint (ASGI):  {requests} requests, p50 {percentile(samples, 50):.2f} ms, "
+        f"p99 {percentile(samples, 99):.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark product recommendations.")
+    parser.add_argument("--lines", type=int, default=10_000_000)
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--k", type=int, default=get_settings().recommendations_top_k)
+    parser.add_argument("--limit", type=int, default=10, help="Neighbours per lookup")
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    lines = synthetic_order_lines(args.lines, args.products, seed=42)
+    print(
+        f"generated {len(lines.items)} order lines in {lines.baskets[-1] + 1} orders "
+        f"over {args.products} products in {time.perf_counter() - started:.1f}s"
+    )
+
+    started = time.perf_counter()
+    neighbours = build_neighbours(lines, args.k)
+    built = time.perf_counter()
+    print(
+        f"build:            {len(neighbours.neighbours)} neighbours "
+        f"(k={args.k}) in {built - started:.1f}s"
+    )
+
+    # Share of neighbours taken from the product's own planted bundle
+    sources = np.repeat(np.arange(args.products), np.diff(neighbours.offsets))
+    same_bundle = sources // BUNDLE_SIZE == neighbours.neighbours // BUNDLE_SIZE
+    print(f"bundle neighbours: {same_bundle.mean():.1%} of all neighbours")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "recommendations.bin"
+        started = time.perf_counter()
+        write_neighbour_file(path, lines.product_ids, neighbours)
+        print(
+            f"write:            {path.stat().st_size / 2**20:.1f} MiB "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+
+        started = time.perf_counter()
+        NeighbourFile(path)
+        print(f"map:              {(time.perf_counter() - started) * 1e6:.0f} us")
+
+        bench_file(path, lines.product_ids, args.lookups, args.limit)
+        asyncio.run(bench_endpoint(path, lines.product_ids, args.requests, args.limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Compare admin report latency and database work: summary tables vs live GROUP BY.
+
+Usage: python -m src.cli.bench_reports --orders 1000000 --users 50000 --days 365
+
+Seeds throwaway users and confirmed orders spread over `days` days, rebuilds
+the summary tables, then runs each report both ways: the naive aggregate
+over orders/users, and the read of the summary table the API serves from.
+For each it reports latency percentiles and the shared buffers one run
+touches (EXPLAIN BUFFERS), a proxy for the load put on the primary. The
+seeded rows are removed and the summaries rebuilt afterwards.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import text
+
+from src.core.config import get_settings
+from src.domain.entities.report import REGISTRATIONS_REPORT, SALES_REPORT
+from src.infrastructure.database import dispose_engine, get_session_maker
+from src.infrastructure.jobs.report_refresher import ReportRefresher
+
+BENCH_EMAIL = "report-bench-%s@example.com"
+
+SEED_USERS = text(
+    """
+    WITH created AS (
+        INSERT INTO users (id, email, hashed_password, full_name, role, is_active, is_verified,
+                           created_at, updated_at)
+        SELECT gen_random_uuid(), format(:email_format, n), '!', 'Report Bench', 'CUSTOMER',
+               true, true, ts, ts
+        FROM (
+            SELECT n, now() - random() * make_interval(days => :days) AS ts
+            FROM generate_series(1, :users) AS n
+        ) AS seeded
+        RETURNING id, email, created_at
+    )
+    INSERT INTO user_directory (user_id, email, created_at, updated_at)
+    SELECT id, email, created_at, created_at FROM created
+    """
+)
+SEED_PRODUCT = text(
+    """
+    INSERT INTO products (id, name, slug, price, is_active)
+    VALUES (gen_random_uuid(), 'Report Bench', 'report-bench', 100, false)
+    RETURNING id
+    """
+)
+SEED_ORDERS = text(
+    """
+    WITH buyers AS (
+        SELECT array_agg(id) AS ids FROM users WHERE email LIKE 'report-bench-%@example.com'
+    ), placed AS (
+        INSERT INTO orders (id, user_id, status, total, reserved_until, created_at, updated_at)
+        SELECT gen_random_uuid(), ids[1 + floor(random() * cardinality(ids))::int],
+               'CONFIRMED', round((50 + random() * 5000)::numeric, 2), ts, ts, ts
+        FROM buyers, (
+            SELECT now() - random() * make_interval(days => :days) AS ts
+            FROM generate_series(1, :orders)
+        ) AS seeded
+        RETURNING id, total
+    )
+    INSERT INTO order_items (order_id, product_id, quantity, unit_price)
+    SELECT id, :product_id, 1, total FROM placed
+    """
+)
+CLEANUP = (
+    text(
+        "DELETE FROM orders WHERE id IN "
+        "(SELECT order_id FROM order_items WHERE product_id = :product_id)"
+    ),
+    text("DELETE FROM products WHERE id = :product_id"),
+    text(
+        """
+        WITH removed AS (
+            DELETE FROM users WHERE email LIKE 'report-bench-%@example.com' RETURNING id
+        )
+        DELETE FROM user_directory WHERE user_id IN (SELECT id FROM removed)
+        """
+    ),
+)
+
+# (report, naive query over the OLTP tables, summary table read)
+QUERIES = (
+    (
+        "sales per day (30 days)",
+        """
+        SELECT (o.updated_at AT TIME ZONE :tz)::date AS day, count(*),
+               sum((SELECT sum(quantity) FROM order_items i WHERE i.order_id = o.id)),
+               sum(o.total)
+        FROM orders o
+        WHERE o.status = 'CONFIRMED' AND o.updated_at >= now() - interval '30 days'
+        GROUP BY day ORDER BY day
+        """,
+        """
+        SELECT day, orders, units, revenue FROM report_daily_sales
+        WHERE day >= (now() AT TIME ZONE :tz)::date - 29 ORDER BY day
+        """,
+    ),
+    (
+        "registrations per day (30 days)",
+        """
+        SELECT (created_at AT TIME ZONE :tz)::date AS day, count(*) FROM user_directory
+        WHERE created_at >= now() - interval '30 days'
+        GROUP BY day ORDER BY day
+        """,
+        """
+        SELECT day, users FROM report_daily_registrations
+        WHERE day >= (now() AT TIME ZONE :tz)::date - 29 ORDER BY day
+        """,
+    ),
+    (
+        "top 20 customers",
+        """
+        SELECT user_id, count(*), sum(total) AS revenue, max(updated_at) FROM orders
+        WHERE status = 'CONFIRMED'
+        GROUP BY user_id ORDER BY revenue DESC, user_id LIMIT 20
+        """,
+        """
+        SELECT user_id, orders, revenue, last_order_at FROM report_customer_sales
+        ORDER BY revenue DESC, user_id LIMIT 20
+        """,
+    ),
+)
+
+
+async def measure(sql: str, params: dict[str, Any], runs: int) -> tuple[list[float], int]:
+    """Run a query `runs` times. Returns latencies in ms and the buffers of one run."""
+    session_maker = get_session_maker()
+    latencies: list[float] = []
+    async with session_maker() as session:
+        plan = await session.scalar(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}"), params)
+        root = (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+        buffers = int(root["Shared Hit Blocks"] + root["Shared Read Blocks"])
+        for _ in range(runs):
+            started = time.perf_counter()
+            await session.execute(text(sql), params)
+            latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+    return latencies, buffers
+
+
+async def bench(orders: int, users: int, days: int, runs: int) -> None:
+    """Seed, rebuild the summaries, and compare both ways of computing each report."""
+    settings = get_settings()
+    session_maker = get_session_maker()
+    # Settle 0: the seeded rows are committed before the rebuild starts
+    refresher = ReportRefresher(
+        session_maker,
+        settle=timedelta(0),
+        max_window=timedelta(seconds=settings.report_max_window),
+        time_zone=settings.report_time_zone,
+    )
+
+    started = time.perf_counter()
+    async with session_maker() as session, session.begin():
+        await session.execute(
+            SEED_USERS, {"email_format": BENCH_EMAIL, "users": users, "days": days}
+        )
+        product_id = await session.scalar(SEED_PRODUCT)
+        await session.execute(
+            SEED_ORDERS, {"orders": orders, "days": days, "product_id": product_id}
+        )
+    async with session_maker() as session:
+        await session.execute(text("ANALYZE users, user_directory, orders, order_items"))
+    print(f"seeded {orders} orders and {users} users in {time.perf_counter() - started:.1f}s")
+
+    try:
+        for report in (SALES_REPORT, REGISTRATIONS_REPORT):
+            started = time.perf_counter()
+            await refresher.reset(report)
+            windows = await refresher.refresh(report)
+            elapsed = time.perf_counter() - started
+            print(f"rebuilt {report} summaries: {windows} windows in {elapsed:.1f}s")
+
+        params = {"tz": settings.report_time_zone}
+        print(f"{'report':34} {'source':8} {'p50 ms':>9} {'p95 ms':>9} {'buffers':>9}")
+        for name, naive, summary in QUERIES:
+            for source, sql in (("naive", naive), ("summary", summary)):
+                latencies, buffers = await measure(sql, params, runs)
+                p95 = latencies[int(len(latencies) * 0.95)]
+                print(
+                    f"{name:34} {source:8} {statistics.median(latencies):9.2f} "
+                    f"{p95:9.2f} {buffers:9d}"
+                )
+    finally:
+        async with session_maker() as session, session.begin():
+            for stmt in CLEANUP:
+                await session.execute(stmt, {"product_id": product_id})
+        # Take the seeded rows back out of the summaries
+        for report in (SALES_REPORT, REGISTRATIONS_REPORT):
+            await refresher.reset(report)
+            await refresher.refresh(report)
+        await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare report latency and database work.")
+    parser.add_argument("--orders", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(bench(args.orders, args.users, args.days, args.runs))
+
+
+if __name__ == "__main__":
+    main()
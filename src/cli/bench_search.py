@@ -0,0 +1,81 @@
+"""
+Measure product search latency against the configured database.
+
+Usage: python -m src.cli.bench_search --queries 2000 --concurrency 8
+
+Runs the SearchProducts use case (first page) for a mix of English, Bangla
+and misspelled queries and prints latency percentiles. Seed data first with
+`python -m src.cli.seed_catalog`.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from src.application.use_cases.catalog.search_products import SearchProducts
+from src.core.constants import DEFAULT_PAGE_SIZE
+from src.infrastructure.database import dispose_engine, get_session_maker
+from src.infrastructure.repositories.sqlalchemy.product_repository_impl import (
+    SQLAlchemyProductRepository,
+)
+
+QUERIES = [
+    "rice", "mustard oil", "premium tea", "organic turmeric", "mobile charger",
+    "saree", "mosquito net", "family biscuit", "deshi ghee", "kettle",
+    "চাল", "সরিষা তেল", "চা", "মোবাইল চার্জার", "শাড়ি", "মশারি",
+    "musterd", "shampo", "biscit", "tumeric", "blendr", "umbrela",
+]  # fmt: skip
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    index = max(round(pct / 100 * len(samples)) - 1, 0)
+    return samples[min(index, len(samples) - 1)]
+
+
+async def bench(queries: int, concurrency: int, limit: int) -> None:
+    """Run `queries` searches from `concurrency` workers and report latency."""
+    session_maker = get_session_maker()
+    latencies: list[float] = []
+    remaining = iter(range(queries))
+    rng = random.Random(36)
+
+    async def worker() -> None:
+        for _ in remaining:
+            query = rng.choice(QUERIES)
+            async with session_maker() as session:
+                use_case = SearchProducts(SQLAlchemyProductRepository(session))
+                started = time.perf_counter()
+                await use_case.execute(query, limit=limit)
+                latencies.append((time.perf_counter() - started) * 1000)
+
+    # Warm the pool and the buffer cache before measuring
+    async with session_maker() as session:
+        for query in QUERIES:
+            await SearchProducts(SQLAlchemyProductRepository(session)).execute(query, limit=limit)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    await dispose_engine()
+
+    latencies.sort()
+    print(f"queries={queries} concurrency={concurrency} limit={limit}")
+    print(f"throughput={queries / elapsed:.0f}/s mean={statistics.fmean(latencies):.1f}ms")
+    for pct in (50, 95, 99):
+        print(f"p{pct}={percentile(latencies, pct):.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure product search latency.")
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--limit", type=int, default=DEFAULT_PAGE_SIZE)
+    args = parser.parse_args()
+    asyncio.run(bench(args.queries, args.concurrency, args.limit))
+
+
+if __name__ == "__main__":
+    main()
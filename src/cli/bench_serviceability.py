@@ -0,0 +1,149 @@
+"""
+Measure delivery serviceability lookups against the in-memory zone grid.
+
+Usage: python -m src.cli.bench_serviceability --points 1000000 --zones 200
+
+Builds a ZoneGrid over synthetic zones (irregular polygons around Dhaka, some
+overlapping, some with holes) or, with --from-db, over the zones stored in
+Postgres. It then times lookups of random points and compares a sample with
+a brute-force point-in-polygon scan over every zone. Any disagreement exits
+non-zero.
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import sys
+import time
+
+from src.core.config import get_settings
+from src.domain.entities.delivery import DeliveryZone, Ring
+from src.infrastructure.cache.serviceability_index import ZoneGrid
+from src.infrastructure.database import dispose_engine, get_session_maker
+from src.infrastructure.repositories.sqlalchemy.delivery_zone_repository_impl import (
+    SQLAlchemyDeliveryZoneRepository,
+)
+
+# Greater Dhaka, (min lng, min lat, max lng, max lat)
+BOUNDS = (90.30, 23.65, 90.55, 23.95)
+
+
+def synthetic_zones(count: int, vertices: int, rng: random.Random) -> list[DeliveryZone]:
+    """Star-shaped zones on a jittered grid; every fifth zone has a hole."""
+    min_x, min_y, max_x, max_y = BOUNDS
+    side = math.ceil(math.sqrt(count))
+    step_x = (max_x - min_x) / side
+    step_y = (max_y - min_y) / side
+
+    zones = []
+    for n in range(count):
+        cx = min_x + (n % side + 0.5) * step_x
+        cy = min_y + (n // side + 0.5) * step_y
+        radius = 0.6 * max(step_x, step_y)
+        outline = _star(cx, cy, radius, vertices, rng)
+        rings = [outline]
+        if n % 5 == 0:
+            rings.append(_star(cx, cy, radius / 4, max(vertices // 4, 3), rng))
+        zones.append(
+            DeliveryZone(
+                name=f"zone-{n}",
+                hub_code=f"HUB-{n}",
+                rings=rings,
+                priority=rng.randint(0, 3),
+            )
+        )
+    return zones
+
+
+def _star(cx: float, cy: float, radius: float, vertices: int, rng: random.Random) -> Ring:
+    return [
+        (
+            cx + radius * rng.uniform(0.6, 1.0) * math.cos(2 * math.pi * k / vertices),
+            cy + radius * rng.uniform(0.6, 1.0) * math.sin(2 * math.pi * k / vertices),
+        )
+        for k in range(vertices)
+    ]
+
+
+def brute_force(zones: list[DeliveryZone], lat: float, lng: float) -> DeliveryZone | None:
+    """Reference answer: even-odd ray cast against every ring of every zone."""
+    for zone in zones:
+        inside = False
+        for ring in zone.rings:
+            for (x1, y1), (x2, y2) in zip(ring, ring[1:] + ring[:1], strict=True):
+                if (y1 > lat) != (y2 > lat) and lng < x1 + (lat - y1) * (x2 - x1) / (y2 - y1):
+                    inside = not inside
+        if inside:
+            return zone
+    return None
+
+
+async def load_zones() -> list[DeliveryZone]:
+    try:
+        async with get_session_maker()() as session:
+            return await SQLAlchemyDeliveryZoneRepository(session).list_changed_since()
+    finally:
+        await dispose_engine()
+
+
+def bench(zones: list[DeliveryZone], points: int, sample: int, cell_size: float) -> bool:
+    started = time.perf_counter()
+    grid = ZoneGrid(zones, cell_size)
+    build_ms = (time.perf_counter() - started) * 1000
+    vertices = sum(len(ring) for zone in grid.zones for ring in zone.rings)
+    print(
+        f"indexed {len(grid.zones)} zones ({vertices} vertices) into {grid.cell_count} cells "
+        f"of {grid.cell_size:g} deg in {build_ms:.0f} ms"
+    )
+
+    rng = random.Random(7)
+    min_x, min_y, max_x, max_y = BOUNDS
+    lats = [rng.uniform(min_y, max_y) for _ in range(points)]
+    lngs = [rng.uniform(min_x, max_x) for _ in range(points)]
+
+    locate = grid.locate
+    started = time.perf_counter()
+    served = sum(1 for lat, lng in zip(lats, lngs, strict=True) if locate(lat, lng) is not None)
+    elapsed = time.perf_counter() - started
+    print(
+        f"grid:        {points} lookups in {elapsed:.2f}s, {points / elapsed:,.0f}/s, "
+        f"{elapsed / points * 1e6:.2f} us each, {served / points:.1%} serviceable"
+    )
+
+    sample = min(sample, points)
+    started = time.perf_counter()
+    expected = [brute_force(grid.zones, lats[i], lngs[i]) for i in range(sample)]
+    elapsed = time.perf_counter() - started
+    print(
+        f"brute force: {sample} lookups in {elapsed:.2f}s, {sample / elapsed:,.0f}/s, "
+        f"{elapsed / sample * 1e6:.2f} us each"
+    )
+
+    mismatches = sum(1 for i in range(sample) if locate(lats[i], lngs[i]) is not expected[i])
+    print(f"mismatches against brute force: {mismatches} of {sample}")
+    return mismatches == 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark delivery serviceability lookups.")
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--sample", type=int, default=20_000)
+    parser.add_argument("--zones", type=int, default=200)
+    parser.add_argument("--vertices", type=int, default=64)
+    parser.add_argument("--cell-size", type=float, default=None)
+    parser.add_argument("--from-db", action="store_true", help="Index the stored zones instead")
+    args = parser.parse_args()
+
+    zones = (
+        asyncio.run(load_zones())
+        if args.from_db
+        else synthetic_zones(args.zones, args.vertices, random.Random(42))
+    )
+    cell_size = args.cell_size or get_settings().delivery_grid_cell_size
+    if not bench(zones, args.points, args.sample, cell_size):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Check that user exports stream in flat memory, whatever the number of users.
+
+Usage: python -m src.cli.bench_user_export --users 3000000
+
+Seeds throwaway users with creation times spread over the past year, then
+exports through GET /users/export, called in process: the most recent 10%
+and everything as NDJSON, everything as gzip-compressed CSV, and the recent
+10% again for a client reading only `--client-rate` MiB/s. For each it
+reports rows, bytes, throughput and how far the process's resident memory
+grew above where it started. For comparison, the recent 10% is also loaded
+the naive way, with `.scalars().all()`. The seeded users are deleted
+afterwards.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+import zlib
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from urllib.parse import urlencode
+from uuid import UUID
+
+from sqlalchemy import select, text
+from starlette.types import ASGIApp, Message
+
+from src.cli.bench_conditional import Client, log_in
+from src.core.config import get_settings
+from src.domain.entities.user import Role
+from src.infrastructure.database import dispose_engine, get_session_maker
+from src.infrastructure.orm.user_model import UserModel
+from src.infrastructure.repositories.sharded_user_repository import UserRepositoryFactory
+from src.main import create_app
+
+BENCH_EMAIL = "export-bench-%s@example.com"
+DAYS = 365
+
+# Inserted in creation order with time-ordered (UUIDv7 layout) ids, as the
+# app writes them; creation times end a day ago, behind the registration
+# report's watermark
+SEED_USERS = text(
+    """
+    INSERT INTO users (id, email, hashed_password, full_name, phone, role, is_active,
+                       is_verified, created_at, updated_at)
+    SELECT (lpad(to_hex((extract(epoch FROM ts) * 1000)::bigint), 12, '0') || '7'
+            || substr(md5(n::text), 1, 3) || '8' || substr(md5(n::text), 4, 15))::uuid,
+           format(:email_format, n), '!', 'Export Bench ' || n, NULL,
+           'CUSTOMER', n % 10 <> 0, n % 3 = 0, ts, ts
+    FROM (
+        SELECT n, now() - interval '1 day'
+                  - make_interval(secs => (:users - n) * 86400.0 * :days / :users) AS ts
+        FROM generate_series(1, :users) AS n
+    ) AS seeded
+    ORDER BY n
+    """
+)
+DELETE_SEEDED = text("DELETE FROM users WHERE email LIKE 'export-bench-%@example.com'")
+
+
+@dataclass
+class Pass:
+    """Outcome of one export."""
+
+    name: str
+    rows: int = 0
+    body_bytes: int = 0
+    seconds: float = 0.0
+    rss_growth: int = 0
+
+
+class RssSampler:
+    """Highest resident set size seen since start(), sampled every few milliseconds."""
+
+    def __init__(self) -> None:
+        self._page_size = os.sysconf("SC_PAGE_SIZE")
+        self.baseline = 0
+        self.peak = 0
+        self._task: asyncio.Task[None] | None = None
+
+    def rss(self) -> int:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * self._page_size
+
+    async def __aenter__(self) -> RssSampler:
+        self.baseline = self.peak = self.rss()
+        self._task = asyncio.create_task(self._sample())
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        assert self._task is not None
+        self._task.cancel()
+        self.peak = max(self.peak, self.rss())
+
+    async def _sample(self) -> None:
+        while True:
+            self.peak = max(self.peak, self.rss())
+            await asyncio.sleep(0.005)
+
+
+async def stream_export(
+    app: ASGIApp, path: str, query: dict[str, str], headers: dict[str, str], rate: float | None
+) -> tuple[int, int, int]:
+    """GET an export, reading at `rate` bytes/s if set; returns status, rows and body bytes."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": urlencode(query).encode(),
+        "headers": [(b"host", b"bench")]
+        + [(name.encode(), value.encode()) for name, value in headers.items()],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    status = 0
+    rows = body_bytes = 0
+    decompressor: zlib._Decompress | None = None
+    started = time.perf_counter()
+    complete = asyncio.Event()
+
+    async def receive() -> Message:
+        # The client stays connected until the response is complete
+        await complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal status, rows, body_bytes, decompressor
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            if (b"content-encoding", b"gzip") in message["headers"]:
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            return
+        body = message.get("body", b"")
+        body_bytes += len(body)
+        # Lines are counted on the plain text, without keeping any of it
+        plain = decompressor.decompress(body) if decompressor else body
+        rows += plain.count(b"\n")
+        if not message.get("more_body", False):
+            complete.set()
+        if rate:
+            # Sending waits while the client is behind, as a socket would
+            await asyncio.sleep(max(started + body_bytes / rate - time.perf_counter(), 0))
+
+    await app(scope, receive, send)
+    return status, rows, body_bytes
+
+
+async def export_pass(
+    app: ASGIApp, name: str, query: dict[str, str], token: str, gzipped: bool, rate: float | None
+) -> Pass:
+    headers = {"authorization": f"Bearer {token}"}
+    if gzipped:
+        headers["accept-encoding"] = "gzip"
+    path = f"{get_settings().api_prefix}/users/export"
+    result = Pass(name)
+    async with RssSampler() as sampler:
+        started = time.perf_counter()
+        status, result.rows, result.body_bytes = await stream_export(
+            app, path, query, headers, rate
+        )
+        result.seconds = time.perf_counter() - started
+    if status != 200:
+        raise SystemExit(f"{name}: export answered {status}")
+    if query.get("format") == "csv":
+        result.rows -= 1  # Header line
+    result.rss_growth = sampler.peak - sampler.baseline
+    return result
+
+
+async def naive_pass(created_from: datetime) -> Pass:
+    """The same users loaded as ORM objects with .scalars().all()."""
+    result = Pass("recent 10%, .all()")
+    async with RssSampler() as sampler:
+        started = time.perf_counter()
+        async with get_session_maker()() as session:
+            stmt = select(UserModel).where(UserModel.created_at >= created_from)
+            users = (await session.execute(stmt)).scalars().all()
+            body = "".join(json.dumps({"id": str(user.id), "email": user.email}) for user in users)
+            result.rows, result.body_bytes = len(users), len(body)
+            del users, body
+        result.seconds = time.perf_counter() - started
+    result.rss_growth = sampler.peak - sampler.baseline
+    return result
+
+
+async def promote_to_admin(repository_factory: UserRepositoryFactory, user_id: UUID) -> None:
+    async with get_session_maker()() as session:
+        repository = repository_factory(session)
+        user = await repository.get_by_id(user_id)
+        assert user is not None
+        await repository.update(replace(user, role=Role.ADMIN))
+        await session.commit()
+
+
+async def delete_user(repository_factory: UserRepositoryFactory, user_id: UUID) -> None:
+    async with get_session_maker()() as session:
+        await repository_factory(session).delete(user_id)
+        await session.commit()
+
+
+async def bench(users: int, client_rate: float) -> None:
+    started = time.perf_counter()
+    async with get_session_maker()() as session, session.begin():
+        await session.execute(
+            SEED_USERS, {"email_format": BENCH_EMAIL, "users": users, "days": DAYS}
+        )
+    async with get_session_maker()() as session:
+        await session.execute(text("ANALYZE users"))
+    print(f"seeded {users} users in {time.perf_counter() - started:.1f}s")
+
+    app = create_app()
+    recent = {"created_from": (datetime.now(UTC) - timedelta(days=1 + DAYS / 10)).isoformat()}
+    try:
+        async with app.router.lifespan_context(app):
+            client = Client(app)
+            user_id, token = await log_in(client, get_settings().api_prefix)
+            repository_factory: UserRepositoryFactory = app.state.user_repository_factory
+            try:
+                await promote_to_admin(repository_factory, user_id)
+                passes = [
+                    await export_pass(app, "recent 10%, NDJSON", recent, token, False, None),
+                    await export_pass(app, "all, NDJSON", {}, token, False, None),
+                    await export_pass(app, "all, CSV, gzip", {"format": "csv"}, token, True, None),
+                    await export_pass(
+                        app,
+                        f"recent 10%, {client_rate:g} MiB/s client",
+                        recent,
+                        token,
+                        False,
+                        client_rate * 2**20,
+                    ),
+                    await naive_pass(datetime.fromisoformat(recent["created_from"])),
+                ]
+            finally:
+                await delete_user(repository_factory, user_id)
+    finally:
+        async with get_session_maker()() as session, session.begin():
+            await session.execute(DELETE_SEEDED)
+        await dispose_engine()
+
+    print(f"{'export':<30} {'rows':>9} {'MiB':>8} {'s':>7} {'rows/s':>9} {'RSS growth MiB':>15}")
+    for result in passes:
+        print(
+            f"{result.name:<30} {result.rows:>9} {result.body_bytes / 2**20:>8.1f} "
+            f"{result.seconds:>7.1f} {result.rows / result.seconds:>9.0f} "
+            f"{result.rss_growth / 2**20:>15.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark streaming user exports.")
+    parser.add_argument("--users", type=int, default=3_000_000, help="Users to seed")
+    parser.add_argument(
+        "--client-rate", type=float, default=4.0, help="MiB/s read by the slow client"
+    )
+    args = parser.parse_args()
+    asyncio.run(bench(args.users, args.client_rate))
+
+
+if __name__ == "__main__":
+    main()
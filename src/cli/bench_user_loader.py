@@ -0,0 +1,152 @@
+"""
+Compare user lookups through the shared UserLoader with direct repository reads.
+
+Usage: python -m src.cli.bench_user_loader --requests 500 --fan-out 20 --hot 1000
+
+Seeds `--users` throwaway customers, then runs `--requests` concurrent
+simulated requests, each with its own request deadline, that look up
+`--fan-out` users drawn from the `--hot` most recent ones (as order,
+review and admin listings resolving their authors do), three ways:
+
+- repository: one session per request and one get_by_id per user;
+- repository batch: one session per request and one get_many_by_ids;
+- loader: UserLoader.load for every user at once, shared across requests.
+
+A login storm follows: every request looks up one of ten emails, by
+get_by_email in its own session or through UserLoader.load_by_email.
+Reported are the queries sent to the users table, total seconds and
+per-request latency percentiles. The seeded users are deleted afterwards.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from functools import partial
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import event, text
+
+from src.cli.bench_user_export import DAYS, SEED_USERS
+from src.core.deadline import start_deadline
+from src.infrastructure.database import dispose_engine, get_engine, get_session_maker
+from src.infrastructure.repositories.sqlalchemy.user_repository_impl import (
+    SQLAlchemyUserRepository,
+)
+from src.infrastructure.repositories.user_loader import UserLoader
+
+BENCH_EMAIL = "loader-bench-%s@example.com"
+DELETE_SEEDED = text("DELETE FROM users WHERE email LIKE 'loader-bench-%@example.com'")
+HOT_IDS = text(
+    "SELECT id FROM users WHERE email LIKE 'loader-bench-%@example.com' ORDER BY id DESC LIMIT :hot"
+)
+REQUEST_TIMEOUT = 30.0
+
+Lookup = Callable[[list[UUID]], Awaitable[object]]
+
+
+@contextmanager
+def counted_queries() -> Iterator[list[int]]:
+    """Statements on the users table sent meanwhile, as a one-item list."""
+    count = [0]
+
+    def record(*args: Any) -> None:
+        if " users" in args[2]:
+            count[0] += 1
+
+    engine = get_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield count
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+async def by_id(user_ids: list[UUID]) -> object:
+    async with get_session_maker()() as session:
+        repository = SQLAlchemyUserRepository(session)
+        return [await repository.get_by_id(user_id) for user_id in user_ids]
+
+
+async def by_ids(user_ids: list[UUID]) -> object:
+    async with get_session_maker()() as session:
+        return await SQLAlchemyUserRepository(session).get_many_by_ids(user_ids)
+
+
+async def by_email(email: str) -> object:
+    async with get_session_maker()() as session:
+        return await SQLAlchemyUserRepository(session).get_by_email(email)
+
+
+async def request(lookup: Callable[[], Awaitable[object]]) -> float:
+    """Seconds one simulated request took, run under its own deadline."""
+    start_deadline(REQUEST_TIMEOUT)
+    started = time.perf_counter()
+    await lookup()
+    return time.perf_counter() - started
+
+
+async def run_pass(name: str, lookups: list[Callable[[], Awaitable[object]]]) -> None:
+    with counted_queries() as queries:
+        started = time.perf_counter()
+        # Each task copies the context, so deadlines stay per request
+        latencies = await asyncio.gather(*(asyncio.create_task(request(f)) for f in lookups))
+        elapsed = time.perf_counter() - started
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<22} {queries[0]:>8} {elapsed:>8.2f} "
+        f"{cuts[49] * 1000:>8.1f} {cuts[98] * 1000:>8.1f}"
+    )
+
+
+async def bench(users: int, requests: int, fan_out: int, hot: int) -> None:
+    session_maker = get_session_maker()
+    try:
+        async with session_maker() as session, session.begin():
+            await session.execute(
+                SEED_USERS, {"email_format": BENCH_EMAIL, "users": users, "days": DAYS}
+            )
+            await session.execute(text("ANALYZE users"))
+            hot_ids = list((await session.execute(HOT_IDS, {"hot": hot})).scalars())
+
+        rng = random.Random(0)
+        fan_outs = [rng.sample(hot_ids, min(fan_out, len(hot_ids))) for _ in range(requests)]
+        emails = [BENCH_EMAIL % rng.randint(1, 10) for _ in range(requests)]
+        loader = UserLoader(session_maker)
+
+        def load_all(user_ids: list[UUID]) -> Awaitable[object]:
+            return asyncio.gather(*(loader.load(user_id) for user_id in user_ids))
+
+        passes: dict[str, Lookup] = {
+            "repository": by_id,
+            "repository batch": by_ids,
+            "loader": load_all,
+        }
+        print(f"users={users} requests={requests} fan_out={fan_out} hot={hot}")
+        print(f"{'lookup':<22} {'queries':>8} {'seconds':>8} {'p50 ms':>8} {'p99 ms':>8}")
+        for name, lookup in passes.items():
+            await run_pass(name, [partial(lookup, ids) for ids in fan_outs])
+        await run_pass("repository by email", [partial(by_email, e) for e in emails])
+        await run_pass("loader by email", [partial(loader.load_by_email, e) for e in emails])
+    finally:
+        async with session_maker() as session, session.begin():
+            await session.execute(DELETE_SEEDED)
+        await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare UserLoader with direct user reads.")
+    parser.add_argument("--users", type=int, default=10_000, help="Seeded users")
+    parser.add_argument("--requests", type=int, default=500, help="Concurrent requests")
+    parser.add_argument("--fan-out", type=int, default=20, help="Users looked up per request")
+    parser.add_argument("--hot", type=int, default=1000, help="Recent users drawn from")
+    args = parser.parse_args()
+    asyncio.run(bench(args.users, args.requests, args.fan_out, args.hot))
+
+
+if __name__ == "__main__":
+    main()
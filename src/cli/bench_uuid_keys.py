@@ -0,0 +1,120 @@
+"""
+Compare random UUIDv4 primary keys with time-ordered UUIDv7 ones.
+
+Usage: python -m src.cli.bench_uuid_keys --rows 10000000 --batch-size 10000
+
+For each key kind a throwaway table shaped like users (uuid primary key,
+timestamps and about 100 bytes of text) is filled with `--rows` rows, keys
+generated by uuid.uuid4 or uuid.uuid7 as the application does, one batch
+per transaction. Reported are rows per second overall and over the last
+tenth of the batches, once the index no longer fits in cache, the WAL
+written, table and primary-key index sizes and, where the pgstattuple
+extension is installed, the index's average leaf density.
+
+The tables are dropped afterwards.
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Callable
+from uuid import UUID, uuid4, uuid7
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from src.infrastructure.database import dispose_engine, get_session_maker
+
+KINDS: dict[str, Callable[[], UUID]] = {"uuid4": uuid4, "uuid7": uuid7}
+MIB = 1024 * 1024
+
+CREATE = """
+    CREATE TABLE {table} (
+        id uuid PRIMARY KEY,
+        created_at timestamptz NOT NULL DEFAULT now(),
+        updated_at timestamptz NOT NULL DEFAULT now(),
+        payload text NOT NULL
+    )
+"""
+INSERT = """
+    INSERT INTO {table} (id, payload)
+    SELECT id, repeat('x', 100) FROM unnest(CAST(:ids AS uuid[])) AS id
+"""
+WAL_POSITION = text("SELECT pg_current_wal_lsn()")
+WAL_SINCE = text("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), CAST(:since AS pg_lsn))")
+SIZES = text(
+    "SELECT pg_relation_size(CAST(:table AS regclass)), pg_relation_size(CAST(:index AS regclass))"
+)
+LEAF_DENSITY = text("SELECT avg_leaf_density FROM pgstatindex(CAST(:index AS regclass))")
+
+
+async def fill(kind: str, rows: int, batch_size: int) -> None:
+    table = f"bench_uuid_keys_{kind}"
+    new_id = KINDS[kind]
+    session_maker = get_session_maker()
+    async with session_maker() as session, session.begin():
+        await session.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        await session.execute(text(CREATE.format(table=table)))
+        wal_start = (await session.execute(WAL_POSITION)).scalar_one()
+
+    try:
+        insert = text(INSERT.format(table=table))
+        batches = -(-rows // batch_size)
+        tail_from = batches - max(1, batches // 10)
+        tail_rows, tail_seconds = 0, 0.0
+        started = time.perf_counter()
+        for batch in range(batches):
+            ids = [new_id() for _ in range(min(batch_size, rows - batch * batch_size))]
+            batch_started = time.perf_counter()
+            async with session_maker() as session, session.begin():
+                await session.execute(insert, {"ids": ids})
+            if batch >= tail_from:
+                tail_rows += len(ids)
+                tail_seconds += time.perf_counter() - batch_started
+        elapsed = time.perf_counter() - started
+
+        async with session_maker() as session:
+            wal = (await session.execute(WAL_SINCE, {"since": wal_start})).scalar_one()
+            table_bytes, index_bytes = (
+                await session.execute(SIZES, {"table": table, "index": f"{table}_pkey"})
+            ).one()
+            try:
+                density = (
+                    await session.execute(LEAF_DENSITY, {"index": f"{table}_pkey"})
+                ).scalar_one()
+            except DBAPIError:
+                density = None
+
+        print(
+            f"{kind:>6} {rows / elapsed:>9.0f} {tail_rows / tail_seconds:>10.0f} "
+            f"{wal / MIB:>8.0f} {table_bytes / MIB:>9.0f} {index_bytes / MIB:>9.0f} "
+            f"{f'{density:.1f}%' if density is not None else 'n/a':>13}"
+        )
+    finally:
+        async with session_maker() as session, session.begin():
+            await session.execute(text(f"DROP TABLE IF EXISTS {table}"))
+
+
+async def bench(rows: int, batch_size: int) -> None:
+    print(f"rows={rows} batch_size={batch_size}")
+    print(
+        f"{'key':>6} {'rows/s':>9} {'last 10%':>10} {'WAL MiB':>8} {'table MiB':>9} "
+        f"{'index MiB':>9} {'leaf density':>13}"
+    )
+    try:
+        for kind in KINDS:
+            await fill(kind, rows, batch_size)
+    finally:
+        await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare UUIDv4 and UUIDv7 primary keys.")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="Rows per table")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="Rows per transaction")
+    args = parser.parse_args()
+    asyncio.run(bench(args.rows, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Build the "frequently bought together" neighbour file from confirmed orders.
+
+Usage: python -m src.cli.build_recommendations --days 365 --k 20
+
+Reads order lines from Postgres, scores co-purchased product pairs with
+vectorised NumPy operations (see recommendation_builder) and atomically
+replaces RECOMMENDATIONS_PATH. Running API workers pick the new file up
+within RECOMMENDATIONS_RELOAD_INTERVAL seconds. Run it from cron or a
+scheduler; it needs the `recommendations` extra.
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from src.core.config import get_settings
+from src.infrastructure.database import dispose_engine, get_session_maker
+from src.infrastructure.jobs.recommendation_builder import (
+    build_neighbours,
+    load_order_lines,
+    write_neighbour_file,
+)
+
+
+async def build(output: Path, days: int, k: int, min_count: int, max_basket: int) -> None:
+    started = time.perf_counter()
+    try:
+        lines = await load_order_lines(get_session_maker(), days)
+    finally:
+        await dispose_engine()
+    loaded = time.perf_counter()
+    print(
+        f"loaded {len(lines.items)} order lines, {len(lines.product_ids)} products "
+        f"in {loaded - started:.1f}s"
+    )
+
+    neighbours = build_neighbours(lines, k, min_count=min_count, max_basket=max_basket)
+    built = time.perf_counter()
+    print(f"scored {len(neighbours.neighbours)} neighbours in {built - loaded:.1f}s")
+
+    write_neighbour_file(output, lines.product_ids, neighbours)
+    print(f"wrote {output} ({output.stat().st_size} bytes) in {time.perf_counter() - built:.1f}s")
+
+
+def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Build product recommendations.")
+    parser.add_argument("--output", type=Path, default=Path(settings.recommendations_path))
+    parser.add_argument("--days", type=int, default=365, help="Order history to use")
+    parser.add_argument("--k", type=int, default=settings.recommendations_top_k)
+    parser.add_argument("--min-count", type=int, default=2)
+    parser.add_argument("--max-basket", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(build(args.output, args.days, args.k, args.min_count, args.max_basket))
+
+
+if __name__ == "__main__":
+    main()
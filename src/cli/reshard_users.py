@@ -0,0 +1,294 @@
+"""
+Create user shards and move users between them while the API keeps running.
+
+Usage:
+    python -m src.cli.reshard_users init                  # users table on every shard
+    python -m src.cli.reshard_users status
+    python -m src.cli.reshard_users rebalance [--dry-run]  # even out slots over shards
+    python -m src.cli.reshard_users move --slot 17 --to 2
+    python -m src.cli.reshard_users check [--delete-strays]
+
+Shards are the databases in DB_USER_SHARD_URLS (shard 0 is the primary).
+Users move a slot at a time:
+
+1. Copy the slot's rows to the target while they stay writable.
+2. Freeze the slot. This waits for writers holding its advisory lock, after
+   which new writes wait for the move (ShardedUserRepository).
+3. Copy again, now only the rows that changed, and delete rows removed since.
+4. Point the slot at the target and unfreeze it; writes resume there.
+5. After --grace seconds, once every API process has reloaded the slot map
+   and stopped reading the source, delete the slot's rows from the source
+   (once for all the slots of a rebalance).
+
+An interrupted move leaves the slot frozen; running the move again resumes
+it. Rows left on a shard their slot has moved away from show up in `check`.
+"""
+
+import argparse
+import asyncio
+import time
+from collections import Counter
+from typing import Any, cast
+
+from sqlalchemy import (
+    Integer,
+    Table,
+    any_,
+    bindparam,
+    delete,
+    func,
+    literal_column,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.types import Uuid
+
+from src.core.config import get_settings
+from src.infrastructure.database import dispose_engine, get_session_maker
+from src.infrastructure.database.sharding import ACTIVE, FROZEN, SLOT_LOCK_NAMESPACE, UserShards
+from src.infrastructure.orm.user_directory_model import UserDirectoryModel, UserShardSlotModel
+from src.infrastructure.orm.user_model import SHARD_SLOT_SQL, SHARD_SLOTS, UserModel
+
+USERS = cast(Table, UserModel.__table__)
+IN_SLOT = text(f"{SHARD_SLOT_SQL} = :slot")
+
+# Rows per upsert statement (10 columns each, under the bind parameter limit)
+UPSERT_BATCH = 1000
+
+
+async def read_slot(shards: UserShards, shard: int, slot: int) -> dict[Any, tuple[Any, ...]]:
+    """All user rows of a slot on a shard, by id."""
+    async with shards.session(shard) as session:
+        rows = await session.execute(select(USERS).where(IN_SLOT), {"slot": slot})
+        return {row.id: tuple(row) for row in rows}
+
+
+async def sync_slot(shards: UserShards, slot: int, source: int, target: int) -> tuple[int, int]:
+    """Make the target's rows of a slot equal the source's. Returns (upserted, deleted)."""
+    wanted, present = await asyncio.gather(
+        read_slot(shards, source, slot), read_slot(shards, target, slot)
+    )
+    changed = [row for user_id, row in wanted.items() if present.get(user_id) != row]
+    removed = [user_id for user_id in present if user_id not in wanted]
+
+    columns = [column.name for column in USERS.columns]
+    async with shards.session(target) as session:
+        for start in range(0, len(changed), UPSERT_BATCH):
+            stmt = insert(USERS).values(
+                [
+                    dict(zip(columns, row, strict=True))
+                    for row in changed[start : start + UPSERT_BATCH]
+                ]
+            )
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[USERS.c.id],
+                    set_={name: stmt.excluded[name] for name in columns if name != "id"},
+                )
+            )
+        if removed:
+            ids = bindparam("user_ids", removed, type_=ARRAY(Uuid()))
+            await session.execute(delete(USERS).where(USERS.c.id == any_(ids)))
+        await session.commit()
+    return len(changed), len(removed)
+
+
+async def read_map() -> list[tuple[int, int, str]]:
+    """(slot, shard, state) of every slot."""
+    async with get_session_maker()() as session:
+        rows = await session.execute(
+            select(
+                UserShardSlotModel.slot, UserShardSlotModel.shard, UserShardSlotModel.state
+            ).order_by(UserShardSlotModel.slot)
+        )
+        return [(slot, shard, state) for slot, shard, state in rows]
+
+
+async def move_slot(shards: UserShards, slot: int, target: int) -> int | None:
+    """
+    Steps 1-4 of moving one slot (see the module docstring).
+
+    Returns the shard the slot left, whose rows of it drop_moved deletes,
+    or None if it was already on the target.
+    """
+    async with get_session_maker()() as session:
+        source, state = (
+            await session.execute(
+                select(UserShardSlotModel.shard, UserShardSlotModel.state).where(
+                    UserShardSlotModel.slot == slot
+                )
+            )
+        ).one()
+    if source == target:
+        if state == FROZEN:
+            await set_slot(slot, source, ACTIVE)
+        return None
+
+    started = time.perf_counter()
+    if state == ACTIVE:
+        copied, _ = await sync_slot(shards, slot, source, target)
+        async with get_session_maker()() as session, session.begin():
+            await session.execute(select(func.pg_advisory_xact_lock(SLOT_LOCK_NAMESPACE, slot)))
+            await session.execute(
+                update(UserShardSlotModel)
+                .where(UserShardSlotModel.slot == slot, UserShardSlotModel.shard == source)
+                .values(state=FROZEN)
+            )
+    else:
+        copied = 0
+    frozen_at = time.perf_counter()
+    changed, removed = await sync_slot(shards, slot, source, target)
+    await set_slot(slot, target, ACTIVE)
+    unfrozen_at = time.perf_counter()
+    print(
+        f"slot {slot}: shard {source} -> {target}, {copied} rows copied, "
+        f"{changed} changed and {removed} removed while frozen for "
+        f"{(unfrozen_at - frozen_at) * 1000:.0f} ms, {unfrozen_at - started:.2f}s total"
+    )
+    return source
+
+
+async def drop_moved(shards: UserShards, moved: list[tuple[int, int]], grace: float) -> None:
+    """Step 5: after the grace period, delete moved (slot, source) rows from their sources."""
+    if not moved:
+        return
+    # One wait for a whole rebalance rather than one per slot
+    await asyncio.sleep(grace)
+    for slot, source in moved:
+        async with shards.session(source) as session:
+            await session.execute(delete(USERS).where(IN_SLOT), {"slot": slot})
+            await session.commit()
+    print(f"deleted the moved rows of {len(moved)} slots from their old shards")
+
+
+async def set_slot(slot: int, shard: int, state: str) -> None:
+    async with get_session_maker()() as session, session.begin():
+        await session.execute(
+            update(UserShardSlotModel)
+            .where(UserShardSlotModel.slot == slot)
+            .values(shard=shard, state=state)
+        )
+
+
+def plan_rebalance(slots: list[tuple[int, int, str]], shard_count: int) -> list[tuple[int, int]]:
+    """(slot, target) moves that leave every shard within one slot of the others."""
+    quota = [
+        SHARD_SLOTS // shard_count + (1 if shard < SHARD_SLOTS % shard_count else 0)
+        for shard in range(shard_count)
+    ]
+    held: list[list[int]] = [[] for _ in range(shard_count)]
+    for slot, shard, _ in slots:
+        held[shard].append(slot)
+
+    surplus = [slot for shard, owned in enumerate(held) for slot in owned[quota[shard] :]]
+    moves = []
+    for shard in range(shard_count):
+        while len(held[shard]) < quota[shard]:
+            slot = surplus.pop()
+            held[shard].append(slot)
+            moves.append((slot, shard))
+    return moves
+
+
+async def init(shards: UserShards) -> None:
+    for shard in range(1, shards.count):
+        async with shards.session(shard) as session:
+            connection = await session.connection()
+            await connection.run_sync(lambda sync: USERS.create(sync, checkfirst=True))
+            await session.commit()
+        print(f"shard {shard}: users table ready")
+
+
+async def status(shards: UserShards) -> None:
+    slots = await read_map()
+    held = Counter(shard for _, shard, _ in slots)
+    frozen = [slot for slot, _, state in slots if state == FROZEN]
+    for shard in range(shards.count):
+        async with shards.session(shard) as session:
+            users = (await session.execute(select(func.count()).select_from(USERS))).scalar_one()
+        print(f"shard {shard}: {held[shard]} slots, {users} users")
+    if frozen:
+        print(f"frozen slots (interrupted moves): {frozen}")
+
+
+async def check(shards: UserShards, delete_strays: bool) -> bool:
+    """Every directory entry has a row on its shard, and no shard has rows of other slots."""
+    slot_shard = {slot: shard for slot, shard, _ in await read_map()}
+    found: set[Any] = set()
+    strays = 0
+    for shard in range(shards.count):
+        async with shards.session(shard) as session:
+            slot_of = literal_column(SHARD_SLOT_SQL, Integer).label("slot")
+            rows = (await session.execute(select(USERS.c.id, slot_of))).all()
+            stray_ids = [row.id for row in rows if slot_shard[row.slot] != shard]
+            found.update(row.id for row in rows if slot_shard[row.slot] == shard)
+            strays += len(stray_ids)
+            if stray_ids and delete_strays:
+                ids = bindparam("user_ids", stray_ids, type_=ARRAY(Uuid()))
+                await session.execute(delete(USERS).where(USERS.c.id == any_(ids)))
+                await session.commit()
+        print(f"shard {shard}: {len(rows)} rows, {len(stray_ids)} outside its slots")
+
+    async with get_session_maker()() as session:
+        directory = set((await session.execute(select(UserDirectoryModel.user_id))).scalars())
+    missing = len(directory - found)
+    print(f"directory: {len(directory)} entries, {missing} without a row on their shard")
+    return missing == 0 and (strays == 0 or delete_strays)
+
+
+async def run(args: argparse.Namespace) -> int:
+    database = get_settings().database
+    shards = UserShards(get_session_maker(), database.user_shard_urls)
+    grace = (
+        args.grace if args.grace is not None else 2 * database.user_shard_map_refresh_interval + 1
+    )
+    try:
+        if args.command == "init":
+            await init(shards)
+        elif args.command == "status":
+            await status(shards)
+        elif args.command == "move":
+            if not 0 <= args.to < shards.count or not 0 <= args.slot < SHARD_SLOTS:
+                raise SystemExit(f"Shards are 0-{shards.count - 1}, slots 0-{SHARD_SLOTS - 1}")
+            source = await move_slot(shards, args.slot, args.to)
+            await drop_moved(shards, [] if source is None else [(args.slot, source)], grace)
+        elif args.command == "rebalance":
+            moves = plan_rebalance(await read_map(), shards.count)
+            print(f"{len(moves)} slots to move over {shards.count} shards")
+            if not args.dry_run:
+                moved = []
+                for slot, target in moves:
+                    source = await move_slot(shards, slot, target)
+                    if source is not None:
+                        moved.append((slot, source))
+                await drop_moved(shards, moved, grace)
+        elif args.command == "check":
+            return 0 if await check(shards, args.delete_strays) else 1
+        return 0
+    finally:
+        await shards.stop()
+        await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manage user shards.")
+    parser.add_argument(
+        "--grace", type=float, default=None, help="Seconds before deleting moved rows"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("init", help="Create the users table on every shard")
+    commands.add_parser("status", help="Slots and users per shard")
+    move = commands.add_parser("move", help="Move one slot")
+    move.add_argument("--slot", type=int, required=True)
+    move.add_argument("--to", type=int, required=True)
+    rebalance = commands.add_parser("rebalance", help="Spread slots evenly over all shards")
+    rebalance.add_argument("--dry-run", action="store_true")
+    check_parser = commands.add_parser("check", help="Verify every user is where the map says")
+    check_parser.add_argument("--delete-strays", action="store_true")
+    raise SystemExit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Seed the catalog with synthetic products for search benchmarks.
+
+Usage: python -m src.cli.seed_catalog --products 1000000
+
+Rows are generated server-side from word lists; only the UUIDv7 ids are
+created here so listing order matches rows created through the API. Run it
+against an empty catalog: seeded slugs are fixed and would collide.
+"""
+
+import argparse
+import asyncio
+import time
+from uuid import uuid7
+
+from sqlalchemy import text
+
+from src.infrastructure.database import dispose_engine, get_engine
+
+ENGLISH_WORDS = [
+    "rice", "lentil", "mustard", "oil", "tea", "sugar", "flour", "soap", "shampoo",
+    "biscuit", "noodles", "milk", "ghee", "spice", "chili", "turmeric", "cumin",
+    "saree", "lungi", "panjabi", "shirt", "sandal", "umbrella", "mobile", "charger",
+    "fan", "blender", "cooker", "kettle", "bucket", "mosquito", "net", "pillow",
+]  # fmt: skip
+BANGLA_WORDS = [
+    "চাল", "ডাল", "সরিষা", "তেল", "চা", "চিনি", "আটা", "সাবান", "শ্যাম্পু",
+    "বিস্কুট", "নুডলস", "দুধ", "ঘি", "মসলা", "মরিচ", "হলুদ", "জিরা",
+    "শাড়ি", "লুঙ্গি", "পাঞ্জাবি", "শার্ট", "স্যান্ডেল", "ছাতা", "মোবাইল", "চার্জার",
+    "ফ্যান", "ব্লেন্ডার", "কুকার", "কেতলি", "বালতি", "মশা", "মশারি", "বালিশ",
+]  # fmt: skip
+ADJECTIVES = ["premium", "fresh", "organic", "family", "classic", "deshi", "mini", "super"]
+
+INSERT_CATEGORIES = text(
+    """
+    INSERT INTO categories (id, name, slug, parent_id, is_active)
+    SELECT ids.id, 'Category ' || ids.n, 'seed-category-' || ids.n,
+           CASE WHEN ids.n > :roots THEN all_ids[1 + (ids.n - 1) % :roots] END, true
+    FROM unnest(CAST(:ids AS uuid[])) WITH ORDINALITY AS ids(id, n),
+         (SELECT CAST(:ids AS uuid[]) AS all_ids) AS arr
+    """
+)
+
+
+def _pick(array: str, salt: int) -> str:
+    """SQL picking a deterministic pseudo-random element of `array` for row `g`."""
+    return f"{array}[1 + (hashint8(g + {salt}) & 2147483647) % cardinality({array})]"
+
+
+# Names vary per row but are deterministic between runs
+INSERT_PRODUCTS = text(
+    f"""
+    WITH words AS (
+        SELECT CAST(:english AS text[]) AS en,
+               CAST(:bangla AS text[]) AS bn,
+               CAST(:adjectives AS text[]) AS adj,
+               CAST(:category_ids AS uuid[]) AS cat
+    )
+    INSERT INTO products (id, name, name_bn, slug, description, price, category_id, is_active)
+    SELECT
+        ids.id,
+        initcap({_pick("adj", 0)} || ' ' || {_pick("en", 1)} || ' ' || {_pick("en", 2)}),
+        {_pick("bn", 1)} || ' ' || {_pick("bn", 2)},
+        'seed-product-' || g,
+        'Quality ' || {_pick("en", 3)} || ' delivered across Dhaka',
+        10 + ((hashint8(g + 4) & 2147483647) % 500000) / 100.0,
+        {_pick("cat", 5)},
+        (hashint8(g + 6) & 2147483647) % 50 <> 0
+    FROM unnest(CAST(:ids AS uuid[])) WITH ORDINALITY AS ids(id, n)
+    CROSS JOIN LATERAL (SELECT CAST(:offset AS bigint) + ids.n AS g) AS seq
+    CROSS JOIN words
+    """
+)
+
+
+async def seed(products: int, categories: int, chunk_size: int) -> None:
+    """Insert `categories` categories and `products` products in committed chunks."""
+    engine = get_engine()
+    category_ids = [uuid7() for _ in range(categories)]
+    async with engine.begin() as conn:
+        await conn.execute(
+            INSERT_CATEGORIES, {"ids": category_ids, "roots": max(categories // 10, 1)}
+        )
+
+    started = time.perf_counter()
+    for offset in range(0, products, chunk_size):
+        ids = [uuid7() for _ in range(min(chunk_size, products - offset))]
+        async with engine.begin() as conn:
+            await conn.execute(
+                INSERT_PRODUCTS,
+                {
+                    "ids": ids,
+                    "offset": offset,
+                    "category_ids": category_ids,
+                    "english": ENGLISH_WORDS,
+                    "bangla": BANGLA_WORDS,
+                    "adjectives": ADJECTIVES,
+                },
+            )
+        print(f"{offset + len(ids):>10} products ({time.perf_counter() - started:.1f}s)")
+
+    async with engine.connect() as conn:
+        await conn.execute(text("ANALYZE categories, products"))
+    await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed synthetic catalog data.")
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--categories", type=int, default=200)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+    asyncio.run(seed(args.products, args.categories, args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Check that a flash sale cannot oversell, and measure checkout throughput.
+
+Usage: python -m src.cli.stress_orders --stock 1000 --buyers 3000
+
+Creates a throwaway product with `stock` units and `buyers` throwaway users,
+each with that product in their cart, then has them all place orders at
+once through the order use cases. A share of the successful orders is
+cancelled straight away, returning units for buyers still in the queue.
+
+Afterwards the stock is audited: units left on the shards plus units
+reserved by pending orders must equal the initial stock, and no more units
+may have been ordered than existed. Exits non-zero if either check fails.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from decimal import Decimal
+from uuid import UUID, uuid7
+
+from sqlalchemy import text
+
+from src.application.use_cases.order.cancel_order import CancelOrder
+from src.application.use_cases.order.place_order import PlaceOrder
+from src.core.config import get_settings
+from src.domain.entities.cart import Cart
+from src.domain.entities.product import Product
+from src.domain.exceptions.order import OutOfStockError
+from src.infrastructure.cache.memory_cart_store import InMemoryCartStore
+from src.infrastructure.database import dispose_engine, get_session_maker
+from src.infrastructure.orm import category_model, user_directory_model  # noqa: F401
+from src.infrastructure.repositories.sqlalchemy.cart_repository_impl import (
+    SQLAlchemyCartRepository,
+)
+from src.infrastructure.repositories.sqlalchemy.inventory_repository_impl import (
+    SQLAlchemyInventoryRepository,
+)
+from src.infrastructure.repositories.sqlalchemy.order_repository_impl import (
+    SQLAlchemyOrderRepository,
+)
+from src.infrastructure.repositories.sqlalchemy.outbox_repository_impl import (
+    SQLAlchemyOutboxRepository,
+)
+from src.infrastructure.repositories.sqlalchemy.product_repository_impl import (
+    SQLAlchemyProductRepository,
+)
+
+BUYER_EMAIL = "order-stress-{}@example.com"
+
+INSERT_USERS = text(
+    """
+    WITH created AS (
+        INSERT INTO users (id, email, hashed_password, full_name, role, is_active, is_verified)
+        SELECT gen_random_uuid(), format(:email_format, n), '!', 'Order Stress', 'CUSTOMER',
+               true, true
+        FROM generate_series(1, :users) AS n
+        ON CONFLICT DO NOTHING
+        RETURNING id, email, created_at
+    )
+    INSERT INTO user_directory (user_id, email, created_at, updated_at)
+    SELECT id, email, created_at, created_at FROM created
+    """
+)
+SELECT_USERS = text("SELECT id FROM users WHERE email LIKE 'order-stress-%@example.com'")
+AUDIT = text(
+    """
+    SELECT
+        (SELECT coalesce(sum(available), 0) FROM inventory_shards WHERE product_id = :product_id),
+        (SELECT coalesce(sum(quantity), 0) FROM stock_reservations WHERE product_id = :product_id),
+        (SELECT coalesce(sum(i.quantity), 0) FROM order_items i JOIN orders o ON o.id = i.order_id
+         WHERE i.product_id = :product_id AND o.status = 'PENDING')
+    """
+)
+CLEANUP = (
+    text(
+        """
+        DELETE FROM outbox_events WHERE aggregate_type = 'order' AND aggregate_id IN
+            (SELECT order_id FROM order_items WHERE product_id = :product_id)
+        """
+    ),
+    text(
+        "DELETE FROM orders WHERE id IN "
+        "(SELECT order_id FROM order_items WHERE product_id = :product_id)"
+    ),
+    text("DELETE FROM products WHERE id = :product_id"),
+    text(
+        """
+        WITH removed AS (
+            DELETE FROM users WHERE email LIKE 'order-stress-%@example.com' RETURNING id
+        )
+        DELETE FROM user_directory WHERE user_id IN (SELECT id FROM removed)
+        """
+    ),
+)
+
+
+async def stress(
+    stock: int, buyers: int, quantity: int, cancel_rate: float, concurrency: int
+) -> int:
+    """Run the flash sale and audit the stock. Returns the process exit code."""
+    settings = get_settings()
+    session_maker = get_session_maker()
+    product = Product(name="Flash sale item", slug=f"flash-sale-{uuid7()}", price=Decimal("99.00"))
+    async with session_maker() as session, session.begin():
+        await SQLAlchemyProductRepository(session).create(product)
+        await SQLAlchemyInventoryRepository(session).set_stock(
+            product.id, stock, settings.inventory_shards
+        )
+        await session.execute(
+            INSERT_USERS, {"email_format": BUYER_EMAIL.replace("{}", "%s"), "users": buyers}
+        )
+        user_ids: list[UUID] = list((await session.execute(SELECT_USERS)).scalars())
+
+    store = InMemoryCartStore(max_entries=buyers)
+    for user_id in user_ids:
+        cart = Cart(user_id=user_id)
+        cart.add_item(product.id, quantity)
+        await store.add(cart)
+
+    rng = random.Random(38)
+    queue = iter(user_ids)
+    latencies: list[float] = []
+    placed = cancelled = sold_out = 0
+
+    async def worker() -> None:
+        nonlocal placed, cancelled, sold_out
+        for user_id in queue:
+            started = time.perf_counter()
+            try:
+                async with session_maker() as session, session.begin():
+                    order = await PlaceOrder(
+                        store,
+                        SQLAlchemyCartRepository(session),
+                        SQLAlchemyProductRepository(session),
+                        SQLAlchemyOrderRepository(session),
+                        SQLAlchemyInventoryRepository(session),
+                        SQLAlchemyOutboxRepository(session),
+                        reservation_ttl=settings.order_reservation_ttl,
+                    ).execute(user_id)
+            except OutOfStockError:
+                sold_out += 1
+                continue
+            finally:
+                latencies.append((time.perf_counter() - started) * 1000)
+            placed += 1
+
+            if rng.random() < cancel_rate:
+                async with session_maker() as session, session.begin():
+                    await CancelOrder(
+                        SQLAlchemyOrderRepository(session),
+                        SQLAlchemyInventoryRepository(session),
+                        SQLAlchemyOutboxRepository(session),
+                    ).execute(user_id, order.id)
+                cancelled += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    async with session_maker() as session, session.begin():
+        left, reserved, pending = (await session.execute(AUDIT, {"product_id": product.id})).one()
+        for stmt in CLEANUP:
+            await session.execute(stmt, {"product_id": product.id})
+    await dispose_engine()
+
+    latencies.sort()
+    print(
+        f"stock={stock} buyers={len(user_ids)} quantity={quantity} "
+        f"shards={settings.inventory_shards} concurrency={concurrency}"
+    )
+    print(f"placed={placed} cancelled={cancelled} sold_out={sold_out}")
+    print(
+        f"throughput={len(latencies) / elapsed:.0f} checkouts/s ({placed / elapsed:.0f} orders/s)"
+    )
+    p50, p99 = latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+    print(f"mean={statistics.fmean(latencies):.2f}ms p50={p50:.2f}ms p99={p99:.2f}ms")
+    print(f"audit: left={left} reserved={reserved} pending_ordered={pending}")
+
+    failures = []
+    if left + reserved != stock:
+        failures.append(f"stock leaked: left + reserved = {left + reserved}, expected {stock}")
+    if reserved != pending:
+        failures.append(f"reserved units ({reserved}) != units in pending orders ({pending})")
+    if (placed - cancelled) * quantity > stock:
+        failures.append(f"oversold: {(placed - cancelled) * quantity} units ordered of {stock}")
+    if placed - cancelled < min(len(user_ids), stock // quantity):
+        failures.append("undersold: buyers were turned away while stock was left")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Flash-sale oversell check and throughput.")
+    parser.add_argument("--stock", type=int, default=1000)
+    parser.add_argument("--buyers", type=int, default=3000)
+    parser.add_argument("--quantity", type=int, default=1)
+    parser.add_argument("--cancel-rate", type=float, default=0.1)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+    raise SystemExit(
+        asyncio.run(
+            stress(args.stock, args.buyers, args.quantity, args.cancel_rate, args.concurrency)
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
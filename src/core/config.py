@@ -1,7 +1,9 @@
 """Application configuration using Pydantic Settings."""
 
 import json
+from functools import lru_cache
 from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -19,6 +21,26 @@ class DatabaseSettings(BaseSettings):
     max_overflow: int = Field(default=10, alias="DB_MAX_OVERFLOW")
     echo: bool = Field(default=False, alias="DB_ECHO")
 
+    # Extra databases holding user rows as shards 1, 2, ...; shard 0 is the one above
+    user_shard_urls: list[str] = Field(default=[], alias="DB_USER_SHARD_URLS")
+    user_shard_map_refresh_interval: float = Field(
+        default=5.0, alias="DB_USER_SHARD_MAP_REFRESH_INTERVAL"
+    )
+    user_email_cache_size: int = Field(default=100_000, alias="DB_USER_EMAIL_CACHE_SIZE")
+
+    # Circuit breaker: fail fast while the database is down or too slow
+    breaker_enabled: bool = Field(default=True, alias="DB_BREAKER_ENABLED")
+    breaker_window: int = Field(default=100, alias="DB_BREAKER_WINDOW")
+    breaker_minimum_calls: int = Field(default=20, alias="DB_BREAKER_MINIMUM_CALLS")
+    breaker_failure_rate: float = Field(default=0.5, alias="DB_BREAKER_FAILURE_RATE")
+    breaker_slow_call_rate: float = Field(default=0.5, alias="DB_BREAKER_SLOW_CALL_RATE")
+    breaker_slow_call_duration: float = Field(default=2.0, alias="DB_BREAKER_SLOW_CALL_DURATION")
+    breaker_open_duration: float = Field(default=5.0, alias="DB_BREAKER_OPEN_DURATION")
+    breaker_half_open_calls: int = Field(default=3, alias="DB_BREAKER_HALF_OPEN_CALLS")
+    # Cached reads served while the breaker is open, if at most this old
+    stale_max_age: float = Field(default=300.0, alias="DB_STALE_MAX_AGE")
+    stale_cache_size: int = Field(default=10_000, alias="DB_STALE_CACHE_SIZE")
+
     @property
     def url(self) -> str:
         """Construct database URL."""
@@ -55,13 +77,133 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = Field(default=30, alias="ACCESS_TOKEN_EXPIRE_MINUTES")
     refresh_token_expire_days: int = Field(default=7, alias="REFRESH_TOKEN_EXPIRE_DAYS")
     algorithm: str = Field(default="HS256", alias="ALGORITHM")
+    # Asymmetric signing (RS256/ES256): directory of <kid>.pem private keys
+    jwt_keys_dir: str | None = Field(default=None, alias="JWT_KEYS_DIR")
+    jwt_active_kid: str | None = Field(default=None, alias="JWT_ACTIVE_KID")
+    jwks_max_age: int = Field(default=300, alias="JWKS_MAX_AGE")
+    email_verification_token_expire_hours: int = Field(
+        default=24, alias="EMAIL_VERIFICATION_TOKEN_EXPIRE_HOURS"
+    )
+    # Frontend page that receives ?token=... and posts it to /auth/verify-email
+    email_verification_url: str = Field(
+        default="http://localhost:3000/verify-email", alias="EMAIL_VERIFICATION_URL"
+    )
 
     # Redis
     redis_url: str = Field(default="redis://localhost:6379/0", alias="REDIS_URL")
     redis_cache_ttl: int = Field(default=300, alias="REDIS_CACHE_TTL")
 
+    # Request deadlines (seconds)
+    request_timeout: float = Field(default=10.0, alias="REQUEST_TIMEOUT")
+    request_timeout_max: float = Field(default=30.0, alias="REQUEST_TIMEOUT_MAX")
+
+    # Response compression (zstd, br with the compression extra, gzip)
+    compression_minimum_size: int = Field(default=1024, alias="COMPRESSION_MINIMUM_SIZE")
+    compression_offload_size: int = Field(default=262_144, alias="COMPRESSION_OFFLOAD_SIZE")
+    compression_gzip_level: int = Field(default=6, alias="COMPRESSION_GZIP_LEVEL")
+    compression_brotli_quality: int = Field(default=4, alias="COMPRESSION_BROTLI_QUALITY")
+    compression_zstd_level: int = Field(default=3, alias="COMPRESSION_ZSTD_LEVEL")
+
+    # Idempotency keys
+    idempotency_backend: str = Field(default="memory", alias="IDEMPOTENCY_BACKEND")
+    idempotency_ttl: int = Field(default=86_400, alias="IDEMPOTENCY_TTL")
+    idempotency_max_entries: int = Field(default=10_000, alias="IDEMPOTENCY_MAX_ENTRIES")
+    idempotency_wait_timeout: float = Field(default=30.0, alias="IDEMPOTENCY_WAIT_TIMEOUT")
+    idempotency_max_request_bytes: int = Field(
+        default=1_048_576, alias="IDEMPOTENCY_MAX_REQUEST_BYTES"
+    )
+
+    # Phone login codes
+    otp_backend: str = Field(default="memory", alias="OTP_BACKEND")
+    otp_length: int = Field(default=6, alias="OTP_LENGTH")
+    otp_ttl: int = Field(default=300, alias="OTP_TTL")
+    otp_max_attempts: int = Field(default=5, alias="OTP_MAX_ATTEMPTS")
+    otp_max_sends: int = Field(default=3, alias="OTP_MAX_SENDS")
+    otp_send_window: int = Field(default=900, alias="OTP_SEND_WINDOW")
+
+    # Auth event log
+    auth_event_queue_size: int = Field(default=10_000, alias="AUTH_EVENT_QUEUE_SIZE")
+    auth_event_batch_size: int = Field(default=500, alias="AUTH_EVENT_BATCH_SIZE")
+    auth_event_flush_interval: float = Field(default=1.0, alias="AUTH_EVENT_FLUSH_INTERVAL")
+    auth_event_enqueue_timeout: float = Field(default=0.05, alias="AUTH_EVENT_ENQUEUE_TIMEOUT")
+    auth_event_shutdown_timeout: float = Field(default=5.0, alias="AUTH_EVENT_SHUTDOWN_TIMEOUT")
+
+    # Background jobs
+    job_concurrency: int = Field(default=4, alias="JOB_CONCURRENCY")
+    job_batch_size: int = Field(default=20, alias="JOB_BATCH_SIZE")
+    job_poll_interval: float = Field(default=0.5, alias="JOB_POLL_INTERVAL")
+    job_max_attempts: int = Field(default=5, alias="JOB_MAX_ATTEMPTS")
+    job_retry_backoff: float = Field(default=2.0, alias="JOB_RETRY_BACKOFF")
+    job_lock_timeout: float = Field(default=300.0, alias="JOB_LOCK_TIMEOUT")
+    job_shutdown_timeout: float = Field(default=10.0, alias="JOB_SHUTDOWN_TIMEOUT")
+
+    # Domain event outbox
+    event_sink: str = Field(default="logging", alias="EVENT_SINK")
+    event_sink_path: str = Field(default="events.ndjson", alias="EVENT_SINK_PATH")
+    outbox_batch_size: int = Field(default=500, alias="OUTBOX_BATCH_SIZE")
+    outbox_poll_interval: float = Field(default=0.2, alias="OUTBOX_POLL_INTERVAL")
+
+    # Catalog
+    category_tree_refresh_interval: float = Field(
+        default=2.0, alias="CATEGORY_TREE_REFRESH_INTERVAL"
+    )
+
+    # Shopping cart
+    cart_backend: str = Field(default="memory", alias="CART_BACKEND")
+    cart_ttl: int = Field(default=604_800, alias="CART_TTL")
+    cart_max_entries: int = Field(default=100_000, alias="CART_MAX_ENTRIES")
+    cart_flush_interval: float = Field(default=1.0, alias="CART_FLUSH_INTERVAL")
+    cart_flush_batch_size: int = Field(default=500, alias="CART_FLUSH_BATCH_SIZE")
+
+    # Delivery coverage
+    delivery_zone_refresh_interval: float = Field(
+        default=10.0, alias="DELIVERY_ZONE_REFRESH_INTERVAL"
+    )
+    delivery_grid_cell_size: float = Field(default=0.002, alias="DELIVERY_GRID_CELL_SIZE")
+
+    # Recommendations
+    recommendations_path: str = Field(
+        default="var/recommendations.bin", alias="RECOMMENDATIONS_PATH"
+    )
+    recommendations_reload_interval: float = Field(
+        default=30.0, alias="RECOMMENDATIONS_RELOAD_INTERVAL"
+    )
+    recommendations_top_k: int = Field(default=20, alias="RECOMMENDATIONS_TOP_K")
+
+    # Orders and inventory
+    order_reservation_ttl: int = Field(default=900, alias="ORDER_RESERVATION_TTL")
+    inventory_shards: int = Field(default=16, alias="INVENTORY_SHARDS")
+    reservation_sweep_interval: float = Field(default=5.0, alias="RESERVATION_SWEEP_INTERVAL")
+    reservation_sweep_batch_size: int = Field(default=500, alias="RESERVATION_SWEEP_BATCH_SIZE")
+
+    # Reporting
+    report_refresh_interval: float = Field(default=30.0, alias="REPORT_REFRESH_INTERVAL")
+    report_settle_seconds: int = Field(default=120, alias="REPORT_SETTLE_SECONDS")
+    report_max_window: int = Field(default=86_400, alias="REPORT_MAX_WINDOW")
+    report_time_zone: str = Field(default="Asia/Dhaka", alias="REPORT_TIME_ZONE")
+    report_cache_ttl: int = Field(default=30, alias="REPORT_CACHE_TTL")
+    report_cache_max_entries: int = Field(default=1000, alias="REPORT_CACHE_MAX_ENTRIES")
+
+    # User export
+    user_export_batch_size: int = Field(default=2000, alias="USER_EXPORT_BATCH_SIZE")
+    user_export_timeout: float = Field(default=3600.0, alias="USER_EXPORT_TIMEOUT")
+
+    # Bulk user updates
+    user_bulk_chunk_size: int = Field(default=1000, alias="USER_BULK_CHUNK_SIZE")
+    user_bulk_timeout: float = Field(default=600.0, alias="USER_BULK_TIMEOUT")
+
+    # Registered email filter
+    email_filter_path: str = Field(default="var/email_filter.bin", alias="EMAIL_FILTER_PATH")
+    email_filter_false_positive_rate: float = Field(
+        default=0.01, alias="EMAIL_FILTER_FALSE_POSITIVE_RATE"
+    )
+    email_filter_refresh_interval: float = Field(default=5.0, alias="EMAIL_FILTER_REFRESH_INTERVAL")
+    email_filter_snapshot_interval: float = Field(
+        default=300.0, alias="EMAIL_FILTER_SNAPSHOT_INTERVAL"
+    )
+
     # Database
-    database: DatabaseSettings = DatabaseSettings()
+    database: DatabaseSettings = Field(default_factory=DatabaseSettings)
 
     # Validators
     @field_validator("allowed_hosts", "cors_origins", mode="before")
@@ -93,6 +235,56 @@ class Settings(BaseSettings):
             raise ValueError(f"Invalid environment. Must be one of: {valid_envs}")
         return v_lower
 
+    @field_validator("idempotency_backend")
+    @classmethod
+    def validate_idempotency_backend(cls, v: str) -> str:
+        """Validate idempotency store backend."""
+        valid_backends = ["memory", "redis"]
+        v_lower = v.lower()
+        if v_lower not in valid_backends:
+            raise ValueError(f"Invalid idempotency backend. Must be one of: {valid_backends}")
+        return v_lower
+
+    @field_validator("otp_backend")
+    @classmethod
+    def validate_otp_backend(cls, v: str) -> str:
+        """Validate login code store backend."""
+        valid_backends = ["memory", "redis"]
+        v_lower = v.lower()
+        if v_lower not in valid_backends:
+            raise ValueError(f"Invalid OTP backend. Must be one of: {valid_backends}")
+        return v_lower
+
+    @field_validator("cart_backend")
+    @classmethod
+    def validate_cart_backend(cls, v: str) -> str:
+        """Validate cart store backend."""
+        valid_backends = ["memory", "redis"]
+        v_lower = v.lower()
+        if v_lower not in valid_backends:
+            raise ValueError(f"Invalid cart backend. Must be one of: {valid_backends}")
+        return v_lower
+
+    @field_validator("event_sink")
+    @classmethod
+    def validate_event_sink(cls, v: str) -> str:
+        """Validate domain event sink."""
+        valid_sinks = ["logging", "memory", "file"]
+        v_lower = v.lower()
+        if v_lower not in valid_sinks:
+            raise ValueError(f"Invalid event sink. Must be one of: {valid_sinks}")
+        return v_lower
+
+    @field_validator("report_time_zone")
+    @classmethod
+    def validate_report_time_zone(cls, v: str) -> str:
+        """Validate reporting time zone is a known IANA name."""
+        try:
+            ZoneInfo(v)
+        except ValueError, ZoneInfoNotFoundError:
+            raise ValueError(f"Unknown time zone: {v}") from None
+        return v
+
     @field_validator("secret_key")
     @classmethod
     def validate_secret_key(cls, v: str) -> str:
@@ -114,5 +306,12 @@ class Settings(BaseSettings):
         return self.environment == "development"
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Return the application settings, loading them on first use.
+
+    Environment and .env parsing happens on the first call instead of at
+    import time, so importing modules that depend on configuration stays cheap.
+    """
+    return Settings()
@@ -6,6 +6,24 @@
 DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
 
+# Full-text and trigram matches each ranked per search; deeper results are
+# not reachable by paging
+SEARCH_MAX_CANDIDATES = 1000
+
+
+# ==========================================================================
+# Reporting
+# ==========================================================================
+DEFAULT_REPORT_DAYS = 30
+MAX_REPORT_DAYS = 366
+
+
+# ==========================================================================
+# Recommendations
+# ==========================================================================
+DEFAULT_RECOMMENDATIONS = 10
+MAX_RECOMMENDATIONS = 50
+
 
 # ==========================================================================
 # Cache
@@ -0,0 +1,103 @@
+"""Dependency container with singleton, request and transient lifetimes."""
+
+from collections.abc import Callable
+from enum import Enum
+from typing import Any, cast
+
+# A class or interface to resolve. Callable rather than type[T] so abstract
+# interfaces are accepted as keys.
+type Key[T] = Callable[..., T]
+
+
+class Lifetime(str, Enum):
+    """How long a resolved instance is reused."""
+
+    SINGLETON = "singleton"  # Built once, on first use, for the whole application
+    REQUEST = "request"  # Built once per scope, which is one HTTP request
+    TRANSIENT = "transient"  # Built on every resolve
+
+
+class ResolutionError(LookupError):
+    """Raised when a key cannot be resolved in the current scope."""
+
+
+class Container:
+    """
+    Registry of factories by key, built once at startup.
+
+    Factories receive the resolving Scope and resolve their own
+    dependencies from it, so a graph is declared by registering each node:
+
+        container.register(ITokenService, lambda _: JWTService(), Lifetime.SINGLETON)
+        container.register(
+            LoginUser, lambda scope: LoginUser(scope.resolve(IUserRepository), ...)
+        )
+
+    Singletons are built in the root scope, so they can only depend on other
+    singletons; a request-scoped dependency would outlive its request.
+    """
+
+    def __init__(self) -> None:
+        self._factories: dict[Key[Any], tuple[Callable[[Scope], Any], Lifetime]] = {}
+        self._singletons: dict[Key[Any], Any] = {}
+        self._root = Scope(self, {})
+
+    def register[T](
+        self,
+        key: Key[T],
+        factory: Callable[[Scope], T],
+        lifetime: Lifetime = Lifetime.TRANSIENT,
+    ) -> None:
+        """Register how to build `key` and how long to keep it."""
+        self._factories[key] = (factory, lifetime)
+        self._singletons.pop(key, None)
+
+    def instance[T](self, key: Key[T], value: T) -> None:
+        """Register an already built singleton."""
+        self._factories[key] = (lambda _: value, Lifetime.SINGLETON)
+        self._singletons[key] = value
+
+    def scope(self, values: dict[Key[Any], Any]) -> Scope:
+        """New request scope, seeded with values supplied by the caller (the session, ...)."""
+        return Scope(self, values)
+
+    def resolve[T](self, key: Key[T]) -> T:
+        """Resolve outside any request; request-scoped keys are refused."""
+        return self._root.resolve(key)
+
+    def _singleton[T](self, key: Key[T], factory: Callable[[Scope], T]) -> T:
+        if key in self._singletons:
+            return cast(T, self._singletons[key])
+        value = factory(self._root)
+        self._singletons[key] = value
+        return value
+
+
+class Scope:
+    """Resolution scope keeping the request-lifetime instances of one request."""
+
+    def __init__(self, container: Container, values: dict[Key[Any], Any]) -> None:
+        self._container = container
+        self._values = values
+
+    def resolve[T](self, key: Key[T]) -> T:
+        """Instance for `key`, built or reused according to its lifetime."""
+        if key in self._values:
+            return cast(T, self._values[key])
+        registration = self._container._factories.get(key)
+        if registration is None:
+            raise ResolutionError(f"Nothing registered for {_name(key)}")
+        factory, lifetime = cast(tuple[Callable[[Scope], T], Lifetime], registration)
+        if lifetime is Lifetime.SINGLETON:
+            return self._container._singleton(key, factory)
+        if lifetime is Lifetime.TRANSIENT:
+            return factory(self)
+        if self is self._container._root:
+            raise ResolutionError(f"{_name(key)} is request-scoped; resolve it within a request")
+        value = factory(self)
+        self._values[key] = value
+        return value
+
+
+def _name(key: Key[Any]) -> str:
+    return getattr(key, "__qualname__", repr(key))
@@ -0,0 +1,51 @@
+"""Per-request deadlines carried in a context variable."""
+
+import asyncio
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+
+
+@dataclass
+class RequestDeadline:
+    """
+    Absolute deadline for the current request (time.monotonic() based).
+
+    `explicit` is True when the client supplied the timeout; route defaults
+    may then only tighten it, never extend it.
+    """
+
+    started_at: float
+    expires_at: float
+    explicit: bool = False
+    changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (never negative)."""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def apply_route_timeout(self, timeout: float) -> None:
+        """Apply a per-route default timeout, measured from the request start."""
+        expires_at = self.started_at + timeout
+        self.expires_at = min(self.expires_at, expires_at) if self.explicit else expires_at
+        self.changed.set()
+
+
+_current_deadline: ContextVar[RequestDeadline | None] = ContextVar("request_deadline", default=None)
+
+
+def start_deadline(timeout: float, *, explicit: bool = False) -> Token[RequestDeadline | None]:
+    """Start a deadline for the current request. Returns a token for reset_deadline()."""
+    now = time.monotonic()
+    deadline = RequestDeadline(started_at=now, expires_at=now + timeout, explicit=explicit)
+    return _current_deadline.set(deadline)
+
+
+def reset_deadline(token: Token[RequestDeadline | None]) -> None:
+    """Clear the deadline set by start_deadline()."""
+    _current_deadline.reset(token)
+
+
+def get_deadline() -> RequestDeadline | None:
+    """Deadline of the current request, or None outside a request."""
+    return _current_deadline.get()
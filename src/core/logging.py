@@ -6,7 +6,7 @@ from pathlib import Path
 
 from pythonjsonlogger import jsonlogger
 
-from src.core.config import settings
+from src.core.config import get_settings
 
 
 def setup_logging() -> None:
@@ -17,7 +17,11 @@ def setup_logging() -> None:
     - Console handler (stdout) - human-readable in dev, JSON in prod
     - File handler (logs/app.log) - always JSON format
     - Log level from settings
+
+    Called from the application lifespan rather than at import time.
     """
+    settings = get_settings()
+
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
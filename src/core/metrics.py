@@ -0,0 +1,65 @@
+"""In-process metrics exposed in the Prometheus text format."""
+
+import threading
+from collections.abc import Iterable
+
+# Every metric registers itself here on creation
+REGISTRY: list[Counter] = []
+
+
+class Counter:
+    """Monotonically increasing counter with optional labels."""
+
+    def __init__(self, name: str, description: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter for the given label values."""
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Current value for the given label values."""
+        return self._values.get(tuple(labels.get(name, "") for name in self.labelnames), 0.0)
+
+    def render(self) -> list[str]:
+        """Render as Prometheus text lines."""
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self._type}"]
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {value}")
+        return lines
+
+    _type = "counter"
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    _type = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge for the given label values."""
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            self._values[key] = value
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{value}"' for name, value in zip(names, values, strict=True))
+    return f"{{{pairs}}}"
+
+
+def render_metrics() -> str:
+    """Render every registered metric in the Prometheus text exposition format."""
+    lines: list[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,27 @@
+"""Opaque keyset pagination cursors."""
+
+import base64
+import json
+from typing import Any
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client sends a cursor this API did not issue."""
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last item on a page as an opaque string."""
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """Decode a cursor into its `size` sort-key values. Raises InvalidCursorError."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except ValueError as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError("Invalid cursor")
+    return values
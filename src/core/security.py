@@ -1,5 +1,9 @@
 """Security utilities for password hashing and verification."""
 
+import hashlib
+import hmac
+import secrets
+
 import bcrypt
 
 
@@ -16,3 +20,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     password_bytes = plain_password.encode("utf-8")
     hashed_bytes = hashed_password.encode("utf-8")
     return bcrypt.checkpw(password_bytes, hashed_bytes)
+
+
+def generate_otp(length: int) -> str:
+    """Generate a random numeric one-time code."""
+    return f"{secrets.randbelow(10**length):0{length}d}"
+
+
+def hash_otp(code: str, phone: str, secret_key: str) -> str:
+    """Keyed hash of a one-time code, bound to the phone number it was sent to."""
+    message = f"{phone}:{code}".encode()
+    return hmac.new(secret_key.encode("utf-8"), message, hashlib.sha256).hexdigest()
@@ -1,5 +1,28 @@
 """Domain entities."""
 
-from src.domain.entities.user import Role, User
+from src.domain.entities.auth_event import AuthEvent, AuthEventType
+from src.domain.entities.cart import Cart, CartItem
+from src.domain.entities.delivery import DeliveryZone
+from src.domain.entities.order import Order, OrderItem, OrderStatus
+from src.domain.entities.product import Category, Product
+from src.domain.entities.report import CustomerSales, DailyRegistrations, DailySales
+from src.domain.entities.user import Role, User, normalize_email
 
-__all__ = ["User", "Role"]
+__all__ = [
+    "User",
+    "Role",
+    "normalize_email",
+    "AuthEvent",
+    "AuthEventType",
+    "Category",
+    "Product",
+    "Cart",
+    "CartItem",
+    "Order",
+    "OrderItem",
+    "OrderStatus",
+    "DailySales",
+    "DailyRegistrations",
+    "CustomerSales",
+    "DeliveryZone",
+]
@@ -0,0 +1,26 @@
+"""Authentication event domain entity."""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from uuid import UUID, uuid7
+
+
+class AuthEventType(str, Enum):
+    """Kinds of authentication events recorded for auditing."""
+
+    LOGIN_SUCCEEDED = "LOGIN_SUCCEEDED"
+    LOGIN_FAILED = "LOGIN_FAILED"
+    REGISTERED = "REGISTERED"
+
+
+@dataclass(frozen=True)
+class AuthEvent:
+    """Append-only record of an authentication attempt or registration."""
+
+    event_type: AuthEventType
+    email: str
+    user_id: UUID | None = None
+    reason: str | None = None
+    id: UUID = field(default_factory=uuid7)
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(UTC))
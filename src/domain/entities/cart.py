@@ -0,0 +1,87 @@
+"""Shopping cart domain entities."""
+
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from uuid import UUID
+
+from src.domain.exceptions.cart import CartItemNotFoundError, CartLimitExceededError
+
+MAX_CART_LINES = 50
+MAX_ITEM_QUANTITY = 99
+
+
+@dataclass(frozen=True)
+class CartItem:
+    """A product line in a cart."""
+
+    product_id: UUID
+    quantity: int
+    added_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+@dataclass
+class Cart:
+    """
+    A user's shopping cart.
+
+    `version` increases with every change; stores use it to detect
+    concurrent writers and to skip persisting stale copies.
+    """
+
+    user_id: UUID
+    items: list[CartItem] = field(default_factory=list)
+    version: int = 0
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    def add_item(self, product_id: UUID, quantity: int) -> None:
+        """Add a product, or increase its quantity if it is already in the cart."""
+        index = self._index(product_id)
+        if index is None:
+            if len(self.items) >= MAX_CART_LINES:
+                raise CartLimitExceededError(f"A cart can hold at most {MAX_CART_LINES} products")
+            self._check_quantity(quantity)
+            self.items.append(CartItem(product_id=product_id, quantity=quantity))
+        else:
+            item = self.items[index]
+            self._check_quantity(item.quantity + quantity)
+            self.items[index] = replace(item, quantity=item.quantity + quantity)
+        self._touch()
+
+    def set_quantity(self, product_id: UUID, quantity: int) -> None:
+        """Set the quantity of a product in the cart; zero removes it."""
+        if quantity == 0:
+            self.remove_item(product_id)
+            return
+        index = self._index(product_id)
+        if index is None:
+            raise CartItemNotFoundError()
+        self._check_quantity(quantity)
+        self.items[index] = replace(self.items[index], quantity=quantity)
+        self._touch()
+
+    def remove_item(self, product_id: UUID) -> None:
+        """Remove a product from the cart."""
+        index = self._index(product_id)
+        if index is None:
+            raise CartItemNotFoundError()
+        del self.items[index]
+        self._touch()
+
+    def clear(self) -> None:
+        """Remove every item."""
+        self.items.clear()
+        self._touch()
+
+    def _index(self, product_id: UUID) -> int | None:
+        for index, item in enumerate(self.items):
+            if item.product_id == product_id:
+                return index
+        return None
+
+    def _check_quantity(self, quantity: int) -> None:
+        if quantity > MAX_ITEM_QUANTITY:
+            raise CartLimitExceededError(f"At most {MAX_ITEM_QUANTITY} of a product per cart")
+
+    def _touch(self) -> None:
+        self.version += 1
+        self.updated_at = datetime.now(UTC)
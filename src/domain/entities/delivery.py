@@ -0,0 +1,27 @@
+"""Delivery coverage domain entities."""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from uuid import UUID, uuid7
+
+# A closed ring of (longitude, latitude) vertices; the closing vertex is not repeated
+Ring = list[tuple[float, float]]
+
+
+@dataclass
+class DeliveryZone:
+    """
+    Area served by one delivery hub.
+
+    The first ring is the outline and any further rings are holes. Where zones
+    overlap, the one with the highest priority serves the point.
+    """
+
+    name: str
+    hub_code: str
+    rings: list[Ring]
+    id: UUID = field(default_factory=uuid7)
+    priority: int = 0
+    is_active: bool = True
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
@@ -0,0 +1,59 @@
+"""Order domain entities."""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID, uuid7
+
+
+class OrderStatus(str, Enum):
+    """Order lifecycle. Stock is held while PENDING and kept once CONFIRMED."""
+
+    PENDING = "PENDING"
+    CONFIRMED = "CONFIRMED"
+    CANCELLED = "CANCELLED"
+    EXPIRED = "EXPIRED"
+
+
+@dataclass(frozen=True)
+class OrderItem:
+    """A product line of an order, priced when the order was placed."""
+
+    product_id: UUID
+    quantity: int
+    unit_price: Decimal
+
+    @property
+    def subtotal(self) -> Decimal:
+        """Price of the line."""
+        return self.unit_price * self.quantity
+
+
+@dataclass
+class Order:
+    """
+    A customer order.
+
+    Placing an order reserves its stock until reserved_until. Confirming it
+    before then keeps the stock; otherwise the reservation is released and
+    the order expires.
+    """
+
+    user_id: UUID
+    items: list[OrderItem]
+    reserved_until: datetime
+    id: UUID = field(default_factory=uuid7)
+    status: OrderStatus = OrderStatus.PENDING
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def total(self) -> Decimal:
+        """Sum of all line subtotals."""
+        return sum((item.subtotal for item in self.items), Decimal("0"))
+
+    def is_pending(self, now: datetime | None = None) -> bool:
+        """Check if the order still holds a live stock reservation."""
+        now = now or datetime.now(UTC)
+        return self.status == OrderStatus.PENDING and self.reserved_until > now
@@ -0,0 +1,39 @@
+"""Product catalog domain entities."""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import UUID, uuid7
+
+
+@dataclass
+class Category:
+    """Product category; categories form a tree through parent_id."""
+
+    name: str
+    slug: str
+    id: UUID = field(default_factory=uuid7)
+    parent_id: UUID | None = None
+    is_active: bool = True
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+@dataclass
+class Product:
+    """Product offered in the catalog. Names may be given in English and Bangla."""
+
+    name: str
+    slug: str
+    price: Decimal
+    id: UUID = field(default_factory=uuid7)
+    name_bn: str | None = None
+    description: str | None = None
+    category_id: UUID | None = None
+    is_active: bool = True
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    def is_available(self) -> bool:
+        """Check if the product can be shown and sold."""
+        return self.is_active
@@ -0,0 +1,38 @@
+"""Reporting entities: pre-aggregated rows of the admin dashboards."""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+# Sources the summary tables are built from; each has its own watermark
+SALES_REPORT = "sales"
+REGISTRATIONS_REPORT = "registrations"
+
+
+@dataclass(frozen=True)
+class DailySales:
+    """Confirmed orders of one day (in the reporting time zone)."""
+
+    day: date
+    orders: int
+    units: int
+    revenue: Decimal
+
+
+@dataclass(frozen=True)
+class DailyRegistrations:
+    """Users who registered on one day (in the reporting time zone)."""
+
+    day: date
+    users: int
+
+
+@dataclass(frozen=True)
+class CustomerSales:
+    """A customer's confirmed orders over all time."""
+
+    user_id: UUID
+    orders: int
+    revenue: Decimal
+    last_order_at: datetime
@@ -1,9 +1,31 @@
 """User domain entity."""
 
+import re
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
-from uuid import UUID, uuid4
+from uuid import UUID, uuid7
+
+
+def normalize_email(email: str) -> str:
+    """Normalize an email address for storage and lookup (case-insensitive)."""
+    return email.strip().lower()
+
+
+# Bangladeshi mobile numbers in the normalized +8801XXXXXXXXX form
+BD_MOBILE_PATTERN = re.compile(r"^\+8801[3-9]\d{8}$")
+
+
+def normalize_phone(phone: str) -> str:
+    """Normalize a phone number for storage and lookup (+880 prefix, no separators)."""
+    phone = re.sub(r"[\s\-().]", "", phone)
+    if phone.startswith("00"):
+        phone = "+" + phone[2:]
+    if phone.startswith("01"):
+        phone = "+88" + phone
+    elif phone.startswith("880"):
+        phone = "+" + phone
+    return phone
 
 
 class Role(str, Enum):
@@ -19,7 +41,7 @@ class User:
 
     email: str
     hashed_password: str
-    id: UUID = field(default_factory=uuid4)
+    id: UUID = field(default_factory=uuid7)
     full_name: str | None = None
     phone: str | None = None
     role: Role = Role.CUSTOMER
@@ -28,6 +50,12 @@ class User:
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
+    def __post_init__(self) -> None:
+        """Store emails and phones in normalized form so lookups match any spelling."""
+        self.email = normalize_email(self.email)
+        if self.phone:
+            self.phone = normalize_phone(self.phone)
+
     def is_admin(self) -> bool:
         """Check if user has admin privileges."""
         return self.role == Role.ADMIN
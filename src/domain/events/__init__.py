@@ -0,0 +1,31 @@
+"""Domain events."""
+
+from src.domain.events.base import DomainEvent
+from src.domain.events.order import (
+    OrderCancelled,
+    OrderConfirmed,
+    OrderEvent,
+    OrderExpired,
+    OrderPlaced,
+)
+from src.domain.events.user import (
+    UserDeactivated,
+    UserEvent,
+    UserRegistered,
+    UserRoleChanged,
+    UserVerified,
+)
+
+__all__ = [
+    "DomainEvent",
+    "UserEvent",
+    "UserRegistered",
+    "UserVerified",
+    "UserDeactivated",
+    "UserRoleChanged",
+    "OrderEvent",
+    "OrderPlaced",
+    "OrderConfirmed",
+    "OrderCancelled",
+    "OrderExpired",
+]
@@ -0,0 +1,35 @@
+"""Base domain event."""
+
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import Any, ClassVar
+from uuid import UUID, uuid7
+
+
+@dataclass(frozen=True, kw_only=True)
+class DomainEvent:
+    """
+    Something that happened to an aggregate, published to other services.
+
+    Subclasses add their own fields, which become the event payload.
+    """
+
+    aggregate_type: ClassVar[str]
+
+    aggregate_id: UUID
+    event_id: UUID = field(default_factory=uuid7)
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def event_type(self) -> str:
+        """Event name as published, e.g. 'UserRegistered'."""
+        return type(self).__name__
+
+    def payload(self) -> dict[str, Any]:
+        """Event-specific fields as JSON-compatible values."""
+        data = asdict(self)
+        for name in ("aggregate_id", "event_id", "occurred_at"):
+            data.pop(name)
+        return {
+            key: str(value) if isinstance(value, UUID) else value for key, value in data.items()
+        }
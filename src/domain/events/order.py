@@ -0,0 +1,39 @@
+"""Order domain events."""
+
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from src.domain.events.base import DomainEvent
+
+
+@dataclass(frozen=True, kw_only=True)
+class OrderEvent(DomainEvent):
+    """Event whose aggregate is an order; aggregate_id is the order ID."""
+
+    aggregate_type = "order"
+
+
+@dataclass(frozen=True, kw_only=True)
+class OrderPlaced(OrderEvent):
+    """An order was placed and its stock reserved."""
+
+    user_id: UUID
+    # Decimal amounts are published as strings to keep them exact
+    total: str
+    items: list[dict[str, Any]]
+
+
+@dataclass(frozen=True, kw_only=True)
+class OrderConfirmed(OrderEvent):
+    """An order was confirmed; its reserved stock is sold."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class OrderCancelled(OrderEvent):
+    """An order was cancelled and its stock released."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class OrderExpired(OrderEvent):
+    """An order was not confirmed in time and its stock was released."""
@@ -0,0 +1,39 @@
+"""User domain events."""
+
+from dataclasses import dataclass
+
+from src.domain.events.base import DomainEvent
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserEvent(DomainEvent):
+    """Event whose aggregate is a user; aggregate_id is the user ID."""
+
+    aggregate_type = "user"
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserRegistered(UserEvent):
+    """A new user account was created."""
+
+    email: str
+    role: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserVerified(UserEvent):
+    """A user confirmed ownership of their email address."""
+
+    email: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserDeactivated(UserEvent):
+    """A user account was deactivated and can no longer log in."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserRoleChanged(UserEvent):
+    """A user was given another authorization role."""
+
+    role: str
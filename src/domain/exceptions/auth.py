@@ -15,3 +15,10 @@ class TokenError(DomainException):
 
     def __init__(self, message: str = "Invalid or expired token") -> None:
         super().__init__(message)
+
+
+class OtpRateLimitedError(DomainException):
+    """Raised when too many login codes were requested for a phone number."""
+
+    def __init__(self, message: str = "Too many codes requested. Try again later.") -> None:
+        super().__init__(message)
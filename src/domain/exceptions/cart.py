@@ -0,0 +1,24 @@
+"""Shopping cart domain exceptions."""
+
+from src.domain.exceptions.base import DomainException
+
+
+class CartItemNotFoundError(DomainException):
+    """Raised when a product is not in the cart."""
+
+    def __init__(self, message: str = "Product is not in the cart") -> None:
+        super().__init__(message)
+
+
+class CartLimitExceededError(DomainException):
+    """Raised when a change would exceed the cart's line or quantity limits."""
+
+    def __init__(self, message: str = "Cart limit exceeded") -> None:
+        super().__init__(message)
+
+
+class CartConflictError(DomainException):
+    """Raised when concurrent changes to a cart keep conflicting."""
+
+    def __init__(self, message: str = "Cart was modified concurrently, please retry") -> None:
+        super().__init__(message)
@@ -0,0 +1,31 @@
+"""Product catalog domain exceptions."""
+
+from src.domain.exceptions.base import DomainException
+
+
+class ProductNotFoundError(DomainException):
+    """Raised when a product is not found."""
+
+    def __init__(self, message: str = "Product not found") -> None:
+        super().__init__(message)
+
+
+class ProductAlreadyExistsError(DomainException):
+    """Raised when a product slug is already taken."""
+
+    def __init__(self, message: str = "Product already exists") -> None:
+        super().__init__(message)
+
+
+class CategoryNotFoundError(DomainException):
+    """Raised when a category is not found."""
+
+    def __init__(self, message: str = "Category not found") -> None:
+        super().__init__(message)
+
+
+class CategoryAlreadyExistsError(DomainException):
+    """Raised when a category slug is already taken."""
+
+    def __init__(self, message: str = "Category already exists") -> None:
+        super().__init__(message)
@@ -0,0 +1,10 @@
+"""Delivery coverage domain exceptions."""
+
+from src.domain.exceptions.base import DomainException
+
+
+class DeliveryZoneNotFoundError(DomainException):
+    """Raised when a delivery zone is not found."""
+
+    def __init__(self, message: str = "Delivery zone not found") -> None:
+        super().__init__(message)
@@ -0,0 +1,34 @@
+"""Order domain exceptions."""
+
+from uuid import UUID
+
+from src.domain.exceptions.base import DomainException
+
+
+class OrderNotFoundError(DomainException):
+    """Raised when an order is not found."""
+
+    def __init__(self, message: str = "Order not found") -> None:
+        super().__init__(message)
+
+
+class EmptyCartError(DomainException):
+    """Raised when placing an order from an empty cart."""
+
+    def __init__(self, message: str = "Cart is empty") -> None:
+        super().__init__(message)
+
+
+class OutOfStockError(DomainException):
+    """Raised when there is not enough stock to reserve a product."""
+
+    def __init__(self, product_id: UUID, message: str | None = None) -> None:
+        self.product_id = product_id
+        super().__init__(message or f"Product {product_id} is out of stock")
+
+
+class InvalidOrderStateError(DomainException):
+    """Raised when an order cannot make the requested transition."""
+
+    def __init__(self, message: str = "Order cannot be changed in its current state") -> None:
+        super().__init__(message)
@@ -0,0 +1,10 @@
+"""Reporting domain exceptions."""
+
+from src.domain.exceptions.base import DomainException
+
+
+class InvalidReportRangeError(DomainException):
+    """Raised when a report is requested for an invalid or too long date range."""
+
+    def __init__(self, message: str = "Invalid report date range") -> None:
+        super().__init__(message)
@@ -15,3 +15,10 @@ class UserNotFoundError(DomainException):
 
     def __init__(self, message: str = "User not found") -> None:
         super().__init__(message)
+
+
+class InvalidUserFilterError(DomainException):
+    """Raised when users are selected by contradictory criteria."""
+
+    def __init__(self, message: str = "Invalid user filter") -> None:
+        super().__init__(message)
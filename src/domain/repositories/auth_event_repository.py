@@ -0,0 +1,23 @@
+"""Authentication event repository interface (Port)."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+
+from src.domain.entities.auth_event import AuthEvent
+
+
+class IAuthEventRepository(ABC):
+    """Repository interface for the append-only authentication event log."""
+
+    @abstractmethod
+    async def add_many(self, events: Sequence[AuthEvent]) -> None:
+        """Append a batch of events."""
+        pass
+
+    @abstractmethod
+    async def get_recent_failures(
+        self, email: str, since: datetime, limit: int = 50
+    ) -> list[AuthEvent]:
+        """Get failed logins for an account since the given time, newest first."""
+        pass
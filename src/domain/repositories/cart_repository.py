@@ -0,0 +1,26 @@
+"""Cart repository interface (Port)."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from uuid import UUID
+
+from src.domain.entities.cart import Cart
+
+
+class ICartRepository(ABC):
+    """Repository interface for durable cart storage."""
+
+    @abstractmethod
+    async def get(self, user_id: UUID) -> Cart | None:
+        """Get a user's persisted cart."""
+        pass
+
+    @abstractmethod
+    async def save_many(self, carts: Sequence[Cart]) -> None:
+        """
+        Insert or update carts.
+
+        A stored cart with a higher version than the given one is kept, so a
+        late write of an old copy cannot overwrite newer contents.
+        """
+        pass
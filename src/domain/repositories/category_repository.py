@@ -0,0 +1,35 @@
+"""Category repository interface (Port)."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.entities.product import Category
+
+
+class ICategoryRepository(ABC):
+    """Repository interface for Category persistence operations."""
+
+    @abstractmethod
+    async def create(self, category: Category) -> Category:
+        """Create a new category. Raises CategoryAlreadyExistsError if the slug is taken."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, category_id: UUID) -> Category | None:
+        """Get category by ID."""
+        pass
+
+    @abstractmethod
+    async def update(self, category: Category) -> Category:
+        """Update existing category."""
+        pass
+
+    @abstractmethod
+    async def list_changed_since(self, since: datetime | None = None) -> list[Category]:
+        """
+        Get categories updated after the given time, including inactive ones.
+
+        With no time, returns every category.
+        """
+        pass
@@ -0,0 +1,35 @@
+"""Delivery zone repository interface (Port)."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.entities.delivery import DeliveryZone
+
+
+class IDeliveryZoneRepository(ABC):
+    """Repository interface for DeliveryZone persistence operations."""
+
+    @abstractmethod
+    async def create(self, zone: DeliveryZone) -> DeliveryZone:
+        """Create a new delivery zone."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, zone_id: UUID) -> DeliveryZone | None:
+        """Get delivery zone by ID."""
+        pass
+
+    @abstractmethod
+    async def update(self, zone: DeliveryZone) -> DeliveryZone:
+        """Update existing delivery zone."""
+        pass
+
+    @abstractmethod
+    async def list_changed_since(self, since: datetime | None = None) -> list[DeliveryZone]:
+        """
+        Get zones updated after the given time, including inactive ones.
+
+        With no time, returns every zone.
+        """
+        pass
@@ -0,0 +1,49 @@
+"""Inventory repository interface (Port)."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from uuid import UUID
+
+
+class IInventoryRepository(ABC):
+    """Repository interface for product stock and order reservations."""
+
+    @abstractmethod
+    async def set_stock(self, product_id: UUID, available: int, shards: int) -> None:
+        """Replace a product's sellable stock, spread over `shards` counters."""
+        pass
+
+    @abstractmethod
+    async def get_available(self, product_id: UUID) -> int:
+        """Get a product's sellable stock (excluding reserved units)."""
+        pass
+
+    @abstractmethod
+    async def get_available_many(self, product_ids: Sequence[UUID]) -> dict[UUID, int]:
+        """
+        Get the sellable stock of several products without taking locks.
+
+        The result may be stale by the time it is used; it serves to turn
+        buyers away early, while reserve() makes the binding check.
+        """
+        pass
+
+    @abstractmethod
+    async def reserve(self, order_id: UUID, items: Sequence[tuple[UUID, int]]) -> None:
+        """
+        Take (product_id, quantity) items out of stock for an order.
+
+        Raises OutOfStockError if any product lacks stock; the caller must
+        then roll back so nothing stays reserved.
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, order_ids: Sequence[UUID]) -> None:
+        """Return the stock reserved for orders."""
+        pass
+
+    @abstractmethod
+    async def commit(self, order_ids: Sequence[UUID]) -> None:
+        """Drop the reservations of orders whose stock is sold."""
+        pass
@@ -0,0 +1,50 @@
+"""Order repository interface (Port)."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from src.core.constants import DEFAULT_PAGE_SIZE
+from src.domain.entities.order import Order, OrderStatus
+
+
+class IOrderRepository(ABC):
+    """Repository interface for Order persistence operations."""
+
+    @abstractmethod
+    async def create(self, order: Order) -> Order:
+        """Create a new order with its items."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, order_id: UUID, *, for_update: bool = False) -> Order | None:
+        """
+        Get order by ID.
+
+        With for_update, the order row stays locked until the transaction
+        ends, so status changes cannot race each other.
+        """
+        pass
+
+    @abstractmethod
+    async def list_by_user(
+        self, user_id: UUID, after_id: UUID | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> list[Order]:
+        """List a user's orders, newest first, starting after the given ID."""
+        pass
+
+    @abstractmethod
+    async def set_status(self, order_ids: Sequence[UUID], status: OrderStatus) -> None:
+        """Change the status of orders."""
+        pass
+
+    @abstractmethod
+    async def lock_expired(self, now: datetime, limit: int) -> list[UUID]:
+        """
+        Lock pending orders whose reservation ended before `now`.
+
+        Orders locked by another transaction are skipped, so several
+        sweepers can run at once without waiting on each other.
+        """
+        pass
@@ -0,0 +1,20 @@
+"""Outbox repository interface (Port)."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from src.domain.events.base import DomainEvent
+
+
+class IOutboxRepository(ABC):
+    """Repository interface for the transactional outbox of domain events."""
+
+    @abstractmethod
+    async def add(self, events: Sequence[DomainEvent]) -> None:
+        """
+        Stage events for publishing in the current transaction.
+
+        They are published only if the transaction commits, together with
+        the state change that raised them.
+        """
+        pass
@@ -0,0 +1,75 @@
+"""Product repository interface (Port)."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core.constants import DEFAULT_PAGE_SIZE
+from src.domain.entities.product import Product
+
+
+@dataclass(frozen=True)
+class ProductSearchHit:
+    """A product matched by a search query with its relevance score."""
+
+    product: Product
+    score: float
+
+
+class IProductRepository(ABC):
+    """Repository interface for Product persistence operations."""
+
+    @abstractmethod
+    async def create(self, product: Product) -> Product:
+        """Create a new product. Raises ProductAlreadyExistsError if the slug is taken."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, product_id: UUID) -> Product | None:
+        """Get product by ID."""
+        pass
+
+    @abstractmethod
+    async def get_many_by_ids(self, product_ids: Sequence[UUID]) -> list[Product]:
+        """Get products by ID. Missing IDs are omitted."""
+        pass
+
+    @abstractmethod
+    async def get_by_slug(self, slug: str) -> Product | None:
+        """Get product by slug."""
+        pass
+
+    @abstractmethod
+    async def update(self, product: Product) -> Product:
+        """Update existing product."""
+        pass
+
+    @abstractmethod
+    async def list_after(
+        self,
+        category_ids: Sequence[UUID] | None = None,
+        after_id: UUID | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> list[Product]:
+        """
+        List active products, newest first, starting after the given ID.
+
+        When category_ids is given, only products in those categories are listed.
+        """
+        pass
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        after: tuple[float, UUID] | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> list[ProductSearchHit]:
+        """
+        Search active products by English or Bangla name and description.
+
+        Results are ordered by (score, id) descending; `after` is the
+        (score, id) of the last hit on the previous page.
+        """
+        pass
@@ -0,0 +1,54 @@
+"""Report repository interface (Port)."""
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timedelta
+
+from src.domain.entities.report import CustomerSales, DailyRegistrations, DailySales
+
+
+class IReportRepository(ABC):
+    """
+    Repository interface for the reporting summary tables.
+
+    Reads never touch the order or user tables; refresh() folds new source
+    rows into the summaries incrementally.
+    """
+
+    @abstractmethod
+    async def daily_sales(self, start: date, end: date) -> list[DailySales]:
+        """List days from start to end (inclusive) that had confirmed orders."""
+        pass
+
+    @abstractmethod
+    async def daily_registrations(self, start: date, end: date) -> list[DailyRegistrations]:
+        """List days from start to end (inclusive) that had registrations."""
+        pass
+
+    @abstractmethod
+    async def top_customers(self, limit: int) -> list[CustomerSales]:
+        """List the customers with the highest confirmed revenue."""
+        pass
+
+    @abstractmethod
+    async def watermarks(self) -> dict[str, datetime]:
+        """Get how far each source has been folded in, by report name."""
+        pass
+
+    @abstractmethod
+    async def refresh(
+        self, report: str, settle: timedelta, max_window: timedelta, time_zone: str
+    ) -> bool:
+        """
+        Fold the next window of source rows into the report's summaries.
+
+        The window starts at the watermark and ends `settle` before now, or
+        `max_window` later, whichever is earlier. Returns True if source rows
+        newer than the window remain, so the caller should call again.
+        Returns False without waiting if another process holds the watermark.
+        """
+        pass
+
+    @abstractmethod
+    async def reset(self, report: str) -> None:
+        """Empty the report's summaries and rewind its watermark, to be rebuilt."""
+        pass
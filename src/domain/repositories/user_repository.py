@@ -1,9 +1,65 @@
 """User repository interface (Port)."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import NamedTuple
 from uuid import UUID
 
-from src.domain.entities.user import User
+from src.core.constants import DEFAULT_PAGE_SIZE
+from src.domain.entities.user import Role, User
+from src.domain.exceptions.user import InvalidUserFilterError
+
+
+@dataclass(frozen=True)
+class UserFilter:
+    """
+    Criteria selecting users in bulk; None matches any value.
+
+    Datetimes without a zone are taken as UTC. Raises InvalidUserFilterError
+    if the creation range is empty.
+    """
+
+    role: Role | None = None
+    is_active: bool | None = None
+    created_from: datetime | None = None  # Inclusive
+    created_to: datetime | None = None  # Exclusive
+
+    def __post_init__(self) -> None:
+        for name in ("created_from", "created_to"):
+            value = getattr(self, name)
+            if value is not None and value.tzinfo is None:
+                object.__setattr__(self, name, value.replace(tzinfo=UTC))
+        if (
+            self.created_from is not None
+            and self.created_to is not None
+            and self.created_from >= self.created_to
+        ):
+            raise InvalidUserFilterError("created_from must be before created_to")
+
+
+@dataclass(frozen=True)
+class UserChanges:
+    """Values set on every user of a bulk update; None leaves a field unchanged."""
+
+    role: Role | None = None
+    is_active: bool | None = None
+    is_verified: bool | None = None
+
+
+class UserRow(NamedTuple):
+    """User columns read in bulk, without the password hash."""
+
+    id: UUID
+    email: str
+    full_name: str | None
+    phone: str | None
+    role: str
+    is_active: bool
+    is_verified: bool
+    created_at: datetime
+    updated_at: datetime
 
 
 class IUserRepository(ABC):
@@ -19,11 +75,21 @@ class IUserRepository(ABC):
         """Get user by ID."""
         pass
 
+    @abstractmethod
+    async def get_many_by_ids(self, user_ids: Sequence[UUID]) -> list[User]:
+        """Get users by IDs in one query. Missing IDs are omitted; order is not guaranteed."""
+        pass
+
     @abstractmethod
     async def get_by_email(self, email: str) -> User | None:
         """Get user by email."""
         pass
 
+    @abstractmethod
+    async def get_by_phone(self, phone: str) -> User | None:
+        """Get user by phone number (any spelling that normalizes to the stored one)."""
+        pass
+
     @abstractmethod
     async def update(self, user: User) -> User:
         """Update existing user."""
@@ -38,3 +104,48 @@ class IUserRepository(ABC):
     async def exists_by_email(self, email: str) -> bool:
         """Check if user exists by email."""
         pass
+
+    @abstractmethod
+    async def list_after(
+        self, after_id: UUID | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> list[User]:
+        """List users in creation order, starting after the given ID (keyset pagination)."""
+        pass
+
+    @abstractmethod
+    def stream(
+        self, user_filter: UserFilter, batch_size: int = 1000
+    ) -> AsyncGenerator[list[UserRow]]:
+        """
+        Yield the matching users in batches, read through a server-side cursor.
+
+        Only one batch is held in memory at a time, whatever the number of
+        users; the next is fetched when the caller asks for it. A caller that
+        stops early must aclose() it, so that the cursor is closed.
+        """
+        pass
+
+    @abstractmethod
+    async def count_matching(
+        self, user_filter: UserFilter, changes: UserChanges, exclude_id: UUID | None = None
+    ) -> tuple[int, int]:
+        """Users matching the filter, and how many of them `changes` would alter."""
+        pass
+
+    @abstractmethod
+    async def update_matching(
+        self,
+        user_filter: UserFilter,
+        changes: UserChanges,
+        limit: int,
+        exclude_id: UUID | None = None,
+    ) -> list[UserRow]:
+        """
+        Apply changes to up to `limit` matching users they would alter.
+
+        One set-based `UPDATE ... RETURNING` that also sets updated_at;
+        returns the changed users as they are now. Users already in the
+        target state do not match, so repeating the call until it returns
+        fewer than `limit` users updates them all, a bounded chunk at a time.
+        """
+        pass
@@ -0,0 +1 @@
+"""Cache and key-value store implementations."""
@@ -0,0 +1,100 @@
+"""Write-behind persistence of carts from the hot store to Postgres."""
+
+import asyncio
+import contextlib
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.interfaces.cart_store import ICartStore
+from src.core.logging import get_logger
+from src.core.metrics import Counter, Gauge
+from src.infrastructure.repositories.sqlalchemy.cart_repository_impl import (
+    SQLAlchemyCartRepository,
+)
+
+logger = get_logger(__name__)
+
+carts_flushed_total = Counter("carts_flushed_total", "Carts written to the database")
+cart_flush_failures_total = Counter("cart_flush_failures_total", "Failed cart flush batches")
+cart_flush_lag_seconds = Gauge(
+    "cart_flush_lag_seconds", "Age of the oldest change written by the last flush"
+)
+
+
+class CartFlusher:
+    """
+    Persists dirty carts from the hot store every flush_interval seconds.
+
+    - Changes are coalesced: however many times a cart changed since the
+      last flush, only its latest copy is written, once per interval.
+    - A flush writes only carts dirtied before it started; a cart changed
+      while being written stays dirty and goes out in the next flush.
+    - Rows carry the cart version and the upsert never replaces a newer
+      version, so several flushers (one per API process) can run at once.
+    - Nothing is marked clean until its transaction commits. After a crash,
+      dirty carts are still in the store and the next start() writes them.
+    """
+
+    def __init__(
+        self,
+        store: ICartStore,
+        session_maker: async_sessionmaker[AsyncSession],
+        *,
+        flush_interval: float = 1.0,
+        batch_size: int = 500,
+    ) -> None:
+        self._store = store
+        self._session_maker = session_maker
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    async def start(self) -> None:
+        """Write carts left dirty by a previous run, then flush periodically."""
+        self._stopping.clear()
+        await self._safe_flush()
+        self._task = asyncio.create_task(self._run(), name="cart-flusher")
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and write everything still dirty."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+        await self._safe_flush()
+
+    async def flush(self) -> int:
+        """Write carts dirtied before this call. Returns how many were written."""
+        started = time.time()
+        flushed = 0
+        while True:
+            batch = await self._store.dirty(self._batch_size, before=started)
+            if not batch:
+                break
+            carts = [entry.cart for entry in batch]
+            async with self._session_maker() as session, session.begin():
+                await SQLAlchemyCartRepository(session).save_many(carts)
+            await self._store.mark_clean(carts)
+
+            flushed += len(carts)
+            carts_flushed_total.inc(len(carts))
+            cart_flush_lag_seconds.set(time.time() - batch[0].dirty_since)
+        return flushed
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._flush_interval)
+            if not self._stopping.is_set():
+                await self._safe_flush()
+
+    async def _safe_flush(self) -> None:
+        """Flush, leaving carts dirty for the next attempt if the database fails."""
+        try:
+            await self.flush()
+        except Exception:
+            cart_flush_failures_total.inc()
+            logger.exception("Cart flush failed")
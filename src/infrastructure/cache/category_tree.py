@@ -0,0 +1,179 @@
+"""In-process category tree kept current from the categories table."""
+
+import asyncio
+import contextlib
+import hashlib
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.interfaces.category_tree import CategoryNode, ICategoryTree
+from src.core.logging import get_logger
+from src.domain.entities.product import Category
+from src.infrastructure.repositories.sqlalchemy.category_repository_impl import (
+    SQLAlchemyCategoryRepository,
+)
+
+logger = get_logger(__name__)
+
+# Re-read changes this far behind the watermark: a transaction can commit a
+# row whose updated_at is earlier than rows already seen.
+WATERMARK_OVERLAP = timedelta(seconds=5)
+
+
+class InMemoryCategoryTree(ICategoryTree):
+    """
+    Category hierarchy held in memory and refreshed incrementally.
+
+    - refresh() loads only categories whose updated_at is past the watermark
+      and patches them into the tree; the first call loads everything.
+    - A background task refreshes every refresh_interval seconds, so changes
+      made by any process become visible within that interval.
+    - Derived views (subtree IDs, the nested roots list, the version) are
+      computed on first use and dropped when a refresh changes anything.
+    """
+
+    def __init__(
+        self, session_maker: async_sessionmaker[AsyncSession], refresh_interval: float = 2.0
+    ) -> None:
+        self._session_maker = session_maker
+        self._refresh_interval = refresh_interval
+        self._categories: dict[UUID, Category] = {}
+        self._children: dict[UUID | None, set[UUID]] = {}
+        self._by_slug: dict[str, UUID] = {}
+        self._watermark: datetime | None = None
+        self._descendants: dict[UUID, list[UUID]] = {}
+        self._roots: list[CategoryNode] | None = None
+        self._version: str | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    async def start(self) -> None:
+        """Load the tree and start the background refresh task."""
+        self._stopping.clear()
+        await self._safe_refresh()
+        self._task = asyncio.create_task(self._run(), name="category-tree-refresh")
+
+    async def stop(self) -> None:
+        """Stop the background refresh task."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def refresh(self) -> int:
+        """Apply categories changed since the watermark. Returns how many changed."""
+        since = self._watermark - WATERMARK_OVERLAP if self._watermark else None
+        async with self._session_maker() as session:
+            changed = await SQLAlchemyCategoryRepository(session).list_changed_since(since)
+
+        applied = 0
+        for category in changed:
+            if self._categories.get(category.id) != category:
+                self._apply(category)
+                applied += 1
+            if self._watermark is None or category.updated_at > self._watermark:
+                self._watermark = category.updated_at
+
+        if applied:
+            self._descendants.clear()
+            self._roots = None
+            self._version = None
+        return applied
+
+    def get(self, category_id: UUID) -> Category | None:
+        category = self._categories.get(category_id)
+        return category if category and self._is_visible(category) else None
+
+    def get_by_slug(self, slug: str) -> Category | None:
+        category_id = self._by_slug.get(slug)
+        return self.get(category_id) if category_id else None
+
+    def descendant_ids(self, category_id: UUID) -> list[UUID]:
+        cached = self._descendants.get(category_id)
+        if cached is not None:
+            return cached
+        if self.get(category_id) is None:
+            return []
+
+        ids: list[UUID] = []
+        stack = [category_id]
+        while stack:
+            current = stack.pop()
+            if current in ids:
+                continue
+            ids.append(current)
+            stack.extend(
+                child_id
+                for child_id in self._children.get(current, ())
+                if self._categories[child_id].is_active
+            )
+        self._descendants[category_id] = ids
+        return ids
+
+    def roots(self) -> list[CategoryNode]:
+        if self._roots is None:
+            self._roots = self._build_nodes(None)
+        return self._roots
+
+    def version(self) -> str:
+        # A hash of every category's version rather than a counter, so every
+        # process holding the same categories reports the same tag
+        if self._version is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for category in sorted(self._categories.values(), key=lambda c: c.id):
+                digest.update(f"{category.id}:{category.updated_at.isoformat()};".encode())
+            self._version = digest.hexdigest()
+        return self._version
+
+    def _apply(self, category: Category) -> None:
+        """Insert or replace one category, moving it if its parent changed."""
+        previous = self._categories.get(category.id)
+        if previous is not None:
+            self._children.get(previous.parent_id, set()).discard(category.id)
+            if self._by_slug.get(previous.slug) == category.id:
+                del self._by_slug[previous.slug]
+        self._categories[category.id] = category
+        self._children.setdefault(category.parent_id, set()).add(category.id)
+        self._by_slug[category.slug] = category.id
+
+    def _is_visible(self, category: Category) -> bool:
+        """A category is visible when it and all of its ancestors are active."""
+        seen: set[UUID] = set()
+        current: Category | None = category
+        while current is not None:
+            if not current.is_active or current.id in seen:
+                return False
+            seen.add(current.id)
+            current = self._categories.get(current.parent_id) if current.parent_id else None
+        return True
+
+    def _build_nodes(self, parent_id: UUID | None) -> list[CategoryNode]:
+        children = [
+            self._categories[child_id]
+            for child_id in self._children.get(parent_id, ())
+            if self._categories[child_id].is_active
+        ]
+        return [
+            CategoryNode(category=child, children=tuple(self._build_nodes(child.id)))
+            for child in sorted(children, key=lambda c: c.name)
+        ]
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._refresh_interval)
+            if not self._stopping.is_set():
+                await self._safe_refresh()
+
+    async def _safe_refresh(self) -> None:
+        """Refresh, keeping the current tree if the database is unavailable."""
+        try:
+            changed = await self.refresh()
+        except Exception:
+            logger.exception("Category tree refresh failed")
+            return
+        if changed:
+            logger.info("Category tree refreshed", extra={"changed": changed})
@@ -0,0 +1,383 @@
+"""Bloom filter of registered emails, kept current from users and snapshotted to disk."""
+
+import asyncio
+import contextlib
+import hashlib
+import math
+import os
+import struct
+import time
+from collections.abc import Iterator
+from contextlib import aclosing
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.interfaces.email_filter import IRegisteredEmailFilter
+from src.core.logging import get_logger
+from src.core.metrics import Counter, Gauge
+from src.domain.entities.user import normalize_email
+from src.domain.repositories.user_repository import UserChanges, UserFilter
+from src.infrastructure.repositories.sharded_user_repository import UserRepositoryFactory
+from src.infrastructure.repositories.sqlalchemy.user_directory import SQLAlchemyUserDirectory
+
+logger = get_logger(__name__)
+
+# Snapshot layout, little-endian:
+#   header  magic, bit count, hash count, estimated email count, capacity,
+#           watermark (unix seconds, 0 for none), padded to HEADER_SIZE
+#   bits    bit count / 8 bytes; bit i is bit i % 8 of byte i // 8
+MAGIC = b"DCEMLv1\x00"
+HEADER = struct.Struct("<8sQIQQd")
+HEADER_SIZE = 48
+
+# Re-read directory changes this far behind the watermark: a transaction can
+# commit an entry whose updated_at is earlier than entries already seen.
+WATERMARK_OVERLAP = timedelta(seconds=5)
+
+# A rebuilt filter has room for this many times the current users; past
+# that its false-positive rate climbs above the target and it is rebuilt
+CAPACITY_GROWTH = 2
+MIN_CAPACITY = 100_000
+
+email_filter_lookups_total = Counter(
+    "email_filter_lookups_total",
+    "Registered email filter answers (absent, maybe, or not_loaded)",
+    ["answer"],
+)
+email_filter_entries = Gauge("email_filter_entries", "Emails in the registered email filter")
+email_filter_bytes = Gauge("email_filter_bytes", "Memory held by the registered email filter")
+
+
+class BloomFilter:
+    """
+    Bloom filter over strings in a flat bit array.
+
+    Sized for `capacity` entries at false-positive rate p with
+    m = -capacity * ln(p) / ln(2)^2 bits and k = m / capacity * ln(2) hash
+    positions: 9.6 bits and 7 positions per entry at 1%. The positions come
+    from one 128-bit BLAKE2b digest by double hashing, so a lookup hashes
+    the key once whatever k is.
+
+    `count` is estimated from the bits set rather than counted per add: a
+    key added twice sets no new bit, but neither does a new key that is a
+    false positive, and counting only keys that set one would undercount
+    as the filter fills.
+    """
+
+    def __init__(self, bit_count: int, hash_count: int, bits: bytearray | None = None) -> None:
+        self.bit_count = bit_count
+        self.hash_count = hash_count
+        self.bits = bits if bits is not None else bytearray(bit_count // 8)
+        self.set_bits = int.from_bytes(self.bits).bit_count() if bits is not None else 0
+
+    @property
+    def count(self) -> int:
+        """
+        Entries estimated from the bits set, X of m: -m / k * ln(1 - X / m).
+
+        Within a fraction of a percent of the distinct keys added, up to
+        several times the capacity.
+        """
+        if self.set_bits >= self.bit_count:
+            return self.bit_count
+        fill = self.set_bits / self.bit_count
+        return round(-self.bit_count / self.hash_count * math.log1p(-fill))
+
+    @classmethod
+    def sized(cls, capacity: int, false_positive_rate: float) -> BloomFilter:
+        """Empty filter for `capacity` entries at the given false-positive rate."""
+        bits = -capacity * math.log(false_positive_rate) / math.log(2) ** 2
+        bit_count = math.ceil(bits / 8) * 8
+        return cls(bit_count, max(1, round(bit_count / capacity * math.log(2))))
+
+    def add(self, key: str) -> None:
+        bits = self.bits
+        for position in self._positions(key):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                self.set_bits += 1
+
+    def copy(self) -> BloomFilter:
+        bloom = BloomFilter(self.bit_count, self.hash_count)
+        bloom.bits[:] = self.bits
+        bloom.set_bits = self.set_bits
+        return bloom
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def _positions(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:], "little")
+        for i in range(self.hash_count):
+            yield (first + i * step) % self.bit_count
+
+
+def write_snapshot(
+    path: Path, bloom: BloomFilter, capacity: int, watermark: datetime | None
+) -> None:
+    """
+    Write the filter next to `path` and rename it into place.
+
+    The rename is atomic, so workers starting meanwhile read the old
+    snapshot or the new one, never a partial write.
+    """
+    header = HEADER.pack(
+        MAGIC,
+        bloom.bit_count,
+        bloom.hash_count,
+        bloom.count,
+        capacity,
+        watermark.timestamp() if watermark else 0.0,
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f".{path.name}.{os.getpid()}.partial")
+    with partial.open("wb") as file:
+        file.write(header.ljust(HEADER_SIZE, b"\0"))
+        file.write(bloom.bits)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(partial, path)
+
+
+def read_snapshot(path: Path) -> tuple[BloomFilter, int, datetime | None]:
+    """Filter, capacity and watermark stored by write_snapshot."""
+    data = path.read_bytes()
+    # The stored count is informational; the filter estimates it from its bits
+    magic, bit_count, hash_count, _, capacity, watermark = HEADER.unpack_from(data)
+    if magic != MAGIC or len(data) != HEADER_SIZE + bit_count // 8:
+        raise ValueError(f"{path} is not a valid email filter snapshot")
+    bloom = BloomFilter(bit_count, hash_count, bytearray(data[HEADER_SIZE:]))
+    return bloom, capacity, datetime.fromtimestamp(watermark, UTC) if watermark else None
+
+
+class BloomEmailFilter(IRegisteredEmailFilter):
+    """
+    Registered emails in a Bloom filter, kept current from the users table.
+
+    - start() loads the snapshot file if there is one. The background task
+      then reads the changes since the snapshot's watermark, or all users
+      without a snapshot. Until that first read succeeds every email might
+      be registered, so lookups go to the database.
+    - Every refresh_interval seconds it adds the emails registered or
+      changed by any process since the watermark, read from the user
+      directory by updated_at. add() records this process's registrations
+      and email changes at once; other workers see them within
+      refresh_interval.
+    - Once it holds more emails than it was sized for, it is rebuilt from
+      every user with room for CAPACITY_GROWTH times as many. Emails of
+      deleted users stay in until then; they only cost a database lookup.
+    - The filter is written to the snapshot file after the first read, then
+      every snapshot_interval seconds if it changed, and on stop.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        repository_factory: UserRepositoryFactory,
+        snapshot_path: str,
+        false_positive_rate: float = 0.01,
+        refresh_interval: float = 5.0,
+        snapshot_interval: float = 300.0,
+        batch_size: int = 5000,
+    ) -> None:
+        self._session_maker = session_maker
+        self._repository_factory = repository_factory
+        self._snapshot_path = Path(snapshot_path)
+        self._false_positive_rate = false_positive_rate
+        self._refresh_interval = refresh_interval
+        self._snapshot_interval = snapshot_interval
+        self._batch_size = batch_size
+        self._bloom: BloomFilter | None = None
+        self._capacity = 0
+        self._watermark: datetime | None = None
+        self._ready = False
+        self._changed = False
+        # Filter being rebuilt, which registrations are recorded in as well
+        self._building: BloomFilter | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    async def start(self) -> None:
+        """Load the snapshot and start reading users in the background."""
+        self._stopping.clear()
+        self._load_snapshot()
+        self._task = asyncio.create_task(self._run(), name="email-filter-refresh")
+
+    async def stop(self) -> None:
+        """Stop refreshing and write the snapshot."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+        await self._safe_save()
+
+    @property
+    def ready(self) -> bool:
+        """Whether lookups are answered from the filter yet."""
+        return self._ready
+
+    def might_be_registered(self, email: str) -> bool:
+        bloom = self._bloom
+        if bloom is None or not self._ready:
+            email_filter_lookups_total.inc(answer="not_loaded")
+            return True
+        found = normalize_email(email) in bloom
+        email_filter_lookups_total.inc(answer="maybe" if found else "absent")
+        return found
+
+    def add(self, email: str) -> None:
+        email = normalize_email(email)
+        for bloom in (self._bloom, self._building):
+            if bloom is not None:
+                bloom.add(email)
+        self._changed = True
+
+    async def refresh(self) -> int:
+        """Add emails changed since the watermark, rebuilding when full. Returns emails read."""
+        if self._bloom is None or self._bloom.count > self._capacity:
+            read = await self._rebuild()
+        else:
+            set_bits = self._bloom.set_bits
+            if self._watermark is None:
+                read, self._watermark = await self._read_users(self._bloom)
+            else:
+                read, self._watermark = await self._read_changes(self._bloom, self._watermark)
+            self._changed |= self._bloom.set_bits != set_bits
+        self._ready = True
+        return read
+
+    async def save(self) -> bool:
+        """Write the snapshot if the filter changed since the last one. True if written."""
+        bloom = self._bloom
+        if bloom is None or not self._changed:
+            return False
+        self._changed = False
+        try:
+            await asyncio.to_thread(
+                write_snapshot, self._snapshot_path, bloom.copy(), self._capacity, self._watermark
+            )
+        except BaseException:
+            self._changed = True
+            raise
+        return True
+
+    async def _rebuild(self) -> int:
+        started = time.perf_counter()
+        async with self._session_maker() as session:
+            users, _ = await self._repository_factory(session).count_matching(
+                UserFilter(), UserChanges()
+            )
+        capacity = max(MIN_CAPACITY, users * CAPACITY_GROWTH)
+        self._building = BloomFilter.sized(capacity, self._false_positive_rate)
+        try:
+            read, watermark = await self._read_users(self._building)
+            bloom = self._building
+        finally:
+            self._building = None
+
+        self._bloom, self._capacity, self._watermark = bloom, capacity, watermark
+        self._changed = True
+        email_filter_entries.set(bloom.count)
+        email_filter_bytes.set(len(bloom.bits))
+        logger.info(
+            "Email filter built",
+            extra={
+                "emails": bloom.count,
+                "capacity": capacity,
+                "bytes": len(bloom.bits),
+                "hashes": bloom.hash_count,
+                "build_ms": round((time.perf_counter() - started) * 1000, 1),
+            },
+        )
+        return read
+
+    async def _read_users(self, bloom: BloomFilter) -> tuple[int, datetime | None]:
+        """Add every user's email; users read and the newest created_at."""
+        read, newest = 0, None
+        async with self._session_maker() as session:
+            batches = self._repository_factory(session).stream(UserFilter(), self._batch_size)
+            async with aclosing(batches):
+                async for batch in batches:
+                    for user in batch:
+                        bloom.add(user.email)
+                    read += len(batch)
+                    # Shards are streamed one after the other, each in creation order
+                    created = max(user.created_at for user in batch)
+                    newest = created if newest is None else max(newest, created)
+        email_filter_entries.set(bloom.count)
+        return read, newest
+
+    async def _read_changes(self, bloom: BloomFilter, since: datetime) -> tuple[int, datetime]:
+        """
+        Add emails registered or changed since `since`; entries read and the newest updated_at.
+
+        Read from the user directory on the primary database, which has every
+        user's current email whichever shard holds the user.
+        """
+        read, newest = 0, since
+        async with self._session_maker() as session:
+            batches = SQLAlchemyUserDirectory(session).stream_changed(
+                since - WATERMARK_OVERLAP, self._batch_size
+            )
+            async with aclosing(batches):
+                async for batch in batches:
+                    for email, _ in batch:
+                        bloom.add(email)
+                    read += len(batch)
+                    newest = max(newest, batch[-1][1])
+        email_filter_entries.set(bloom.count)
+        return read, newest
+
+    def _load_snapshot(self) -> None:
+        try:
+            self._bloom, self._capacity, self._watermark = read_snapshot(self._snapshot_path)
+        except FileNotFoundError:
+            return
+        except Exception:
+            logger.exception(
+                "Email filter snapshot unreadable, rebuilding",
+                extra={"path": str(self._snapshot_path)},
+            )
+            return
+        email_filter_entries.set(self._bloom.count)
+        email_filter_bytes.set(len(self._bloom.bits))
+        logger.info(
+            "Email filter snapshot loaded",
+            extra={
+                "path": str(self._snapshot_path),
+                "emails": self._bloom.count,
+                "watermark": self._watermark.isoformat() if self._watermark else None,
+            },
+        )
+
+    async def _run(self) -> None:
+        next_save = 0.0
+        while not self._stopping.is_set():
+            await self._safe_refresh()
+            if self._ready and time.monotonic() >= next_save:
+                await self._safe_save()
+                next_save = time.monotonic() + self._snapshot_interval
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._refresh_interval)
+
+    async def _safe_refresh(self) -> None:
+        """Refresh, keeping the current filter if the database is unavailable."""
+        try:
+            await self.refresh()
+        except Exception:
+            logger.exception("Email filter refresh failed")
+
+    async def _safe_save(self) -> None:
+        try:
+            await self.save()
+        except Exception:
+            logger.exception(
+                "Email filter snapshot failed", extra={"path": str(self._snapshot_path)}
+            )
@@ -0,0 +1,84 @@
+"""In-process cart store."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import replace
+from itertools import islice, takewhile
+from uuid import UUID
+
+from src.application.interfaces.cart_store import DirtyCart, ICartStore
+from src.domain.entities.cart import Cart
+
+
+class InMemoryCartStore(ICartStore):
+    """
+    Cart store for a single process (development and tests).
+
+    Carts are copied on the way in and out, so callers never share a
+    mutable cart with the store. When full, the least recently used clean
+    cart is evicted; dirty carts stay until flushed. Unflushed changes are
+    lost if the process dies, so use the redis backend in production.
+    """
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self._max_entries = max_entries
+        self._carts: OrderedDict[UUID, Cart] = OrderedDict()
+        # user_id -> dirty_since, in order of first change
+        self._dirty: dict[UUID, float] = {}
+
+    async def get(self, user_id: UUID) -> Cart | None:
+        cart = self._carts.get(user_id)
+        if cart is None:
+            return None
+        self._carts.move_to_end(user_id)
+        return _copy(cart)
+
+    async def add(self, cart: Cart) -> bool:
+        if cart.user_id in self._carts:
+            return False
+        self._put(cart)
+        return True
+
+    async def save(self, cart: Cart, expected_version: int) -> bool:
+        current = self._carts.get(cart.user_id)
+        if current is None or current.version != expected_version:
+            return False
+        self._put(cart)
+        self._dirty.setdefault(cart.user_id, time.time())
+        return True
+
+    async def dirty(self, limit: int, before: float) -> list[DirtyCart]:
+        batch = islice(takewhile(lambda entry: entry[1] < before, self._dirty.items()), limit)
+        return [
+            DirtyCart(cart=_copy(self._carts[user_id]), dirty_since=since)
+            for user_id, since in batch
+        ]
+
+    async def mark_clean(self, carts: Sequence[Cart]) -> None:
+        now = time.time()
+        for cart in carts:
+            current = self._carts.get(cart.user_id)
+            if current is not None and current.version == cart.version:
+                self._dirty.pop(cart.user_id, None)
+            elif cart.user_id in self._dirty:
+                # Changed during the flush: move to the back for the next one
+                del self._dirty[cart.user_id]
+                self._dirty[cart.user_id] = now
+
+    def _put(self, cart: Cart) -> None:
+        self._carts[cart.user_id] = _copy(cart)
+        self._carts.move_to_end(cart.user_id)
+        if len(self._carts) > self._max_entries:
+            self._evict()
+
+    def _evict(self) -> None:
+        for user_id in self._carts:
+            if user_id not in self._dirty:
+                del self._carts[user_id]
+                return
+
+
+def _copy(cart: Cart) -> Cart:
+    # CartItem is frozen, so copying the list is enough
+    return replace(cart, items=list(cart.items))
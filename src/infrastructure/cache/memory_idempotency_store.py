@@ -0,0 +1,81 @@
+"""In-process LRU idempotency store."""
+
+import asyncio
+import contextlib
+import time
+from collections import OrderedDict
+
+from src.application.interfaces.idempotency_store import IIdempotencyStore, StoredResponse
+
+
+class InMemoryIdempotencyStore(IIdempotencyStore):
+    """
+    Bounded LRU idempotency store for a single process.
+
+    Entries expire after their TTL; when full, the least recently used entry
+    is evicted. Waiters on an in-flight key are woken by an asyncio.Event,
+    which is set when the key gets a response, is released, evicted or
+    expires.
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self._max_entries = max_entries
+        # key -> (expires_at, response); a None response marks an in-flight key
+        self._entries: OrderedDict[str, tuple[float, StoredResponse | None]] = OrderedDict()
+        self._events: dict[str, asyncio.Event] = {}
+
+    async def get(self, key: str) -> StoredResponse | None:
+        entry = self._lookup(key)
+        return entry[1] if entry else None
+
+    async def reserve(self, key: str, ttl: int) -> bool:
+        if self._lookup(key) is not None:
+            return False
+        self._put(key, None, ttl)
+        self._events[key] = asyncio.Event()
+        return True
+
+    async def save(self, key: str, response: StoredResponse, ttl: int) -> None:
+        self._put(key, response, ttl)
+        self._wake(key)
+
+    async def release(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._wake(key)
+
+    async def wait_for(self, key: str, timeout: float) -> StoredResponse | None:
+        event = self._events.get(key)
+        entry = self._entries.get(key)
+        if event is not None:
+            if entry is not None:
+                # Nothing else may look the key up once its reservation expires
+                timeout = min(timeout, entry[0] - time.monotonic())
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(event.wait(), timeout=max(timeout, 0))
+        return await self.get(key)
+
+    async def close(self) -> None:
+        """Nothing to release; entries are dropped with the process."""
+
+    def _lookup(self, key: str) -> tuple[float, StoredResponse | None] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            self._wake(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _put(self, key: str, response: StoredResponse | None, ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._wake(evicted)
+
+    def _wake(self, key: str) -> None:
+        event = self._events.pop(key, None)
+        if event is not None:
+            event.set()
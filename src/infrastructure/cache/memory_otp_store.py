@@ -0,0 +1,85 @@
+"""In-process login code store with timer-wheel expiry."""
+
+import hmac
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.application.interfaces.otp_store import IOtpStore, OtpCheck
+from src.infrastructure.cache.timer_wheel import TimerWheel
+
+
+@dataclass
+class _Code:
+    code_hash: str
+    expires_at: float
+    attempts_left: int
+
+
+@dataclass
+class _SendWindow:
+    count: int
+    expires_at: float
+
+
+class InMemoryOtpStore(IOtpStore):
+    """
+    Login code store for a single process.
+
+    Codes and send counters live in dicts; a TimerWheel tracks their expiry
+    so each operation reclaims whatever expired since the last one in O(1)
+    per entry, with no periodic scan. Reads also check the deadline, so an
+    entry is never served late even between wheel ticks.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._codes: dict[str, _Code] = {}
+        self._sends: dict[str, _SendWindow] = {}
+        self._wheel = TimerWheel(clock())
+
+    async def count_send(self, phone: str, window: int) -> int:
+        now = self._expire()
+        sends = self._sends.get(phone)
+        if sends is None or sends.expires_at <= now:
+            sends = _SendWindow(count=0, expires_at=now + window)
+            self._sends[phone] = sends
+            self._wheel.schedule(f"sends:{phone}", sends.expires_at)
+        sends.count += 1
+        return sends.count
+
+    async def save(self, phone: str, code_hash: str, ttl: int, attempts: int) -> None:
+        now = self._expire()
+        self._codes[phone] = _Code(
+            code_hash=code_hash, expires_at=now + ttl, attempts_left=attempts
+        )
+        self._wheel.schedule(f"code:{phone}", now + ttl)
+
+    async def check(self, phone: str, code_hash: str) -> OtpCheck:
+        now = self._expire()
+        code = self._codes.get(phone)
+        if code is None or code.expires_at <= now:
+            return OtpCheck.MISSING
+        if hmac.compare_digest(code.code_hash, code_hash):
+            self._discard(phone)
+            return OtpCheck.VALID
+        code.attempts_left -= 1
+        if code.attempts_left <= 0:
+            self._discard(phone)
+            return OtpCheck.EXHAUSTED
+        return OtpCheck.INVALID
+
+    def _discard(self, phone: str) -> None:
+        del self._codes[phone]
+        self._wheel.cancel(f"code:{phone}")
+
+    def _expire(self) -> float:
+        """Drop entries whose deadline passed and return the current time."""
+        now = self._clock()
+        for key in self._wheel.advance(now):
+            kind, _, phone = key.partition(":")
+            if kind == "code":
+                self._codes.pop(phone, None)
+            else:
+                self._sends.pop(phone, None)
+        return now
@@ -0,0 +1,165 @@
+"""Memory-mapped product neighbour file and the index that serves it."""
+
+import asyncio
+import bisect
+import contextlib
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from uuid import UUID
+
+from src.application.interfaces.recommendation_index import IRecommendationIndex, Recommendation
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# File layout, little-endian, every section 4-byte aligned:
+#   header      magic, product count n, neighbours per product k, entry count,
+#               build time (unix seconds), padded to HEADER_SIZE
+#   ids         n x 16-byte product UUIDs, ascending by bytes (binary-searchable)
+#   offsets     (n + 1) x uint32; row i's neighbours are entries offsets[i]:offsets[i+1]
+#   neighbours  entries x uint32 row numbers into ids, best first
+#   scores      entries x float32
+MAGIC = b"DCNBRv1\x00"
+HEADER = struct.Struct("<8sIIId")
+HEADER_SIZE = 32
+ID_SIZE = 16
+
+
+class _IdColumn:
+    """Sequence view of the sorted UUID bytes for bisect."""
+
+    def __init__(self, ids: memoryview) -> None:
+        self._ids = ids
+
+    def __len__(self) -> int:
+        return len(self._ids) // ID_SIZE
+
+    def __getitem__(self, row: int) -> bytes:
+        return self._ids[row * ID_SIZE : (row + 1) * ID_SIZE].tobytes()
+
+
+class NeighbourFile:
+    """
+    Read-only neighbour file mapped into memory.
+
+    The arrays are memoryviews over the mapping: nothing is copied or parsed
+    at load, pages are read on first touch and shared by every worker
+    process mapping the same file. A lookup binary-searches the ID table and
+    slices the neighbour arrays in place.
+
+    The mapping is released when the last reference goes away, so a file
+    replaced while requests still read the old one stays valid for them.
+    """
+
+    def __init__(self, path: Path) -> None:
+        if sys.byteorder != "little":
+            raise RuntimeError("Neighbour files are little-endian")
+        with path.open("rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self._mmap)
+        magic, count, self.k, entries, self.built_at = HEADER.unpack_from(view)
+        ids_end = HEADER_SIZE + count * ID_SIZE
+        offsets_end = ids_end + (count + 1) * 4
+        neighbours_end = offsets_end + entries * 4
+        if magic != MAGIC or len(view) != neighbours_end + entries * 4:
+            raise ValueError(f"{path} is not a valid neighbour file")
+
+        self._ids = view[HEADER_SIZE:ids_end]
+        self._id_column = _IdColumn(self._ids)
+        self._offsets = view[ids_end:offsets_end].cast("I")
+        self._neighbours = view[offsets_end:neighbours_end].cast("I")
+        self._scores = view[neighbours_end:].cast("f")
+        self.product_count = count
+
+    def neighbours(self, product_id: UUID, limit: int) -> list[Recommendation]:
+        key = product_id.bytes
+        row = bisect.bisect_left(self._id_column, key)
+        if row == self.product_count or self._id_column[row] != key:
+            return []
+
+        start = self._offsets[row]
+        end = min(self._offsets[row + 1], start + limit)
+        return [
+            Recommendation(
+                product_id=UUID(bytes=self._id_column[self._neighbours[entry]]),
+                score=self._scores[entry],
+            )
+            for entry in range(start, end)
+        ]
+
+
+class MmapRecommendationIndex(IRecommendationIndex):
+    """
+    Recommendations served from the neighbour file written by the offline build.
+
+    - start() maps the file if it exists; until one is built every product
+      simply has no recommendations.
+    - A background task checks the file every reload_interval seconds and maps
+      the new one when the build job has replaced it (atomically, by rename).
+    """
+
+    def __init__(self, path: str, reload_interval: float = 30.0) -> None:
+        self._path = Path(path)
+        self._reload_interval = reload_interval
+        self._file: NeighbourFile | None = None
+        self._signature: tuple[int, int] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    async def start(self) -> None:
+        """Map the current file and start watching for new builds."""
+        self._stopping.clear()
+        self._safe_reload()
+        self._task = asyncio.create_task(self._run(), name="recommendation-index-reload")
+
+    async def stop(self) -> None:
+        """Stop watching for new builds."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    def reload(self) -> bool:
+        """Map the file if it changed since the last load. Returns True if it did."""
+        try:
+            stat = os.stat(self._path)
+        except FileNotFoundError:
+            return False
+        signature = (stat.st_ino, stat.st_mtime_ns)
+        if signature == self._signature:
+            return False
+
+        self._file = NeighbourFile(self._path)
+        self._signature = signature
+        logger.info(
+            "Recommendation index loaded",
+            extra={
+                "path": str(self._path),
+                "products": self._file.product_count,
+                "built_at": self._file.built_at,
+            },
+        )
+        return True
+
+    def neighbours(self, product_id: UUID, limit: int) -> list[Recommendation]:
+        neighbour_file = self._file
+        return neighbour_file.neighbours(product_id, limit) if neighbour_file else []
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._reload_interval)
+            if not self._stopping.is_set():
+                self._safe_reload()
+
+    def _safe_reload(self) -> None:
+        """Reload, keeping the current file if the new one cannot be read."""
+        try:
+            self.reload()
+        except Exception:
+            logger.exception("Recommendation index reload failed")
@@ -0,0 +1,162 @@
+"""Redis-backed cart store shared across workers."""
+
+import json
+import time
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from src.application.interfaces.cart_store import DirtyCart, ICartStore
+from src.core.constants import CACHE_KEY_PREFIX
+from src.domain.entities.cart import Cart, CartItem
+
+# KEYS: cart hash. ARGV: version, data, ttl
+_ADD = """
+if redis.call('EXISTS', KEYS[1]) == 1 then return 0 end
+redis.call('HSET', KEYS[1], 'v', ARGV[1], 'd', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+# KEYS: cart hash, dirty zset. ARGV: expected version, version, data, ttl, user_id, now
+_SAVE = """
+if redis.call('HGET', KEYS[1], 'v') ~= ARGV[1] then return 0 end
+redis.call('HSET', KEYS[1], 'v', ARGV[2], 'd', ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+redis.call('ZADD', KEYS[2], 'NX', ARGV[6], ARGV[5])
+return 1
+"""
+
+# KEYS: dirty zset, then one cart hash per cart. ARGV: now, then (user_id, version) pairs
+_MARK_CLEAN = """
+for i = 2, #KEYS do
+    local user_id = ARGV[2 * i - 2]
+    if redis.call('HGET', KEYS[i], 'v') == ARGV[2 * i - 1] then
+        redis.call('ZREM', KEYS[1], user_id)
+    else
+        redis.call('ZADD', KEYS[1], 'XX', ARGV[1], user_id)
+    end
+end
+return 1
+"""
+
+
+class RedisCartStore(ICartStore):
+    """
+    Cart store on any Redis-compatible server.
+
+    Each cart is a hash holding its version and JSON body. Dirty carts are
+    tracked in a sorted set scored by the time of their first unpersisted
+    change. Version checks and dirty marking run in Lua scripts, so they are
+    atomic across workers. The dirty set survives an API crash (and a Redis
+    restart with persistence enabled), so the next flusher picks it up.
+    Requires the optional `redis` package (`uv sync --extra redis`).
+    """
+
+    def __init__(self, url: str, ttl: int = 604_800) -> None:
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise RuntimeError("The redis cart backend requires the 'redis' extra") from e
+        self._redis: Any = Redis.from_url(url)
+        self._ttl = ttl
+        self._dirty_key = f"{CACHE_KEY_PREFIX}:cart:dirty"
+        self._add = self._redis.register_script(_ADD)
+        self._save = self._redis.register_script(_SAVE)
+        self._mark_clean = self._redis.register_script(_MARK_CLEAN)
+
+    async def get(self, user_id: UUID) -> Cart | None:
+        raw = await self._redis.hget(self._key(user_id), "d")
+        return _decode(raw) if raw is not None else None
+
+    async def add(self, cart: Cart) -> bool:
+        return bool(
+            await self._add(
+                keys=[self._key(cart.user_id)], args=[cart.version, _encode(cart), self._ttl]
+            )
+        )
+
+    async def save(self, cart: Cart, expected_version: int) -> bool:
+        return bool(
+            await self._save(
+                keys=[self._key(cart.user_id), self._dirty_key],
+                args=[
+                    expected_version,
+                    cart.version,
+                    _encode(cart),
+                    self._ttl,
+                    str(cart.user_id),
+                    time.time(),
+                ],
+            )
+        )
+
+    async def dirty(self, limit: int, before: float) -> list[DirtyCart]:
+        entries = await self._redis.zrangebyscore(
+            self._dirty_key, "-inf", f"({before}", start=0, num=limit, withscores=True
+        )
+        if not entries:
+            return []
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for member, _ in entries:
+                pipe.hget(self._key(member.decode()), "d")
+            bodies = await pipe.execute()
+
+        batch: list[DirtyCart] = []
+        for (member, since), raw in zip(entries, bodies, strict=True):
+            if raw is None:
+                # Expired before it was flushed; nothing left to persist
+                await self._redis.zrem(self._dirty_key, member)
+                continue
+            batch.append(DirtyCart(cart=_decode(raw), dirty_since=since))
+        return batch
+
+    async def mark_clean(self, carts: Sequence[Cart]) -> None:
+        if not carts:
+            return
+        args: list[Any] = [time.time()]
+        for cart in carts:
+            args.extend((str(cart.user_id), cart.version))
+        await self._mark_clean(
+            keys=[self._dirty_key, *(self._key(cart.user_id) for cart in carts)], args=args
+        )
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        await self._redis.aclose()
+
+    def _key(self, user_id: UUID | str) -> str:
+        return f"{CACHE_KEY_PREFIX}:cart:{user_id}"
+
+
+def _encode(cart: Cart) -> str:
+    return json.dumps(
+        {
+            "user_id": str(cart.user_id),
+            "version": cart.version,
+            "updated_at": cart.updated_at.isoformat(),
+            "items": [
+                [str(item.product_id), item.quantity, item.added_at.isoformat()]
+                for item in cart.items
+            ],
+        },
+        separators=(",", ":"),
+    )
+
+
+def _decode(raw: bytes) -> Cart:
+    data = json.loads(raw)
+    return Cart(
+        user_id=UUID(data["user_id"]),
+        version=data["version"],
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+        items=[
+            CartItem(
+                product_id=UUID(product_id),
+                quantity=quantity,
+                added_at=datetime.fromisoformat(added_at),
+            )
+            for product_id, quantity, added_at in data["items"]
+        ],
+    )
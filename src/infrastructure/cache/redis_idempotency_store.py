@@ -0,0 +1,79 @@
+"""Redis-backed idempotency store shared across workers."""
+
+import asyncio
+import base64
+import json
+from typing import Any
+
+from src.application.interfaces.idempotency_store import IIdempotencyStore, StoredResponse
+from src.core.constants import CACHE_KEY_PREFIX
+
+_IN_FLIGHT = b"__in_flight__"
+
+
+class RedisIdempotencyStore(IIdempotencyStore):
+    """
+    Idempotency store on any Redis-compatible server.
+
+    Reservation uses SET NX, so only one worker runs a given key. Waiters on
+    other workers poll with capped exponential backoff.
+    Requires the optional `redis` package (`uv sync --extra redis`).
+    """
+
+    def __init__(self, url: str) -> None:
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise RuntimeError("The redis idempotency backend requires the 'redis' extra") from e
+        self._redis: Any = Redis.from_url(url)
+
+    async def get(self, key: str) -> StoredResponse | None:
+        raw = await self._redis.get(self._key(key))
+        if raw is None or raw == _IN_FLIGHT:
+            return None
+        return self._decode(raw)
+
+    async def reserve(self, key: str, ttl: int) -> bool:
+        return bool(await self._redis.set(self._key(key), _IN_FLIGHT, nx=True, ex=ttl))
+
+    async def save(self, key: str, response: StoredResponse, ttl: int) -> None:
+        data = {
+            "status_code": response.status_code,
+            "headers": response.headers,
+            "body": base64.b64encode(response.body).decode("ascii"),
+            "fingerprint": response.fingerprint,
+        }
+        await self._redis.set(self._key(key), json.dumps(data), ex=ttl)
+
+    async def release(self, key: str) -> None:
+        await self._redis.delete(self._key(key))
+
+    async def wait_for(self, key: str, timeout: float) -> StoredResponse | None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = 0.01
+        while loop.time() < deadline:
+            raw = await self._redis.get(self._key(key))
+            if raw is None:
+                return None
+            if raw != _IN_FLIGHT:
+                return self._decode(raw)
+            await asyncio.sleep(min(delay, max(deadline - loop.time(), 0)))
+            delay = min(delay * 2, 0.25)
+        return None
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        await self._redis.aclose()
+
+    def _decode(self, raw: bytes) -> StoredResponse:
+        data = json.loads(raw)
+        return StoredResponse(
+            status_code=data["status_code"],
+            headers=[(name, value) for name, value in data["headers"]],
+            body=base64.b64decode(data["body"]),
+            fingerprint=data["fingerprint"],
+        )
+
+    def _key(self, key: str) -> str:
+        return f"{CACHE_KEY_PREFIX}:idempotency:{key}"
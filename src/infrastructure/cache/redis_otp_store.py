@@ -0,0 +1,73 @@
+"""Redis-backed login code store shared across workers."""
+
+from typing import Any
+
+from src.application.interfaces.otp_store import IOtpStore, OtpCheck
+from src.core.constants import CACHE_KEY_PREFIX
+
+# Compare and count down in one step so concurrent guesses cannot overspend
+_CHECK_SCRIPT = """
+local stored = redis.call('HGET', KEYS[1], 'hash')
+if not stored then return 0 end
+if stored == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return 1
+end
+if redis.call('HINCRBY', KEYS[1], 'attempts', -1) <= 0 then
+    redis.call('DEL', KEYS[1])
+    return 3
+end
+return 2
+"""
+
+_CHECK_RESULTS = {
+    0: OtpCheck.MISSING,
+    1: OtpCheck.VALID,
+    2: OtpCheck.INVALID,
+    3: OtpCheck.EXHAUSTED,
+}
+
+
+class RedisOtpStore(IOtpStore):
+    """
+    Login code store on any Redis-compatible server.
+
+    Codes are hashes expiring with the code's TTL; send counters are INCR keys
+    whose expiry is set by the first send of a window.
+    Requires the optional `redis` package (`uv sync --extra redis`).
+    """
+
+    def __init__(self, url: str) -> None:
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise RuntimeError("The redis OTP backend requires the 'redis' extra") from e
+        self._redis: Any = Redis.from_url(url)
+        self._check = self._redis.register_script(_CHECK_SCRIPT)
+
+    async def count_send(self, phone: str, window: int) -> int:
+        key = self._key("sends", phone)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, window, nx=True)
+            count, _ = await pipe.execute()
+        return int(count)
+
+    async def save(self, phone: str, code_hash: str, ttl: int, attempts: int) -> None:
+        key = self._key("code", phone)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping={"hash": code_hash, "attempts": attempts})
+            pipe.expire(key, ttl)
+            await pipe.execute()
+
+    async def check(self, phone: str, code_hash: str) -> OtpCheck:
+        result = await self._check(keys=[self._key("code", phone)], args=[code_hash])
+        return _CHECK_RESULTS[int(result)]
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        await self._redis.aclose()
+
+    def _key(self, kind: str, phone: str) -> str:
+        return f"{CACHE_KEY_PREFIX}:otp:{kind}:{phone}"
@@ -0,0 +1,93 @@
+"""In-process cache of report responses."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from src.application.interfaces.report_cache import IReportCache
+from src.core.metrics import Counter
+from src.infrastructure.cache.stale_cache import stale_reads_total
+from src.infrastructure.database.circuit_breaker import DatabaseUnavailableError
+
+report_cache_hits_total = Counter("report_cache_hits_total", "Report responses served from cache")
+report_cache_misses_total = Counter("report_cache_misses_total", "Report responses built")
+
+
+class InMemoryReportCache(IReportCache):
+    """
+    TTL cache of report bodies, per process.
+
+    Summary tables only change when the report refresher runs, so a body
+    can be reused for `ttl` seconds. A dashboard opened by many admins at
+    once builds each report once: later callers wait for the first one's
+    result. The oldest entries are evicted beyond `max_entries`.
+
+    While the database circuit breaker is open, an expired body is served
+    instead of failing if it was built at most `max_stale` seconds ago.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 1000, max_stale: float = 0.0) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._max_stale = max_stale
+        # key -> (built at, body)
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[bytes]] = {}
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[bytes]]) -> bytes:
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] + self._ttl > time.monotonic():
+                report_cache_hits_total.inc()
+                return entry[1]
+
+            future = self._inflight.get(key)
+            if future is None:
+                return await self._load(key, loader)
+            try:
+                body = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The loading request was cancelled, not this one: try again
+                current = asyncio.current_task()
+                if not future.cancelled() or (current is not None and current.cancelling()):
+                    raise
+                continue
+            report_cache_hits_total.inc()
+            return body
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[bytes]]) -> bytes:
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        report_cache_misses_total.inc()
+        try:
+            body = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except DatabaseUnavailableError as e:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] + self._max_stale < time.monotonic():
+                self._fail(future, e)
+                raise
+            stale_reads_total.inc(cache="reports")
+            future.set_result(entry[1])
+            return entry[1]
+        except Exception as e:
+            self._fail(future, e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        self._entries[key] = (time.monotonic(), body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        future.set_result(body)
+        return body
+
+    @staticmethod
+    def _fail(future: asyncio.Future[bytes], error: Exception) -> None:
+        future.set_exception(error)
+        # Retrieve it so an unawaited failure is not logged as never retrieved
+        future.exception()
@@ -0,0 +1,258 @@
+"""In-process delivery serviceability index kept current from the delivery_zones table."""
+
+import asyncio
+import bisect
+import contextlib
+import math
+import time
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.interfaces.serviceability_index import IServiceabilityIndex
+from src.core.logging import get_logger
+from src.domain.entities.delivery import DeliveryZone
+from src.infrastructure.repositories.sqlalchemy.delivery_zone_repository_impl import (
+    SQLAlchemyDeliveryZoneRepository,
+)
+
+logger = get_logger(__name__)
+
+# Re-read changes this far behind the watermark: a transaction can commit a
+# row whose updated_at is earlier than rows already seen.
+WATERMARK_OVERLAP = timedelta(seconds=5)
+
+# Polygon edge as (x1, y1, x2, y2), x being longitude and y latitude
+Edge = tuple[float, float, float, float]
+# (zone, edges crossing the cell or None when the zone covers all of it,
+#  cell centre x, cell centre y, whether the centre is inside the zone)
+CellEntry = tuple[DeliveryZone, tuple[Edge, ...] | None, float, float, bool]
+
+
+class ZoneGrid:
+    """
+    Immutable uniform grid over the zones' bounding box.
+
+    Each cell lists, highest priority first, the zones that reach it:
+
+    - A zone covering the whole cell answers without any geometry.
+    - A zone whose boundary passes through the cell keeps only the edges that
+      touch the cell and whether the cell centre is inside. A point in the
+      cell is inside when the segment from the centre to it crosses those
+      edges an even number of times (odd, if the centre is outside), so a
+      lookup tests a handful of edges however detailed the polygon is.
+
+    The cell size doubles until the grid fits in max_cells.
+    """
+
+    def __init__(
+        self, zones: Sequence[DeliveryZone], cell_size: float, max_cells: int = 1_000_000
+    ) -> None:
+        self.zones = sorted(
+            (zone for zone in zones if zone.is_active and zone.rings),
+            key=lambda zone: (-zone.priority, zone.name, zone.id),
+        )
+        self._cells: list[tuple[CellEntry, ...]] = []
+        self._nx = self._ny = 0
+        self._min_x = self._min_y = 0.0
+        self._cell_size = cell_size
+
+        points = [point for zone in self.zones for ring in zone.rings for point in ring]
+        if not points:
+            return
+
+        self._min_x = min(x for x, _ in points)
+        self._min_y = min(y for _, y in points)
+        width = max(x for x, _ in points) - self._min_x
+        height = max(y for _, y in points) - self._min_y
+        while (width // self._cell_size + 1) * (height // self._cell_size + 1) > max_cells:
+            self._cell_size *= 2
+        self._nx = int(width // self._cell_size) + 1
+        self._ny = int(height // self._cell_size) + 1
+
+        cells: list[list[CellEntry]] = [[] for _ in range(self._nx * self._ny)]
+        for zone in self.zones:
+            self._add_zone(zone, cells)
+        empty: tuple[CellEntry, ...] = ()
+        self._cells = [tuple(entries) if entries else empty for entries in cells]
+
+    @property
+    def cell_count(self) -> int:
+        return len(self._cells)
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    def locate(self, lat: float, lng: float) -> DeliveryZone | None:
+        """Highest-priority zone containing the point, or None."""
+        fx = (lng - self._min_x) / self._cell_size
+        fy = (lat - self._min_y) / self._cell_size
+        if fx < 0 or fy < 0 or fx >= self._nx or fy >= self._ny:
+            return None
+
+        for zone, edges, cx, cy, inside in self._cells[int(fy) * self._nx + int(fx)]:
+            if edges is not None:
+                dx = lng - cx
+                dy = lat - cy
+                for x1, y1, x2, y2 in edges:
+                    # The edge's ends lie on opposite sides of centre->point,
+                    # and the centre and point on opposite sides of the edge
+                    if (dx * (y1 - cy) - dy * (x1 - cx) > 0) != (
+                        dx * (y2 - cy) - dy * (x2 - cx) > 0
+                    ):
+                        ex = x2 - x1
+                        ey = y2 - y1
+                        if (ex * (cy - y1) - ey * (cx - x1) > 0) != (
+                            ex * (lat - y1) - ey * (lng - x1) > 0
+                        ):
+                            inside = not inside
+            if inside:
+                return zone
+        return None
+
+    def _add_zone(self, zone: DeliveryZone, cells: list[list[CellEntry]]) -> None:
+        edges = [
+            (x1, y1, x2, y2)
+            for ring in zone.rings
+            for (x1, y1), (x2, y2) in zip(ring, ring[1:] + ring[:1], strict=True)
+            if (x1, y1) != (x2, y2)
+        ]
+        if not edges:
+            return
+
+        edges_by_cell: dict[int, list[Edge]] = {}
+        for edge in edges:
+            x1, y1, x2, y2 = edge
+            for iy in range(self._row(min(y1, y2)), self._row(max(y1, y2)) + 1):
+                for ix in range(self._column(min(x1, x2)), self._column(max(x1, x2)) + 1):
+                    if self._touches_cell(edge, ix, iy):
+                        edges_by_cell.setdefault(iy * self._nx + ix, []).append(edge)
+
+        xs = [x for ring in zone.rings for x, _ in ring]
+        ys = [y for ring in zone.rings for _, y in ring]
+        columns = range(self._column(min(xs)), self._column(max(xs)) + 1)
+        for iy in range(self._row(min(ys)), self._row(max(ys)) + 1):
+            cy = self._min_y + (iy + 0.5) * self._cell_size
+            # Even-odd rule along the row through the cell centres
+            crossings = sorted(
+                x1 + (cy - y1) * (x2 - x1) / (y2 - y1)
+                for x1, y1, x2, y2 in edges
+                if (y1 > cy) != (y2 > cy)
+            )
+            for ix in columns:
+                cx = self._min_x + (ix + 0.5) * self._cell_size
+                inside = bisect.bisect_right(crossings, cx) % 2 == 1
+                index = iy * self._nx + ix
+                cell_edges = edges_by_cell.get(index)
+                if cell_edges is not None:
+                    cells[index].append((zone, tuple(cell_edges), cx, cy, inside))
+                elif inside:
+                    cells[index].append((zone, None, cx, cy, True))
+
+    def _column(self, x: float) -> int:
+        return min(int((x - self._min_x) // self._cell_size), self._nx - 1)
+
+    def _row(self, y: float) -> int:
+        return min(int((y - self._min_y) // self._cell_size), self._ny - 1)
+
+    def _touches_cell(self, edge: Edge, ix: int, iy: int) -> bool:
+        """Whether the edge's line passes through the cell (its bounding box already overlaps)."""
+        x1, y1, x2, y2 = edge
+        left = self._min_x + ix * self._cell_size
+        bottom = self._min_y + iy * self._cell_size
+        sides = {
+            math.copysign(1.0, (x2 - x1) * (y - y1) - (y2 - y1) * (x - x1))
+            for x in (left, left + self._cell_size)
+            for y in (bottom, bottom + self._cell_size)
+        }
+        return len(sides) > 1
+
+
+class InMemoryServiceabilityIndex(IServiceabilityIndex):
+    """
+    Delivery zones held in memory as a ZoneGrid and refreshed incrementally.
+
+    - refresh() loads only zones whose updated_at is past the watermark; the
+      first call loads everything. Any change rebuilds the grid in a worker
+      thread and swaps it in, so lookups never see a half-built index.
+    - A background task refreshes every refresh_interval seconds, so zone
+      changes made by any process become visible within that interval.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        refresh_interval: float = 10.0,
+        cell_size: float = 0.002,
+    ) -> None:
+        self._session_maker = session_maker
+        self._refresh_interval = refresh_interval
+        self._cell_size = cell_size
+        self._zones: dict[UUID, DeliveryZone] = {}
+        self._grid = ZoneGrid([], cell_size)
+        self._watermark: datetime | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    async def start(self) -> None:
+        """Load the zones and start the background refresh task."""
+        self._stopping.clear()
+        await self._safe_refresh()
+        self._task = asyncio.create_task(self._run(), name="serviceability-index-refresh")
+
+    async def stop(self) -> None:
+        """Stop the background refresh task."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def refresh(self) -> int:
+        """Apply zones changed since the watermark. Returns how many changed."""
+        since = self._watermark - WATERMARK_OVERLAP if self._watermark else None
+        async with self._session_maker() as session:
+            changed = await SQLAlchemyDeliveryZoneRepository(session).list_changed_since(since)
+
+        applied = 0
+        for zone in changed:
+            if self._zones.get(zone.id) != zone:
+                self._zones[zone.id] = zone
+                applied += 1
+            if self._watermark is None or zone.updated_at > self._watermark:
+                self._watermark = zone.updated_at
+
+        if applied:
+            started = time.perf_counter()
+            self._grid = await asyncio.to_thread(
+                ZoneGrid, list(self._zones.values()), self._cell_size
+            )
+            logger.info(
+                "Serviceability index rebuilt",
+                extra={
+                    "zones": len(self._grid.zones),
+                    "cells": self._grid.cell_count,
+                    "build_ms": round((time.perf_counter() - started) * 1000, 1),
+                },
+            )
+        return applied
+
+    def locate(self, lat: float, lng: float) -> DeliveryZone | None:
+        return self._grid.locate(lat, lng)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._refresh_interval)
+            if not self._stopping.is_set():
+                await self._safe_refresh()
+
+    async def _safe_refresh(self) -> None:
+        """Refresh, keeping the current index if the database is unavailable."""
+        try:
+            await self.refresh()
+        except Exception:
+            logger.exception("Serviceability index refresh failed")
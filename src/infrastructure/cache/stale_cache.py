@@ -0,0 +1,61 @@
+"""Last successful reads, kept to answer while the database is unavailable."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+from src.core.metrics import Counter
+
+stale_reads_total = Counter(
+    "db_stale_reads_total",
+    "Reads answered from a stale cache while the database was unavailable",
+    ["cache"],
+)
+
+
+class StaleCache[K: Hashable, V]:
+    """
+    Bounded LRU of the latest value read for each key, with its age.
+
+    Readers put every value they get from the database and only fall back to
+    `get` when a read raised DatabaseUnavailableError. Values older than
+    `max_age` seconds are never served; `max_age` 0 disables the cache.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 10_000,
+        max_age: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._name = name
+        self._max_entries = max_entries
+        self._max_age = max_age
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def put(self, key: K, value: V) -> None:
+        """Remember the value just read for key."""
+        if self._max_age <= 0:
+            return
+        self._entries[key] = (self._clock(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: K) -> V | None:
+        """The value last read for key, if it is recent enough to serve."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if self._clock() - stored_at > self._max_age:
+            del self._entries[key]
+            return None
+        stale_reads_total.inc(cache=self._name)
+        return value
+
+    def discard(self, key: K) -> None:
+        """Forget key, for instance after it was deleted."""
+        self._entries.pop(key, None)
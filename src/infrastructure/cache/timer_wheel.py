@@ -0,0 +1,88 @@
+"""Hierarchical timing wheel for O(1) key expiry."""
+
+import math
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel that expires keys in amortised O(1).
+
+    Time is counted in ticks of `tick` seconds. Level 0 has one slot per
+    tick; each higher level has slots `slots` times wider. A key is placed in
+    the lowest level whose span covers its deadline. When a lower level wraps
+    around, the matching slot of the level above is emptied and its keys are
+    placed again, now in a finer level. Keys further away than the top
+    level's span wait in its last slot and are re-placed as time passes.
+
+    Rescheduling and cancelling only update the key's deadline; stale slot
+    entries are skipped when their slot fires. Expiry is at tick granularity,
+    never early.
+    """
+
+    def __init__(self, now: float, tick: float = 1.0, slots: int = 64, levels: int = 4) -> None:
+        self._tick = tick
+        self._slots = slots
+        self._spans = [slots**level for level in range(levels)]
+        self._wheels: list[list[set[str]]] = [[set() for _ in range(slots)] for _ in range(levels)]
+        self._deadlines: dict[str, int] = {}
+        self._current = self._to_tick(now)
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def schedule(self, key: str, deadline: float) -> None:
+        """Expire `key` at `deadline`, replacing any earlier schedule."""
+        tick = max(math.ceil(deadline / self._tick), self._current + 1)
+        self._deadlines[key] = tick
+        self._place(key, tick)
+
+    def cancel(self, key: str) -> None:
+        """Stop tracking `key`."""
+        self._deadlines.pop(key, None)
+
+    def advance(self, now: float) -> list[str]:
+        """Move the wheel to `now` and return the keys that expired on the way."""
+        expired: list[str] = []
+        target = self._to_tick(now)
+        while self._current < target and self._deadlines:
+            self._current += 1
+            # Cascade: a level's slot is redistributed when the level below
+            # wraps, coarsest first so keys can drop through several levels
+            wrapped = [
+                level
+                for level in range(1, len(self._spans))
+                if self._current % self._spans[level] == 0
+            ]
+            for level in reversed(wrapped):
+                self._replace(level, (self._current // self._spans[level]) % self._slots)
+
+            slot = self._current % self._slots
+            bucket, self._wheels[0][slot] = self._wheels[0][slot], set()
+            for key in bucket:
+                if self._deadlines.get(key) == self._current:
+                    del self._deadlines[key]
+                    expired.append(key)
+        # Nothing is scheduled: jump straight to now
+        self._current = max(self._current, target)
+        return expired
+
+    def _replace(self, level: int, slot: int) -> None:
+        bucket, self._wheels[level][slot] = self._wheels[level][slot], set()
+        for key in bucket:
+            tick = self._deadlines.get(key)
+            if tick is not None:
+                self._place(key, tick)
+
+    def _place(self, key: str, tick: int) -> None:
+        delta = tick - self._current
+        top = len(self._spans) - 1
+        for level in range(top + 1):
+            if level == top or delta < self._spans[level] * self._slots:
+                break
+        if level == top and delta >= self._spans[top] * self._slots:
+            # Beyond the wheel's reach: park in the top level's furthest slot
+            tick = self._current + self._spans[top] * (self._slots - 1)
+        self._wheels[level][(tick // self._spans[level]) % self._slots].add(key)
+
+    def _to_tick(self, now: float) -> int:
+        return math.floor(now / self._tick)
@@ -1,11 +1,12 @@
 """Database infrastructure module."""
 
-from src.infrastructure.database.connection import engine
-from src.infrastructure.database.session import SessionDep, async_session_maker, get_session
+from src.infrastructure.database.connection import dispose_engine, get_engine
+from src.infrastructure.database.session import SessionDep, get_session, get_session_maker
 
 __all__ = [
-    "engine",
+    "dispose_engine",
+    "get_engine",
     "get_session",
-    "async_session_maker",
+    "get_session_maker",
     "SessionDep",
 ]
@@ -0,0 +1,338 @@
+"""Circuit breaker in front of a database engine."""
+
+import time
+from collections import deque
+from collections.abc import Callable
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.core.metrics import Counter, Gauge
+
+logger = get_logger(__name__)
+
+# SQLSTATE classes meaning the database, not the statement, is in trouble:
+# connection exceptions and insufficient resources
+OUTAGE_SQLSTATE_CLASSES = ("08", "53")
+# Operator intervention that takes the server away: admin_shutdown,
+# crash_shutdown, cannot_connect_now. Not query_canceled (57014), which a
+# request's own deadline causes through statement_timeout, down to the 1ms
+# a client can ask for with X-Request-Timeout: 0
+OUTAGE_SQLSTATES = frozenset({"57P01", "57P02", "57P03"})
+
+circuit_state = Gauge(
+    "db_circuit_state",
+    "Database circuit breaker state (0 closed, 1 half open, 2 open)",
+    ["database"],
+)
+circuit_opened_total = Counter(
+    "db_circuit_opened_total", "Times the database circuit breaker opened", ["database"]
+)
+circuit_rejected_total = Counter(
+    "db_circuit_rejected_total", "Connections refused while the breaker was open", ["database"]
+)
+
+# Every breaker registers itself here by name, for the readiness endpoint
+BREAKERS: dict[str, CircuitBreaker] = {}
+
+
+class DatabaseUnavailableError(Exception):
+    """Raised instead of using a database whose circuit breaker is open."""
+
+    def __init__(self, database: str, retry_after: float) -> None:
+        self.database = database
+        self.retry_after = retry_after
+        super().__init__(f"Database {database} is unavailable; retry in {retry_after:.1f}s")
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+STATE_VALUES = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+class CircuitBreaker:
+    """
+    Trips on the error rate or latency of recent database calls.
+
+    - Closed: calls go through and the outcomes of the last `window` calls
+      are kept. Once there are `minimum_calls` of them, the breaker opens
+      when `failure_rate` of them failed for lack of a database (connection
+      errors, the server shutting down or refusing connections, an
+      exhausted pool) or `slow_call_rate` of them took `slow_call_duration`
+      seconds or more.
+    - Open: every connection checkout fails at once with
+      DatabaseUnavailableError, for `open_duration` seconds.
+    - Half open: up to `half_open_calls` checkouts are let through as
+      probes. That many fast, successful calls close the breaker; one
+      failed or slow call opens it again. Probes that never report back are
+      replaced after another `open_duration`.
+
+    A call counts as slow as soon as it has run for `slow_call_duration`,
+    without waiting for it to finish: a stalled database may never answer.
+    Errors caused by the statement itself (constraint violations, bad input)
+    and statements cancelled by statement_timeout count as successful calls,
+    since the database answered; a timed-out statement still counts as slow
+    if it ran that long. Calls the caller gave up on (a cancelled request)
+    count only if they were slow.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        window: int = 100,
+        minimum_calls: int = 20,
+        failure_rate: float = 0.5,
+        slow_call_rate: float = 0.5,
+        slow_call_duration: float = 2.0,
+        open_duration: float = 5.0,
+        half_open_calls: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._minimum_calls = minimum_calls
+        self._failure_rate = failure_rate
+        self._slow_call_rate = slow_call_rate
+        self._slow_call_duration = slow_call_duration
+        self._open_duration = open_duration
+        self._half_open_calls = half_open_calls
+        self._clock = clock
+        # Calls in flight by token, oldest first, with their start times
+        self._inflight: dict[object, float] = {}
+        # (failed, slow) for the last `window` calls, with running totals
+        self._calls: deque[tuple[bool, bool]] = deque(maxlen=window)
+        self._failures = 0
+        self._slow = 0
+        self._state = CircuitState.CLOSED
+        self._changed_at = clock()
+        self._probes = 0
+        self._probe_successes = 0
+        circuit_state.set(0, database=name)
+        BREAKERS[name] = self
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._changed_at >= self._open_duration
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def before_checkout(self) -> None:
+        """Let a connection checkout through, or raise DatabaseUnavailableError."""
+        self._count_stalled()
+        state = self.state
+        if state is CircuitState.HALF_OPEN:
+            if self._clock() - self._changed_at >= self._open_duration:
+                # The probes let through never reported back
+                self._probes = 0
+                self._changed_at = self._clock()
+            if self._probes < self._half_open_calls:
+                self._probes += 1
+                return
+        elif state is CircuitState.CLOSED:
+            return
+        circuit_rejected_total.inc(database=self.name)
+        retry_after = max(self._open_duration - (self._clock() - self._changed_at), 0.0)
+        raise DatabaseUnavailableError(self.name, retry_after)
+
+    def call_started(self, token: object) -> None:
+        """Start timing a call; `token` identifies it to call_finished."""
+        self._inflight[token] = self._clock()
+
+    def call_finished(self, token: object, failed: bool = False, fast_counts: bool = True) -> None:
+        """
+        Record the outcome of a call.
+
+        With `fast_counts` off, a call that succeeded quickly is not counted,
+        so connection checkouts do not dilute the rates of the statements
+        that follow them.
+        """
+        started = self._inflight.pop(token, None)
+        if started is None:
+            # Already counted as slow, or started before the last state change
+            return
+        slow = self._clock() - started >= self._slow_call_duration
+        if failed or slow or fast_counts:
+            self._record(failed, slow)
+
+    def snapshot(self) -> dict[str, Any]:
+        """State and window rates, for the readiness endpoint."""
+        state = self.state
+        calls = len(self._calls)
+        return {
+            "state": state.value,
+            "calls": calls,
+            "failure_rate": round(self._failures / calls, 3) if calls else 0.0,
+            "slow_call_rate": round(self._slow / calls, 3) if calls else 0.0,
+        }
+
+    def _count_stalled(self) -> None:
+        """Count calls still running past slow_call_duration as slow."""
+        cutoff = self._clock() - self._slow_call_duration
+        while self._inflight:
+            token, started = next(iter(self._inflight.items()))
+            if started > cutoff:
+                break
+            del self._inflight[token]
+            self._record(failed=False, slow=True)
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        state = self.state
+        if state is CircuitState.HALF_OPEN:
+            if failed or slow:
+                self._transition(CircuitState.OPEN)
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self._half_open_calls:
+                self._transition(CircuitState.CLOSED)
+            return
+        if state is CircuitState.OPEN:
+            return
+
+        if len(self._calls) == self._calls.maxlen:
+            old_failed, old_slow = self._calls[0]
+            self._failures -= old_failed
+            self._slow -= old_slow
+        self._calls.append((failed, slow))
+        self._failures += failed
+        self._slow += slow
+        calls = len(self._calls)
+        if calls >= self._minimum_calls and (
+            self._failures / calls >= self._failure_rate
+            or self._slow / calls >= self._slow_call_rate
+        ):
+            self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        if state is CircuitState.OPEN:
+            circuit_opened_total.inc(database=self.name)
+            logger.warning(
+                "Database circuit breaker opened",
+                extra={
+                    "database": self.name,
+                    "calls": len(self._calls),
+                    "failures": self._failures,
+                    "slow_calls": self._slow,
+                },
+            )
+        else:
+            logger.info(
+                "Database circuit breaker state changed",
+                extra={"database": self.name, "state": state.value},
+            )
+        self._state = state
+        self._changed_at = self._clock()
+        self._probes = 0
+        self._probe_successes = 0
+        # Judge the database afresh after every change, ignoring calls
+        # already running
+        self._inflight.clear()
+        self._calls.clear()
+        self._failures = self._slow = 0
+        circuit_state.set(STATE_VALUES[state], database=self.name)
+
+
+def circuit_breaker(name: str) -> CircuitBreaker | None:
+    """Breaker for database `name` configured from settings, or None when disabled."""
+    database = get_settings().database
+    if not database.breaker_enabled:
+        return None
+    return CircuitBreaker(
+        name,
+        window=database.breaker_window,
+        minimum_calls=database.breaker_minimum_calls,
+        failure_rate=database.breaker_failure_rate,
+        slow_call_rate=database.breaker_slow_call_rate,
+        slow_call_duration=database.breaker_slow_call_duration,
+        open_duration=database.breaker_open_duration,
+        half_open_calls=database.breaker_half_open_calls,
+    )
+
+
+def create_guarded_engine(url: str, breaker: CircuitBreaker | None, **kwargs: Any) -> AsyncEngine:
+    """
+    create_async_engine with every connection checkout and statement going through `breaker`.
+
+    Checkouts ask the breaker first, so an open breaker fails before waiting
+    for the pool or pinging a connection. Failed checkouts count as failed
+    calls and slow ones as slow calls; every statement counts with its
+    duration.
+    """
+    if breaker is None:
+        return create_async_engine(url, **kwargs)
+    engine = create_async_engine(url, poolclass=_guarded_pool(breaker), **kwargs)
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start_call(conn: Connection, *_args: Any) -> None:
+        token = object()
+        conn.info["breaker_call"] = token
+        breaker.call_started(token)
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _record_success(conn: Connection, *_args: Any) -> None:
+        breaker.call_finished(conn.info.pop("breaker_call", None))
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _record_error(context: ExceptionContext) -> None:
+        conn = context.connection
+        token = conn.info.pop("breaker_call", None) if conn is not None else None
+        if token is not None:
+            breaker.call_finished(token, failed=_is_outage(context))
+        # Failures while connecting are recorded by the pool
+
+    return engine
+
+
+def _guarded_pool(breaker: CircuitBreaker) -> type[AsyncAdaptedQueuePool]:
+    # A subclass rather than a pool event: "checkout" fires only after the
+    # pool wait and pre-ping this is meant to skip
+    class GuardedPool(AsyncAdaptedQueuePool):
+        def connect(self) -> PoolProxiedConnection:
+            breaker.before_checkout()
+            token = object()
+            breaker.call_started(token)
+            try:
+                connection = super().connect()
+            except Exception:
+                breaker.call_finished(token, failed=True)
+                raise
+            except BaseException:
+                # Cancelled while waiting for the pool
+                breaker.call_finished(token, fast_counts=False)
+                raise
+            breaker.call_finished(token, fast_counts=False)
+            return connection
+
+    return GuardedPool
+
+
+def _is_outage(context: ExceptionContext) -> bool:
+    """Whether an error says the database is unreachable or overloaded."""
+    error = context.original_exception
+    if not isinstance(error, Exception):
+        # Cancelled by the caller; SQLAlchemy reports these as disconnects too
+        return False
+    if context.is_disconnect:
+        return True
+    sqlstate = getattr(error, "sqlstate", None) or getattr(
+        getattr(error, "orig", None), "sqlstate", None
+    )
+    if isinstance(sqlstate, str):
+        return sqlstate[:2] in OUTAGE_SQLSTATE_CLASSES or sqlstate in OUTAGE_SQLSTATES
+    # Includes TimeoutError and refused or reset connections
+    return isinstance(error, OSError)
@@ -1,15 +1,37 @@
 """Database connection and engine configuration."""
 
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-
-from src.core.config import settings
-
-# Create async engine with connection pooling
-engine: AsyncEngine = create_async_engine(
-    settings.database.url,
-    echo=settings.database.echo,
-    pool_size=settings.database.pool_size,
-    max_overflow=settings.database.max_overflow,
-    pool_pre_ping=True,
-    future=True,
-)
+from functools import lru_cache
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import get_settings
+from src.infrastructure.database.circuit_breaker import circuit_breaker, create_guarded_engine
+
+
+@lru_cache
+def get_engine() -> AsyncEngine:
+    """
+    Return the async engine, creating it with connection pooling on first use.
+
+    The engine is built lazily so importing the database package does not
+    parse settings or set up a connection pool. Its connections go through
+    the "primary" circuit breaker unless DB_BREAKER_ENABLED is off.
+    """
+    settings = get_settings()
+    return create_guarded_engine(
+        settings.database.url,
+        circuit_breaker("primary"),
+        echo=settings.database.echo,
+        pool_size=settings.database.pool_size,
+        max_overflow=settings.database.max_overflow,
+        pool_pre_ping=True,
+        future=True,
+    )
+
+
+async def dispose_engine() -> None:
+    """Dispose the engine if it was ever created."""
+    if get_engine.cache_info().currsize == 0:
+        return
+    await get_engine().dispose()
+    get_engine.cache_clear()
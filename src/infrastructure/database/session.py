@@ -1,21 +1,45 @@
 """Database session management and dependency injection."""
 
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy import Connection, event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, SessionTransaction
 
-from src.infrastructure.database.connection import engine
+from src.core.deadline import get_deadline
+from src.infrastructure.database.connection import get_engine
 
-# Session factory
-async_session_maker = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+
+@lru_cache
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Return the session factory, binding it to the engine on first use."""
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_statement_timeout(
+    _session: Session, _transaction: SessionTransaction, connection: Connection
+) -> None:
+    """
+    Bound every statement by the time left on the request deadline.
+
+    SET LOCAL lasts until the transaction ends, so the pooled connection is
+    returned without the setting. Sessions outside a request are unaffected.
+    """
+    deadline = get_deadline()
+    if deadline is None:
+        return
+    timeout_ms = max(int(deadline.remaining() * 1000), 1)
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
 
 
 async def get_session() -> AsyncGenerator[AsyncSession]:
@@ -34,7 +58,7 @@ async def get_session() -> AsyncGenerator[AsyncSession]:
     - Rolls back on execution
     - Closes session
     """
-    async with async_session_maker() as session:
+    async with get_session_maker()() as session:
         try:
             yield session
             await session.commit()
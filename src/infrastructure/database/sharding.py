@@ -0,0 +1,214 @@
+"""User shard engines and the slot map that routes users to them."""
+
+import asyncio
+import contextlib
+import time
+from collections import OrderedDict
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.core.logging import get_logger
+from src.infrastructure.database.circuit_breaker import circuit_breaker, create_guarded_engine
+from src.infrastructure.orm.user_directory_model import UserShardSlotModel
+from src.infrastructure.orm.user_model import SHARD_SLOTS, shard_slot
+
+logger = get_logger(__name__)
+
+ACTIVE = "active"
+FROZEN = "frozen"
+
+# pg_advisory_xact_lock(SLOT_LOCK_NAMESPACE, slot): shared by writers to a
+# slot, exclusive while the resharding tool freezes it
+SLOT_LOCK_NAMESPACE = 0x75736572
+
+# How long a write waits for a frozen slot to finish moving
+FROZEN_SLOT_TIMEOUT = 10.0
+FROZEN_SLOT_POLL_INTERVAL = 0.05
+
+
+class UserShards:
+    """
+    Databases holding user rows, and the map of which one holds each user.
+
+    - Shard 0 is the primary database; shard_urls add shards 1, 2, ...
+    - A user's slot is a stable hash of their id (shard_slot). The slot map
+      in user_shard_slots says which shard holds each slot, so moving users
+      means moving slots and never rehashing.
+    - Reads route by an in-memory copy of the map, refreshed every
+      map_refresh_interval seconds. Writes check the slot on the primary
+      under a shared advisory lock instead (writable_shard), so they never
+      go to a shard a slot has left.
+    - An LRU of email -> user id lets email lookups skip the directory.
+    - Each shard has its own circuit breaker ("user_shard_<n>"), so one
+      failing shard does not cut off the others.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        shard_urls: list[str],
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        echo: bool = False,
+        map_refresh_interval: float = 5.0,
+        email_cache_size: int = 100_000,
+    ) -> None:
+        self._primary = primary
+        self._engines: list[AsyncEngine] = [
+            create_guarded_engine(
+                url,
+                circuit_breaker(f"user_shard_{shard}"),
+                echo=echo,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_pre_ping=True,
+            )
+            for shard, url in enumerate(shard_urls, start=1)
+        ]
+        self._session_makers = [primary] + [
+            async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+            for engine in self._engines
+        ]
+        self._map_refresh_interval = map_refresh_interval
+        self._slots: list[int] = [0] * SHARD_SLOTS
+        self._email_cache_size = email_cache_size
+        self._email_ids: OrderedDict[str, UUID] = OrderedDict()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    @property
+    def count(self) -> int:
+        """Number of shards, including the primary."""
+        return len(self._session_makers)
+
+    async def start(self) -> None:
+        """Load the slot map and keep it current in the background."""
+        self._stopping.clear()
+        # Unlike other caches, a failure here stops startup: without the map
+        # users cannot be found
+        await self.refresh()
+        self._task = asyncio.create_task(self._run(), name="user-shard-map-refresh")
+
+    async def stop(self) -> None:
+        """Stop refreshing and close the shard connection pools."""
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+        for engine in self._engines:
+            await engine.dispose()
+
+    async def refresh(self) -> None:
+        """Reload the slot map from the primary."""
+        async with self._primary() as session:
+            rows = (
+                await session.execute(select(UserShardSlotModel.slot, UserShardSlotModel.shard))
+            ).all()
+        slots = [0] * SHARD_SLOTS
+        for slot, shard in rows:
+            if shard >= self.count:
+                raise RuntimeError(
+                    f"Slot {slot} is on shard {shard} but only {self.count} shards are configured"
+                )
+            slots[slot] = shard
+        self._slots = slots
+
+    def shard_of(self, user_id: UUID) -> int:
+        """Shard to read a user from."""
+        return self._slots[shard_slot(user_id)]
+
+    def session(self, shard: int) -> AsyncSession:
+        """New session on a shard."""
+        return self._session_makers[shard]()
+
+    async def writable_shard(self, session: AsyncSession, user_id: UUID) -> int:
+        """
+        Shard to write a user to, waiting while their slot is being moved.
+
+        Takes a shared advisory lock on the slot in the given primary
+        session, held until it ends, so the resharding tool cannot freeze
+        the slot between this check and the write.
+        """
+        slot = shard_slot(user_id)
+        await session.execute(select(func.pg_advisory_xact_lock_shared(SLOT_LOCK_NAMESPACE, slot)))
+        deadline = time.monotonic() + FROZEN_SLOT_TIMEOUT
+        stmt = select(UserShardSlotModel.shard, UserShardSlotModel.state).where(
+            UserShardSlotModel.slot == slot
+        )
+        while True:
+            shard, state = (await session.execute(stmt)).one()
+            if state == ACTIVE:
+                self._slots[slot] = shard
+                return shard
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"User slot {slot} is still being moved")
+            await asyncio.sleep(FROZEN_SLOT_POLL_INTERVAL)
+
+    def slots_of(self, shard: int) -> list[int]:
+        """Slots to read a shard's users from."""
+        return [slot for slot, slot_shard in enumerate(self._slots) if slot_shard == shard]
+
+    async def writable_slots(self, session: AsyncSession, shard: int) -> list[int]:
+        """
+        Slots whose users can be written on a shard, waiting while any is being moved.
+
+        writable_shard for every slot of the shard at once: the shared locks
+        are taken in one statement and held until the session's transaction
+        ends. A slot that arrived on the shard after they were taken is left
+        out.
+        """
+        locked = (
+            await session.execute(
+                select(
+                    UserShardSlotModel.slot,
+                    func.pg_advisory_xact_lock_shared(SLOT_LOCK_NAMESPACE, UserShardSlotModel.slot),
+                ).where(UserShardSlotModel.shard == shard)
+            )
+        ).all()
+        deadline = time.monotonic() + FROZEN_SLOT_TIMEOUT
+        stmt = select(UserShardSlotModel.slot, UserShardSlotModel.state).where(
+            UserShardSlotModel.slot.in_([slot for slot, _ in locked]),
+            UserShardSlotModel.shard == shard,
+        )
+        while True:
+            states = (await session.execute(stmt)).all()
+            if all(state == ACTIVE for _, state in states):
+                return [slot for slot, _ in states]
+            if time.monotonic() > deadline:
+                frozen = [slot for slot, state in states if state != ACTIVE]
+                raise RuntimeError(f"User slots {frozen} are still being moved")
+            await asyncio.sleep(FROZEN_SLOT_POLL_INTERVAL)
+
+    def cached_user_id(self, email: str) -> UUID | None:
+        """User id last seen with this normalized email."""
+        user_id = self._email_ids.get(email)
+        if user_id is not None:
+            self._email_ids.move_to_end(email)
+        return user_id
+
+    def remember_email(self, email: str, user_id: UUID) -> None:
+        """Cache a normalized email's user id, evicting the least recently used."""
+        self._email_ids[email] = user_id
+        self._email_ids.move_to_end(email)
+        if len(self._email_ids) > self._email_cache_size:
+            self._email_ids.popitem(last=False)
+
+    def forget_email(self, email: str) -> None:
+        """Drop a cached email."""
+        self._email_ids.pop(email, None)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._map_refresh_interval)
+            if not self._stopping.is_set():
+                await self._safe_refresh()
+
+    async def _safe_refresh(self) -> None:
+        """Refresh, keeping the current map on failure."""
+        try:
+            await self.refresh()
+        except Exception:
+            logger.exception("User shard map refresh failed")
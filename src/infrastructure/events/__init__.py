@@ -0,0 +1 @@
+"""Domain event publishing from the transactional outbox."""
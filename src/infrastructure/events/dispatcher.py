@@ -0,0 +1,154 @@
+"""Background dispatcher publishing outbox events to the configured sink."""
+
+import asyncio
+import contextlib
+from datetime import UTC, datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from src.application.interfaces.event_sink import IEventSink
+from src.core.logging import get_logger
+from src.core.metrics import Counter, Gauge
+from src.infrastructure.repositories.sqlalchemy.outbox_repository_impl import (
+    SQLAlchemyOutboxRepository,
+)
+
+logger = get_logger(__name__)
+
+# pg advisory lock held by the single publishing process
+OUTBOX_LOCK_KEY = 7_301_955_412
+
+events_published_total = Counter(
+    "outbox_events_published_total", "Domain events published from the outbox"
+)
+dispatch_lag_seconds = Gauge(
+    "outbox_dispatch_lag_seconds",
+    "Age of the oldest event in the last published batch",
+)
+dispatcher_leader = Gauge(
+    "outbox_dispatcher_leader", "1 while this process holds the outbox publishing lock"
+)
+
+
+class OutboxDispatcher:
+    """
+    Publishes outbox events in batches, in insertion order.
+
+    - Only one process publishes at a time: the leader holds a session-level
+      advisory lock on a dedicated connection. Others retry every
+      leader_retry_interval and take over if the leader's connection drops.
+    - Each batch is read, handed to the sink, then deleted. A crash between
+      publish and delete republishes the batch (at-least-once).
+    - With a single publisher, events of one aggregate are delivered in the
+      order their transactions inserted them.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        sink: IEventSink,
+        *,
+        batch_size: int = 500,
+        poll_interval: float = 0.2,
+        leader_retry_interval: float = 5.0,
+        shutdown_timeout: float = 10.0,
+    ) -> None:
+        self._engine = engine
+        self._sink = sink
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._leader_retry_interval = leader_retry_interval
+        self._shutdown_timeout = shutdown_timeout
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start the background dispatch task."""
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run(), name="outbox-dispatcher")
+
+    async def stop(self) -> None:
+        """Stop after the batch in progress; unpublished events stay in the outbox."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        _, pending = await asyncio.wait({self._task}, timeout=self._shutdown_timeout)
+        for task in pending:
+            task.cancel()
+            logger.warning("Outbox dispatcher cancelled on shutdown")
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        """Contend for leadership, then publish until stopped."""
+        while not self._stopping.is_set():
+            try:
+                async with self._engine.connect() as connection:
+                    if await self._acquire_leadership(connection):
+                        try:
+                            await self._publish_loop(connection)
+                        finally:
+                            await self._release_leadership(connection)
+            except Exception:
+                logger.exception("Outbox dispatcher failed")
+            await self._sleep(self._leader_retry_interval)
+
+    async def _publish_loop(self, connection: AsyncConnection) -> None:
+        """Publish batches back to back, sleeping only when the outbox is drained."""
+        session = AsyncSession(bind=connection, expire_on_commit=False)
+        try:
+            while not self._stopping.is_set():
+                published = await self.dispatch_once(session)
+                if published < self._batch_size:
+                    await self._sleep(self._poll_interval)
+        finally:
+            await session.close()
+
+    async def dispatch_once(self, session: AsyncSession) -> int:
+        """Publish one batch. Returns the number of events published."""
+        repository = SQLAlchemyOutboxRepository(session)
+        async with session.begin():
+            batch = await repository.fetch_batch(self._batch_size)
+        if not batch:
+            dispatch_lag_seconds.set(0)
+            return 0
+
+        # The sink is called outside a transaction so slow delivery holds no snapshot
+        await self._sink.publish(batch)
+        async with session.begin():
+            await repository.delete_many([event.sequence for event in batch])
+
+        events_published_total.inc(len(batch))
+        dispatch_lag_seconds.set((datetime.now(UTC) - batch[0].occurred_at).total_seconds())
+        return len(batch)
+
+    async def _acquire_leadership(self, connection: AsyncConnection) -> bool:
+        acquired = bool(
+            await connection.scalar(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": OUTBOX_LOCK_KEY}
+            )
+        )
+        await connection.commit()
+        if acquired:
+            dispatcher_leader.set(1)
+            logger.info("Outbox dispatcher is the leader")
+        return acquired
+
+    async def _release_leadership(self, connection: AsyncConnection) -> None:
+        """Unlock before the connection goes back to the pool, or discard it."""
+        dispatcher_leader.set(0)
+        try:
+            await connection.rollback()
+            await connection.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": OUTBOX_LOCK_KEY}
+            )
+            await connection.commit()
+        except Exception:
+            # Closing the server connection releases the lock
+            await connection.invalidate()
+
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep, waking early on stop."""
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
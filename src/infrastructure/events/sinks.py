@@ -0,0 +1,47 @@
+"""Event sinks for locally published domain events."""
+
+import asyncio
+import json
+from collections.abc import Sequence
+from pathlib import Path
+
+from src.application.interfaces.event_sink import EventEnvelope, IEventSink
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class LoggingEventSink(IEventSink):
+    """Writes each event to the application log."""
+
+    async def publish(self, events: Sequence[EventEnvelope]) -> None:
+        for event in events:
+            logger.info("Domain event published", extra=event.to_dict())
+
+
+class InMemoryEventSink(IEventSink):
+    """Keeps published events in memory, in publishing order."""
+
+    def __init__(self) -> None:
+        self.events: list[EventEnvelope] = []
+
+    async def publish(self, events: Sequence[EventEnvelope]) -> None:
+        self.events.extend(events)
+
+
+class FileEventSink(IEventSink):
+    """Appends events to a newline-delimited JSON file, one batch per write."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+
+    async def publish(self, events: Sequence[EventEnvelope]) -> None:
+        lines = "".join(
+            json.dumps(event.to_dict(), separators=(",", ":")) + "\n" for event in events
+        )
+        # File I/O runs off the event loop
+        await asyncio.to_thread(self._append, lines)
+
+    def _append(self, lines: str) -> None:
+        with self._path.open("a", encoding="utf-8") as f:
+            f.write(lines)
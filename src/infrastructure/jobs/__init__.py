@@ -0,0 +1 @@
+"""Durable background jobs backed by PostgreSQL."""
@@ -0,0 +1,27 @@
+"""Job handlers wired to their use cases."""
+
+from typing import Any
+from uuid import UUID
+
+from src.application.interfaces.email_sender import IEmailSender
+from src.application.interfaces.token_service import ITokenService
+from src.application.use_cases.user.send_verification_email import (
+    SEND_VERIFICATION_EMAIL_JOB,
+    SendVerificationEmail,
+)
+from src.core.config import get_settings
+from src.infrastructure.jobs.registry import JobRegistry
+
+
+def register_job_handlers(
+    registry: JobRegistry, *, email_sender: IEmailSender, token_service: ITokenService
+) -> None:
+    """Register every background job the application knows how to run."""
+    send_verification_email = SendVerificationEmail(
+        token_service, email_sender, get_settings().email_verification_url
+    )
+
+    async def handle_send_verification_email(payload: dict[str, Any]) -> None:
+        await send_verification_email.execute(UUID(payload["user_id"]), payload["email"])
+
+    registry.register(SEND_VERIFICATION_EMAIL_JOB, handle_send_verification_email)
@@ -0,0 +1,213 @@
+"""SQLAlchemy implementation of the job queue."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+from typing import Any
+from uuid import UUID, uuid7
+
+from sqlalchemy import ColumnElement, and_, case, delete, func, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.job_queue import IJobQueue
+from src.infrastructure.orm.job_model import JobModel
+
+DEFAULT_MAX_ATTEMPTS = 5
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of a queued job. Succeeded jobs are deleted."""
+
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    FAILED = "FAILED"
+
+
+@dataclass(frozen=True)
+class ClaimedJob:
+    """A job a worker has locked for execution."""
+
+    id: UUID
+    name: str
+    payload: dict[str, Any]
+    attempts: int
+    max_attempts: int
+
+
+class SQLAlchemyJobQueue(IJobQueue):
+    """
+    Job queue stored in the 'jobs' table.
+
+    Request handlers use it to enqueue inside their own transaction; the job
+    runner uses it with its own sessions to claim and settle jobs.
+    """
+
+    def __init__(self, session: AsyncSession, default_max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        """
+        Initialize queue with database session.
+
+        Args:
+            session: SQLAlchemy async database session
+            default_max_attempts: Attempts allowed when enqueue does not say
+        """
+        self._session = session
+        self._default_max_attempts = default_max_attempts
+
+    async def enqueue(
+        self,
+        name: str,
+        payload: dict[str, Any],
+        *,
+        delay_seconds: float = 0,
+        max_attempts: int | None = None,
+    ) -> UUID:
+        """Insert a pending job; it becomes visible to workers on commit."""
+        job_id = uuid7()
+        await self._session.execute(
+            insert(JobModel).values(
+                id=job_id,
+                name=name,
+                payload=payload,
+                status=JobStatus.PENDING.value,
+                max_attempts=max_attempts or self._default_max_attempts,
+                run_at=datetime.now(UTC) + timedelta(seconds=delay_seconds),
+            )
+        )
+        return job_id
+
+    async def claim(self, limit: int) -> list[ClaimedJob]:
+        """
+        Lock up to `limit` due jobs and mark them RUNNING in one statement.
+
+        SKIP LOCKED lets concurrent workers (in this or other processes) take
+        disjoint batches without waiting on each other.
+        """
+        # Materialized so the locking SELECT runs exactly once; as an IN
+        # subquery the planner may re-run it and contend on the same rows
+        due = (
+            select(JobModel.id)
+            .where(JobModel.status == JobStatus.PENDING.value, JobModel.run_at <= func.now())
+            .order_by(JobModel.run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("due")
+            .prefix_with("MATERIALIZED")
+        )
+        stmt = (
+            update(JobModel)
+            .where(JobModel.id == due.c.id)
+            .values(
+                status=JobStatus.RUNNING.value,
+                attempts=JobModel.attempts + 1,
+                locked_at=func.now(),
+            )
+            .returning(
+                JobModel.id,
+                JobModel.name,
+                JobModel.payload,
+                JobModel.attempts,
+                JobModel.max_attempts,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return [ClaimedJob(*row) for row in result.all()]
+
+    async def renew(self, jobs: Sequence[ClaimedJob]) -> set[UUID]:
+        """Restart the lock clock of claimed jobs. Returns the ids still held."""
+        if not jobs:
+            return set()
+        stmt = (
+            update(JobModel)
+            .where(_held(jobs))
+            .values(locked_at=func.now())
+            .returning(JobModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return set(result.scalars())
+
+    async def complete(self, jobs: Sequence[ClaimedJob]) -> set[UUID]:
+        """Delete finished jobs still held by this claim. Returns the ids deleted."""
+        if not jobs:
+            return set()
+        result = await self._session.execute(
+            delete(JobModel)
+            .where(_held(jobs))
+            .returning(JobModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        return set(result.scalars())
+
+    async def retry(self, job: ClaimedJob, delay_seconds: float, error: str) -> bool:
+        """
+        Return a failed job to the queue, due after the backoff delay.
+
+        Returns False when the job is no longer held by this claim.
+        """
+        result = await self._session.execute(
+            update(JobModel)
+            .where(_held([job]))
+            .values(
+                status=JobStatus.PENDING.value,
+                run_at=datetime.now(UTC) + timedelta(seconds=delay_seconds),
+                locked_at=None,
+                last_error=error,
+            )
+            .returning(JobModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.first() is not None
+
+    async def fail(self, job: ClaimedJob, error: str) -> bool:
+        """
+        Mark a job as permanently failed; it stays in the table for inspection.
+
+        Returns False when the job is no longer held by this claim.
+        """
+        result = await self._session.execute(
+            update(JobModel)
+            .where(_held([job]))
+            .values(status=JobStatus.FAILED.value, locked_at=None, last_error=error)
+            .returning(JobModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.first() is not None
+
+    async def recover_stale(self, locked_before: datetime) -> int:
+        """
+        Release RUNNING jobs whose worker died before settling them.
+
+        Jobs with attempts left go back to PENDING; the rest are marked FAILED.
+        """
+        stmt = (
+            update(JobModel)
+            .where(JobModel.status == JobStatus.RUNNING.value, JobModel.locked_at < locked_before)
+            .values(
+                status=case(
+                    (JobModel.attempts >= JobModel.max_attempts, JobStatus.FAILED.value),
+                    else_=JobStatus.PENDING.value,
+                ),
+                locked_at=None,
+                last_error="Worker lock expired",
+            )
+            .returning(JobModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return len(result.all())
+
+
+def _held(jobs: Sequence[ClaimedJob]) -> ColumnElement[bool]:
+    """
+    Jobs still held by the claims they were returned from.
+
+    A job counts as held while it is RUNNING with the attempt count of this
+    claim; once its lock lapses and another worker claims it again, its
+    attempts differ and the first worker can no longer renew or settle it.
+    """
+    return and_(
+        JobModel.status == JobStatus.RUNNING.value,
+        tuple_(JobModel.id, JobModel.attempts).in_([(job.id, job.attempts) for job in jobs]),
+    )
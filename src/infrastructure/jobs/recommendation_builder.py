@@ -0,0 +1,174 @@
+"""
+Offline "frequently bought together" model built from order lines.
+
+Requires the optional `numpy` package (`uv sync --extra recommendations`);
+the API only reads the file this writes and does not need it.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import UUID
+
+import numpy as np
+import numpy.typing as npt
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.cache.recommendation_index import HEADER, HEADER_SIZE, MAGIC
+
+# Confirmed order lines of active products, grouped by order (ix order_items pkey)
+ORDER_LINES = text(
+    """
+    SELECT oi.order_id, oi.product_id
+    FROM order_items AS oi
+    JOIN orders AS o ON o.id = oi.order_id
+    JOIN products AS p ON p.id = oi.product_id
+    WHERE o.status = 'CONFIRMED'
+      AND o.updated_at >= now() - make_interval(days => :days)
+      AND p.is_active
+    ORDER BY oi.order_id
+    """
+)
+
+
+@dataclass(frozen=True)
+class OrderLines:
+    """
+    Order lines as parallel arrays.
+
+    `baskets` is non-decreasing (lines of one order are adjacent) and
+    `items` are row numbers into `product_ids`, which is sorted by UUID bytes.
+    """
+
+    baskets: npt.NDArray[np.int64]
+    items: npt.NDArray[np.int64]
+    product_ids: list[UUID]
+
+
+@dataclass(frozen=True)
+class Neighbours:
+    """Top-k neighbours of every product in CSR form."""
+
+    offsets: npt.NDArray[np.uint32]
+    neighbours: npt.NDArray[np.uint32]
+    scores: npt.NDArray[np.float32]
+    k: int
+
+
+async def load_order_lines(
+    session_maker: async_sessionmaker[AsyncSession], days: int, batch_size: int = 50_000
+) -> OrderLines:
+    """Stream confirmed order lines from the last `days` days."""
+    rows: dict[UUID, int] = {}
+    baskets: list[int] = []
+    items: list[int] = []
+    basket = -1
+    previous_order: UUID | None = None
+
+    async with session_maker() as session:
+        result = await session.stream(
+            ORDER_LINES.execution_options(yield_per=batch_size), {"days": days}
+        )
+        async for order_id, product_id in result:
+            if order_id != previous_order:
+                basket += 1
+                previous_order = order_id
+            baskets.append(basket)
+            items.append(rows.setdefault(product_id, len(rows)))
+
+    # Renumber products in UUID byte order, the order the file's ID table uses
+    product_ids = sorted(rows, key=lambda product_id: product_id.bytes)
+    renumber = np.empty(len(rows), dtype=np.int64)
+    renumber[[rows[product_id] for product_id in product_ids]] = np.arange(len(rows))
+    return OrderLines(
+        baskets=np.asarray(baskets, dtype=np.int64),
+        items=renumber[np.asarray(items, dtype=np.int64)],
+        product_ids=product_ids,
+    )
+
+
+def build_neighbours(
+    lines: OrderLines, k: int, min_count: int = 2, max_basket: int = 50
+) -> Neighbours:
+    """
+    Score product pairs by how often they are bought together.
+
+    Every pair of distinct products in a basket is counted once. The score is
+    the cosine similarity of the two products' basket sets,
+    count(a, b) / sqrt(baskets(a) * baskets(b)), so best sellers do not
+    dominate every list. Pairs seen in fewer than `min_count` baskets are
+    dropped as noise, and baskets larger than `max_basket` (bulk and
+    wholesale orders) are skipped, since their pair count grows quadratically.
+    """
+    n = len(lines.product_ids)
+    items = lines.items
+    starts = np.flatnonzero(np.r_[True, np.diff(lines.baskets) != 0])
+    sizes = np.diff(np.r_[starts, len(items)])
+    frequency = np.bincount(items[np.repeat(sizes, sizes) <= max_basket], minlength=n)
+
+    # All pairs within baskets, one (size x size) upper triangle per basket size
+    sources: list[npt.NDArray[np.int64]] = []
+    targets: list[npt.NDArray[np.int64]] = []
+    for size in np.unique(sizes[(sizes >= 2) & (sizes <= max_basket)]):
+        basket_items = items[starts[sizes == size][:, None] + np.arange(size)]
+        first, second = np.triu_indices(size, 1)
+        sources.append(basket_items[:, first].ravel())
+        targets.append(basket_items[:, second].ravel())
+    if not sources:
+        return Neighbours(
+            offsets=np.zeros(n + 1, dtype=np.uint32),
+            neighbours=np.zeros(0, dtype=np.uint32),
+            scores=np.zeros(0, dtype=np.float32),
+            k=k,
+        )
+    a = np.concatenate(sources)
+    b = np.concatenate(targets)
+
+    # Count each directed pair: sorting the packed keys groups them by source
+    pairs, counts = np.unique(np.concatenate([a * n + b, b * n + a]), return_counts=True)
+    keep = counts >= min_count
+    pairs = pairs[keep]
+    source = pairs // n
+    target = pairs % n
+    scores = (counts[keep] / np.sqrt(frequency[source] * frequency[target])).astype(np.float32)
+
+    # Best first within each source, then keep the first k of each
+    order = np.lexsort((-scores, source))
+    source, target, scores = source[order], target[order], scores[order]
+    rank = np.arange(len(source)) - np.searchsorted(source, source)
+    top = rank < k
+    source, target, scores = source[top], target[top], scores[top]
+
+    offsets = np.zeros(n + 1, dtype=np.uint32)
+    np.cumsum(np.bincount(source, minlength=n), out=offsets[1:])
+    return Neighbours(
+        offsets=offsets,
+        neighbours=target.astype(np.uint32),
+        scores=scores,
+        k=k,
+    )
+
+
+def write_neighbour_file(path: Path, product_ids: list[UUID], neighbours: Neighbours) -> None:
+    """
+    Write the neighbour file next to `path` and rename it into place.
+
+    The rename is atomic, so readers see the old file or the new one, never a
+    partial write.
+    """
+    header = HEADER.pack(
+        MAGIC, len(product_ids), neighbours.k, len(neighbours.neighbours), time.time()
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f".{path.name}.partial")
+    with partial.open("wb") as file:
+        file.write(header.ljust(HEADER_SIZE, b"\0"))
+        file.write(b"".join(product_id.bytes for product_id in product_ids))
+        file.write(neighbours.offsets.astype("<u4").tobytes())
+        file.write(neighbours.neighbours.astype("<u4").tobytes())
+        file.write(neighbours.scores.astype("<f4").tobytes())
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(partial, path)
@@ -0,0 +1,34 @@
+"""Registry mapping job names to handlers."""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+JobHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class JobRegistry:
+    """
+    Job handlers by name.
+
+    A handler receives the job's JSON payload and raises to signal failure.
+    Handlers may run more than once for the same job (at-least-once), so they
+    should be safe to repeat.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, JobHandler] = {}
+
+    def register(self, name: str, handler: JobHandler) -> None:
+        """Register the handler for a job name."""
+        if name in self._handlers:
+            raise ValueError(f"Job handler '{name}' is already registered")
+        self._handlers[name] = handler
+
+    def get(self, name: str) -> JobHandler | None:
+        """Get the handler for a job name, or None if unknown."""
+        return self._handlers.get(name)
+
+    @property
+    def names(self) -> list[str]:
+        """Registered job names."""
+        return list(self._handlers)
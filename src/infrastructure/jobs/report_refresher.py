@@ -0,0 +1,104 @@
+"""Background incremental refresh of the reporting summary tables."""
+
+import asyncio
+import contextlib
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.logging import get_logger
+from src.core.metrics import Counter, Gauge
+from src.domain.entities.report import REGISTRATIONS_REPORT, SALES_REPORT
+from src.infrastructure.repositories.sqlalchemy.report_repository_impl import (
+    SQLAlchemyReportRepository,
+)
+
+logger = get_logger(__name__)
+
+REPORTS = (SALES_REPORT, REGISTRATIONS_REPORT)
+
+report_refresh_failures_total = Counter(
+    "report_refresh_failures_total", "Failed report refresh windows"
+)
+report_lag_seconds = Gauge(
+    "report_lag_seconds", "Age of the newest source row included in the sales report"
+)
+
+
+class ReportRefresher:
+    """
+    Folds new orders and registrations into the summary tables every
+    refresh_interval seconds.
+
+    Each window is its own short transaction, so catching up on a long
+    history (the first run, or after `reset`) never holds locks for long.
+    Every API process runs a refresher; a process that finds a report's
+    watermark locked skips that report until the next tick.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        *,
+        refresh_interval: float = 30.0,
+        settle: timedelta = timedelta(seconds=120),
+        max_window: timedelta = timedelta(days=1),
+        time_zone: str = "UTC",
+    ) -> None:
+        self._session_maker = session_maker
+        self._refresh_interval = refresh_interval
+        self._settle = settle
+        self._max_window = max_window
+        self._time_zone = time_zone
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    async def start(self) -> None:
+        """Start refreshing in the background."""
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run(), name="report-refresher")
+
+    async def stop(self) -> None:
+        """Stop refreshing, letting a running window commit first."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def refresh(self, report: str) -> int:
+        """Fold in every settled window of a report. Returns how many windows."""
+        windows = 0
+        more = True
+        while more and not self._stopping.is_set():
+            async with self._session_maker() as session, session.begin():
+                more = await SQLAlchemyReportRepository(session).refresh(
+                    report, self._settle, self._max_window, self._time_zone
+                )
+            windows += 1
+        return windows
+
+    async def reset(self, report: str) -> None:
+        """Empty a report's summaries; the next refresh rebuilds them from the source."""
+        async with self._session_maker() as session, session.begin():
+            await SQLAlchemyReportRepository(session).reset(report)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            for report in REPORTS:
+                try:
+                    await self.refresh(report)
+                except Exception:
+                    report_refresh_failures_total.inc()
+                    logger.exception("Report refresh failed", extra={"report": report})
+            await self._record_lag()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._refresh_interval)
+
+    async def _record_lag(self) -> None:
+        with contextlib.suppress(Exception):
+            async with self._session_maker() as session:
+                watermarks = await SQLAlchemyReportRepository(session).watermarks()
+            if SALES_REPORT in watermarks:
+                lag = datetime.now(UTC) - watermarks[SALES_REPORT]
+                report_lag_seconds.set(lag.total_seconds())
@@ -0,0 +1,89 @@
+"""Background release of stock held by orders that were never confirmed."""
+
+import asyncio
+import contextlib
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.use_cases.order.expire_orders import ExpireOrders
+from src.core.logging import get_logger
+from src.core.metrics import Counter
+from src.infrastructure.repositories.sqlalchemy.inventory_repository_impl import (
+    SQLAlchemyInventoryRepository,
+)
+from src.infrastructure.repositories.sqlalchemy.order_repository_impl import (
+    SQLAlchemyOrderRepository,
+)
+from src.infrastructure.repositories.sqlalchemy.outbox_repository_impl import (
+    SQLAlchemyOutboxRepository,
+)
+
+logger = get_logger(__name__)
+
+orders_expired_total = Counter("orders_expired_total", "Pending orders expired by the sweeper")
+reservation_sweep_failures_total = Counter(
+    "reservation_sweep_failures_total", "Failed reservation sweep batches"
+)
+
+
+class ReservationSweeper:
+    """
+    Expires pending orders past their reservation every sweep_interval seconds.
+
+    Each batch runs in its own short transaction. Expired orders are claimed
+    with FOR UPDATE SKIP LOCKED, so one API process per sweep does the work
+    while the others skip those rows, and orders being confirmed right now
+    are left alone.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        *,
+        sweep_interval: float = 5.0,
+        batch_size: int = 500,
+    ) -> None:
+        self._session_maker = session_maker
+        self._sweep_interval = sweep_interval
+        self._batch_size = batch_size
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    async def start(self) -> None:
+        """Start sweeping in the background."""
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run(), name="reservation-sweeper")
+
+    async def stop(self) -> None:
+        """Stop sweeping, letting a running batch commit first."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def sweep(self) -> int:
+        """Expire every overdue order, batch by batch. Returns how many."""
+        expired = 0
+        while not self._stopping.is_set():
+            async with self._session_maker() as session, session.begin():
+                count = await ExpireOrders(
+                    SQLAlchemyOrderRepository(session),
+                    SQLAlchemyInventoryRepository(session),
+                    SQLAlchemyOutboxRepository(session),
+                ).execute(self._batch_size)
+            expired += count
+            orders_expired_total.inc(count)
+            if count < self._batch_size:
+                break
+        return expired
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.sweep()
+            except Exception:
+                reservation_sweep_failures_total.inc()
+                logger.exception("Reservation sweep failed")
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._sweep_interval)
@@ -0,0 +1,203 @@
+"""In-process worker pool for the PostgreSQL job queue."""
+
+import asyncio
+import contextlib
+import random
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.logging import get_logger
+from src.core.metrics import Counter
+from src.infrastructure.jobs.queue import ClaimedJob, SQLAlchemyJobQueue
+from src.infrastructure.jobs.registry import JobRegistry
+
+logger = get_logger(__name__)
+
+jobs_processed_total = Counter(
+    "jobs_processed_total", "Background jobs processed", labelnames=("name", "outcome")
+)
+jobs_recovered_total = Counter(
+    "jobs_recovered_total", "Running jobs released after their worker lock expired"
+)
+
+
+class JobRunner:
+    """
+    Runs queued jobs on `concurrency` worker tasks inside the API process.
+
+    - Each worker claims up to batch_size due jobs per transaction and runs
+      them one by one; successes are deleted together in one statement.
+      While the batch runs, its locks are renewed every lock_timeout / 3, so
+      jobs waiting their turn are not released to other workers.
+    - A failed job is retried after an exponential backoff with jitter until
+      max_attempts, then marked FAILED with its last error.
+    - Results are settled only for jobs this claim still holds: RUNNING with
+      the claim's attempt count. A job whose lock lapsed and was claimed
+      again is left to the worker now running it.
+    - Workers sleep poll_interval when the queue is empty.
+    - Jobs left RUNNING by a crashed process are released once their lock is
+      older than lock_timeout. It also bounds each handler's run time.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        registry: JobRegistry,
+        *,
+        concurrency: int = 4,
+        batch_size: int = 20,
+        poll_interval: float = 0.5,
+        retry_backoff: float = 2.0,
+        max_retry_backoff: float = 600.0,
+        lock_timeout: float = 300.0,
+        shutdown_timeout: float = 10.0,
+    ) -> None:
+        self._session_maker = session_maker
+        self._registry = registry
+        self._concurrency = concurrency
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._retry_backoff = retry_backoff
+        self._max_retry_backoff = max_retry_backoff
+        self._lock_timeout = lock_timeout
+        self._shutdown_timeout = shutdown_timeout
+        self._stopping = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        """Start the workers and the stale-lock recovery task."""
+        self._stopping.clear()
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"job-worker-{i}")
+            for i in range(self._concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._recover(), name="job-recovery"))
+
+    async def stop(self) -> None:
+        """
+        Stop claiming jobs and let running batches finish.
+
+        Workers still busy after shutdown_timeout are cancelled; their jobs stay
+        RUNNING and are picked up again after lock_timeout.
+        """
+        if not self._tasks:
+            return
+        self._stopping.set()
+        _, pending = await asyncio.wait(self._tasks, timeout=self._shutdown_timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if pending:
+            logger.warning("Job workers cancelled on shutdown", extra={"workers": len(pending)})
+        self._tasks = []
+
+    async def run_once(self) -> int:
+        """Claim and run one batch. Returns the number of jobs claimed."""
+        async with self._session_maker() as session, session.begin():
+            jobs = await SQLAlchemyJobQueue(session).claim(self._batch_size)
+        if not jobs:
+            return 0
+
+        held = {job.id for job in jobs}
+        heartbeat = asyncio.create_task(self._heartbeat(jobs, held), name="job-heartbeat")
+        succeeded: list[ClaimedJob] = []
+        failed: list[tuple[ClaimedJob, str]] = []
+        try:
+            for job in jobs:
+                # Released after a lost renewal; it runs on the worker that claimed it again
+                if job.id not in held:
+                    continue
+                error = await self._execute(job)
+                if error is None:
+                    succeeded.append(job)
+                else:
+                    failed.append((job, error))
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+
+        # Jobs whose lock lapsed meanwhile belong to whoever claimed them next
+        async with self._session_maker() as session, session.begin():
+            queue = SQLAlchemyJobQueue(session)
+            settled = len(await queue.complete(succeeded))
+            for job, error in failed:
+                if job.attempts >= job.max_attempts:
+                    settled += await queue.fail(job, error)
+                else:
+                    settled += await queue.retry(job, self._backoff(job.attempts), error)
+        lost = len(succeeded) + len(failed) - settled
+        if lost:
+            logger.warning("Job results dropped after their locks lapsed", extra={"count": lost})
+        return len(jobs)
+
+    async def _work(self) -> None:
+        """Worker loop: run batches back to back, sleeping only when idle."""
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.run_once()
+            except Exception:
+                logger.exception("Job worker iteration failed")
+                claimed = 0
+            if claimed < self._batch_size:
+                await self._sleep(self._poll_interval)
+
+    async def _execute(self, job: ClaimedJob) -> str | None:
+        """Run one job. Returns None on success or the error description."""
+        handler = self._registry.get(job.name)
+        if handler is None:
+            jobs_processed_total.inc(name=job.name, outcome="unknown")
+            return f"No handler registered for job '{job.name}'"
+        try:
+            await asyncio.wait_for(handler(job.payload), timeout=self._lock_timeout)
+        except Exception as e:
+            jobs_processed_total.inc(name=job.name, outcome="error")
+            logger.warning(
+                "Job failed",
+                extra={"job_id": str(job.id), "job": job.name, "attempt": job.attempts},
+                exc_info=True,
+            )
+            return f"{type(e).__name__}: {e}"[:1000]
+        jobs_processed_total.inc(name=job.name, outcome="success")
+        return None
+
+    async def _heartbeat(self, jobs: list[ClaimedJob], held: set[UUID]) -> None:
+        """Renew the batch's locks until cancelled, dropping jobs no longer held from `held`."""
+        while True:
+            await asyncio.sleep(self._lock_timeout / 3)
+            try:
+                async with self._session_maker() as session, session.begin():
+                    renewed = await SQLAlchemyJobQueue(session).renew(jobs)
+            except Exception:
+                logger.exception("Job lock renewal failed")
+                continue
+            lost = held - renewed
+            if lost:
+                held.difference_update(lost)
+                logger.warning("Job locks lost", extra={"count": len(lost)})
+
+    async def _recover(self) -> None:
+        """Periodically release jobs whose lock outlived lock_timeout."""
+        while not self._stopping.is_set():
+            try:
+                async with self._session_maker() as session, session.begin():
+                    recovered = await SQLAlchemyJobQueue(session).recover_stale(
+                        datetime.now(UTC) - timedelta(seconds=self._lock_timeout)
+                    )
+                if recovered:
+                    jobs_recovered_total.inc(recovered)
+                    logger.warning("Recovered stale jobs", extra={"count": recovered})
+            except Exception:
+                logger.exception("Job recovery failed")
+            await self._sleep(self._lock_timeout / 2)
+
+    def _backoff(self, attempts: int) -> float:
+        """Exponential backoff with jitter, so failing jobs do not retry in lockstep."""
+        delay = min(self._retry_backoff * 2.0 ** (attempts - 1), self._max_retry_backoff)
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep, waking early on stop."""
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
@@ -0,0 +1,41 @@
+"""Authentication event ORM model for the audit log."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, Index, String, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.orm.base import Base
+
+
+class AuthEventModel(Base):
+    """
+    Authentication event table model.
+
+    Maps to the append-only 'auth_events' table, range-partitioned by month
+    on occurred_at. The partition key must be part of the primary key.
+    """
+
+    __tablename__ = "auth_events"
+    __table_args__ = {"postgresql_partition_by": "RANGE (occurred_at)"}
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(30), nullable=False)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
+    user_id: Mapped[UUID | None] = mapped_column(Uuid, nullable=True)
+    reason: Mapped[str | None] = mapped_column(String(100), nullable=True)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<AuthEventModel(id={self.id}, type={self.event_type}, email={self.email})>"
+
+
+# Partial index serving "recent failures for this account" lookups
+Index(
+    "ix_auth_events_failures_email",
+    AuthEventModel.email,
+    AuthEventModel.occurred_at.desc(),
+    postgresql_where=AuthEventModel.event_type == "LOGIN_FAILED",
+)
@@ -2,14 +2,16 @@
 
 from datetime import datetime
 from typing import Annotated
-from uuid import UUID, uuid4
+from uuid import UUID, uuid7
 
 from sqlalchemy import DateTime, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 # Type annotations for common column types
 intpk = Annotated[int, mapped_column(primary_key=True)]
-uuidpk = Annotated[UUID, mapped_column(primary_key=True, default=uuid4)]
+# UUIDv7 keys are time-ordered: inserts append to the right of the B-tree and
+# ORDER BY id follows creation order, so keyset pagination can use id alone.
+uuidpk = Annotated[UUID, mapped_column(primary_key=True, default=uuid7)]
 timestamp = Annotated[
     datetime,
     mapped_column(DateTime(timezone=True), server_default=func.now()),
@@ -0,0 +1,35 @@
+"""Cart ORM model for write-behind cart persistence."""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Uuid
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.orm.base import Base, timestamp
+
+
+class CartModel(Base):
+    """
+    Cart table model.
+
+    Maps to 'carts', one row per user. Rows are written only by the cart
+    flusher; items are stored as a JSON array so a flush is a single-row
+    upsert. updated_at is the time of the last cart change, not of the flush.
+    """
+
+    __tablename__ = "carts"
+
+    user_id: Mapped[UUID] = mapped_column(
+        Uuid, ForeignKey("user_directory.user_id", ondelete="CASCADE"), primary_key=True
+    )
+    items: Mapped[list[dict[str, Any]]] = mapped_column(JSONB, nullable=False)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    created_at: Mapped[timestamp]
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<CartModel(user_id={self.user_id}, version={self.version})>"
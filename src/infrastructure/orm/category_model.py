@@ -0,0 +1,33 @@
+"""Category ORM model for the product catalog."""
+
+from uuid import UUID
+
+from sqlalchemy import Boolean, ForeignKey, Index, String, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.orm.base import Base, TimestampMixin, uuidpk
+
+
+class CategoryModel(Base, TimestampMixin):
+    """
+    Category table model.
+
+    Maps to 'categories'. Categories are deactivated rather than deleted so
+    the in-process category tree can pick up every change from updated_at.
+    """
+
+    __tablename__ = "categories"
+
+    id: Mapped[uuidpk]
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    slug: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+    parent_id: Mapped[UUID | None] = mapped_column(Uuid, ForeignKey("categories.id"), nullable=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<CategoryModel(id={self.id}, slug={self.slug})>"
+
+
+# Serves the category tree's incremental refresh (changes since a watermark)
+Index("ix_categories_updated_at", CategoryModel.updated_at)
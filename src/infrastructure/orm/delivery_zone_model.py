@@ -0,0 +1,35 @@
+"""Delivery zone ORM model."""
+
+from sqlalchemy import Boolean, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.orm.base import Base, TimestampMixin, uuidpk
+
+
+class DeliveryZoneModel(Base, TimestampMixin):
+    """
+    Delivery zone table model.
+
+    Maps to 'delivery_zones'. Polygons are stored as JSON rings of
+    [longitude, latitude] pairs; lookups are served by the in-process
+    serviceability index, never by the database. Zones are deactivated rather
+    than deleted so the index can pick up every change from updated_at.
+    """
+
+    __tablename__ = "delivery_zones"
+
+    id: Mapped[uuidpk]
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    hub_code: Mapped[str] = mapped_column(String(50), nullable=False)
+    rings: Mapped[list[list[list[float]]]] = mapped_column(JSONB, nullable=False)
+    priority: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<DeliveryZoneModel(id={self.id}, name={self.name})>"
+
+
+# Serves the serviceability index's incremental refresh (changes since a watermark)
+Index("ix_delivery_zones_updated_at", DeliveryZoneModel.updated_at)
@@ -0,0 +1,58 @@
+"""Inventory ORM models: sharded stock counters and order reservations."""
+
+from uuid import UUID
+
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer, SmallInteger, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.orm.base import Base, TimestampMixin, uuidpk
+
+
+class InventoryShardModel(Base, TimestampMixin):
+    """
+    Inventory shard table model.
+
+    Maps to 'inventory_shards'. A product's stock is split over several
+    rows so concurrent checkouts of one product lock different rows. The
+    check constraint makes overselling impossible even if a caller forgets
+    to test the stock first.
+    """
+
+    __tablename__ = "inventory_shards"
+    __table_args__ = (CheckConstraint("available >= 0", name="ck_inventory_shards_available"),)
+
+    product_id: Mapped[UUID] = mapped_column(
+        Uuid, ForeignKey("products.id", ondelete="CASCADE"), primary_key=True
+    )
+    shard: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    available: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<InventoryShardModel(product_id={self.product_id}, shard={self.shard})>"
+
+
+class StockReservationModel(Base, TimestampMixin):
+    """
+    Stock reservation table model.
+
+    Maps to 'stock_reservations': units taken from one inventory shard for a
+    pending order. Releasing a reservation puts the units back on that shard.
+    """
+
+    __tablename__ = "stock_reservations"
+
+    id: Mapped[uuidpk]
+    order_id: Mapped[UUID] = mapped_column(
+        Uuid, ForeignKey("orders.id", ondelete="CASCADE"), nullable=False
+    )
+    product_id: Mapped[UUID] = mapped_column(Uuid, nullable=False)
+    shard: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<StockReservationModel(order_id={self.order_id}, product_id={self.product_id})>"
+
+
+Index("ix_stock_reservations_order_id", StockReservationModel.order_id)
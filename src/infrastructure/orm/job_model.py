@@ -0,0 +1,45 @@
+"""Background job ORM model for the durable job queue."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.orm.base import Base, TimestampMixin, uuidpk
+
+
+class JobModel(Base, TimestampMixin):
+    """
+    Job table model.
+
+    Maps to the 'jobs' table. Workers claim PENDING rows whose run_at has
+    passed with FOR UPDATE SKIP LOCKED and move them to RUNNING; locked_at
+    lets stale claims from crashed workers be recovered.
+    """
+
+    __tablename__ = "jobs"
+
+    id: Mapped[uuidpk]
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="PENDING")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    run_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    locked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<JobModel(id={self.id}, name={self.name}, status={self.status})>"
+
+
+# Partial indexes keep the claim and stale-lock scans small as finished jobs pile up
+Index("ix_jobs_pending_run_at", JobModel.run_at, postgresql_where=JobModel.status == "PENDING")
+Index(
+    "ix_jobs_running_locked_at", JobModel.locked_at, postgresql_where=JobModel.status == "RUNNING"
+)
@@ -0,0 +1,81 @@
+"""Order ORM models."""
+
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, String, Uuid
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.infrastructure.orm.base import Base, TimestampMixin, uuidpk
+
+
+class OrderModel(Base, TimestampMixin):
+    """
+    Order table model.
+
+    Maps to 'orders'. A PENDING order holds stock reservations until
+    reserved_until; the reservation sweeper expires it after that.
+    """
+
+    __tablename__ = "orders"
+    # Timestamps come back from INSERT ... RETURNING; no refresh round trip
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[uuidpk]
+    user_id: Mapped[UUID] = mapped_column(
+        Uuid, ForeignKey("user_directory.user_id"), nullable=False
+    )
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    total: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    reserved_until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    items: Mapped[list[OrderItemModel]] = relationship(
+        back_populates="order", lazy="selectin", cascade="all, delete-orphan"
+    )
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<OrderModel(id={self.id}, user_id={self.user_id}, status={self.status})>"
+
+
+class OrderItemModel(Base):
+    """
+    Order item table model.
+
+    Maps to 'order_items', one row per product in an order. The unit price
+    is copied from the product when the order is placed.
+    """
+
+    __tablename__ = "order_items"
+
+    order_id: Mapped[UUID] = mapped_column(
+        Uuid, ForeignKey("orders.id", ondelete="CASCADE"), primary_key=True
+    )
+    product_id: Mapped[UUID] = mapped_column(Uuid, ForeignKey("products.id"), primary_key=True)
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    unit_price: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+
+    order: Mapped[OrderModel] = relationship(back_populates="items")
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<OrderItemModel(order_id={self.order_id}, product_id={self.product_id})>"
+
+
+# A user's order history, newest first
+Index("ix_orders_user_id_id", OrderModel.user_id, OrderModel.id.desc())
+
+# Serves the reservation sweeper; only pending orders can expire
+Index(
+    "ix_orders_pending_reserved_until",
+    OrderModel.reserved_until,
+    postgresql_where=OrderModel.status == "PENDING",
+)
+
+# Serves the sales report refresh, which reads orders by confirmation time
+Index(
+    "ix_orders_confirmed_updated_at",
+    OrderModel.updated_at,
+    postgresql_where=OrderModel.status == "CONFIRMED",
+)
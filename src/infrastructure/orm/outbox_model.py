@@ -0,0 +1,35 @@
+"""Outbox ORM model for transactional domain event publishing."""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, Identity, String, Uuid
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.orm.base import Base
+
+
+class OutboxModel(Base):
+    """
+    Outbox table model.
+
+    Maps to 'outbox_events'. Rows are inserted in the same transaction as the
+    change that raised them and deleted once published. The identity column
+    gives the publishing order.
+    """
+
+    __tablename__ = "outbox_events"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    event_id: Mapped[UUID] = mapped_column(Uuid, nullable=False, unique=True)
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    aggregate_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    aggregate_id: Mapped[UUID] = mapped_column(Uuid, nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<OutboxModel(id={self.id}, type={self.event_type}, aggregate={self.aggregate_id})>"
@@ -0,0 +1,70 @@
+"""Product ORM model for the product catalog."""
+
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import Boolean, Computed, ForeignKey, Index, Numeric, String, Text, Uuid
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.orm.base import Base, TimestampMixin, uuidpk
+
+# English stemming for names and descriptions, plus an unstemmed 'simple'
+# vector that also covers Bangla names (Postgres has no Bangla dictionary).
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(name_bn, '')), 'A')"
+    " || setweight(to_tsvector('english', coalesce(name, '')), 'B')"
+    " || setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+
+class ProductModel(Base, TimestampMixin):
+    """
+    Product table model.
+
+    Maps to 'products'. search_vector is a stored generated column with a
+    GIN index for full-text search; trigram GIN indexes on the names
+    (pg_trgm) serve typo-tolerant matching.
+    """
+
+    __tablename__ = "products"
+
+    id: Mapped[uuidpk]
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    name_bn: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    slug: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    price: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    category_id: Mapped[UUID | None] = mapped_column(
+        Uuid, ForeignKey("categories.id"), nullable=True
+    )
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True), nullable=False, deferred=True
+    )
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<ProductModel(id={self.id}, slug={self.slug})>"
+
+
+Index("ix_products_search_vector", ProductModel.search_vector, postgresql_using="gin")
+Index(
+    "ix_products_name_trgm",
+    ProductModel.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+)
+Index(
+    "ix_products_name_bn_trgm",
+    ProductModel.name_bn,
+    postgresql_using="gin",
+    postgresql_ops={"name_bn": "gin_trgm_ops"},
+)
+# Category listings walk newest-first within the categories of a subtree
+Index(
+    "ix_products_category_id_id",
+    ProductModel.category_id,
+    ProductModel.id.desc(),
+    postgresql_where=ProductModel.is_active,
+)
@@ -0,0 +1,74 @@
+"""Reporting ORM models: summary tables and their watermarks."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Date, DateTime, ForeignKey, Integer, Numeric, String, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.orm.base import Base, TimestampMixin
+
+
+class ReportWatermarkModel(Base, TimestampMixin):
+    """
+    Report watermark table model.
+
+    Maps to 'report_watermarks', one row per report source. Source rows with
+    a timestamp at or before the watermark are included in the summaries.
+    The row is locked while a refresh runs.
+    """
+
+    __tablename__ = "report_watermarks"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    watermark: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<ReportWatermarkModel(name={self.name}, watermark={self.watermark})>"
+
+
+class DailySalesModel(Base, TimestampMixin):
+    """Daily sales summary table model. Maps to 'report_daily_sales'."""
+
+    __tablename__ = "report_daily_sales"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    orders: Mapped[int] = mapped_column(Integer, nullable=False)
+    units: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    revenue: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<DailySalesModel(day={self.day}, orders={self.orders})>"
+
+
+class DailyRegistrationsModel(Base, TimestampMixin):
+    """Daily registrations summary table model. Maps to 'report_daily_registrations'."""
+
+    __tablename__ = "report_daily_registrations"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    users: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<DailyRegistrationsModel(day={self.day}, users={self.users})>"
+
+
+class CustomerSalesModel(Base, TimestampMixin):
+    """Per-customer sales summary table model. Maps to 'report_customer_sales'."""
+
+    __tablename__ = "report_customer_sales"
+
+    user_id: Mapped[UUID] = mapped_column(
+        Uuid, ForeignKey("user_directory.user_id", ondelete="CASCADE"), primary_key=True
+    )
+    orders: Mapped[int] = mapped_column(Integer, nullable=False)
+    revenue: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, index=True)
+    last_order_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<CustomerSalesModel(user_id={self.user_id}, orders={self.orders})>"
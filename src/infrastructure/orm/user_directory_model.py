@@ -0,0 +1,58 @@
+"""User directory and shard map ORM models."""
+
+from uuid import UUID
+
+from sqlalchemy import Index, Integer, String, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.orm.base import Base, TimestampMixin, timestamp_updated
+
+
+class UserDirectoryModel(Base, TimestampMixin):
+    """
+    Every user's id and normalized email, on the primary database.
+
+    Maps to 'user_directory'. Rows are written together with the user row,
+    wherever that lives, so emails are unique across shards, an email is
+    resolved to an id without asking every shard, and tables on the primary
+    can reference users by foreign key. created_at is the user's.
+    """
+
+    __tablename__ = "user_directory"
+
+    user_id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<UserDirectoryModel(user_id={self.user_id}, email={self.email})>"
+
+
+class UserShardSlotModel(Base):
+    """
+    Which shard holds the users of each slot.
+
+    Maps to 'user_shard_slots', one row per slot. A slot being moved is
+    'frozen': its users stay readable but writes wait until the move ends.
+    """
+
+    __tablename__ = "user_shard_slots"
+
+    slot: Mapped[int] = mapped_column(Integer, primary_key=True)
+    shard: Mapped[int] = mapped_column(Integer, nullable=False)
+    state: Mapped[str] = mapped_column(String(10), nullable=False, default="active")
+    updated_at: Mapped[timestamp_updated]
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<UserShardSlotModel(slot={self.slot}, shard={self.shard}, state={self.state})>"
+
+
+# Emails are stored normalized, so a plain unique index serves lookups
+Index("ix_user_directory_email", UserDirectoryModel.email, unique=True)
+
+# Registrations by time for reporting refresh windows
+Index("ix_user_directory_created_at", UserDirectoryModel.created_at)
+
+# Entries added or whose email changed since an email filter's last refresh
+Index("ix_user_directory_updated_at", UserDirectoryModel.updated_at)
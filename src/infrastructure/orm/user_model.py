@@ -1,10 +1,25 @@
 """User ORM model for database persistence."""
 
-from sqlalchemy import Boolean, String
+import hashlib
+from uuid import UUID
+
+from sqlalchemy import Boolean, Index, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.infrastructure.orm.base import Base, TimestampMixin, uuidpk
 
+# Users are hashed by id into a fixed number of slots; each slot lives on one
+# shard. The hash is computed the same way in SQL (ix_users_shard_slot, used to
+# move a slot between shards) and in Python (shard_slot).
+SHARD_SLOTS = 1024
+SHARD_SLOT_SQL = f"(('x' || substr(md5(id::text), 1, 4))::bit(16)::integer % {SHARD_SLOTS})"
+
+
+def shard_slot(user_id: UUID) -> int:
+    """Slot of a user, equal to SHARD_SLOT_SQL for the same id."""
+    digest = hashlib.md5(str(user_id).encode(), usedforsecurity=False).hexdigest()
+    return int(digest[:4], 16) % SHARD_SLOTS
+
 
 class UserModel(Base, TimestampMixin):
     """
@@ -12,12 +27,18 @@ class UserModel(Base, TimestampMixin):
 
     Maps to 'users' table in PostgreSQL.
     Inherits created_at/updated_at from TimestampMixin.
+    Email uniqueness is enforced case-insensitively by ix_users_email_lower;
+    phone numbers are stored normalized and are unique when present. With
+    user shards configured, each shard database holds this table for its
+    slots, and user_directory on the primary keeps emails unique across them.
     """
 
     __tablename__ = "users"
+    # Expression index; declared here because a text expression names no table
+    __table_args__ = (Index("ix_users_shard_slot", text(SHARD_SLOT_SQL)),)
 
     id: Mapped[uuidpk]
-    email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
     phone: Mapped[str | None] = mapped_column(String(20), nullable=True)
@@ -28,3 +49,18 @@ class UserModel(Base, TimestampMixin):
     def __repr__(self) -> str:
         """String representation for debugging."""
         return f"<UserModel(id={self.id}, email={self.email}, role={self.role})>"
+
+
+# Functional unique index backing case-insensitive email lookups
+Index("ix_users_email_lower", func.lower(UserModel.email), unique=True)
+
+# Phone lookups for OTP login; one account per number
+Index(
+    "ix_users_phone",
+    UserModel.phone,
+    unique=True,
+    postgresql_where=UserModel.phone.is_not(None),
+)
+
+# Registrations by time: reporting refresh windows and admin listings
+Index("ix_users_created_at", UserModel.created_at)
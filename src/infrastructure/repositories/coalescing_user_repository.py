@@ -0,0 +1,108 @@
+"""User repository that routes reads through the shared loader."""
+
+from collections.abc import AsyncGenerator, Sequence
+from uuid import UUID
+
+from src.core.constants import DEFAULT_PAGE_SIZE
+from src.domain.entities.user import User
+from src.domain.repositories.user_repository import (
+    IUserRepository,
+    UserChanges,
+    UserFilter,
+    UserRow,
+)
+from src.infrastructure.repositories.user_loader import UserLoader
+
+
+class CoalescingUserRepository(IUserRepository):
+    """
+    Request-scoped repository combining the session repository and the UserLoader.
+
+    Point reads are batched and de-duplicated across concurrent requests by the
+    loader. Writes go to the request's session; after the first write, reads
+    also use the session so the request sees its own uncommitted changes.
+    """
+
+    def __init__(self, repository: IUserRepository, loader: UserLoader) -> None:
+        """
+        Initialize with the session-bound repository and the shared loader.
+
+        Args:
+            repository: Repository bound to the request's session
+            loader: Application-scoped batching loader
+        """
+        self._repository = repository
+        self._loader = loader
+        self._has_written = False
+
+    async def create(self, user: User) -> User:
+        """Create a new user."""
+        self._has_written = True
+        return await self._repository.create(user)
+
+    async def get_by_id(self, user_id: UUID) -> User | None:
+        """Get user by ID."""
+        if self._has_written:
+            return await self._repository.get_by_id(user_id)
+        return await self._loader.load(user_id)
+
+    async def get_many_by_ids(self, user_ids: Sequence[UUID]) -> list[User]:
+        """Get users by IDs."""
+        if self._has_written:
+            return await self._repository.get_many_by_ids(user_ids)
+        return await self._loader.load_many(user_ids)
+
+    async def get_by_email(self, email: str) -> User | None:
+        """Get user by email."""
+        if self._has_written:
+            return await self._repository.get_by_email(email)
+        return await self._loader.load_by_email(email)
+
+    async def get_by_phone(self, phone: str) -> User | None:
+        """Get user by phone number."""
+        return await self._repository.get_by_phone(phone)
+
+    async def update(self, user: User) -> User:
+        """Update existing user."""
+        self._has_written = True
+        return await self._repository.update(user)
+
+    async def delete(self, user_id: UUID) -> bool:
+        """Delete user by ID."""
+        self._has_written = True
+        return await self._repository.delete(user_id)
+
+    async def exists_by_email(self, email: str) -> bool:
+        """Check if user exists by email."""
+        if self._has_written:
+            return await self._repository.exists_by_email(email)
+        return await self._loader.load_by_email(email) is not None
+
+    async def list_after(
+        self, after_id: UUID | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> list[User]:
+        """List users in creation order, starting after the given ID."""
+        return await self._repository.list_after(after_id, limit)
+
+    def stream(
+        self, user_filter: UserFilter, batch_size: int = 1000
+    ) -> AsyncGenerator[list[UserRow]]:
+        """Yield matching users in batches."""
+        return self._repository.stream(user_filter, batch_size)
+
+    async def count_matching(
+        self, user_filter: UserFilter, changes: UserChanges, exclude_id: UUID | None = None
+    ) -> tuple[int, int]:
+        """Users matching the filter, and how many of them `changes` would alter."""
+        return await self._repository.count_matching(user_filter, changes, exclude_id)
+
+    async def update_matching(
+        self,
+        user_filter: UserFilter,
+        changes: UserChanges,
+        limit: int,
+        exclude_id: UUID | None = None,
+    ) -> list[UserRow]:
+        """Apply changes to up to `limit` matching users they would alter."""
+        self._has_written = True
+        return await self._repository.update_matching(user_filter, changes, limit, exclude_id)
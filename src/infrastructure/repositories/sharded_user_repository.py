@@ -0,0 +1,274 @@
+"""User repository spread over several databases."""
+
+import asyncio
+from collections.abc import AsyncGenerator, Callable, Sequence
+from contextlib import aclosing
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.email_filter import IRegisteredEmailFilter
+from src.core.constants import DEFAULT_PAGE_SIZE
+from src.domain.entities.user import User, normalize_email
+from src.domain.repositories.user_repository import (
+    IUserRepository,
+    UserChanges,
+    UserFilter,
+    UserRow,
+)
+from src.infrastructure.database.sharding import UserShards
+from src.infrastructure.orm.user_model import SHARD_SLOTS
+from src.infrastructure.repositories.sqlalchemy.user_directory import SQLAlchemyUserDirectory
+from src.infrastructure.repositories.sqlalchemy.user_repository_impl import (
+    SQLAlchemyUserRepository,
+)
+
+# Builds the user repository for a session on the primary database
+UserRepositoryFactory = Callable[[AsyncSession], IUserRepository]
+
+
+def user_repository_factory(
+    shards: UserShards | None, email_filter: IRegisteredEmailFilter | None = None
+) -> UserRepositoryFactory:
+    """
+    Plain repository without shards, sharded repository with them.
+
+    `email_filter` is told about email changes made through the repositories.
+    """
+    if shards is None:
+        return lambda session: SQLAlchemyUserRepository(session, email_filter=email_filter)
+    return lambda session: ShardedUserRepository(session, shards, email_filter)
+
+
+class ShardedUserRepository(IUserRepository):
+    """
+    User rows on the shard their id hashes to; the directory on the primary.
+
+    - Lookups by id go straight to one shard; several ids are fetched from
+      their shards concurrently.
+    - Lookups by email resolve the id from the cached email directory (or
+      the directory table on a miss) and then read one shard.
+    - Lookups by phone and listings ask every shard concurrently, each for
+      the slots the map gives it: rows of a slot that moved away stay on the
+      old shard for a while.
+    - Streams read one shard after the other, each in creation order.
+    - Bulk updates go one shard after the other, each shard's writes
+      committed at once; counts ask every shard concurrently.
+
+    Directory changes go through the request's session and commit with it.
+    Shard writes commit at once in their own session, after the directory
+    change has been flushed, so a duplicate email fails before any shard is
+    written. A request that fails after that can leave a shard row without a
+    directory entry, which no email lookup reaches.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        shards: UserShards,
+        email_filter: IRegisteredEmailFilter | None = None,
+    ) -> None:
+        """
+        Initialize repository with the primary session and the shard set.
+
+        Args:
+            session: Request session on the primary database
+            shards: Application-scoped shard engines and slot map
+            email_filter: This process's registered email filter, if any
+        """
+        self._session = session
+        self._shards = shards
+        self._directory = SQLAlchemyUserDirectory(session)
+        self._email_filter = email_filter
+
+    async def create(self, user: User) -> User:
+        """Create new user."""
+        self._directory.add(user)
+        try:
+            await self._session.flush()
+        except IntegrityError as e:
+            await self._session.rollback()
+            raise ValueError(f"User with email {user.email} already exists") from e
+
+        shard = await self._shards.writable_shard(self._session, user.id)
+        async with self._shards.session(shard) as session:
+            created = await SQLAlchemyUserRepository(session, directory=False).create(user)
+            await session.commit()
+        self._shards.remember_email(created.email, created.id)
+        return created
+
+    async def get_by_id(self, user_id: UUID) -> User | None:
+        """Get user by ID."""
+        async with self._shards.session(self._shards.shard_of(user_id)) as session:
+            return await SQLAlchemyUserRepository(session, directory=False).get_by_id(user_id)
+
+    async def get_many_by_ids(self, user_ids: Sequence[UUID]) -> list[User]:
+        """Get users by IDs, one query per shard involved."""
+        by_shard: dict[int, list[UUID]] = {}
+        for user_id in user_ids:
+            by_shard.setdefault(self._shards.shard_of(user_id), []).append(user_id)
+        batches = await asyncio.gather(
+            *(self._get_many_from(shard, ids) for shard, ids in by_shard.items())
+        )
+        return [user for batch in batches for user in batch]
+
+    async def get_by_email(self, email: str) -> User | None:
+        """Get user by email (case-insensitive)."""
+        email = normalize_email(email)
+        user_id = self._shards.cached_user_id(email)
+        if user_id is not None:
+            user = await self.get_by_id(user_id)
+            if user is not None and user.email == email:
+                return user
+            # The email moved to another account or the user is gone
+            self._shards.forget_email(email)
+
+        user_id = await self._directory.find(email)
+        if user_id is None:
+            return None
+        user = await self.get_by_id(user_id)
+        if user is not None:
+            self._shards.remember_email(email, user_id)
+        return user
+
+    async def get_by_phone(self, phone: str) -> User | None:
+        """Get user by phone number, asking every shard."""
+        users = await asyncio.gather(
+            *(self._get_by_phone_from(shard, phone) for shard in range(self._shards.count))
+        )
+        return next((user for user in users if user is not None), None)
+
+    async def update(self, user: User) -> User:
+        """Update existing user."""
+        changed = await self._directory.change_email(user.id, user.email)
+        try:
+            await self._session.flush()
+        except IntegrityError as e:
+            await self._session.rollback()
+            raise ValueError(f"User with email {user.email} already exists") from e
+        if changed and self._email_filter is not None:
+            self._email_filter.add(user.email)
+
+        shard = await self._shards.writable_shard(self._session, user.id)
+        async with self._shards.session(shard) as session:
+            updated = await SQLAlchemyUserRepository(session, directory=False).update(user)
+            await session.commit()
+        self._shards.remember_email(updated.email, updated.id)
+        return updated
+
+    async def delete(self, user_id: UUID) -> bool:
+        """Delete user by ID."""
+        # Removed from the directory first: references from orders fail here
+        await self._directory.remove(user_id)
+
+        shard = await self._shards.writable_shard(self._session, user_id)
+        async with self._shards.session(shard) as session:
+            deleted = await SQLAlchemyUserRepository(session, directory=False).delete(user_id)
+            await session.commit()
+        return deleted
+
+    async def exists_by_email(self, email: str) -> bool:
+        """Check if user exists by email, from the directory alone."""
+        return await self._directory.find(email) is not None
+
+    async def list_after(
+        self, after_id: UUID | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> list[User]:
+        """List users in creation order, merging the first page of every shard."""
+        pages = await asyncio.gather(
+            *(self._list_after_from(shard, after_id, limit) for shard in range(self._shards.count))
+        )
+        users = sorted((user for page in pages for user in page), key=lambda user: user.id)
+        return users[:limit]
+
+    async def stream(
+        self, user_filter: UserFilter, batch_size: int = 1000
+    ) -> AsyncGenerator[list[UserRow]]:
+        """Yield matching users shard by shard, with one cursor open at a time."""
+        for shard in range(self._shards.count):
+            # Rows of a slot that moved away stay on the old shard for a while
+            slots = self._shards.slots_of(shard)
+            async with self._shards.session(shard) as session:
+                repository = SQLAlchemyUserRepository(session, directory=False)
+                batches = repository.stream(user_filter, batch_size, slots=slots)
+                async with aclosing(batches):
+                    async for batch in batches:
+                        yield batch
+
+    async def count_matching(
+        self, user_filter: UserFilter, changes: UserChanges, exclude_id: UUID | None = None
+    ) -> tuple[int, int]:
+        """Users matching the filter, and how many of them `changes` would alter, on every shard."""
+        counts = await asyncio.gather(
+            *(
+                self._count_matching_on(shard, user_filter, changes, exclude_id)
+                for shard in range(self._shards.count)
+            )
+        )
+        return sum(matched for matched, _ in counts), sum(changed for _, changed in counts)
+
+    async def update_matching(
+        self,
+        user_filter: UserFilter,
+        changes: UserChanges,
+        limit: int,
+        exclude_id: UUID | None = None,
+    ) -> list[UserRow]:
+        """
+        Apply changes on one shard after the other until `limit` users changed.
+
+        The slots written on each shard are locked in the primary session
+        (writable_slots), so the resharding tool cannot freeze them until the
+        caller's transaction ends. A slot moved to an already visited shard
+        in the meantime is missed by the pass, which is then repeated.
+        """
+        rows: list[UserRow] = []
+        while True:
+            covered: set[int] = set()
+            for shard in range(self._shards.count):
+                slots = await self._shards.writable_slots(self._session, shard)
+                covered.update(slots)
+                if not slots:
+                    continue
+                async with self._shards.session(shard) as session:
+                    rows += await SQLAlchemyUserRepository(
+                        session, directory=False
+                    ).update_matching(
+                        user_filter, changes, limit - len(rows), exclude_id, slots=slots
+                    )
+                    await session.commit()
+                if len(rows) >= limit:
+                    return rows
+            if len(covered) == SHARD_SLOTS:
+                return rows
+
+    async def _count_matching_on(
+        self,
+        shard: int,
+        user_filter: UserFilter,
+        changes: UserChanges,
+        exclude_id: UUID | None,
+    ) -> tuple[int, int]:
+        async with self._shards.session(shard) as session:
+            return await SQLAlchemyUserRepository(session, directory=False).count_matching(
+                user_filter, changes, exclude_id, slots=self._shards.slots_of(shard)
+            )
+
+    async def _get_many_from(self, shard: int, user_ids: list[UUID]) -> list[User]:
+        async with self._shards.session(shard) as session:
+            return await SQLAlchemyUserRepository(session, directory=False).get_many_by_ids(
+                user_ids
+            )
+
+    async def _get_by_phone_from(self, shard: int, phone: str) -> User | None:
+        async with self._shards.session(shard) as session:
+            return await SQLAlchemyUserRepository(session, directory=False).get_by_phone(
+                phone, slots=self._shards.slots_of(shard)
+            )
+
+    async def _list_after_from(self, shard: int, after_id: UUID | None, limit: int) -> list[User]:
+        async with self._shards.session(shard) as session:
+            return await SQLAlchemyUserRepository(session, directory=False).list_after(
+                after_id, limit, slots=self._shards.slots_of(shard)
+            )
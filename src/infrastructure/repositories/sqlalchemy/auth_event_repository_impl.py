@@ -0,0 +1,97 @@
+"""SQLAlchemy implementation of the authentication event repository."""
+
+from collections.abc import Sequence
+from datetime import date, datetime
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.auth_event import AuthEvent, AuthEventType
+from src.domain.entities.user import normalize_email
+from src.domain.repositories.auth_event_repository import IAuthEventRepository
+from src.infrastructure.orm.auth_event_model import AuthEventModel
+
+
+class SQLAlchemyAuthEventRepository(IAuthEventRepository):
+    """SQLAlchemy-based authentication event repository implementation."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy async database session
+        """
+        self._session = session
+
+    async def add_many(self, events: Sequence[AuthEvent]) -> None:
+        """Append a batch of events with a single multi-row INSERT."""
+        if not events:
+            return
+        await self._session.execute(
+            insert(AuthEventModel),
+            [
+                {
+                    "id": event.id,
+                    "occurred_at": event.occurred_at,
+                    "event_type": event.event_type.value,
+                    "email": event.email,
+                    "user_id": event.user_id,
+                    "reason": event.reason,
+                }
+                for event in events
+            ],
+        )
+
+    async def get_recent_failures(
+        self, email: str, since: datetime, limit: int = 50
+    ) -> list[AuthEvent]:
+        """Get failed logins for an account since the given time, newest first."""
+        # Matches ix_auth_events_failures_email; the range prunes old partitions
+        stmt = (
+            select(AuthEventModel)
+            .where(
+                AuthEventModel.event_type == AuthEventType.LOGIN_FAILED.value,
+                AuthEventModel.email == normalize_email(email),
+                AuthEventModel.occurred_at >= since,
+            )
+            .order_by(AuthEventModel.occurred_at.desc())
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+
+        return [self._to_entity(db_event) for db_event in result.scalars()]
+
+    async def ensure_monthly_partition(self, month: date) -> None:
+        """Create the partition holding the given month if it does not exist."""
+        start = month.replace(day=1)
+        end = (
+            date(start.year + 1, 1, 1)
+            if start.month == 12
+            else start.replace(month=start.month + 1)
+        )
+        await self._session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS auth_events_y{start:%Y}m{start:%m} "
+                f"PARTITION OF auth_events FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
+        )
+
+    def _to_entity(self, db_event: AuthEventModel) -> AuthEvent:
+        """
+        Convert ORM model to domain entity.
+
+        Args:
+            db_event: SQLAlchemy AuthEventModel instance
+
+        Returns:
+            Domain AuthEvent entity
+        """
+        return AuthEvent(
+            id=db_event.id,
+            occurred_at=db_event.occurred_at,
+            event_type=AuthEventType(db_event.event_type),
+            email=db_event.email,
+            user_id=db_event.user_id,
+            reason=db_event.reason,
+        )
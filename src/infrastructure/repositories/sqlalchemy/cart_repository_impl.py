@@ -0,0 +1,91 @@
+"""SQLAlchemy implementation of Cart repository."""
+
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.cart import Cart, CartItem
+from src.domain.repositories.cart_repository import ICartRepository
+from src.infrastructure.orm.cart_model import CartModel
+
+
+class SQLAlchemyCartRepository(ICartRepository):
+    """SQLAlchemy-based Cart repository implementation."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy async database session
+        """
+        self._session = session
+
+    async def get(self, user_id: UUID) -> Cart | None:
+        """Get a user's persisted cart."""
+        db_cart = await self._session.get(CartModel, user_id)
+        return self._to_entity(db_cart) if db_cart else None
+
+    async def save_many(self, carts: Sequence[Cart]) -> None:
+        """Upsert carts with one multi-row INSERT ... ON CONFLICT."""
+        if not carts:
+            return
+        stmt = insert(CartModel).values(
+            [
+                {
+                    "user_id": cart.user_id,
+                    "items": self._items_to_json(cart),
+                    "version": cart.version,
+                    "updated_at": cart.updated_at,
+                }
+                for cart in carts
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CartModel.user_id],
+            # Subscript: `excluded.items` is the column collection's items() method
+            set_={
+                "items": stmt.excluded["items"],
+                "version": stmt.excluded.version,
+                "updated_at": stmt.excluded.updated_at,
+            },
+            where=CartModel.version < stmt.excluded.version,
+        )
+        await self._session.execute(stmt)
+
+    def _items_to_json(self, cart: Cart) -> list[dict[str, str | int]]:
+        return [
+            {
+                "product_id": str(item.product_id),
+                "quantity": item.quantity,
+                "added_at": item.added_at.isoformat(),
+            }
+            for item in cart.items
+        ]
+
+    def _to_entity(self, db_cart: CartModel) -> Cart:
+        """
+        Convert ORM model to domain entity.
+
+        Args:
+            db_cart: SQLAlchemy CartModel instance
+
+        Returns:
+            Domain Cart entity
+        """
+        return Cart(
+            user_id=db_cart.user_id,
+            items=[
+                CartItem(
+                    product_id=UUID(item["product_id"]),
+                    quantity=item["quantity"],
+                    added_at=datetime.fromisoformat(item["added_at"]),
+                )
+                for item in db_cart.items
+            ],
+            version=db_cart.version,
+            updated_at=db_cart.updated_at,
+        )
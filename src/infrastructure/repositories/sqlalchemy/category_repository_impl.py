@@ -0,0 +1,126 @@
+"""SQLAlchemy implementation of Category repository."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.product import Category
+from src.domain.exceptions.catalog import CategoryAlreadyExistsError
+from src.domain.repositories.category_repository import ICategoryRepository
+from src.infrastructure.orm.category_model import CategoryModel
+
+
+class SQLAlchemyCategoryRepository(ICategoryRepository):
+    """SQLAlchemy-based Category repository implementation."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy async database session
+        """
+        self._session = session
+
+    async def create(self, category: Category) -> Category:
+        """Create new category."""
+        db_category = self._to_orm(category)
+        self._session.add(db_category)
+
+        try:
+            await self._session.flush()
+            await self._session.refresh(db_category)
+        except IntegrityError as e:
+            await self._session.rollback()
+            raise CategoryAlreadyExistsError(
+                f"Category with slug {category.slug} already exists."
+            ) from e
+
+        return self._to_entity(db_category)
+
+    async def get_by_id(self, category_id: UUID) -> Category | None:
+        """Get category by ID."""
+        stmt = select(CategoryModel).where(CategoryModel.id == category_id)
+        result = await self._session.execute(stmt)
+        db_category = result.scalar_one_or_none()
+
+        return self._to_entity(db_category) if db_category else None
+
+    async def update(self, category: Category) -> Category:
+        """Update existing category."""
+        stmt = select(CategoryModel).where(CategoryModel.id == category.id)
+        result = await self._session.execute(stmt)
+        db_category = result.scalar_one_or_none()
+
+        if not db_category:
+            raise ValueError(f"Category with id {category.id} not found!")
+
+        # Update fields
+        db_category.name = category.name
+        db_category.slug = category.slug
+        db_category.parent_id = category.parent_id
+        db_category.is_active = category.is_active
+        db_category.updated_at = category.updated_at
+
+        try:
+            await self._session.flush()
+            await self._session.refresh(db_category)
+        except IntegrityError as e:
+            await self._session.rollback()
+            raise CategoryAlreadyExistsError(
+                f"Category with slug {category.slug} already exists."
+            ) from e
+
+        return self._to_entity(db_category)
+
+    async def list_changed_since(self, since: datetime | None = None) -> list[Category]:
+        """Get categories updated after the given time (all when None), oldest change first."""
+        stmt = select(CategoryModel).order_by(CategoryModel.updated_at)
+        if since is not None:
+            stmt = stmt.where(CategoryModel.updated_at > since)
+        result = await self._session.execute(stmt)
+
+        return [self._to_entity(db_category) for db_category in result.scalars()]
+
+    def _to_entity(self, db_category: CategoryModel) -> Category:
+        """
+        Convert ORM model to domain entity.
+
+        Args:
+            db_category: SQLAlchemy CategoryModel instance
+
+        Returns:
+            Domain Category entity
+        """
+        return Category(
+            id=db_category.id,
+            name=db_category.name,
+            slug=db_category.slug,
+            parent_id=db_category.parent_id,
+            is_active=db_category.is_active,
+            created_at=db_category.created_at,
+            updated_at=db_category.updated_at,
+        )
+
+    def _to_orm(self, category: Category) -> CategoryModel:
+        """
+        Converts domain entity to ORM model.
+
+        Args:
+            category: Domain Category entity
+
+        Returns:
+            SQLAlchemy CategoryModel instance
+        """
+        return CategoryModel(
+            id=category.id,
+            name=category.name,
+            slug=category.slug,
+            parent_id=category.parent_id,
+            is_active=category.is_active,
+            created_at=category.created_at,
+            updated_at=category.updated_at,
+        )
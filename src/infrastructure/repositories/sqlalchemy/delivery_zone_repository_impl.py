@@ -0,0 +1,118 @@
+"""SQLAlchemy implementation of DeliveryZone repository."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.delivery import DeliveryZone
+from src.domain.repositories.delivery_zone_repository import IDeliveryZoneRepository
+from src.infrastructure.orm.delivery_zone_model import DeliveryZoneModel
+
+
+class SQLAlchemyDeliveryZoneRepository(IDeliveryZoneRepository):
+    """SQLAlchemy-based DeliveryZone repository implementation."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy async database session
+        """
+        self._session = session
+
+    async def create(self, zone: DeliveryZone) -> DeliveryZone:
+        """Create new delivery zone."""
+        db_zone = self._to_orm(zone)
+        self._session.add(db_zone)
+        await self._session.flush()
+        await self._session.refresh(db_zone)
+
+        return self._to_entity(db_zone)
+
+    async def get_by_id(self, zone_id: UUID) -> DeliveryZone | None:
+        """Get delivery zone by ID."""
+        stmt = select(DeliveryZoneModel).where(DeliveryZoneModel.id == zone_id)
+        result = await self._session.execute(stmt)
+        db_zone = result.scalar_one_or_none()
+
+        return self._to_entity(db_zone) if db_zone else None
+
+    async def update(self, zone: DeliveryZone) -> DeliveryZone:
+        """Update existing delivery zone."""
+        stmt = select(DeliveryZoneModel).where(DeliveryZoneModel.id == zone.id)
+        result = await self._session.execute(stmt)
+        db_zone = result.scalar_one_or_none()
+
+        if not db_zone:
+            raise ValueError(f"Delivery zone with id {zone.id} not found!")
+
+        # Update fields
+        db_zone.name = zone.name
+        db_zone.hub_code = zone.hub_code
+        db_zone.rings = self._rings_to_json(zone)
+        db_zone.priority = zone.priority
+        db_zone.is_active = zone.is_active
+        db_zone.updated_at = zone.updated_at
+
+        await self._session.flush()
+        await self._session.refresh(db_zone)
+
+        return self._to_entity(db_zone)
+
+    async def list_changed_since(self, since: datetime | None = None) -> list[DeliveryZone]:
+        """Get zones updated after the given time (all when None), oldest change first."""
+        stmt = select(DeliveryZoneModel).order_by(DeliveryZoneModel.updated_at)
+        if since is not None:
+            stmt = stmt.where(DeliveryZoneModel.updated_at > since)
+        result = await self._session.execute(stmt)
+
+        return [self._to_entity(db_zone) for db_zone in result.scalars()]
+
+    def _rings_to_json(self, zone: DeliveryZone) -> list[list[list[float]]]:
+        """Rings as JSON arrays of [longitude, latitude] pairs."""
+        return [[[lng, lat] for lng, lat in ring] for ring in zone.rings]
+
+    def _to_entity(self, db_zone: DeliveryZoneModel) -> DeliveryZone:
+        """
+        Convert ORM model to domain entity.
+
+        Args:
+            db_zone: SQLAlchemy DeliveryZoneModel instance
+
+        Returns:
+            Domain DeliveryZone entity
+        """
+        return DeliveryZone(
+            id=db_zone.id,
+            name=db_zone.name,
+            hub_code=db_zone.hub_code,
+            rings=[[(lng, lat) for lng, lat in ring] for ring in db_zone.rings],
+            priority=db_zone.priority,
+            is_active=db_zone.is_active,
+            created_at=db_zone.created_at,
+            updated_at=db_zone.updated_at,
+        )
+
+    def _to_orm(self, zone: DeliveryZone) -> DeliveryZoneModel:
+        """
+        Converts domain entity to ORM model.
+
+        Args:
+            zone: Domain DeliveryZone entity
+
+        Returns:
+            SQLAlchemy DeliveryZoneModel instance
+        """
+        return DeliveryZoneModel(
+            id=zone.id,
+            name=zone.name,
+            hub_code=zone.hub_code,
+            rings=self._rings_to_json(zone),
+            priority=zone.priority,
+            is_active=zone.is_active,
+            created_at=zone.created_at,
+            updated_at=zone.updated_at,
+        )
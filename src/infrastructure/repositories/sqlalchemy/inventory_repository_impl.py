@@ -0,0 +1,243 @@
+"""SQLAlchemy implementation of Inventory repository."""
+
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import cast
+from uuid import UUID, uuid7
+
+from sqlalchemy import (
+    Table,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import Uuid
+
+from src.domain.exceptions.order import OutOfStockError
+from src.domain.repositories.inventory_repository import IInventoryRepository
+from src.infrastructure.orm.inventory_model import InventoryShardModel, StockReservationModel
+
+shard_table = cast(Table, InventoryShardModel.__table__)
+
+# Take units from one shard; run as executemany in (product_id, shard) order
+_TAKE = (
+    update(shard_table)
+    .where(
+        shard_table.c.product_id == bindparam("b_product_id"),
+        shard_table.c.shard == bindparam("b_shard"),
+    )
+    .values(available=shard_table.c.available - bindparam("b_quantity"))
+)
+
+# Give units back to one shard, recreating it if set_stock changed the shard
+# count meanwhile; also run in (product_id, shard) order
+_insert_shard = pg_insert(shard_table).values(
+    product_id=bindparam("b_product_id"),
+    shard=bindparam("b_shard"),
+    available=bindparam("b_quantity"),
+)
+_RESTOCK = _insert_shard.on_conflict_do_update(
+    index_elements=[shard_table.c.product_id, shard_table.c.shard],
+    # onupdate defaults are not applied to ON CONFLICT updates
+    set_={
+        "available": shard_table.c.available + _insert_shard.excluded.available,
+        "updated_at": func.now(),
+    },
+)
+
+
+class SQLAlchemyInventoryRepository(IInventoryRepository):
+    """
+    Inventory over sharded stock counters.
+
+    Reserving n units of a product first tries one shard that has at least
+    n units and is not locked by another checkout (FOR UPDATE SKIP LOCKED),
+    starting from a random shard so checkouts of a hot product spread over
+    all of its rows; that path takes one statement per product. Only when no
+    such shard is free does it lock all of the product's shards, in shard
+    order, and take the units from several.
+
+    Shard rows are always locked in (product_id, shard) order, here and when
+    releasing, so concurrent multi-product orders cannot deadlock.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy async database session
+        """
+        self._session = session
+
+    async def set_stock(self, product_id: UUID, available: int, shards: int) -> None:
+        """Replace the product's shard rows with `available` split evenly."""
+        await self._session.execute(
+            delete(InventoryShardModel).where(InventoryShardModel.product_id == product_id)
+        )
+        per_shard, remainder = divmod(available, shards)
+        await self._session.execute(
+            insert(InventoryShardModel),
+            [
+                {
+                    "product_id": product_id,
+                    "shard": shard,
+                    "available": per_shard + (1 if shard < remainder else 0),
+                }
+                for shard in range(shards)
+            ],
+        )
+
+    async def get_available(self, product_id: UUID) -> int:
+        """Sum the product's shard counters."""
+        stmt = select(func.coalesce(func.sum(InventoryShardModel.available), 0)).where(
+            InventoryShardModel.product_id == product_id
+        )
+        return int((await self._session.execute(stmt)).scalar_one())
+
+    async def get_available_many(self, product_ids: Sequence[UUID]) -> dict[UUID, int]:
+        """Sum the shard counters of each product; products without stock rows are omitted."""
+        ids = bindparam("product_ids", list(product_ids), type_=ARRAY(Uuid()))
+        stmt = (
+            select(InventoryShardModel.product_id, func.sum(InventoryShardModel.available))
+            .where(InventoryShardModel.product_id == any_(ids))
+            .group_by(InventoryShardModel.product_id)
+        )
+        return {product_id: int(total) for product_id, total in await self._session.execute(stmt)}
+
+    async def reserve(self, order_id: UUID, items: Sequence[tuple[UUID, int]]) -> None:
+        """Reserve items in product order and record which shards they came from."""
+        reservations: list[dict[str, object]] = []
+        for product_id, quantity in sorted(items):
+            if await self._take_from_one_shard(order_id, product_id, quantity):
+                continue
+            taken = await self._take_from_all_shards(product_id, quantity)
+            reservations.extend(
+                {"order_id": order_id, "product_id": product_id, "shard": s, "quantity": q}
+                for s, q in taken.items()
+            )
+        if reservations:
+            await self._session.execute(insert(StockReservationModel), reservations)
+
+    async def release(self, order_ids: Sequence[UUID]) -> None:
+        """Delete the orders' reservations and put their units back."""
+        released = await self._delete_reservations(order_ids)
+        if released:
+            await self._session.execute(
+                _RESTOCK,
+                [
+                    {"b_product_id": product_id, "b_shard": shard, "b_quantity": quantity}
+                    for (product_id, shard), quantity in sorted(released.items())
+                ],
+            )
+
+    async def commit(self, order_ids: Sequence[UUID]) -> None:
+        """Delete the orders' reservations, leaving the units sold."""
+        await self._delete_reservations(order_ids)
+
+    async def _take_from_one_shard(self, order_id: UUID, product_id: UUID, quantity: int) -> bool:
+        """
+        Decrement a free shard holding enough units and record the reservation.
+
+        One statement: pick the shard, update it and insert the reservation
+        row. Returns False, changing nothing, when no such shard is free.
+        """
+        pick = (
+            select(InventoryShardModel.product_id, InventoryShardModel.shard)
+            .where(
+                InventoryShardModel.product_id == product_id,
+                InventoryShardModel.available >= quantity,
+            )
+            # Random order so concurrent checkouts try different rows first
+            .order_by(func.random())
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .cte("pick")
+        )
+        taken = (
+            update(shard_table)
+            .where(
+                shard_table.c.product_id == pick.c.product_id, shard_table.c.shard == pick.c.shard
+            )
+            .values(available=shard_table.c.available - quantity)
+            .returning(shard_table.c.shard)
+            .cte("taken")
+        )
+        stmt = (
+            insert(StockReservationModel)
+            .from_select(
+                ["id", "order_id", "product_id", "shard", "quantity"],
+                select(
+                    literal(uuid7(), Uuid()),
+                    literal(order_id, Uuid()),
+                    literal(product_id, Uuid()),
+                    taken.c.shard,
+                    literal(quantity),
+                ),
+            )
+            .returning(StockReservationModel.shard)
+        )
+        return (await self._session.execute(stmt)).first() is not None
+
+    async def _take_from_all_shards(self, product_id: UUID, quantity: int) -> dict[int, int]:
+        """Lock every shard of the product and take units from the fullest ones."""
+        unlocked_total = await self.get_available(product_id)
+        if unlocked_total < quantity:
+            # Sold out: fail without queueing behind the checkouts holding the locks
+            raise OutOfStockError(product_id)
+
+        stmt = (
+            select(InventoryShardModel.shard, InventoryShardModel.available)
+            .where(InventoryShardModel.product_id == product_id)
+            .order_by(InventoryShardModel.shard)
+            .with_for_update()
+        )
+        counters = {row.shard: row.available for row in await self._session.execute(stmt)}
+        if sum(counters.values()) < quantity:
+            raise OutOfStockError(product_id)
+
+        taken: dict[int, int] = {}
+        remaining = quantity
+        for shard, available in sorted(counters.items(), key=lambda item: -item[1]):
+            if remaining == 0:
+                break
+            take = min(available, remaining)
+            if take:
+                taken[shard] = take
+                remaining -= take
+
+        await self._session.execute(
+            _TAKE,
+            [
+                {"b_product_id": product_id, "b_shard": shard, "b_quantity": take}
+                for shard, take in sorted(taken.items())
+            ],
+        )
+        return taken
+
+    async def _delete_reservations(self, order_ids: Sequence[UUID]) -> dict[tuple[UUID, int], int]:
+        """Delete reservations, returning the units they held per (product_id, shard)."""
+        if not order_ids:
+            return {}
+        ids = bindparam("order_ids", list(order_ids), type_=ARRAY(Uuid()))
+        stmt = (
+            delete(StockReservationModel)
+            .where(StockReservationModel.order_id == any_(ids))
+            .returning(
+                StockReservationModel.product_id,
+                StockReservationModel.shard,
+                StockReservationModel.quantity,
+            )
+        )
+        released: dict[tuple[UUID, int], int] = defaultdict(int)
+        for row in await self._session.execute(stmt):
+            released[(row.product_id, row.shard)] += row.quantity
+        return released
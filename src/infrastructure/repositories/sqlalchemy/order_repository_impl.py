@@ -0,0 +1,139 @@
+"""SQLAlchemy implementation of Order repository."""
+
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import any_, bindparam, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import Uuid
+
+from src.core.constants import DEFAULT_PAGE_SIZE
+from src.domain.entities.order import Order, OrderItem, OrderStatus
+from src.domain.repositories.order_repository import IOrderRepository
+from src.infrastructure.orm.order_model import OrderItemModel, OrderModel
+
+
+class SQLAlchemyOrderRepository(IOrderRepository):
+    """SQLAlchemy-based Order repository implementation."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy async database session
+        """
+        self._session = session
+
+    async def create(self, order: Order) -> Order:
+        """Create new order with its items; the items are already loaded, so no refresh."""
+        db_order = self._to_orm(order)
+        self._session.add(db_order)
+        await self._session.flush()
+
+        return self._to_entity(db_order)
+
+    async def get_by_id(self, order_id: UUID, *, for_update: bool = False) -> Order | None:
+        """Get order by ID, optionally locking its row."""
+        stmt = select(OrderModel).where(OrderModel.id == order_id)
+        if for_update:
+            stmt = stmt.with_for_update(of=OrderModel)
+        result = await self._session.execute(stmt)
+        db_order = result.scalar_one_or_none()
+
+        return self._to_entity(db_order) if db_order else None
+
+    async def list_by_user(
+        self, user_id: UUID, after_id: UUID | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> list[Order]:
+        """List a user's orders newest first (UUIDv7 order), starting after the given ID."""
+        stmt = (
+            select(OrderModel)
+            .where(OrderModel.user_id == user_id)
+            .order_by(OrderModel.id.desc())
+            .limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(OrderModel.id < after_id)
+        result = await self._session.execute(stmt)
+
+        return [self._to_entity(db_order) for db_order in result.scalars()]
+
+    async def set_status(self, order_ids: Sequence[UUID], status: OrderStatus) -> None:
+        """Change the status of orders with one UPDATE."""
+        if not order_ids:
+            return
+        ids = bindparam("order_ids", list(order_ids), type_=ARRAY(Uuid()))
+        await self._session.execute(
+            update(OrderModel)
+            .where(OrderModel.id == any_(ids))
+            .values(status=status.value)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def lock_expired(self, now: datetime, limit: int) -> list[UUID]:
+        """Lock the oldest expired pending orders with FOR UPDATE SKIP LOCKED."""
+        stmt = (
+            select(OrderModel.id)
+            .where(
+                OrderModel.status == OrderStatus.PENDING.value,
+                OrderModel.reserved_until < now,
+            )
+            .order_by(OrderModel.reserved_until)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.execute(stmt)
+
+        return list(result.scalars())
+
+    def _to_entity(self, db_order: OrderModel) -> Order:
+        """
+        Convert ORM model to domain entity.
+
+        Args:
+            db_order: SQLAlchemy OrderModel instance with its items loaded
+
+        Returns:
+            Domain Order entity
+        """
+        return Order(
+            id=db_order.id,
+            user_id=db_order.user_id,
+            items=[
+                OrderItem(
+                    product_id=item.product_id, quantity=item.quantity, unit_price=item.unit_price
+                )
+                for item in db_order.items
+            ],
+            reserved_until=db_order.reserved_until,
+            status=OrderStatus(db_order.status),
+            created_at=db_order.created_at,
+            updated_at=db_order.updated_at,
+        )
+
+    def _to_orm(self, order: Order) -> OrderModel:
+        """
+        Convert domain entity to ORM model.
+
+        Args:
+            order: Domain Order entity
+
+        Returns:
+            SQLAlchemy OrderModel instance with its items
+        """
+        return OrderModel(
+            id=order.id,
+            user_id=order.user_id,
+            status=order.status.value,
+            total=order.total,
+            reserved_until=order.reserved_until,
+            items=[
+                OrderItemModel(
+                    product_id=item.product_id, quantity=item.quantity, unit_price=item.unit_price
+                )
+                for item in order.items
+            ],
+        )
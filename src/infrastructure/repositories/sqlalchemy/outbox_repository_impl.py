@@ -0,0 +1,85 @@
+"""SQLAlchemy implementation of the outbox repository."""
+
+from collections.abc import Sequence
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.event_sink import EventEnvelope
+from src.domain.events.base import DomainEvent
+from src.domain.repositories.outbox_repository import IOutboxRepository
+from src.infrastructure.orm.outbox_model import OutboxModel
+
+
+class SQLAlchemyOutboxRepository(IOutboxRepository):
+    """SQLAlchemy-based outbox repository implementation."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy async database session
+        """
+        self._session = session
+
+    async def add(self, events: Sequence[DomainEvent]) -> None:
+        """Insert events with a single multi-row INSERT."""
+        if not events:
+            return
+        await self._session.execute(
+            insert(OutboxModel),
+            [
+                {
+                    "event_id": event.event_id,
+                    "event_type": event.event_type,
+                    "aggregate_type": event.aggregate_type,
+                    "aggregate_id": event.aggregate_id,
+                    "payload": event.payload(),
+                    "occurred_at": event.occurred_at,
+                }
+                for event in events
+            ],
+        )
+
+    async def fetch_batch(self, limit: int) -> list[EventEnvelope]:
+        """Get the oldest unpublished events in insertion order."""
+        stmt = select(OutboxModel).order_by(OutboxModel.id).limit(limit)
+        result = await self._session.execute(stmt)
+
+        return [self._to_envelope(row) for row in result.scalars()]
+
+    async def delete_many(self, sequences: Sequence[int]) -> None:
+        """
+        Remove published events.
+
+        Deletes by exact sequence rather than a range: a transaction that took a
+        lower sequence may commit after higher ones were read.
+        """
+        if not sequences:
+            return
+        await self._session.execute(
+            delete(OutboxModel)
+            .where(OutboxModel.id.in_(sequences))
+            .execution_options(synchronize_session=False)
+        )
+
+    def _to_envelope(self, row: OutboxModel) -> EventEnvelope:
+        """
+        Convert ORM model to a publishable envelope.
+
+        Args:
+            row: SQLAlchemy OutboxModel instance
+
+        Returns:
+            EventEnvelope carrying the serialized event
+        """
+        return EventEnvelope(
+            sequence=row.id,
+            event_id=row.event_id,
+            event_type=row.event_type,
+            aggregate_type=row.aggregate_type,
+            aggregate_id=row.aggregate_id,
+            payload=row.payload,
+            occurred_at=row.occurred_at,
+        )
@@ -0,0 +1,249 @@
+"""SQLAlchemy implementation of Product repository."""
+
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy import (
+    Double,
+    any_,
+    bindparam,
+    cast,
+    func,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    union,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.types import Uuid
+
+from src.core.constants import DEFAULT_PAGE_SIZE, SEARCH_MAX_CANDIDATES
+from src.domain.entities.product import Product
+from src.domain.exceptions.catalog import ProductAlreadyExistsError
+from src.domain.repositories.product_repository import IProductRepository, ProductSearchHit
+from src.infrastructure.orm.product_model import ProductModel
+
+
+class SQLAlchemyProductRepository(IProductRepository):
+    """SQLAlchemy-based Product repository implementation."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy async database session
+        """
+        self._session = session
+
+    async def create(self, product: Product) -> Product:
+        """Create new product."""
+        db_product = self._to_orm(product)
+        self._session.add(db_product)
+
+        try:
+            await self._session.flush()
+            await self._session.refresh(db_product)
+        except IntegrityError as e:
+            await self._session.rollback()
+            raise ProductAlreadyExistsError(
+                f"Product with slug {product.slug} already exists."
+            ) from e
+
+        return self._to_entity(db_product)
+
+    async def get_by_id(self, product_id: UUID) -> Product | None:
+        """Get product by ID."""
+        stmt = select(ProductModel).where(ProductModel.id == product_id)
+        result = await self._session.execute(stmt)
+        db_product = result.scalar_one_or_none()
+
+        return self._to_entity(db_product) if db_product else None
+
+    async def get_many_by_ids(self, product_ids: Sequence[UUID]) -> list[Product]:
+        """Get products by IDs with a single `id = ANY(:ids)` query."""
+        if not product_ids:
+            return []
+        ids = bindparam("product_ids", list(product_ids), type_=ARRAY(Uuid()))
+        stmt = select(ProductModel).where(ProductModel.id == any_(ids))
+        result = await self._session.execute(stmt)
+
+        return [self._to_entity(db_product) for db_product in result.scalars()]
+
+    async def get_by_slug(self, slug: str) -> Product | None:
+        """Get product by slug."""
+        stmt = select(ProductModel).where(ProductModel.slug == slug)
+        result = await self._session.execute(stmt)
+        db_product = result.scalar_one_or_none()
+
+        return self._to_entity(db_product) if db_product else None
+
+    async def update(self, product: Product) -> Product:
+        """Update existing product."""
+        stmt = select(ProductModel).where(ProductModel.id == product.id)
+        result = await self._session.execute(stmt)
+        db_product = result.scalar_one_or_none()
+
+        if not db_product:
+            raise ValueError(f"Product with id {product.id} not found!")
+
+        # Update fields
+        db_product.name = product.name
+        db_product.name_bn = product.name_bn
+        db_product.slug = product.slug
+        db_product.description = product.description
+        db_product.price = product.price
+        db_product.category_id = product.category_id
+        db_product.is_active = product.is_active
+        db_product.updated_at = product.updated_at
+
+        try:
+            await self._session.flush()
+            await self._session.refresh(db_product)
+        except IntegrityError as e:
+            await self._session.rollback()
+            raise ProductAlreadyExistsError(
+                f"Product with slug {product.slug} already exists."
+            ) from e
+
+        return self._to_entity(db_product)
+
+    async def list_after(
+        self,
+        category_ids: Sequence[UUID] | None = None,
+        after_id: UUID | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> list[Product]:
+        """List active products newest first (UUIDv7 order), starting after the given ID."""
+        stmt = (
+            select(ProductModel)
+            .where(ProductModel.is_active)
+            .order_by(ProductModel.id.desc())
+            .limit(limit)
+        )
+        if category_ids is not None:
+            ids = bindparam("category_ids", list(category_ids), type_=ARRAY(Uuid()))
+            stmt = stmt.where(ProductModel.category_id == any_(ids))
+        if after_id is not None:
+            stmt = stmt.where(ProductModel.id < after_id)
+        result = await self._session.execute(stmt)
+
+        return [self._to_entity(db_product) for db_product in result.scalars()]
+
+    async def search(
+        self,
+        query: str,
+        after: tuple[float, UUID] | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> list[ProductSearchHit]:
+        """
+        Rank products by full-text match plus trigram word similarity.
+
+        Full-text covers stemmed English and exact Bangla/English words;
+        the trigram operators (`%>`, served by the pg_trgm GIN indexes) catch
+        misspellings the text search misses. Each kind of match is capped
+        separately at SEARCH_MAX_CANDIDATES: full-text matches by rank,
+        trigram matches by word similarity (then highest id for both). Only
+        the union of the two is scored, so a broad term costs about the same
+        as a narrow one, and every page of a search ranks the same
+        candidates.
+        """
+        ts_query = func.websearch_to_tsquery(literal_column("'english'::regconfig"), query).op(
+            "||"
+        )(func.websearch_to_tsquery(literal_column("'simple'::regconfig"), query))
+        similarity = func.greatest(
+            func.word_similarity(query, ProductModel.name),
+            func.coalesce(func.word_similarity(query, ProductModel.name_bn), 0),
+        )
+        text_rank = func.ts_rank_cd(ProductModel.search_vector, ts_query)
+        # Cast to double so the score survives the round trip through a cursor exactly
+        score = cast(text_rank + similarity, Double)
+
+        text_matches = (
+            select(ProductModel.id)
+            .where(ProductModel.is_active, ProductModel.search_vector.op("@@")(ts_query))
+            .order_by(text_rank.desc(), ProductModel.id.desc())
+            .limit(SEARCH_MAX_CANDIDATES)
+            .subquery()
+        )
+        # Misspellings have no text rank, so they compete on similarity alone
+        trigram_matches = (
+            select(ProductModel.id)
+            .where(
+                ProductModel.is_active,
+                or_(ProductModel.name.op("%>")(query), ProductModel.name_bn.op("%>")(query)),
+            )
+            .order_by(similarity.desc(), ProductModel.id.desc())
+            .limit(SEARCH_MAX_CANDIDATES)
+            .subquery()
+        )
+        candidates = union(select(text_matches.c.id), select(trigram_matches.c.id)).subquery()
+        ranked = (
+            select(ProductModel, score.label("score"))
+            .join(candidates, ProductModel.id == candidates.c.id)
+            .subquery()
+        )
+        product = aliased(ProductModel, ranked)
+        stmt = (
+            select(product, ranked.c.score)
+            .order_by(ranked.c.score.desc(), ranked.c.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(ranked.c.score, ranked.c.id) < tuple_(*after))
+        result = await self._session.execute(stmt)
+
+        return [
+            ProductSearchHit(product=self._to_entity(db_product), score=score)
+            for db_product, score in result.all()
+        ]
+
+    def _to_entity(self, db_product: ProductModel) -> Product:
+        """
+        Convert ORM model to domain entity.
+
+        Args:
+            db_product: SQLAlchemy ProductModel instance
+
+        Returns:
+            Domain Product entity
+        """
+        return Product(
+            id=db_product.id,
+            name=db_product.name,
+            name_bn=db_product.name_bn,
+            slug=db_product.slug,
+            description=db_product.description,
+            price=db_product.price,
+            category_id=db_product.category_id,
+            is_active=db_product.is_active,
+            created_at=db_product.created_at,
+            updated_at=db_product.updated_at,
+        )
+
+    def _to_orm(self, product: Product) -> ProductModel:
+        """
+        Converts domain entity to ORM model.
+
+        Args:
+            product: Domain Product entity
+
+        Returns:
+            SQLAlchemy ProductModel instance
+        """
+        return ProductModel(
+            id=product.id,
+            name=product.name,
+            name_bn=product.name_bn,
+            slug=product.slug,
+            description=product.description,
+            price=product.price,
+            category_id=product.category_id,
+            is_active=product.is_active,
+            created_at=product.created_at,
+            updated_at=product.updated_at,
+        )
@@ -0,0 +1,257 @@
+"""SQLAlchemy implementation of Report repository."""
+
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import Date, cast, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.order import OrderStatus
+from src.domain.entities.report import (
+    REGISTRATIONS_REPORT,
+    SALES_REPORT,
+    CustomerSales,
+    DailyRegistrations,
+    DailySales,
+)
+from src.domain.repositories.report_repository import IReportRepository
+from src.infrastructure.orm.order_model import OrderItemModel, OrderModel
+from src.infrastructure.orm.report_model import (
+    CustomerSalesModel,
+    DailyRegistrationsModel,
+    DailySalesModel,
+    ReportWatermarkModel,
+)
+from src.infrastructure.orm.user_directory_model import UserDirectoryModel
+
+# Watermark of a report that has not been built yet
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+class SQLAlchemyReportRepository(IReportRepository):
+    """
+    Summary tables maintained by watermark-driven incremental refresh.
+
+    Summaries are additive counters, so a source row must be folded in
+    exactly once. A row's timestamp is set when its transaction starts but
+    it only becomes visible at commit, so rows newer than `now() - settle`
+    are left for a later refresh: by then every transaction that could
+    still produce a row inside the window has committed. The counters and
+    the watermark are updated in one transaction, so a failed refresh
+    leaves both unchanged.
+
+    - Sales: orders counted when confirmed (CONFIRMED is final), bucketed
+      by the confirmation day, i.e. the order's updated_at.
+    - Registrations: users bucketed by created_at.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy async database session
+        """
+        self._session = session
+
+    async def daily_sales(self, start: date, end: date) -> list[DailySales]:
+        """List daily sales rows in the date range."""
+        stmt = (
+            select(DailySalesModel)
+            .where(DailySalesModel.day >= start, DailySalesModel.day <= end)
+            .order_by(DailySalesModel.day)
+        )
+        return [
+            DailySales(day=row.day, orders=row.orders, units=row.units, revenue=row.revenue)
+            for row in await self._session.scalars(stmt)
+        ]
+
+    async def daily_registrations(self, start: date, end: date) -> list[DailyRegistrations]:
+        """List daily registration rows in the date range."""
+        stmt = (
+            select(DailyRegistrationsModel)
+            .where(DailyRegistrationsModel.day >= start, DailyRegistrationsModel.day <= end)
+            .order_by(DailyRegistrationsModel.day)
+        )
+        return [
+            DailyRegistrations(day=row.day, users=row.users)
+            for row in await self._session.scalars(stmt)
+        ]
+
+    async def top_customers(self, limit: int) -> list[CustomerSales]:
+        """List customers by confirmed revenue, highest first."""
+        stmt = (
+            select(CustomerSalesModel)
+            .order_by(CustomerSalesModel.revenue.desc(), CustomerSalesModel.user_id)
+            .limit(limit)
+        )
+        return [
+            CustomerSales(
+                user_id=row.user_id,
+                orders=row.orders,
+                revenue=row.revenue,
+                last_order_at=row.last_order_at,
+            )
+            for row in await self._session.scalars(stmt)
+        ]
+
+    async def watermarks(self) -> dict[str, datetime]:
+        """Read every report's watermark."""
+        result = await self._session.execute(
+            select(ReportWatermarkModel.name, ReportWatermarkModel.watermark)
+        )
+        return dict(result.tuples().all())
+
+    async def refresh(
+        self, report: str, settle: timedelta, max_window: timedelta, time_zone: str
+    ) -> bool:
+        """Fold one window of source rows in and advance the watermark."""
+        if report not in (SALES_REPORT, REGISTRATIONS_REPORT):
+            raise ValueError(f"Unknown report '{report}'")
+        # Skip if another process is refreshing this report right now
+        stmt = (
+            select(ReportWatermarkModel.watermark, func.now())
+            .where(ReportWatermarkModel.name == report)
+            .with_for_update(skip_locked=True)
+        )
+        row = (await self._session.execute(stmt)).one_or_none()
+        if row is None:
+            return False
+        lower, now = row
+        settled = now - settle
+        if settled <= lower:
+            return False
+
+        # Jump over stretches without source rows instead of walking them window by window
+        next_change = await self._next_change(report, lower)
+        if next_change is None or next_change > settled:
+            upper = settled
+        else:
+            upper = min(settled, next_change + max_window)
+            if report == SALES_REPORT:
+                await self._fold_sales(lower, upper, time_zone)
+            else:
+                await self._fold_registrations(lower, upper, time_zone)
+
+        await self._session.execute(
+            update(ReportWatermarkModel)
+            .where(ReportWatermarkModel.name == report)
+            .values(watermark=upper)
+        )
+        return upper < settled
+
+    async def reset(self, report: str) -> None:
+        """Delete the report's summary rows and set its watermark back to the epoch."""
+        if report == SALES_REPORT:
+            await self._session.execute(delete(DailySalesModel))
+            await self._session.execute(delete(CustomerSalesModel))
+        elif report == REGISTRATIONS_REPORT:
+            await self._session.execute(delete(DailyRegistrationsModel))
+        else:
+            raise ValueError(f"Unknown report '{report}'")
+        await self._session.execute(
+            update(ReportWatermarkModel)
+            .where(ReportWatermarkModel.name == report)
+            .values(watermark=EPOCH)
+        )
+
+    async def _next_change(self, report: str, after: datetime) -> datetime | None:
+        """Timestamp of the report's first source row after the given time."""
+        stmt = (
+            select(func.min(OrderModel.updated_at)).where(
+                OrderModel.status == OrderStatus.CONFIRMED.value, OrderModel.updated_at > after
+            )
+            if report == SALES_REPORT
+            else select(func.min(UserDirectoryModel.created_at)).where(
+                UserDirectoryModel.created_at > after
+            )
+        )
+        next_change: datetime | None = (await self._session.execute(stmt)).scalar_one()
+        return next_change
+
+    async def _fold_sales(self, lower: datetime, upper: datetime, time_zone: str) -> None:
+        """Add orders confirmed in (lower, upper] to the daily and per-customer sales."""
+        units = (
+            select(func.sum(OrderItemModel.quantity))
+            .where(OrderItemModel.order_id == OrderModel.id)
+            .scalar_subquery()
+        )
+        confirmed = (
+            select(
+                OrderModel.user_id,
+                OrderModel.total,
+                OrderModel.updated_at,
+                cast(func.timezone(time_zone, OrderModel.updated_at), Date).label("day"),
+                units.label("units"),
+            )
+            .where(
+                OrderModel.status == OrderStatus.CONFIRMED.value,
+                OrderModel.updated_at > lower,
+                OrderModel.updated_at <= upper,
+            )
+            .cte("confirmed")
+        )
+
+        daily = pg_insert(DailySalesModel).from_select(
+            ["day", "orders", "units", "revenue"],
+            select(
+                confirmed.c.day,
+                func.count(),
+                func.sum(confirmed.c.units),
+                func.sum(confirmed.c.total),
+            ).group_by(confirmed.c.day),
+        )
+        await self._session.execute(
+            daily.on_conflict_do_update(
+                index_elements=[DailySalesModel.day],
+                set_={
+                    "orders": DailySalesModel.orders + daily.excluded.orders,
+                    "units": DailySalesModel.units + daily.excluded.units,
+                    "revenue": DailySalesModel.revenue + daily.excluded.revenue,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+        customers = pg_insert(CustomerSalesModel).from_select(
+            ["user_id", "orders", "revenue", "last_order_at"],
+            select(
+                confirmed.c.user_id,
+                func.count(),
+                func.sum(confirmed.c.total),
+                func.max(confirmed.c.updated_at),
+            ).group_by(confirmed.c.user_id),
+        )
+        await self._session.execute(
+            customers.on_conflict_do_update(
+                index_elements=[CustomerSalesModel.user_id],
+                set_={
+                    "orders": CustomerSalesModel.orders + customers.excluded.orders,
+                    "revenue": CustomerSalesModel.revenue + customers.excluded.revenue,
+                    "last_order_at": func.greatest(
+                        CustomerSalesModel.last_order_at, customers.excluded.last_order_at
+                    ),
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    async def _fold_registrations(self, lower: datetime, upper: datetime, time_zone: str) -> None:
+        """Add users created in (lower, upper] to the daily registrations."""
+        # The directory holds every user, whichever shard stores the user row
+        day = cast(func.timezone(time_zone, UserDirectoryModel.created_at), Date)
+        daily = pg_insert(DailyRegistrationsModel).from_select(
+            ["day", "users"],
+            select(day, func.count())
+            .where(UserDirectoryModel.created_at > lower, UserDirectoryModel.created_at <= upper)
+            .group_by(day),
+        )
+        await self._session.execute(
+            daily.on_conflict_do_update(
+                index_elements=[DailyRegistrationsModel.day],
+                set_={
+                    "users": DailyRegistrationsModel.users + daily.excluded.users,
+                    "updated_at": func.now(),
+                },
+            )
+        )
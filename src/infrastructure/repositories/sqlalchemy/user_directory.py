@@ -0,0 +1,91 @@
+"""SQLAlchemy access to the user directory on the primary database."""
+
+from collections.abc import AsyncGenerator
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.user import User, normalize_email
+from src.infrastructure.orm.user_directory_model import UserDirectoryModel
+
+
+class SQLAlchemyUserDirectory:
+    """
+    Email-to-id entries for every user, kept next to the user rows.
+
+    Changes are staged on the session and flushed by the caller together
+    with the user row, so a duplicate email fails the same flush.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize directory with a session on the primary database.
+
+        Args:
+            session: SQLAlchemy async database session
+        """
+        self._session = session
+
+    def add(self, user: User) -> None:
+        """Stage the entry of a new user."""
+        self._session.add(
+            UserDirectoryModel(
+                user_id=user.id,
+                email=normalize_email(user.email),
+                created_at=user.created_at,
+                updated_at=user.updated_at,
+            )
+        )
+
+    async def find(self, email: str) -> UUID | None:
+        """ID of the user with this email, if any."""
+        stmt = select(UserDirectoryModel.user_id).where(
+            UserDirectoryModel.email == normalize_email(email)
+        )
+        user_id: UUID | None = (await self._session.execute(stmt)).scalar_one_or_none()
+        return user_id
+
+    async def change_email(self, user_id: UUID, email: str) -> bool:
+        """
+        Point the entry at a new email, bumping updated_at.
+
+        A no-op when it is unchanged. Returns whether the email changed.
+        """
+        email = normalize_email(email)
+        result = await self._session.execute(
+            update(UserDirectoryModel)
+            .where(UserDirectoryModel.user_id == user_id, UserDirectoryModel.email != email)
+            .values(email=email)
+            .returning(UserDirectoryModel.user_id)
+        )
+        return result.first() is not None
+
+    async def stream_changed(
+        self, since: datetime, batch_size: int = 5000
+    ) -> AsyncGenerator[list[tuple[str, datetime]]]:
+        """
+        Entries added or whose email changed since `since`, as (email, updated_at).
+
+        Yielded in updated_at order, `batch_size` rows per cursor fetch.
+        """
+        stmt = (
+            select(UserDirectoryModel.email, UserDirectoryModel.updated_at)
+            .where(UserDirectoryModel.updated_at >= since)
+            .order_by(UserDirectoryModel.updated_at)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream(stmt)
+        try:
+            async for partition in result.partitions():
+                yield [(email, updated_at) for email, updated_at in partition]
+        finally:
+            # Closes the cursor when the caller stops early
+            await result.close()
+
+    async def remove(self, user_id: UUID) -> None:
+        """Delete the entry of a user."""
+        await self._session.execute(
+            delete(UserDirectoryModel).where(UserDirectoryModel.user_id == user_id)
+        )
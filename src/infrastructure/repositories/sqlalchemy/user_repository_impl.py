@@ -1,32 +1,71 @@
 """SQLAlchemy implementation of User repository."""
 
+from collections.abc import AsyncGenerator, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    any_,
+    bindparam,
+    false,
+    func,
+    literal_column,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import Uuid
 
-from src.domain.entities.user import User
-from src.domain.repositories.user_repository import IUserRepository
-from src.infrastructure.orm.user_model import UserModel
+from src.application.interfaces.email_filter import IRegisteredEmailFilter
+from src.core.constants import DEFAULT_PAGE_SIZE
+from src.domain.entities.user import Role, User, normalize_email, normalize_phone
+from src.domain.repositories.user_repository import (
+    IUserRepository,
+    UserChanges,
+    UserFilter,
+    UserRow,
+)
+from src.infrastructure.orm.user_model import SHARD_SLOT_SQL, UserModel
+from src.infrastructure.repositories.sqlalchemy.user_directory import SQLAlchemyUserDirectory
 
 
 class SQLAlchemyUserRepository(IUserRepository):
-    """SQLAlchemy-based User repository implementation."""
+    """
+    SQLAlchemy-based User repository implementation.
 
-    def __init__(self, session: AsyncSession) -> None:
+    Writes also maintain the user directory in the same transaction, except
+    on a shard database, where ShardedUserRepository maintains it instead.
+    A changed email is added to the registered email filter at once.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        directory: bool = True,
+        email_filter: IRegisteredEmailFilter | None = None,
+    ) -> None:
         """
         Initialize repository with database session.
 
         Args:
             session: SQLAlchemy async database session
+            directory: Whether the session's database holds the user directory
+            email_filter: This process's registered email filter, if any
         """
         self._session = session
+        self._directory = SQLAlchemyUserDirectory(session) if directory else None
+        self._email_filter = email_filter
 
     async def create(self, user: User) -> User:
         """Create new user."""
         db_user = self._to_orm(user)
         self._session.add(db_user)
+        if self._directory:
+            self._directory.add(user)
 
         try:
             await self._session.flush()
@@ -45,9 +84,34 @@ class SQLAlchemyUserRepository(IUserRepository):
 
         return self._to_entity(db_user) if db_user else None
 
+    async def get_many_by_ids(self, user_ids: Sequence[UUID]) -> list[User]:
+        """Get users by IDs with a single `id = ANY(:ids)` query."""
+        if not user_ids:
+            return []
+        # One array parameter keeps the statement text identical for any batch size
+        ids = bindparam("user_ids", list(user_ids), type_=ARRAY(Uuid()))
+        stmt = select(UserModel).where(UserModel.id == any_(ids))
+        result = await self._session.execute(stmt)
+
+        return [self._to_entity(db_user) for db_user in result.scalars()]
+
     async def get_by_email(self, email: str) -> User | None:
-        """Get user by email."""
-        stmt = select(UserModel).where(UserModel.email == email)
+        """Get user by email (case-insensitive)."""
+        stmt = select(UserModel).where(func.lower(UserModel.email) == normalize_email(email))
+        result = await self._session.execute(stmt)
+        db_user = result.scalar_one_or_none()
+
+        return self._to_entity(db_user) if db_user else None
+
+    async def get_by_phone(self, phone: str, *, slots: Sequence[int] | None = None) -> User | None:
+        """
+        Get user by phone number (normalized, served by ix_users_phone).
+
+        `slots` keeps the lookup to users of those shard slots.
+        """
+        stmt = select(UserModel).where(UserModel.phone == normalize_phone(phone))
+        if slots is not None:
+            stmt = stmt.where(_in_slots(slots))
         result = await self._session.execute(stmt)
         db_user = result.scalar_one_or_none()
 
@@ -61,6 +125,11 @@ class SQLAlchemyUserRepository(IUserRepository):
 
         if not db_user:
             raise ValueError(f"User with id {user.id} not found!")
+        if self._directory:
+            changed = await self._directory.change_email(user.id, user.email)
+            # Before commit: a rollback leaves only a false positive behind
+            if changed and self._email_filter is not None:
+                self._email_filter.add(user.email)
 
         # Update fields
         db_user.email = user.email
@@ -88,16 +157,120 @@ class SQLAlchemyUserRepository(IUserRepository):
 
         await self._session.delete(db_user)
         await self._session.flush()
+        if self._directory:
+            await self._directory.remove(user_id)
 
         return True
 
     async def exists_by_email(self, email: str) -> bool:
-        """Check if user exists by email."""
-        stmt = select(UserModel).where(UserModel.email == email)
+        """Check if user exists by email (case-insensitive)."""
+        stmt = select(UserModel.id).where(func.lower(UserModel.email) == normalize_email(email))
         result = await self._session.execute(stmt)
 
         return result.scalar_one_or_none() is not None
 
+    async def list_after(
+        self,
+        after_id: UUID | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        *,
+        slots: Sequence[int] | None = None,
+    ) -> list[User]:
+        """
+        List users in creation order, starting after the given ID.
+
+        `slots` keeps the listing to users of those shard slots.
+        """
+        # IDs are UUIDv7, so primary-key order is creation order
+        stmt = select(UserModel).order_by(UserModel.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(UserModel.id > after_id)
+        if slots is not None:
+            stmt = stmt.where(_in_slots(slots))
+        result = await self._session.execute(stmt)
+
+        return [self._to_entity(db_user) for db_user in result.scalars()]
+
+    async def stream(
+        self,
+        user_filter: UserFilter,
+        batch_size: int = 1000,
+        *,
+        slots: Sequence[int] | None = None,
+    ) -> AsyncGenerator[list[UserRow]]:
+        """
+        Yield matching users in creation order, `batch_size` rows per cursor fetch.
+
+        `slots` keeps the stream to users of those shard slots.
+        """
+        # By created_at rather than id, so a date range reads ix_users_created_at
+        stmt = (
+            select(*_row_columns())
+            .where(*_filter_clauses(user_filter, slots=slots))
+            .order_by(UserModel.created_at, UserModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream(stmt)
+        try:
+            async for partition in result.partitions():
+                yield [UserRow._make(row) for row in partition]
+        finally:
+            # Closes the cursor when the caller stops early
+            await result.close()
+
+    async def count_matching(
+        self,
+        user_filter: UserFilter,
+        changes: UserChanges,
+        exclude_id: UUID | None = None,
+        *,
+        slots: Sequence[int] | None = None,
+    ) -> tuple[int, int]:
+        """Users matching the filter, and how many of them `changes` would alter."""
+        values = _changed_values(changes)
+        differs = _differs(values) if values else false()
+        stmt = (
+            select(func.count(), func.count().filter(differs))
+            .select_from(UserModel)
+            .where(*_filter_clauses(user_filter, exclude_id, slots))
+        )
+        matched, changed = (await self._session.execute(stmt)).one()
+        return matched, changed
+
+    async def update_matching(
+        self,
+        user_filter: UserFilter,
+        changes: UserChanges,
+        limit: int,
+        exclude_id: UUID | None = None,
+        *,
+        slots: Sequence[int] | None = None,
+    ) -> list[UserRow]:
+        """
+        Apply changes with `UPDATE ... WHERE id IN (SELECT ... LIMIT ... FOR UPDATE)`.
+
+        `slots` keeps the update to users of those shard slots.
+        """
+        values = _changed_values(changes)
+        if not values:
+            return []
+        chunk = (
+            select(UserModel.id)
+            .where(*_filter_clauses(user_filter, exclude_id, slots), _differs(values))
+            .limit(limit)
+            .with_for_update()
+        )
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id.in_(chunk.scalar_subquery()))
+            # Set explicitly: ETags of the changed users depend on it
+            .values(**values, updated_at=func.now())
+            .returning(*_row_columns())
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return [UserRow._make(row) for row in result]
+
     def _to_entity(self, db_user: UserModel) -> User:
         """
         Convert ORM model to domain entity.
@@ -114,7 +287,7 @@ class SQLAlchemyUserRepository(IUserRepository):
             hashed_password=db_user.hashed_password,
             full_name=db_user.full_name,
             phone=db_user.phone,
-            role=db_user.role,
+            role=Role(db_user.role),
             is_active=db_user.is_active,
             is_verified=db_user.is_verified,
             created_at=db_user.created_at,
@@ -143,3 +316,51 @@ class SQLAlchemyUserRepository(IUserRepository):
             created_at=user.created_at,
             updated_at=user.updated_at,
         )
+
+
+def _row_columns() -> list[ColumnElement[object]]:
+    """The UserRow columns, in order."""
+    return [getattr(UserModel, name) for name in UserRow._fields]
+
+
+def _filter_clauses(
+    user_filter: UserFilter, exclude_id: UUID | None = None, slots: Sequence[int] | None = None
+) -> list[ColumnElement[bool]]:
+    """WHERE clauses for a UserFilter, optionally skipping a user or keeping to shard slots."""
+    clauses: list[ColumnElement[bool]] = []
+    if user_filter.role is not None:
+        clauses.append(UserModel.role == user_filter.role.value)
+    if user_filter.is_active is not None:
+        clauses.append(UserModel.is_active == user_filter.is_active)
+    if user_filter.created_from is not None:
+        clauses.append(UserModel.created_at >= user_filter.created_from)
+    if user_filter.created_to is not None:
+        clauses.append(UserModel.created_at < user_filter.created_to)
+    if exclude_id is not None:
+        clauses.append(UserModel.id != exclude_id)
+    if slots is not None:
+        clauses.append(_in_slots(slots))
+    return clauses
+
+
+def _in_slots(slots: Sequence[int]) -> ColumnElement[bool]:
+    """Users whose id hashes to one of these shard slots."""
+    in_slots = bindparam("slots", list(slots), type_=ARRAY(Integer()))
+    return literal_column(SHARD_SLOT_SQL) == any_(in_slots)
+
+
+def _changed_values(changes: UserChanges) -> dict[str, object]:
+    """Column values a UserChanges sets."""
+    values: dict[str, object] = {}
+    if changes.role is not None:
+        values["role"] = changes.role.value
+    if changes.is_active is not None:
+        values["is_active"] = changes.is_active
+    if changes.is_verified is not None:
+        values["is_verified"] = changes.is_verified
+    return values
+
+
+def _differs(values: dict[str, object]) -> ColumnElement[bool]:
+    """Whether setting `values` would change a row."""
+    return or_(*(getattr(UserModel, name) != value for name, value in values.items()))
@@ -0,0 +1,97 @@
+"""Product repository that can answer catalog reads from stale copies."""
+
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import cast
+from uuid import UUID
+
+from src.core.constants import DEFAULT_PAGE_SIZE
+from src.domain.entities.product import Product
+from src.domain.repositories.product_repository import IProductRepository, ProductSearchHit
+from src.infrastructure.cache.stale_cache import StaleCache
+from src.infrastructure.database.circuit_breaker import DatabaseUnavailableError
+
+# Shared by all requests: lookup key -> last result read for it
+ProductStaleCache = StaleCache[tuple[Hashable, ...], object]
+
+
+class StaleReadProductRepository(IProductRepository):
+    """
+    Request-scoped repository keeping the catalog browsable while the database is down.
+
+    Product lookups, listing pages and search pages are read through the
+    wrapped repository and remembered in an application-scoped StaleCache.
+    When the database circuit breaker is open, the same read is answered
+    from the cache if it is recent enough, and only fails when it is not.
+    Writes and bulk lookups (used by carts and orders, which need current
+    prices and stock) always go to the wrapped repository.
+    """
+
+    def __init__(self, repository: IProductRepository, cache: ProductStaleCache) -> None:
+        """
+        Initialize with the session-bound repository and the shared cache.
+
+        Args:
+            repository: Repository bound to the request's session
+            cache: Application-scoped cache of previous reads
+        """
+        self._repository = repository
+        self._cache = cache
+
+    async def create(self, product: Product) -> Product:
+        """Create a new product."""
+        return await self._repository.create(product)
+
+    async def get_by_id(self, product_id: UUID) -> Product | None:
+        """Get product by ID."""
+        return await self._read(("id", product_id), lambda: self._repository.get_by_id(product_id))
+
+    async def get_many_by_ids(self, product_ids: Sequence[UUID]) -> list[Product]:
+        """Get products by ID."""
+        return await self._repository.get_many_by_ids(product_ids)
+
+    async def get_by_slug(self, slug: str) -> Product | None:
+        """Get product by slug."""
+        return await self._read(("slug", slug), lambda: self._repository.get_by_slug(slug))
+
+    async def update(self, product: Product) -> Product:
+        """Update existing product."""
+        updated = await self._repository.update(product)
+        self._cache.put(("id", updated.id), updated)
+        return updated
+
+    async def list_after(
+        self,
+        category_ids: Sequence[UUID] | None = None,
+        after_id: UUID | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> list[Product]:
+        """List active products, newest first, starting after the given ID."""
+        key = ("list", tuple(category_ids) if category_ids is not None else None, after_id, limit)
+        products = await self._read(
+            key, lambda: self._repository.list_after(category_ids, after_id, limit)
+        )
+        return list(products)
+
+    async def search(
+        self,
+        query: str,
+        after: tuple[float, UUID] | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> list[ProductSearchHit]:
+        """Search active products."""
+        hits = await self._read(
+            ("search", query, after, limit), lambda: self._repository.search(query, after, limit)
+        )
+        return list(hits)
+
+    async def _read[T](self, key: tuple[Hashable, ...], load: Callable[[], Awaitable[T]]) -> T:
+        try:
+            result = await load()
+        except DatabaseUnavailableError:
+            stale = self._cache.get(key)
+            if stale is None:
+                raise
+            return cast(T, stale)
+        if result is not None:
+            self._cache.put(key, result)
+        return result
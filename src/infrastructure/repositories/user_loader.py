@@ -0,0 +1,233 @@
+"""Batched, single-flight user lookups shared across requests."""
+
+import asyncio
+import contextvars
+import math
+import time
+from collections.abc import Coroutine, Iterable, Sequence
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.deadline import get_deadline, start_deadline
+from src.domain.entities.user import User, normalize_email
+from src.infrastructure.cache.stale_cache import StaleCache
+from src.infrastructure.database.circuit_breaker import DatabaseUnavailableError
+from src.infrastructure.repositories.sharded_user_repository import UserRepositoryFactory
+from src.infrastructure.repositories.sqlalchemy.user_repository_impl import (
+    SQLAlchemyUserRepository,
+)
+
+# Lookups are indexed reads taking milliseconds: one in flight with this many
+# seconds left finishes in time for any caller unless the database is stalled
+JOIN_MARGIN = 1.0
+
+
+class UserLoader:
+    """
+    DataLoader-style reader over the user repository.
+
+    - get_by_id calls made in the same event-loop tick are collected and
+      resolved by one `get_many_by_ids` query.
+    - Concurrent lookups for the same id or email share one in-flight query
+      (single-flight) instead of each issuing their own.
+
+    Nothing is cached once a lookup completes, so results are never staler
+    than the query that produced them. The one exception is stale_cache:
+    users loaded by id are remembered there and, while the database circuit
+    breaker is open, answered from it instead of failing, so signed-in users
+    keep being recognised. A lookup by id running for `stall_timeout`
+    seconds is not joined any more: the database is likely stalled, and a
+    fresh lookup fails fast (or is served stale) once the breaker opens,
+    where waiting on the old one would not. Reads use their own short-lived sessions and do
+    not see uncommitted writes of the calling request. Queries go through
+    the repository repository_factory builds for such a session (sharded
+    when user shards are configured).
+
+    A shared query runs under the latest request deadline of its callers,
+    or none if one has no deadline, so a caller with a short timeout cannot
+    fail the lookups of the others. A query in flight is only joined if its
+    deadline is as late as the caller's or at least JOIN_MARGIN away.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        max_batch_size: int = 500,
+        repository_factory: UserRepositoryFactory = SQLAlchemyUserRepository,
+        stale_cache: StaleCache[UUID, User] | None = None,
+        stall_timeout: float | None = None,
+    ) -> None:
+        self._session_maker = session_maker
+        self._repository_factory = repository_factory
+        self._stale_cache = stale_cache
+        self._stall_timeout = stall_timeout
+        self._max_batch_size = max_batch_size
+        self._pending_ids: dict[UUID, asyncio.Future[User | None]] = {}
+        # Latest deadline (monotonic time, inf for none) of the pending callers
+        self._pending_expires = -math.inf
+        self._inflight_ids: dict[UUID, asyncio.Future[User | None]] = {}
+        # When each lookup in flight started, and the deadline it runs under
+        self._inflight_started: dict[UUID, tuple[float, float]] = {}
+        self._inflight_emails: dict[str, tuple[asyncio.Future[User | None], float]] = {}
+        self._dispatch_scheduled = False
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, user_id: UUID) -> User | None:
+        """Load one user by ID, batched with other loads in this tick."""
+        return await asyncio.shield(self._future_for_id(user_id))
+
+    async def load_many(self, user_ids: Sequence[UUID]) -> list[User]:
+        """Load several users by ID. Missing IDs are omitted."""
+        futures = [
+            asyncio.shield(self._future_for_id(user_id)) for user_id in dict.fromkeys(user_ids)
+        ]
+        users = await asyncio.gather(*futures)
+        return [user for user in users if user is not None]
+
+    async def load_by_email(self, email: str) -> User | None:
+        """Load one user by email, sharing any identical in-flight lookup."""
+        email = normalize_email(email)
+        expires = _caller_expires()
+        inflight = self._inflight_emails.get(email)
+        if inflight is not None and _joinable(inflight[1], expires):
+            future = inflight[0]
+        else:
+            future = asyncio.get_running_loop().create_future()
+            future.add_done_callback(_retrieve_exception)
+            self._inflight_emails[email] = (future, expires)
+            self._spawn(self._fetch_by_email(email, future), expires)
+        return await asyncio.shield(future)
+
+    def forget(self, user_ids: Iterable[UUID]) -> None:
+        """
+        Drop what the loader holds on users changed without it, e.g. by a bulk update.
+
+        Their stale copies are discarded, and lookups already running, which
+        may have read them before the change, are not joined any more.
+        """
+        for user_id in user_ids:
+            if self._stale_cache is not None:
+                self._stale_cache.discard(user_id)
+            if self._inflight_ids.pop(user_id, None) is not None:
+                del self._inflight_started[user_id]
+
+    def _future_for_id(self, user_id: UUID) -> asyncio.Future[User | None]:
+        expires = _caller_expires()
+        future = self._pending_ids.get(user_id)
+        if future is not None:
+            self._pending_expires = max(self._pending_expires, expires)
+            return future
+        future = self._inflight_ids.get(user_id)
+        if (
+            future is not None
+            and not self._stalled(user_id)
+            and _joinable(self._inflight_started[user_id][1], expires)
+        ):
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        future.add_done_callback(_retrieve_exception)
+        self._pending_ids[user_id] = future
+        self._pending_expires = max(self._pending_expires, expires)
+        if not self._dispatch_scheduled:
+            # Runs after every callback already queued for this loop iteration
+            self._dispatch_scheduled = True
+            loop.call_soon(self._dispatch)
+        return future
+
+    def _dispatch(self) -> None:
+        self._dispatch_scheduled = False
+        pending, self._pending_ids = self._pending_ids, {}
+        expires, self._pending_expires = self._pending_expires, -math.inf
+        self._inflight_ids.update(pending)
+        self._inflight_started.update(dict.fromkeys(pending, (time.monotonic(), expires)))
+
+        items = list(pending.items())
+        for start in range(0, len(items), self._max_batch_size):
+            batch = dict(items[start : start + self._max_batch_size])
+            self._spawn(self._fetch_batch(batch), expires)
+
+    async def _fetch_batch(self, batch: dict[UUID, asyncio.Future[User | None]]) -> None:
+        try:
+            async with self._session_maker() as session:
+                users = await self._repository_factory(session).get_many_by_ids(list(batch))
+            found = {user.id: user for user in users}
+            for user_id, future in batch.items():
+                if not future.done():
+                    future.set_result(found.get(user_id))
+            if self._stale_cache is not None:
+                for user in users:
+                    # Unless forgotten meanwhile: the user may have been read before a change
+                    if self._inflight_ids.get(user.id) is batch[user.id]:
+                        self._stale_cache.put(user.id, user)
+        except DatabaseUnavailableError as e:
+            for user_id, future in batch.items():
+                if future.done():
+                    continue
+                stale = self._stale_cache.get(user_id) if self._stale_cache else None
+                if stale is None:
+                    future.set_exception(e)
+                else:
+                    future.set_result(stale)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for user_id, future in batch.items():
+                # A stalled lookup may have been replaced by a newer one
+                if self._inflight_ids.get(user_id) is future:
+                    del self._inflight_ids[user_id]
+                    del self._inflight_started[user_id]
+
+    def _stalled(self, user_id: UUID) -> bool:
+        return (
+            self._stall_timeout is not None
+            and time.monotonic() - self._inflight_started[user_id][0] >= self._stall_timeout
+        )
+
+    async def _fetch_by_email(self, email: str, future: asyncio.Future[User | None]) -> None:
+        try:
+            async with self._session_maker() as session:
+                future.set_result(await self._repository_factory(session).get_by_email(email))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            # A caller with a later deadline may have started a newer lookup
+            if self._inflight_emails.get(email, (None,))[0] is future:
+                del self._inflight_emails[email]
+
+    def _spawn(self, coro: Coroutine[Any, Any, None], expires: float) -> None:
+        """
+        Run a fetch independently of the caller, so one cancelled waiter cannot abort it.
+
+        It runs in a fresh context rather than a copy of the caller's, under
+        the deadline `expires` (none for inf) instead of the caller's own.
+        """
+        context = contextvars.Context()
+        if expires != math.inf:
+            context.run(start_deadline, max(expires - time.monotonic(), 0.0))
+        task = asyncio.create_task(coro, context=context)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+def _caller_expires() -> float:
+    """Deadline of the calling request in monotonic time, inf without one."""
+    deadline = get_deadline()
+    return deadline.expires_at if deadline is not None else math.inf
+
+
+def _joinable(inflight_expires: float, expires: float) -> bool:
+    """Whether a caller with deadline `expires` may wait on a query with `inflight_expires`."""
+    return inflight_expires >= min(expires, time.monotonic() + JOIN_MARGIN)
+
+
+def _retrieve_exception(future: asyncio.Future[User | None]) -> None:
+    # Every waiter may have given up (a timed out request) before the lookup
+    # failed; without this asyncio logs the unread exception
+    if not future.cancelled():
+        future.exception()
@@ -0,0 +1,137 @@
+"""Buffered authentication event recorder."""
+
+import asyncio
+from datetime import UTC, date, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.interfaces.auth_event_recorder import IAuthEventRecorder
+from src.core.logging import get_logger
+from src.domain.entities.auth_event import AuthEvent
+from src.infrastructure.repositories.sqlalchemy.auth_event_repository_impl import (
+    SQLAlchemyAuthEventRepository,
+)
+
+logger = get_logger(__name__)
+
+
+class BufferedAuthEventRecorder(IAuthEventRecorder):
+    """
+    Records auth events in memory and writes them in batches from a background task.
+
+    - record() only enqueues; request handlers never wait on the database.
+    - The queue is bounded. When full, record() waits up to enqueue_timeout
+      (backpressure) and then drops the event rather than stalling logins.
+    - On stop(), queued events are flushed for up to shutdown_timeout; anything
+      still queued after that is dropped and counted.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        *,
+        max_queue_size: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        enqueue_timeout: float = 0.05,
+        shutdown_timeout: float = 5.0,
+    ) -> None:
+        self._session_maker = session_maker
+        self._queue: asyncio.Queue[AuthEvent] = asyncio.Queue(maxsize=max_queue_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._enqueue_timeout = enqueue_timeout
+        self._shutdown_timeout = shutdown_timeout
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+        self._partition_month: date | None = None
+        self.dropped = 0
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="auth-event-recorder")
+
+    async def stop(self) -> None:
+        """Flush queued events and stop, dropping whatever is left after the timeout."""
+        if self._task is None:
+            return
+        self._stopping = True
+        try:
+            await asyncio.wait_for(self._task, timeout=self._shutdown_timeout)
+        except TimeoutError:
+            self.dropped += self._queue.qsize()
+            logger.warning(
+                "Auth event flush timed out on shutdown",
+                extra={"dropped": self._queue.qsize()},
+            )
+        self._task = None
+        if self.dropped:
+            logger.warning("Auth events dropped", extra={"dropped": self.dropped})
+
+    async def record(self, event: AuthEvent) -> None:
+        """Enqueue an event, applying bounded backpressure when the queue is full."""
+        if self._stopping:
+            self.dropped += 1
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(self._queue.put(event), timeout=self._enqueue_timeout)
+            except TimeoutError:
+                self.dropped += 1
+
+    async def _run(self) -> None:
+        """Flush batches until stopped and the queue is drained."""
+        while not (self._stopping and self._queue.empty()):
+            batch = await self._next_batch()
+            if batch:
+                await self._flush(batch)
+
+    async def _next_batch(self) -> list[AuthEvent]:
+        """Collect up to batch_size events, waiting at most flush_interval."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval
+        batch: list[AuthEvent] = []
+
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if self._stopping or remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except TimeoutError:
+                break
+
+        return batch
+
+    async def _flush(self, batch: list[AuthEvent]) -> None:
+        """Write one batch; a failed batch is logged and dropped."""
+        try:
+            async with self._session_maker() as session, session.begin():
+                repository = SQLAlchemyAuthEventRepository(session)
+                await self._ensure_partitions(repository)
+                await repository.add_many(batch)
+        except Exception:
+            self.dropped += len(batch)
+            logger.exception("Failed to write auth events", extra={"batch_size": len(batch)})
+
+    async def _ensure_partitions(self, repository: SQLAlchemyAuthEventRepository) -> None:
+        """Create this month's and next month's partitions once per month."""
+        this_month = datetime.now(UTC).date().replace(day=1)
+        if self._partition_month == this_month:
+            return
+        next_month = (
+            date(this_month.year + 1, 1, 1)
+            if this_month.month == 12
+            else this_month.replace(month=this_month.month + 1)
+        )
+        await repository.ensure_monthly_partition(this_month)
+        await repository.ensure_monthly_partition(next_month)
+        self._partition_month = this_month
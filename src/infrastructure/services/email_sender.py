@@ -0,0 +1,28 @@
+"""Local email sink used until a real mail provider is configured."""
+
+from dataclasses import dataclass
+
+from src.application.interfaces.email_sender import IEmailSender
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class SentEmail:
+    """An email captured by the in-memory sink."""
+
+    to: str
+    subject: str
+    body: str
+
+
+class InMemoryEmailSender(IEmailSender):
+    """Keeps sent emails in memory and logs them; nothing leaves the process."""
+
+    def __init__(self) -> None:
+        self.sent: list[SentEmail] = []
+
+    async def send(self, to: str, subject: str, body: str) -> None:
+        self.sent.append(SentEmail(to=to, subject=subject, body=body))
+        logger.info("Email captured", extra={"to": to, "subject": subject})
@@ -0,0 +1,109 @@
+"""Asymmetric JWT signing keys and the published JWKS document."""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from jose import jwk
+from jose.backends.base import Key
+
+from src.core.config import get_settings
+
+# Algorithms signed with a private key and verifiable with a published public key
+ASYMMETRIC_ALGORITHMS = frozenset(
+    {"RS256", "RS384", "RS512", "ES256", "ES384", "ES512", "PS256", "PS384", "PS512"}
+)
+
+
+@dataclass(frozen=True)
+class JwksDocument:
+    """Pre-serialized JWKS body with its ETag."""
+
+    body: bytes
+    etag: str
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    """A parsed signing key pair identified by its kid."""
+
+    kid: str
+    private_key: Key
+    public_key: Key
+
+
+class KeyRing:
+    """
+    Signing keys loaded from PEM files, one per kid.
+
+    Rotation: add a new `<kid>.pem`, point JWT_ACTIVE_KID at it, and remove the
+    old file once tokens signed with it have expired. Every loaded key is
+    published in the JWKS so tokens signed with a retiring key still verify.
+    """
+
+    def __init__(self, keys: dict[str, SigningKey], active_kid: str, algorithm: str) -> None:
+        if active_kid not in keys:
+            raise ValueError(f"Active JWT key '{active_kid}' was not found")
+        self._keys = keys
+        self._active = keys[active_kid]
+        self._algorithm = algorithm
+        self._jwks = self._build_jwks()
+
+    @classmethod
+    def from_directory(cls, path: Path, active_kid: str, algorithm: str) -> KeyRing:
+        """Load every `<kid>.pem` private key in a directory."""
+        keys: dict[str, SigningKey] = {}
+        for pem_file in sorted(path.glob("*.pem")):
+            private_key = jwk.construct(pem_file.read_text(), algorithm)
+            keys[pem_file.stem] = SigningKey(
+                kid=pem_file.stem,
+                private_key=private_key,
+                public_key=private_key.public_key(),
+            )
+        return cls(keys, active_kid, algorithm)
+
+    @property
+    def active(self) -> SigningKey:
+        """Key used to sign new tokens."""
+        return self._active
+
+    @property
+    def jwks(self) -> JwksDocument:
+        """Public keys as a serialized JWKS document."""
+        return self._jwks
+
+    def public_key(self, kid: str) -> Key | None:
+        """Get the parsed public key for a kid, or None if unknown."""
+        key = self._keys.get(kid)
+        return key.public_key if key else None
+
+    def _build_jwks(self) -> JwksDocument:
+        """Serialize the public keys once; the document only changes with the key set."""
+        keys = [
+            {**key.public_key.to_dict(), "kid": key.kid, "use": "sig", "alg": self._algorithm}
+            for key in self._keys.values()
+        ]
+        body = json.dumps({"keys": keys}, separators=(",", ":"), sort_keys=True).encode()
+        return JwksDocument(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+EMPTY_JWKS = JwksDocument(body=b'{"keys":[]}', etag='"empty"')
+
+
+@lru_cache
+def get_key_ring() -> KeyRing | None:
+    """
+    Return the key ring for asymmetric algorithms, loading it on first use.
+
+    Returns None when tokens are signed with the shared SECRET_KEY (HS*).
+    """
+    settings = get_settings()
+    if settings.algorithm not in ASYMMETRIC_ALGORITHMS:
+        return None
+    if not settings.jwt_keys_dir or not settings.jwt_active_kid:
+        raise ValueError(f"JWT_KEYS_DIR and JWT_ACTIVE_KID are required for {settings.algorithm}")
+    return KeyRing.from_directory(
+        Path(settings.jwt_keys_dir), settings.jwt_active_kid, settings.algorithm
+    )
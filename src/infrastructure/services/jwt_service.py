@@ -1,23 +1,36 @@
 """JWT tokekn service implementation."""
 
 from datetime import UTC, datetime, timedelta
+from typing import Any
 from uuid import UUID
 
 from jose import JWTError, jwt
+from jose.backends.base import Key
 
 from src.application.interfaces.token_service import ITokenService
-from src.core.config import settings
+from src.core.config import get_settings
 from src.domain.exceptions.auth import TokenError
+from src.infrastructure.services.jwt_keys import get_key_ring
 
 
 class JWTService(ITokenService):
-    """JWT implementation of token service."""
+    """
+    JWT implementation of token service.
+
+    Signs with the shared SECRET_KEY for HS* algorithms, or with the active
+    key of the key ring (adding a `kid` header) for asymmetric algorithms.
+    """
 
     def __init__(self) -> None:
+        settings = get_settings()
         self._secret_key = settings.secret_key
         self._algorithm = settings.algorithm
+        self._key_ring = get_key_ring()
         self._access_token_expire = timedelta(minutes=settings.access_token_expire_minutes)
         self._refresh_token_expire = timedelta(days=settings.refresh_token_expire_days)
+        self._email_verification_expire = timedelta(
+            hours=settings.email_verification_token_expire_hours
+        )
 
     def create_access_token(self, user_id: UUID, role: str) -> str:
         expire = datetime.now(UTC) + self._access_token_expire
@@ -28,7 +41,7 @@ class JWTService(ITokenService):
             "exp": expire,
             "iat": datetime.now(UTC),
         }
-        return jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
+        return self._encode(payload)
 
     def create_refresh_token(self, user_id: UUID) -> str:
         expire = datetime.now(UTC) + self._refresh_token_expire
@@ -38,23 +51,60 @@ class JWTService(ITokenService):
             "exp": expire,
             "iat": datetime.now(UTC),
         }
-        return jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
+        return self._encode(payload)
+
+    def create_email_verification_token(self, user_id: UUID, email: str) -> str:
+        expire = datetime.now(UTC) + self._email_verification_expire
+        payload = {
+            "sub": str(user_id),
+            "email": email,
+            "type": "email_verification",
+            "exp": expire,
+            "iat": datetime.now(UTC),
+        }
+        return self._encode(payload)
 
-    def verify_access_token(self, token: str) -> dict:
+    def verify_access_token(self, token: str) -> dict[str, Any]:
         payload = self._decode_token(token)
         if payload.get("type") != "access":
             raise TokenError("Invalid token type")
         return payload
 
-    def verify_refresh_token(self, token: str) -> dict:
+    def verify_refresh_token(self, token: str) -> dict[str, Any]:
         payload = self._decode_token(token)
         if payload.get("type") != "refresh":
             raise TokenError("Invalid token type")
         return payload
 
-    def _decond_token(self, token: str) -> dict:
+    def verify_email_verification_token(self, token: str) -> dict[str, Any]:
+        payload = self._decode_token(token)
+        if payload.get("type") != "email_verification":
+            raise TokenError("Invalid token type")
+        return payload
+
+    def _encode(self, payload: dict[str, Any]) -> str:
+        if self._key_ring is None:
+            return jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
+        signing_key = self._key_ring.active
+        return jwt.encode(
+            payload,
+            signing_key.private_key,
+            algorithm=self._algorithm,
+            headers={"kid": signing_key.kid},
+        )
+
+    def _decode_token(self, token: str) -> dict[str, Any]:
         try:
-            payload = jwt.decode(token, self._secret_key, algorithms=[self._algorithm])
+            payload = jwt.decode(token, self._verification_key(token), algorithms=[self._algorithm])
             return payload
         except JWTError as e:
             raise TokenError(f"Token validation failed: {str(e)}") from e
+
+    def _verification_key(self, token: str) -> str | Key:
+        if self._key_ring is None:
+            return self._secret_key
+        kid = jwt.get_unverified_header(token).get("kid")
+        public_key = self._key_ring.public_key(kid) if kid else None
+        if public_key is None:
+            raise TokenError("Unknown signing key")
+        return public_key
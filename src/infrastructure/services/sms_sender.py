@@ -0,0 +1,29 @@
+"""Local SMS sink used until a real SMS gateway is configured."""
+
+from dataclasses import dataclass
+
+from src.application.interfaces.sms_sender import ISmsSender
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class SentSms:
+    """A text message captured by the in-memory sink."""
+
+    to: str
+    body: str
+
+
+class InMemorySmsSender(ISmsSender):
+    """Keeps sent messages in memory and logs the recipient; nothing leaves the process."""
+
+    def __init__(self, max_messages: int = 1000) -> None:
+        self._max_messages = max_messages
+        self.sent: list[SentSms] = []
+
+    async def send(self, to: str, body: str) -> None:
+        self.sent.append(SentSms(to=to, body=body))
+        del self.sent[: -self._max_messages]
+        logger.info("SMS captured", extra={"to": to})
@@ -1,27 +1,69 @@
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+import math
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import timedelta
+from typing import TYPE_CHECKING
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
-from src.core.config import settings
+from src.core.config import get_settings
 from src.core.logging import get_logger, setup_logging
-from src.infrastructure.database import engine
-from src.presentation.api.v1.routers import auth
+from src.core.metrics import Counter, render_metrics
+from src.infrastructure.database import dispose_engine, get_engine, get_session_maker
+
+if TYPE_CHECKING:
+    from src.application.interfaces.cart_store import ICartStore
+    from src.application.interfaces.event_sink import IEventSink
+    from src.application.interfaces.idempotency_store import IIdempotencyStore
+    from src.application.interfaces.otp_store import IOtpStore
+    from src.infrastructure.database.sharding import UserShards
 
-# Setup logging
-setup_logging()
 logger = get_logger(__name__)
 
+# SQLSTATE raised when statement_timeout cancels a query
+QUERY_CANCELED_SQLSTATE = "57014"
+
+statement_timeout_total = Counter(
+    "db_statement_timeout_total", "Queries cancelled by the request deadline"
+)
+
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
     Application lifespan manager.
 
-    Handles startup and shutdown events.
+    Handles startup and shutdown events. Logging is configured here rather
+    than at import time; the database engine is created on first use.
     """
+    # Background services are imported here so `import src.main` stays cheap
+    from src.application.interfaces.token_service import ITokenService
+    from src.infrastructure.cache.cart_flusher import CartFlusher
+    from src.infrastructure.cache.category_tree import InMemoryCategoryTree
+    from src.infrastructure.cache.email_filter import BloomEmailFilter
+    from src.infrastructure.cache.recommendation_index import MmapRecommendationIndex
+    from src.infrastructure.cache.report_cache import InMemoryReportCache
+    from src.infrastructure.cache.serviceability_index import InMemoryServiceabilityIndex
+    from src.infrastructure.cache.stale_cache import StaleCache
+    from src.infrastructure.events.dispatcher import OutboxDispatcher
+    from src.infrastructure.jobs.handlers import register_job_handlers
+    from src.infrastructure.jobs.registry import JobRegistry
+    from src.infrastructure.jobs.report_refresher import ReportRefresher
+    from src.infrastructure.jobs.reservation_sweeper import ReservationSweeper
+    from src.infrastructure.jobs.runner import JobRunner
+    from src.infrastructure.repositories.sharded_user_repository import user_repository_factory
+    from src.infrastructure.repositories.user_loader import UserLoader
+    from src.infrastructure.services.auth_event_recorder import BufferedAuthEventRecorder
+    from src.infrastructure.services.email_sender import InMemoryEmailSender
+    from src.infrastructure.services.sms_sender import InMemorySmsSender
+    from src.presentation.api.wiring import build_container
+
+    settings = get_settings()
+
     # Startup
+    setup_logging()
     logger.info(
         "Application starting...",
         extra={
@@ -39,7 +81,7 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
         else "unknown"
     )
     logger.info(
-        "Database engine initialized",
+        "Database engine configured",
         extra={
             "host": db_host,
             "pool_size": settings.database.pool_size,
@@ -47,43 +89,368 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
         },
     )
 
-    yield
+    # Every service's stop is registered as it starts, so shutdown unwinds
+    # in reverse order, also when a later startup step fails, and a stop
+    # that raises does not skip the ones after it
+    async with AsyncExitStack() as stack:
+        stack.push_async_callback(_dispose_database)
+        stack.push_async_callback(app.state.idempotency_store.close)
+
+        # Background writer for the authentication audit log
+        auth_event_recorder = BufferedAuthEventRecorder(
+            get_session_maker(),
+            max_queue_size=settings.auth_event_queue_size,
+            batch_size=settings.auth_event_batch_size,
+            flush_interval=settings.auth_event_flush_interval,
+            enqueue_timeout=settings.auth_event_enqueue_timeout,
+            shutdown_timeout=settings.auth_event_shutdown_timeout,
+        )
+        await auth_event_recorder.start()
+        stack.push_async_callback(_stop, "Flushing auth events...", auth_event_recorder.stop)
+        app.state.auth_event_recorder = auth_event_recorder
+
+        # Services and use cases resolved by request handlers; shared services
+        # set on app.state below are looked up when first resolved
+        app.state.container = build_container(app.state)
+
+        # Users are spread over shard databases when extra ones are configured
+        user_shards = _create_user_shards()
+        if user_shards is not None:
+            await user_shards.start()
+            stack.push_async_callback(_stop, "Closing user shards...", user_shards.stop)
+
+        # Registered emails in memory, so most availability checks skip the
+        # database; loaded from its snapshot and caught up in the background.
+        # The app's repositories add the emails users change to at once
+        email_filter = BloomEmailFilter(
+            get_session_maker(),
+            user_repository_factory(user_shards),
+            settings.email_filter_path,
+            false_positive_rate=settings.email_filter_false_positive_rate,
+            refresh_interval=settings.email_filter_refresh_interval,
+            snapshot_interval=settings.email_filter_snapshot_interval,
+        )
+        await email_filter.start()
+        stack.push_async_callback(email_filter.stop)
+        app.state.email_filter = email_filter
+        app.state.user_repository_factory = user_repository_factory(user_shards, email_filter)
+
+        # Batched, single-flight user reads shared by all requests; users and
+        # catalog reads are also kept to serve stale while the database is down
+        stale_cache_size = settings.database.stale_cache_size
+        stale_max_age = settings.database.stale_max_age
+        app.state.user_loader = UserLoader(
+            get_session_maker(),
+            repository_factory=app.state.user_repository_factory,
+            stale_cache=StaleCache("users", stale_cache_size, stale_max_age),
+            stall_timeout=settings.database.breaker_slow_call_duration,
+        )
+        app.state.product_stale_cache = StaleCache("products", stale_cache_size, stale_max_age)
+
+        # Phone login codes and the SMS channel that delivers them
+        app.state.otp_store = _create_otp_store()
+        app.state.sms_sender = InMemorySmsSender()
+
+        # Category hierarchy served from memory, refreshed from updated_at
+        category_tree = InMemoryCategoryTree(
+            get_session_maker(), refresh_interval=settings.category_tree_refresh_interval
+        )
+        await category_tree.start()
+        stack.push_async_callback(category_tree.stop)
+        app.state.category_tree = category_tree
+
+        # Delivery zones indexed in memory for serviceability lookups
+        serviceability_index = InMemoryServiceabilityIndex(
+            get_session_maker(),
+            refresh_interval=settings.delivery_zone_refresh_interval,
+            cell_size=settings.delivery_grid_cell_size,
+        )
+        await serviceability_index.start()
+        stack.push_async_callback(serviceability_index.stop)
+        app.state.serviceability_index = serviceability_index
+
+        # Co-purchase neighbours built offline, memory-mapped and shared by workers
+        recommendation_index = MmapRecommendationIndex(
+            settings.recommendations_path,
+            reload_interval=settings.recommendations_reload_interval,
+        )
+        await recommendation_index.start()
+        stack.push_async_callback(recommendation_index.stop)
+        app.state.recommendation_index = recommendation_index
+
+        # Carts live in the hot store and are written behind to Postgres
+        app.state.cart_store = _create_cart_store()
+        cart_flusher = CartFlusher(
+            app.state.cart_store,
+            get_session_maker(),
+            flush_interval=settings.cart_flush_interval,
+            batch_size=settings.cart_flush_batch_size,
+        )
+        await cart_flusher.start()
+        stack.push_async_callback(_stop, "Flushing carts...", cart_flusher.stop)
+
+        # Returns stock held by orders that were not confirmed in time
+        reservation_sweeper = ReservationSweeper(
+            get_session_maker(),
+            sweep_interval=settings.reservation_sweep_interval,
+            batch_size=settings.reservation_sweep_batch_size,
+        )
+        await reservation_sweeper.start()
+        stack.push_async_callback(
+            _stop, "Stopping reservation sweeper...", reservation_sweeper.stop
+        )
+
+        # Admin reports are served from summary tables kept current in the background
+        app.state.report_cache = InMemoryReportCache(
+            ttl=settings.report_cache_ttl,
+            max_entries=settings.report_cache_max_entries,
+            max_stale=settings.database.stale_max_age,
+        )
+        report_refresher = ReportRefresher(
+            get_session_maker(),
+            refresh_interval=settings.report_refresh_interval,
+            settle=timedelta(seconds=settings.report_settle_seconds),
+            max_window=timedelta(seconds=settings.report_max_window),
+            time_zone=settings.report_time_zone,
+        )
+        await report_refresher.start()
+        stack.push_async_callback(_stop, "Stopping report refresher...", report_refresher.stop)
+
+        # Background job workers (verification emails, ...)
+        app.state.email_sender = InMemoryEmailSender()
+        job_registry = JobRegistry()
+        register_job_handlers(
+            job_registry,
+            email_sender=app.state.email_sender,
+            token_service=app.state.container.resolve(ITokenService),
+        )
+        job_runner = JobRunner(
+            get_session_maker(),
+            job_registry,
+            concurrency=settings.job_concurrency,
+            batch_size=settings.job_batch_size,
+            poll_interval=settings.job_poll_interval,
+            retry_backoff=settings.job_retry_backoff,
+            lock_timeout=settings.job_lock_timeout,
+            shutdown_timeout=settings.job_shutdown_timeout,
+        )
+        await job_runner.start()
+        stack.push_async_callback(_stop, "Stopping job workers...", job_runner.stop)
+
+        # Publishes domain events committed to the outbox
+        app.state.event_sink = _create_event_sink()
+        outbox_dispatcher = OutboxDispatcher(
+            get_engine(),
+            app.state.event_sink,
+            batch_size=settings.outbox_batch_size,
+            poll_interval=settings.outbox_poll_interval,
+        )
+        await outbox_dispatcher.start()
+        stack.push_async_callback(_stop, "Stopping outbox dispatcher...", outbox_dispatcher.stop)
+
+        yield
 
-    # Shutdown
-    logger.info("Disposing database engine...")
-    await engine.dispose()
     logger.info("Application shutdown complete")
 
 
-# Create app
-app = FastAPI(
-    title=settings.app_name,
-    version=settings.app_version,
-    description="Dhakacart API",
-    docs_url=f"{settings.api_prefix}/docs",
-    redoc_url=f"{settings.api_prefix}/redoc",
-    openapi_url=f"{settings.api_prefix}/openapi.json",
-    debug=settings.debug,
-    lifespan=lifespan,
-)
+def create_app() -> FastAPI:
+    """
+    Application factory.
 
-# CORS Middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    Run with ``uvicorn src.main:create_app --factory``. Settings are loaded and
+    routers imported only when the app is built, so importing this module has
+    no side effects.
+    """
+    # Routers, middleware and error types are imported here so `import src.main`
+    # does not pull them in
+    from sqlalchemy.exc import DBAPIError
+
+    from src.infrastructure.database.circuit_breaker import DatabaseUnavailableError
+    from src.presentation.api.v1.routers import (
+        auth,
+        cart,
+        categories,
+        delivery,
+        orders,
+        products,
+        reports,
+        users,
+        well_known,
+    )
+    from src.presentation.middleware.compression import (
+        CompressionMiddleware,
+        available_encoders,
+    )
+    from src.presentation.middleware.deadline import DeadlineMiddleware
+    from src.presentation.middleware.idempotency import IdempotencyMiddleware
+
+    settings = get_settings()
+
+    app = FastAPI(
+        title=settings.app_name,
+        version=settings.app_version,
+        description="Dhakacart API",
+        docs_url=f"{settings.api_prefix}/docs",
+        redoc_url=f"{settings.api_prefix}/redoc",
+        openapi_url=f"{settings.api_prefix}/openapi.json",
+        debug=settings.debug,
+        lifespan=lifespan,
+    )
+
+    # Middleware runs outermost-last: CORS -> compression -> deadline -> idempotency -> routes
+    # Idempotency-Key replay for POST requests; keys stay reserved for as long
+    # as the longest route deadline (bulk user updates) lets a request run
+    app.state.idempotency_store = _create_idempotency_store()
+    app.add_middleware(
+        IdempotencyMiddleware,
+        store=app.state.idempotency_store,
+        ttl=settings.idempotency_ttl,
+        reservation_ttl=math.ceil(max(settings.request_timeout_max, settings.user_bulk_timeout))
+        + 1,
+        in_flight_timeout=settings.idempotency_wait_timeout,
+        max_request_bytes=settings.idempotency_max_request_bytes,
+    )
+
+    # Request deadlines and cancellation on client disconnect
+    app.add_middleware(
+        DeadlineMiddleware,
+        default_timeout=settings.request_timeout,
+        max_timeout=settings.request_timeout_max,
+    )
+
+    # Response compression negotiated from Accept-Encoding
+    app.add_middleware(
+        CompressionMiddleware,
+        encoders=available_encoders(
+            gzip_level=settings.compression_gzip_level,
+            brotli_quality=settings.compression_brotli_quality,
+            zstd_level=settings.compression_zstd_level,
+        ),
+        minimum_size=settings.compression_minimum_size,
+        offload_size=settings.compression_offload_size,
+    )
+
+    # CORS Middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    app.add_exception_handler(DBAPIError, database_error_handler)
+    app.add_exception_handler(DatabaseUnavailableError, database_unavailable_handler)
+
+    # Routers
+    app.include_router(auth.router, prefix=settings.api_prefix)
+    app.include_router(cart.router, prefix=settings.api_prefix)
+    app.include_router(categories.router, prefix=settings.api_prefix)
+    app.include_router(delivery.router, prefix=settings.api_prefix)
+    app.include_router(orders.router, prefix=settings.api_prefix)
+    app.include_router(products.router, prefix=settings.api_prefix)
+    app.include_router(reports.router, prefix=settings.api_prefix)
+    app.include_router(users.router, prefix=settings.api_prefix)
+    app.include_router(well_known.router)
+
+    app.add_api_route("/", root, methods=["GET"], tags=["Root"])
+    app.add_api_route("/health", health_check, methods=["GET"], tags=["Health"])
+    app.add_api_route("/health/ready", readiness_check, methods=["GET"], tags=["Health"])
+    app.add_api_route(
+        "/metrics", metrics, methods=["GET"], tags=["Health"], include_in_schema=False
+    )
 
-# Routers
-app.include_router(auth.router, prefix=settings.api_prefix)
+    return app
+
+
+def _create_idempotency_store() -> IIdempotencyStore:
+    """Build the configured idempotency store backend."""
+    settings = get_settings()
+    if settings.idempotency_backend == "redis":
+        from src.infrastructure.cache.redis_idempotency_store import RedisIdempotencyStore
+
+        return RedisIdempotencyStore(settings.redis_url)
+
+    from src.infrastructure.cache.memory_idempotency_store import InMemoryIdempotencyStore
+
+    return InMemoryIdempotencyStore(max_entries=settings.idempotency_max_entries)
+
+
+def _create_cart_store() -> ICartStore:
+    """Build the configured cart store backend."""
+    settings = get_settings()
+    if settings.cart_backend == "redis":
+        from src.infrastructure.cache.redis_cart_store import RedisCartStore
+
+        return RedisCartStore(settings.redis_url, ttl=settings.cart_ttl)
+
+    from src.infrastructure.cache.memory_cart_store import InMemoryCartStore
+
+    return InMemoryCartStore(max_entries=settings.cart_max_entries)
+
+
+def _create_otp_store() -> IOtpStore:
+    """Build the configured login code store backend."""
+    settings = get_settings()
+    if settings.otp_backend == "redis":
+        from src.infrastructure.cache.redis_otp_store import RedisOtpStore
+
+        return RedisOtpStore(settings.redis_url)
+
+    from src.infrastructure.cache.memory_otp_store import InMemoryOtpStore
+
+    return InMemoryOtpStore()
+
+
+def _create_user_shards() -> UserShards | None:
+    """Build the user shard set, or None when users live in the primary only."""
+    from src.infrastructure.database.sharding import UserShards
+
+    database = get_settings().database
+    if not database.user_shard_urls:
+        return None
+    return UserShards(
+        get_session_maker(),
+        database.user_shard_urls,
+        pool_size=database.pool_size,
+        max_overflow=database.max_overflow,
+        echo=database.echo,
+        map_refresh_interval=database.user_shard_map_refresh_interval,
+        email_cache_size=database.user_email_cache_size,
+    )
+
+
+def _create_event_sink() -> IEventSink:
+    """Build the configured domain event sink."""
+    from src.infrastructure.events.sinks import (
+        FileEventSink,
+        InMemoryEventSink,
+        LoggingEventSink,
+    )
+
+    settings = get_settings()
+    if settings.event_sink == "file":
+        return FileEventSink(settings.event_sink_path)
+    if settings.event_sink == "memory":
+        return InMemoryEventSink()
+    return LoggingEventSink()
+
+
+async def _stop(message: str, stop: Callable[[], Awaitable[None]]) -> None:
+    logger.info(message)
+    await stop()
+
+
+async def _dispose_database() -> None:
+    logger.info("Disposing database engine...")
+    await dispose_engine()
+    get_session_maker.cache_clear()
 
 
 # Root endpoint
-@app.get("/", tags=["Root"])
 async def root() -> dict[str, str]:
     """Root endpoint."""
+    settings = get_settings()
     return {
         "message": "Welcome to Dhakacart",
         "docs": f"{settings.api_prefix}/docs",
@@ -92,13 +459,63 @@ async def root() -> dict[str, str]:
 
 
 # Health check endpoint
-@app.get("/health", tags=["Health"])
 async def health_check() -> dict[str, str | bool]:
     """Health check endpoint."""
     logger.debug("Health check called")
+    settings = get_settings()
     return {
         "status": "healthy",
         "app": settings.app_name,
         "version": settings.app_version,
         "environment": settings.environment,
     }
+
+
+# Readiness endpoint
+async def readiness_check() -> dict[str, object]:
+    """
+    Readiness with the state of every database circuit breaker.
+
+    An open breaker reports "degraded" but still answers 200: with the
+    database down, every replica is in the same state, and taking them all
+    out of rotation would turn stale reads and fast 503s into no service.
+    Background refreshers keep the breakers fed even without traffic.
+    """
+    from src.infrastructure.database.circuit_breaker import BREAKERS, CircuitState
+
+    databases = {name: breaker.snapshot() for name, breaker in BREAKERS.items()}
+    degraded = any(db["state"] != CircuitState.CLOSED for db in databases.values())
+    return {"status": "degraded" if degraded else "ready", "databases": databases}
+
+
+# Metrics endpoint (Prometheus text format)
+async def metrics() -> PlainTextResponse:
+    """Expose in-process metrics."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
+async def database_unavailable_handler(_request: Request, exc: Exception) -> JSONResponse:
+    """Answer 503 while a database circuit breaker is open."""
+    from src.infrastructure.database.circuit_breaker import DatabaseUnavailableError
+
+    assert isinstance(exc, DatabaseUnavailableError)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Service temporarily unavailable"},
+        headers={"Retry-After": str(max(math.ceil(exc.retry_after), 1))},
+    )
+
+
+async def database_error_handler(_request: Request, exc: Exception) -> JSONResponse:
+    """Map statement timeouts to 504; log and hide other database errors."""
+    if getattr(getattr(exc, "orig", None), "sqlstate", None) == QUERY_CANCELED_SQLSTATE:
+        statement_timeout_total.inc()
+        return JSONResponse(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            content={"detail": "Request deadline exceeded"},
+        )
+    logger.exception("Database error", exc_info=exc)
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "Internal server error"},
+    )
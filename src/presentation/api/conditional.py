@@ -0,0 +1,110 @@
+"""Conditional GET: ETags, If-None-Match and Cache-Control for read routes."""
+
+import hashlib
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from fastapi import Request, Response, status
+from pydantic_core import to_json
+
+
+def version_etag(*version: object) -> str:
+    """
+    Strong ETag from values that change whenever the representation does.
+
+    For an entity that is its id and `updated_at` (TimestampMixin bumps it on
+    every ORM update); for a page of entities, those of every item plus the
+    next cursor.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in version:
+        digest.update(str(part).encode())
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()}"'
+
+
+def content_etag(body: bytes) -> str:
+    """Strong ETag from the response body itself."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    If-None-Match check, using weak comparison as RFC 9110 requires.
+
+    W/ prefixes are ignored on both sides, so a tag weakened on the way out
+    (for instance by compression) still matches when the client sends it back.
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+class ConditionalResponse:
+    """
+    ETag handling for one request to a read route; built by `conditional`.
+
+    Routes that know their representation's version call `not_modified`
+    before building the body, so a match costs no serialization at all.
+    Routes without one return `json(content)`, which serializes once and
+    tags the bytes by hash: a match still saves the transfer.
+    """
+
+    def __init__(self, request: Request, response: Response, cache_control: str) -> None:
+        self._if_none_match = request.headers.get("if-none-match")
+        self._response = response
+        self._cache_control = cache_control
+
+    def not_modified(self, *version: object) -> Response | None:
+        """A 304 response if the client holds this version, else None."""
+        etag = version_etag(*version)
+        if etag_matches(self._if_none_match, etag):
+            return self._not_modified(etag)
+        self._response.headers["ETag"] = etag
+        return None
+
+    def json(self, content: Any) -> Response:
+        """Serialized content tagged by its hash, or a 304 if the client holds it."""
+        body = to_json(content)
+        etag = content_etag(body)
+        if etag_matches(self._if_none_match, etag):
+            return self._not_modified(etag)
+        return Response(
+            body,
+            media_type="application/json",
+            headers={"ETag": etag, "Cache-Control": self._cache_control},
+        )
+
+    def _not_modified(self, etag: str) -> Response:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": self._cache_control},
+        )
+
+
+def conditional(
+    cache_control: str,
+) -> Callable[[Request, Response], Awaitable[ConditionalResponse]]:
+    """
+    Per-route Cache-Control and ETag handling.
+
+    Usage:
+        @router.get("/x")
+        async def read_x(
+            cache: Annotated[ConditionalResponse, Depends(conditional("public, max-age=60"))],
+        ) -> XResponse | Response:
+            x = await load_x()
+            return cache.not_modified(x.id, x.updated_at) or XResponse.model_validate(x)
+
+    Cache-Control is only set on successful responses; errors stay uncached.
+    The dependency is async so it runs on the event loop, not the thread pool.
+    """
+
+    async def apply_conditional(request: Request, response: Response) -> ConditionalResponse:
+        response.headers["Cache-Control"] = cache_control
+        return ConditionalResponse(request, response, cache_control)
+
+    return apply_conditional
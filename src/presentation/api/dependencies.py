@@ -0,0 +1,103 @@
+"""Shared FastAPI dependencies."""
+
+from collections.abc import Awaitable, Callable
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.token_service import ITokenService
+from src.core.container import Container, Key, Scope
+from src.core.deadline import get_deadline
+from src.domain.entities.user import User
+from src.domain.exceptions.auth import TokenError
+from src.domain.repositories.user_repository import IUserRepository
+from src.infrastructure.database.session import get_session
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def route_timeout(seconds: float) -> Callable[[], Awaitable[None]]:
+    """
+    Per-route default deadline, measured from the start of the request.
+
+    Usage:
+        @router.post("/x", dependencies=[Depends(route_timeout(5.0))])
+
+    A client-supplied X-Request-Timeout can only be tightened by it.
+    """
+
+    async def apply_route_timeout() -> None:
+        deadline = get_deadline()
+        if deadline is not None:
+            deadline.apply_route_timeout(seconds)
+
+    return apply_route_timeout
+
+
+def provide[T](key: Key[T]) -> Callable[[Request, AsyncSession], Awaitable[T]]:
+    """
+    Dependency resolving `key` from the application's container.
+
+    Usage:
+        LoginUseCase = Annotated[LoginUser, Depends(provide(LoginUser))]
+
+    All of a request's provide() dependencies share one scope, seeded with
+    its session, so request-lifetime instances are built once per request.
+    Resolution runs on the event loop: plain `def` dependencies would each
+    be sent to the thread pool.
+    """
+
+    async def resolve(
+        request: Request, session: Annotated[AsyncSession, Depends(get_session)]
+    ) -> T:
+        scope: Scope | None = getattr(request.state, "container_scope", None)
+        if scope is None:
+            container: Container = request.app.state.container
+            scope = container.scope({AsyncSession: session})
+            request.state.container_scope = scope
+        return scope.resolve(key)
+
+    return resolve
+
+
+get_user_repository = provide(IUserRepository)
+
+
+async def get_current_user(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)],
+    token_service: Annotated[ITokenService, Depends(provide(ITokenService))],
+    user_repository: Annotated[IUserRepository, Depends(get_user_repository)],
+) -> User:
+    """Resolve the active user from the Bearer access token, or respond 401."""
+    unauthorized = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Not authenticated",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    if credentials is None:
+        raise unauthorized
+    try:
+        payload = token_service.verify_access_token(credentials.credentials)
+        user_id = UUID(payload["sub"])
+    except TokenError, KeyError, ValueError:
+        raise unauthorized from None
+
+    user = await user_repository.get_by_id(user_id)
+    if not user or not user.can_login():
+        raise unauthorized
+    return user
+
+
+async def require_admin(user: Annotated[User, Depends(get_current_user)]) -> User:
+    """Allow only administrators, responding 403 to everyone else."""
+    if not user.is_admin():
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    return user
+
+
+# Type aliases for dependency injection
+CurrentUser = Annotated[User, Depends(get_current_user)]
+AdminUser = Annotated[User, Depends(require_admin)]
@@ -2,43 +2,44 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import EmailStr
 
-from src.application.dto.requests.auth_request import LoginRequest
+from src.application.dto.requests.auth_request import (
+    LoginRequest,
+    RequestOtpRequest,
+    VerifyEmailRequest,
+    VerifyOtpRequest,
+)
 from src.application.dto.requests.user_request import RegisterUserRequest
-from src.application.dto.responses.auth_response import TokenResponse
+from src.application.dto.responses.auth_response import (
+    EmailAvailabilityResponse,
+    OtpSentResponse,
+    TokenResponse,
+)
 from src.application.dto.responses.user_response import UserResponse
+from src.application.use_cases.user.check_email_availability import CheckEmailAvailability
 from src.application.use_cases.user.login_user import LoginUser
 from src.application.use_cases.user.register_user import RegisterUser
-from src.domain.exceptions.auth import InvalidCredentialError
+from src.application.use_cases.user.request_login_otp import RequestLoginOtp
+from src.application.use_cases.user.verify_email import VerifyEmail
+from src.application.use_cases.user.verify_login_otp import VerifyLoginOtp
+from src.core.config import get_settings
+from src.domain.exceptions.auth import InvalidCredentialError, OtpRateLimitedError, TokenError
 from src.domain.exceptions.user import UserAlreadyExistsError
-from src.infrastructure.database.session import get_session
-from src.infrastructure.repositories.sqlalchemy.user_repository_impl import (
-    SQLAlchemyUserRepository,
-)
-from src.infrastructure.services.jwt_service import JWTService
+from src.domain.repositories.outbox_repository import IOutboxRepository
+from src.presentation.api.dependencies import provide, route_timeout
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
-
-def get_user_repository(
-    session: Annotated[AsyncSession, Depends(get_session)],
-) -> SQLAlchemyUserRepository:
-    return SQLAlchemyUserRepository(session)
-
-
-def get_register_use_case(
-    user_repository: Annotated[SQLAlchemyUserRepository, Depends(get_user_repository)],
-) -> RegisterUser:
-    return RegisterUser(user_repository)
-
-
-def get_login_use_case(
-    user_repository: Annotated[SQLAlchemyUserRepository, Depends(get_user_repository)],
-) -> LoginUser:
-    token_service = JWTService()
-    return LoginUser(user_repository, token_service)
+# Use cases and their dependencies are wired in src.presentation.api.wiring
+get_outbox_repository = provide(IOutboxRepository)
+get_register_use_case = provide(RegisterUser)
+get_email_availability_use_case = provide(CheckEmailAvailability)
+get_login_use_case = provide(LoginUser)
+get_request_otp_use_case = provide(RequestLoginOtp)
+get_verify_otp_use_case = provide(VerifyLoginOtp)
+get_verify_email_use_case = provide(VerifyEmail)
 
 
 @router.post(
@@ -47,6 +48,7 @@ def get_login_use_case(
     status_code=status.HTTP_201_CREATED,
     summary="Register new user",
     description="Create a new user account.",
+    dependencies=[Depends(route_timeout(5.0))],
 )
 async def register(
     request: RegisterUserRequest,
@@ -61,12 +63,41 @@ async def register(
         ) from None
 
 
+@router.get(
+    "/email-available",
+    response_model=EmailAvailabilityResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Check email availability",
+    description=(
+        "Whether an email can still be used to register. Emails no user has are "
+        "answered from memory; only possible matches are looked up. An email taken "
+        "moments ago may briefly still read as available."
+    ),
+    dependencies=[Depends(route_timeout(2.0))],
+)
+async def email_available(
+    email: Annotated[EmailStr, Query()],
+    use_case: Annotated[CheckEmailAvailability, Depends(get_email_availability_use_case)],
+) -> EmailAvailabilityResponse:
+    """
+    Answered from this worker's registered email filter when it has never seen the email.
+
+    Registrations and email changes made by this worker are in its filter at
+    once. Those made by other workers reach it on its next refresh, so for up
+    to EMAIL_FILTER_REFRESH_INTERVAL seconds (plus the time a refresh takes)
+    such an email is reported available. Registering it still fails on the
+    unique email index.
+    """
+    return EmailAvailabilityResponse(email=email, available=await use_case.execute(email))
+
+
 @router.post(
     "/login",
     response_model=TokenResponse,
     status_code=status.HTTP_200_OK,
     summary="User login",
     description="Authenticate user and return access/refresh tokens.",
+    dependencies=[Depends(route_timeout(5.0))],
 )
 async def login(
     request: LoginRequest,
@@ -80,3 +111,71 @@ async def login(
             detail=e.message,
             headers={"WWW-Authenticate": "Bearer"},
         ) from None
+
+
+@router.post(
+    "/otp/request",
+    response_model=OtpSentResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Request login code",
+    description=(
+        "Text a one-time login code to a registered mobile number. The response "
+        "is the same whether or not the number has an account."
+    ),
+    dependencies=[Depends(route_timeout(5.0))],
+)
+async def request_otp(
+    request: RequestOtpRequest,
+    use_case: Annotated[RequestLoginOtp, Depends(get_request_otp_use_case)],
+) -> OtpSentResponse:
+    try:
+        return await use_case.execute(request)
+    except OtpRateLimitedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=e.message,
+            headers={"Retry-After": str(get_settings().otp_send_window)},
+        ) from None
+
+
+@router.post(
+    "/otp/verify",
+    response_model=TokenResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Login with code",
+    description="Exchange a texted login code for access/refresh tokens.",
+    dependencies=[Depends(route_timeout(5.0))],
+)
+async def verify_otp(
+    request: VerifyOtpRequest,
+    use_case: Annotated[VerifyLoginOtp, Depends(get_verify_otp_use_case)],
+) -> TokenResponse:
+    try:
+        return await use_case.execute(request)
+    except InvalidCredentialError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=e.message,
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from None
+
+
+@router.post(
+    "/verify-email",
+    response_model=UserResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Verify email",
+    description="Mark the user's email as verified using the token from the verification email.",
+    dependencies=[Depends(route_timeout(5.0))],
+)
+async def verify_email(
+    request: VerifyEmailRequest,
+    use_case: Annotated[VerifyEmail, Depends(get_verify_email_use_case)],
+) -> UserResponse:
+    try:
+        return await use_case.execute(request)
+    except TokenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from None
@@ -0,0 +1,200 @@
+"""Shopping cart API router."""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dto.requests.cart_request import AddCartItemRequest, UpdateCartItemRequest
+from src.application.dto.responses.cart_response import CartResponse
+from src.application.dto.responses.recommendation_response import RecommendationResponse
+from src.application.interfaces.cart_store import ICartStore
+from src.application.interfaces.recommendation_index import IRecommendationIndex
+from src.application.use_cases.cart.add_cart_item import AddCartItem
+from src.application.use_cases.cart.clear_cart import ClearCart
+from src.application.use_cases.cart.get_cart import GetCart
+from src.application.use_cases.cart.get_cart_recommendations import GetCartRecommendations
+from src.application.use_cases.cart.remove_cart_item import RemoveCartItem
+from src.application.use_cases.cart.update_cart_item import UpdateCartItem
+from src.core.constants import DEFAULT_RECOMMENDATIONS
+from src.domain.exceptions.cart import (
+    CartConflictError,
+    CartItemNotFoundError,
+    CartLimitExceededError,
+)
+from src.domain.exceptions.catalog import ProductNotFoundError
+from src.domain.repositories.cart_repository import ICartRepository
+from src.domain.repositories.product_repository import IProductRepository
+from src.infrastructure.database.session import get_session
+from src.infrastructure.repositories.sqlalchemy.cart_repository_impl import (
+    SQLAlchemyCartRepository,
+)
+from src.presentation.api.dependencies import CurrentUser
+from src.presentation.api.v1.routers.products import (
+    RecommendationLimit,
+    get_product_repository,
+    get_recommendation_index,
+)
+
+router = APIRouter(prefix="/cart", tags=["Cart"])
+
+
+def get_cart_store(request: Request) -> ICartStore:
+    cart_store: ICartStore = request.app.state.cart_store
+    return cart_store
+
+
+def get_cart_repository(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> ICartRepository:
+    return SQLAlchemyCartRepository(session)
+
+
+CartStore = Annotated[ICartStore, Depends(get_cart_store)]
+CartRepository = Annotated[ICartRepository, Depends(get_cart_repository)]
+
+
+def get_cart_use_case(cart_store: CartStore, cart_repository: CartRepository) -> GetCart:
+    return GetCart(cart_store, cart_repository)
+
+
+def get_cart_recommendations_use_case(
+    cart_store: CartStore,
+    cart_repository: CartRepository,
+    recommendation_index: Annotated[IRecommendationIndex, Depends(get_recommendation_index)],
+) -> GetCartRecommendations:
+    return GetCartRecommendations(cart_store, cart_repository, recommendation_index)
+
+
+def get_add_cart_item_use_case(
+    cart_store: CartStore,
+    cart_repository: CartRepository,
+    product_repository: Annotated[IProductRepository, Depends(get_product_repository)],
+) -> AddCartItem:
+    return AddCartItem(cart_store, cart_repository, product_repository)
+
+
+def get_update_cart_item_use_case(
+    cart_store: CartStore, cart_repository: CartRepository
+) -> UpdateCartItem:
+    return UpdateCartItem(cart_store, cart_repository)
+
+
+def get_remove_cart_item_use_case(
+    cart_store: CartStore, cart_repository: CartRepository
+) -> RemoveCartItem:
+    return RemoveCartItem(cart_store, cart_repository)
+
+
+def get_clear_cart_use_case(cart_store: CartStore, cart_repository: CartRepository) -> ClearCart:
+    return ClearCart(cart_store, cart_repository)
+
+
+@router.get(
+    "",
+    response_model=CartResponse,
+    summary="Get cart",
+)
+async def get_cart(
+    user: CurrentUser,
+    use_case: Annotated[GetCart, Depends(get_cart_use_case)],
+) -> CartResponse:
+    return await use_case.execute(user.id)
+
+
+@router.get(
+    "/recommendations",
+    response_model=list[RecommendationResponse],
+    summary="Cart recommendations",
+    description=(
+        "Products frequently bought together with the items in the cart, "
+        "excluding those already in it, best first."
+    ),
+)
+async def get_cart_recommendations(
+    user: CurrentUser,
+    use_case: Annotated[GetCartRecommendations, Depends(get_cart_recommendations_use_case)],
+    limit: RecommendationLimit = DEFAULT_RECOMMENDATIONS,
+) -> list[RecommendationResponse]:
+    return await use_case.execute(user.id, limit)
+
+
+@router.post(
+    "/items",
+    response_model=CartResponse,
+    summary="Add to cart",
+    description="Add a product, or increase its quantity if it is already in the cart.",
+)
+async def add_cart_item(
+    request: AddCartItemRequest,
+    user: CurrentUser,
+    use_case: Annotated[AddCartItem, Depends(get_add_cart_item_use_case)],
+) -> CartResponse:
+    try:
+        return await use_case.execute(user.id, request)
+    except ProductNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from None
+    except CartLimitExceededError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=e.message
+        ) from None
+    except CartConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from None
+
+
+@router.put(
+    "/items/{product_id}",
+    response_model=CartResponse,
+    summary="Set item quantity",
+    description="Set the quantity of a product in the cart; 0 removes it.",
+)
+async def update_cart_item(
+    product_id: UUID,
+    request: UpdateCartItemRequest,
+    user: CurrentUser,
+    use_case: Annotated[UpdateCartItem, Depends(get_update_cart_item_use_case)],
+) -> CartResponse:
+    try:
+        return await use_case.execute(user.id, product_id, request)
+    except CartItemNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from None
+    except CartLimitExceededError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=e.message
+        ) from None
+    except CartConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from None
+
+
+@router.delete(
+    "/items/{product_id}",
+    response_model=CartResponse,
+    summary="Remove from cart",
+)
+async def remove_cart_item(
+    product_id: UUID,
+    user: CurrentUser,
+    use_case: Annotated[RemoveCartItem, Depends(get_remove_cart_item_use_case)],
+) -> CartResponse:
+    try:
+        return await use_case.execute(user.id, product_id)
+    except CartItemNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from None
+    except CartConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from None
+
+
+@router.delete(
+    "",
+    response_model=CartResponse,
+    summary="Clear cart",
+)
+async def clear_cart(
+    user: CurrentUser,
+    use_case: Annotated[ClearCart, Depends(get_clear_cart_use_case)],
+) -> CartResponse:
+    try:
+        return await use_case.execute(user.id)
+    except CartConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from None
@@ -0,0 +1,81 @@
+"""Product category API router."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dto.requests.catalog_request import CreateCategoryRequest
+from src.application.dto.responses.catalog_response import CategoryResponse, CategoryTreeResponse
+from src.application.interfaces.category_tree import ICategoryTree
+from src.application.use_cases.catalog.create_category import CreateCategory
+from src.application.use_cases.catalog.get_category_tree import GetCategoryTree
+from src.domain.exceptions.catalog import CategoryAlreadyExistsError, CategoryNotFoundError
+from src.domain.repositories.category_repository import ICategoryRepository
+from src.infrastructure.database.session import get_session
+from src.infrastructure.repositories.sqlalchemy.category_repository_impl import (
+    SQLAlchemyCategoryRepository,
+)
+from src.presentation.api.conditional import ConditionalResponse, conditional
+from src.presentation.api.dependencies import AdminUser
+
+router = APIRouter(prefix="/categories", tags=["Catalog"])
+
+# New categories appear in the in-memory tree within seconds anyway
+CategoryTreeCache = Annotated[ConditionalResponse, Depends(conditional("public, max-age=300"))]
+
+
+def get_category_repository(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> ICategoryRepository:
+    return SQLAlchemyCategoryRepository(session)
+
+
+def get_category_tree(request: Request) -> ICategoryTree:
+    category_tree: ICategoryTree = request.app.state.category_tree
+    return category_tree
+
+
+def get_category_tree_use_case(
+    category_tree: Annotated[ICategoryTree, Depends(get_category_tree)],
+) -> GetCategoryTree:
+    return GetCategoryTree(category_tree)
+
+
+def get_create_category_use_case(
+    category_repository: Annotated[ICategoryRepository, Depends(get_category_repository)],
+) -> CreateCategory:
+    return CreateCategory(category_repository)
+
+
+@router.get(
+    "",
+    response_model=list[CategoryTreeResponse],
+    summary="Category tree",
+    description="Active categories nested under their parents. Served from memory.",
+)
+async def list_categories(
+    use_case: Annotated[GetCategoryTree, Depends(get_category_tree_use_case)],
+    cache: CategoryTreeCache,
+) -> list[CategoryTreeResponse] | Response:
+    return cache.not_modified(use_case.version()) or use_case.execute()
+
+
+@router.post(
+    "",
+    response_model=CategoryResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create category",
+    description="Add a category (admin only). It appears in the tree within a few seconds.",
+)
+async def create_category(
+    request: CreateCategoryRequest,
+    _admin: AdminUser,
+    use_case: Annotated[CreateCategory, Depends(get_create_category_use_case)],
+) -> CategoryResponse:
+    try:
+        return await use_case.execute(request)
+    except CategoryNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from None
+    except CategoryAlreadyExistsError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from None
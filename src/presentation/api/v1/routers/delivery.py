@@ -0,0 +1,108 @@
+"""Delivery coverage API router."""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dto.requests.delivery_request import (
+    CreateDeliveryZoneRequest,
+    UpdateDeliveryZoneRequest,
+)
+from src.application.dto.responses.delivery_response import (
+    DeliveryZoneResponse,
+    ServiceabilityResponse,
+)
+from src.application.interfaces.serviceability_index import IServiceabilityIndex
+from src.application.use_cases.delivery.check_serviceability import CheckServiceability
+from src.application.use_cases.delivery.create_zone import CreateDeliveryZone
+from src.application.use_cases.delivery.update_zone import UpdateDeliveryZone
+from src.domain.exceptions.delivery import DeliveryZoneNotFoundError
+from src.domain.repositories.delivery_zone_repository import IDeliveryZoneRepository
+from src.infrastructure.database.session import get_session
+from src.infrastructure.repositories.sqlalchemy.delivery_zone_repository_impl import (
+    SQLAlchemyDeliveryZoneRepository,
+)
+from src.presentation.api.dependencies import AdminUser
+
+router = APIRouter(prefix="/delivery", tags=["Delivery"])
+
+
+def get_delivery_zone_repository(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> IDeliveryZoneRepository:
+    return SQLAlchemyDeliveryZoneRepository(session)
+
+
+def get_serviceability_index(request: Request) -> IServiceabilityIndex:
+    serviceability_index: IServiceabilityIndex = request.app.state.serviceability_index
+    return serviceability_index
+
+
+def get_check_serviceability_use_case(
+    serviceability_index: Annotated[IServiceabilityIndex, Depends(get_serviceability_index)],
+) -> CheckServiceability:
+    return CheckServiceability(serviceability_index)
+
+
+def get_create_zone_use_case(
+    zone_repository: Annotated[IDeliveryZoneRepository, Depends(get_delivery_zone_repository)],
+) -> CreateDeliveryZone:
+    return CreateDeliveryZone(zone_repository)
+
+
+def get_update_zone_use_case(
+    zone_repository: Annotated[IDeliveryZoneRepository, Depends(get_delivery_zone_repository)],
+) -> UpdateDeliveryZone:
+    return UpdateDeliveryZone(zone_repository)
+
+
+@router.get(
+    "/serviceability",
+    response_model=ServiceabilityResponse,
+    summary="Check serviceability",
+    description="Whether a location is delivered to, and by which hub. Served from memory.",
+)
+async def check_serviceability(
+    lat: Annotated[float, Query(ge=-90, le=90)],
+    lng: Annotated[float, Query(ge=-180, le=180)],
+    use_case: Annotated[CheckServiceability, Depends(get_check_serviceability_use_case)],
+) -> ServiceabilityResponse:
+    return use_case.execute(lat, lng)
+
+
+@router.post(
+    "/zones",
+    response_model=DeliveryZoneResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create delivery zone",
+    description=(
+        "Add a zone served by a hub (admin only). Rings are [longitude, latitude] "
+        "pairs; it is used for lookups within a few seconds."
+    ),
+)
+async def create_zone(
+    request: CreateDeliveryZoneRequest,
+    _admin: AdminUser,
+    use_case: Annotated[CreateDeliveryZone, Depends(get_create_zone_use_case)],
+) -> DeliveryZoneResponse:
+    return await use_case.execute(request)
+
+
+@router.patch(
+    "/zones/{zone_id}",
+    response_model=DeliveryZoneResponse,
+    summary="Update delivery zone",
+    description="Change zone fields (admin only). Omitted fields are left unchanged.",
+)
+async def update_zone(
+    zone_id: UUID,
+    request: UpdateDeliveryZoneRequest,
+    _admin: AdminUser,
+    use_case: Annotated[UpdateDeliveryZone, Depends(get_update_zone_use_case)],
+) -> DeliveryZoneResponse:
+    try:
+        return await use_case.execute(zone_id, request)
+    except DeliveryZoneNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from None
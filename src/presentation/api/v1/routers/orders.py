@@ -0,0 +1,194 @@
+"""Order API router."""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dto.responses.order_response import OrderPageResponse, OrderResponse
+from src.application.use_cases.order.cancel_order import CancelOrder
+from src.application.use_cases.order.confirm_order import ConfirmOrder
+from src.application.use_cases.order.get_order import GetOrder
+from src.application.use_cases.order.list_orders import ListOrders
+from src.application.use_cases.order.place_order import PlaceOrder
+from src.core.config import get_settings
+from src.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.core.pagination import InvalidCursorError
+from src.domain.exceptions.cart import CartConflictError
+from src.domain.exceptions.catalog import ProductNotFoundError
+from src.domain.exceptions.order import (
+    EmptyCartError,
+    InvalidOrderStateError,
+    OrderNotFoundError,
+    OutOfStockError,
+)
+from src.domain.repositories.inventory_repository import IInventoryRepository
+from src.domain.repositories.order_repository import IOrderRepository
+from src.domain.repositories.outbox_repository import IOutboxRepository
+from src.domain.repositories.product_repository import IProductRepository
+from src.infrastructure.database.session import get_session
+from src.infrastructure.repositories.sqlalchemy.order_repository_impl import (
+    SQLAlchemyOrderRepository,
+)
+from src.presentation.api.dependencies import CurrentUser
+from src.presentation.api.v1.routers.auth import get_outbox_repository
+from src.presentation.api.v1.routers.cart import CartRepository, CartStore
+from src.presentation.api.v1.routers.products import (
+    get_inventory_repository,
+    get_product_repository,
+)
+
+router = APIRouter(prefix="/orders", tags=["Orders"])
+
+
+def get_order_repository(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> IOrderRepository:
+    return SQLAlchemyOrderRepository(session)
+
+
+OrderRepository = Annotated[IOrderRepository, Depends(get_order_repository)]
+InventoryRepository = Annotated[IInventoryRepository, Depends(get_inventory_repository)]
+OutboxRepository = Annotated[IOutboxRepository, Depends(get_outbox_repository)]
+
+
+def get_place_order_use_case(
+    cart_store: CartStore,
+    cart_repository: CartRepository,
+    product_repository: Annotated[IProductRepository, Depends(get_product_repository)],
+    order_repository: OrderRepository,
+    inventory_repository: InventoryRepository,
+    outbox: OutboxRepository,
+) -> PlaceOrder:
+    return PlaceOrder(
+        cart_store,
+        cart_repository,
+        product_repository,
+        order_repository,
+        inventory_repository,
+        outbox,
+        reservation_ttl=get_settings().order_reservation_ttl,
+    )
+
+
+def get_confirm_order_use_case(
+    order_repository: OrderRepository,
+    inventory_repository: InventoryRepository,
+    outbox: OutboxRepository,
+) -> ConfirmOrder:
+    return ConfirmOrder(order_repository, inventory_repository, outbox)
+
+
+def get_cancel_order_use_case(
+    order_repository: OrderRepository,
+    inventory_repository: InventoryRepository,
+    outbox: OutboxRepository,
+) -> CancelOrder:
+    return CancelOrder(order_repository, inventory_repository, outbox)
+
+
+def get_order_use_case(order_repository: OrderRepository) -> GetOrder:
+    return GetOrder(order_repository)
+
+
+def get_list_orders_use_case(order_repository: OrderRepository) -> ListOrders:
+    return ListOrders(order_repository)
+
+
+@router.post(
+    "",
+    response_model=OrderResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Place order",
+    description=(
+        "Order everything in the cart. Stock is reserved until `reserved_until`; "
+        "confirm the order before then or it expires and the stock is released."
+    ),
+)
+async def place_order(
+    user: CurrentUser,
+    use_case: Annotated[PlaceOrder, Depends(get_place_order_use_case)],
+) -> OrderResponse:
+    try:
+        return await use_case.execute(user.id)
+    except EmptyCartError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=e.message
+        ) from None
+    except ProductNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from None
+    except (OutOfStockError, CartConflictError) as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from None
+
+
+@router.get(
+    "",
+    response_model=OrderPageResponse,
+    summary="List orders",
+    description="The current user's orders, newest first.",
+)
+async def list_orders(
+    user: CurrentUser,
+    use_case: Annotated[ListOrders, Depends(get_list_orders_use_case)],
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+) -> OrderPageResponse:
+    try:
+        return await use_case.execute(user.id, cursor, limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from None
+
+
+@router.get(
+    "/{order_id}",
+    response_model=OrderResponse,
+    summary="Get order",
+)
+async def get_order(
+    order_id: UUID,
+    user: CurrentUser,
+    use_case: Annotated[GetOrder, Depends(get_order_use_case)],
+) -> OrderResponse:
+    try:
+        return await use_case.execute(user.id, order_id)
+    except OrderNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from None
+
+
+@router.post(
+    "/{order_id}/confirm",
+    response_model=OrderResponse,
+    summary="Confirm order",
+    description="Confirm a pending order before its reservation expires.",
+)
+async def confirm_order(
+    order_id: UUID,
+    user: CurrentUser,
+    use_case: Annotated[ConfirmOrder, Depends(get_confirm_order_use_case)],
+) -> OrderResponse:
+    try:
+        return await use_case.execute(user.id, order_id)
+    except OrderNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from None
+    except InvalidOrderStateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from None
+
+
+@router.post(
+    "/{order_id}/cancel",
+    response_model=OrderResponse,
+    summary="Cancel order",
+    description="Cancel a pending order and release its stock.",
+)
+async def cancel_order(
+    order_id: UUID,
+    user: CurrentUser,
+    use_case: Annotated[CancelOrder, Depends(get_cancel_order_use_case)],
+) -> OrderResponse:
+    try:
+        return await use_case.execute(user.id, order_id)
+    except OrderNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from None
+    except InvalidOrderStateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from None
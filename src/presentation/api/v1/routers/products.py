@@ -0,0 +1,312 @@
+"""Product catalog API router."""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dto.requests.catalog_request import (
+    CreateProductRequest,
+    UpdateProductRequest,
+)
+from src.application.dto.requests.order_request import SetStockRequest
+from src.application.dto.responses.catalog_response import ProductPageResponse, ProductResponse
+from src.application.dto.responses.order_response import StockResponse
+from src.application.dto.responses.recommendation_response import RecommendationResponse
+from src.application.interfaces.category_tree import ICategoryTree
+from src.application.interfaces.recommendation_index import IRecommendationIndex
+from src.application.use_cases.catalog.create_product import CreateProduct
+from src.application.use_cases.catalog.get_product import GetProduct
+from src.application.use_cases.catalog.get_recommendations import GetProductRecommendations
+from src.application.use_cases.catalog.list_products import ListProducts
+from src.application.use_cases.catalog.search_products import SearchProducts
+from src.application.use_cases.catalog.set_stock import GetStock, SetStock
+from src.application.use_cases.catalog.update_product import UpdateProduct
+from src.core.config import get_settings
+from src.core.constants import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_RECOMMENDATIONS,
+    MAX_PAGE_SIZE,
+    MAX_RECOMMENDATIONS,
+)
+from src.core.pagination import InvalidCursorError
+from src.domain.exceptions.catalog import (
+    CategoryNotFoundError,
+    ProductAlreadyExistsError,
+    ProductNotFoundError,
+)
+from src.domain.repositories.category_repository import ICategoryRepository
+from src.domain.repositories.inventory_repository import IInventoryRepository
+from src.domain.repositories.product_repository import IProductRepository
+from src.infrastructure.database.session import get_session
+from src.infrastructure.repositories.sqlalchemy.inventory_repository_impl import (
+    SQLAlchemyInventoryRepository,
+)
+from src.infrastructure.repositories.sqlalchemy.product_repository_impl import (
+    SQLAlchemyProductRepository,
+)
+from src.infrastructure.repositories.stale_product_repository import (
+    ProductStaleCache,
+    StaleReadProductRepository,
+)
+from src.presentation.api.conditional import ConditionalResponse, conditional
+from src.presentation.api.dependencies import AdminUser, route_timeout
+from src.presentation.api.v1.routers.categories import (
+    get_category_repository,
+    get_category_tree,
+)
+
+router = APIRouter(prefix="/products", tags=["Catalog"])
+
+PageSize = Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)]
+RecommendationLimit = Annotated[int, Query(ge=1, le=MAX_RECOMMENDATIONS)]
+
+# Browsers and CDNs may reuse these briefly, then revalidate with If-None-Match
+ProductCache = Annotated[ConditionalResponse, Depends(conditional("public, max-age=60"))]
+ProductPageCache = Annotated[ConditionalResponse, Depends(conditional("public, max-age=30"))]
+# The neighbour file is rebuilt offline, at most a few times a day
+RecommendationCache = Annotated[ConditionalResponse, Depends(conditional("public, max-age=300"))]
+
+
+def get_product_repository(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> IProductRepository:
+    return SQLAlchemyProductRepository(session)
+
+
+def get_catalog_read_repository(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> IProductRepository:
+    # Catalog pages may be served stale while the database is down
+    cache: ProductStaleCache = request.app.state.product_stale_cache
+    return StaleReadProductRepository(SQLAlchemyProductRepository(session), cache)
+
+
+def get_inventory_repository(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> IInventoryRepository:
+    return SQLAlchemyInventoryRepository(session)
+
+
+def get_recommendation_index(request: Request) -> IRecommendationIndex:
+    recommendation_index: IRecommendationIndex = request.app.state.recommendation_index
+    return recommendation_index
+
+
+def get_list_products_use_case(
+    product_repository: Annotated[IProductRepository, Depends(get_catalog_read_repository)],
+    category_tree: Annotated[ICategoryTree, Depends(get_category_tree)],
+) -> ListProducts:
+    return ListProducts(product_repository, category_tree)
+
+
+def get_search_products_use_case(
+    product_repository: Annotated[IProductRepository, Depends(get_catalog_read_repository)],
+) -> SearchProducts:
+    return SearchProducts(product_repository)
+
+
+def get_product_detail_use_case(
+    product_repository: Annotated[IProductRepository, Depends(get_catalog_read_repository)],
+) -> GetProduct:
+    return GetProduct(product_repository)
+
+
+def get_product_recommendations_use_case(
+    recommendation_index: Annotated[IRecommendationIndex, Depends(get_recommendation_index)],
+) -> GetProductRecommendations:
+    return GetProductRecommendations(recommendation_index)
+
+
+def get_create_product_use_case(
+    product_repository: Annotated[IProductRepository, Depends(get_product_repository)],
+    category_repository: Annotated[ICategoryRepository, Depends(get_category_repository)],
+) -> CreateProduct:
+    return CreateProduct(product_repository, category_repository)
+
+
+def get_update_product_use_case(
+    product_repository: Annotated[IProductRepository, Depends(get_product_repository)],
+    category_repository: Annotated[ICategoryRepository, Depends(get_category_repository)],
+) -> UpdateProduct:
+    return UpdateProduct(product_repository, category_repository)
+
+
+def get_stock_use_case(
+    product_repository: Annotated[IProductRepository, Depends(get_product_repository)],
+    inventory_repository: Annotated[IInventoryRepository, Depends(get_inventory_repository)],
+) -> GetStock:
+    return GetStock(product_repository, inventory_repository)
+
+
+def get_set_stock_use_case(
+    product_repository: Annotated[IProductRepository, Depends(get_product_repository)],
+    inventory_repository: Annotated[IInventoryRepository, Depends(get_inventory_repository)],
+) -> SetStock:
+    return SetStock(product_repository, inventory_repository, get_settings().inventory_shards)
+
+
+def page_version(page: ProductPageResponse) -> list[object]:
+    """Everything a product page's body is derived from, for its ETag."""
+    version: list[object] = [page.next_cursor]
+    for product in page.items:
+        version += (product.id, product.updated_at)
+    return version
+
+
+@router.get(
+    "",
+    response_model=ProductPageResponse,
+    summary="List products",
+    description="Newest products first, optionally within a category and its subcategories.",
+)
+async def list_products(
+    use_case: Annotated[ListProducts, Depends(get_list_products_use_case)],
+    cache: ProductPageCache,
+    category: str | None = None,
+    cursor: str | None = None,
+    limit: PageSize = DEFAULT_PAGE_SIZE,
+) -> ProductPageResponse | Response:
+    try:
+        page = await use_case.execute(category, cursor, limit)
+    except CategoryNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from None
+    return cache.not_modified(*page_version(page)) or page
+
+
+@router.get(
+    "/search",
+    response_model=ProductPageResponse,
+    summary="Search products",
+    description="Relevance-ranked, typo-tolerant search over English and Bangla names.",
+    dependencies=[Depends(route_timeout(3.0))],
+)
+async def search_products(
+    use_case: Annotated[SearchProducts, Depends(get_search_products_use_case)],
+    cache: ProductPageCache,
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    cursor: str | None = None,
+    limit: PageSize = DEFAULT_PAGE_SIZE,
+) -> ProductPageResponse | Response:
+    try:
+        page = await use_case.execute(q, cursor, limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from None
+    return cache.not_modified(*page_version(page)) or page
+
+
+@router.get(
+    "/{product_id}",
+    response_model=ProductResponse,
+    summary="Get product",
+)
+async def get_product(
+    product_id: UUID,
+    use_case: Annotated[GetProduct, Depends(get_product_detail_use_case)],
+    cache: ProductCache,
+) -> ProductResponse | Response:
+    try:
+        product = await use_case.execute(product_id)
+    except ProductNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from None
+    return cache.not_modified(product.id, product.updated_at) or product
+
+
+@router.get(
+    "/{product_id}/recommendations",
+    response_model=list[RecommendationResponse],
+    summary="Frequently bought together",
+    description=(
+        "Products most often bought in the same order as this one, best first. "
+        "Served from the precomputed neighbour file; empty until it has been built "
+        "or for products without enough orders."
+    ),
+)
+async def get_product_recommendations(
+    product_id: UUID,
+    use_case: Annotated[GetProductRecommendations, Depends(get_product_recommendations_use_case)],
+    cache: RecommendationCache,
+    limit: RecommendationLimit = DEFAULT_RECOMMENDATIONS,
+) -> Response:
+    return cache.json(use_case.execute(product_id, limit))
+
+
+@router.post(
+    "",
+    response_model=ProductResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create product",
+    description="Add a product to the catalog (admin only).",
+)
+async def create_product(
+    request: CreateProductRequest,
+    _admin: AdminUser,
+    use_case: Annotated[CreateProduct, Depends(get_create_product_use_case)],
+) -> ProductResponse:
+    try:
+        return await use_case.execute(request)
+    except CategoryNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from None
+    except ProductAlreadyExistsError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from None
+
+
+@router.patch(
+    "/{product_id}",
+    response_model=ProductResponse,
+    summary="Update product",
+    description="Change product fields (admin only). Omitted fields are left unchanged.",
+)
+async def update_product(
+    product_id: UUID,
+    request: UpdateProductRequest,
+    _admin: AdminUser,
+    use_case: Annotated[UpdateProduct, Depends(get_update_product_use_case)],
+) -> ProductResponse:
+    try:
+        return await use_case.execute(product_id, request)
+    except (ProductNotFoundError, CategoryNotFoundError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from None
+    except ProductAlreadyExistsError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from None
+
+
+@router.get(
+    "/{product_id}/stock",
+    response_model=StockResponse,
+    summary="Get product stock",
+    description="Units available to order, excluding units reserved by pending orders.",
+)
+async def get_stock(
+    product_id: UUID,
+    use_case: Annotated[GetStock, Depends(get_stock_use_case)],
+) -> StockResponse:
+    try:
+        return await use_case.execute(product_id)
+    except ProductNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from None
+
+
+@router.put(
+    "/{product_id}/stock",
+    response_model=StockResponse,
+    summary="Set product stock",
+    description=(
+        "Replace the units available to order (admin only). Units reserved by "
+        "pending orders are not included and return to stock if those orders expire."
+    ),
+)
+async def set_stock(
+    product_id: UUID,
+    request: SetStockRequest,
+    _admin: AdminUser,
+    use_case: Annotated[SetStock, Depends(get_set_stock_use_case)],
+) -> StockResponse:
+    try:
+        return await use_case.execute(product_id, request)
+    except ProductNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from None
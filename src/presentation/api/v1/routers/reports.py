@@ -0,0 +1,132 @@
+"""Admin reporting API router."""
+
+from collections.abc import Awaitable, Callable
+from datetime import date
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dto.responses.report_response import (
+    RegistrationsReportResponse,
+    SalesReportResponse,
+    TopCustomersResponse,
+)
+from src.application.interfaces.report_cache import IReportCache
+from src.application.use_cases.report.get_registrations_report import GetRegistrationsReport
+from src.application.use_cases.report.get_sales_report import GetSalesReport
+from src.application.use_cases.report.get_top_customers import GetTopCustomers
+from src.core.config import get_settings
+from src.core.constants import MAX_PAGE_SIZE
+from src.domain.exceptions.report import InvalidReportRangeError
+from src.domain.repositories.report_repository import IReportRepository
+from src.infrastructure.database.session import get_session
+from src.infrastructure.repositories.sqlalchemy.report_repository_impl import (
+    SQLAlchemyReportRepository,
+)
+from src.presentation.api.dependencies import AdminUser
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+
+def get_report_repository(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> IReportRepository:
+    return SQLAlchemyReportRepository(session)
+
+
+def get_report_cache(request: Request) -> IReportCache:
+    report_cache: IReportCache = request.app.state.report_cache
+    return report_cache
+
+
+ReportRepository = Annotated[IReportRepository, Depends(get_report_repository)]
+ReportCache = Annotated[IReportCache, Depends(get_report_cache)]
+
+
+def get_sales_report_use_case(report_repository: ReportRepository) -> GetSalesReport:
+    return GetSalesReport(report_repository, get_settings().report_time_zone)
+
+
+def get_registrations_report_use_case(
+    report_repository: ReportRepository,
+) -> GetRegistrationsReport:
+    return GetRegistrationsReport(report_repository, get_settings().report_time_zone)
+
+
+def get_top_customers_use_case(report_repository: ReportRepository) -> GetTopCustomers:
+    return GetTopCustomers(report_repository)
+
+
+async def _cached(
+    cache: IReportCache, key: str, build: Callable[[], Awaitable[BaseModel]]
+) -> Response:
+    """Serve a report body from the cache, building and serializing it on a miss."""
+
+    async def load() -> bytes:
+        return (await build()).model_dump_json().encode()
+
+    try:
+        body = await cache.get_or_load(key, load)
+    except InvalidReportRangeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=e.message
+        ) from None
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Cache-Control": f"private, max-age={get_settings().report_cache_ttl}"},
+    )
+
+
+@router.get(
+    "/sales",
+    response_model=SalesReportResponse,
+    summary="Sales per day",
+    description=(
+        "Confirmed orders, units and revenue per day (admin only). Defaults to the "
+        "last 30 days. Served from summary tables; `as_of` tells how current they are."
+    ),
+)
+async def sales_report(
+    _admin: AdminUser,
+    cache: ReportCache,
+    use_case: Annotated[GetSalesReport, Depends(get_sales_report_use_case)],
+    start: date | None = None,
+    end: date | None = None,
+) -> Response:
+    return await _cached(cache, f"sales:{start}:{end}", lambda: use_case.execute(start, end))
+
+
+@router.get(
+    "/registrations",
+    response_model=RegistrationsReportResponse,
+    summary="Registrations per day",
+    description="New users per day (admin only). Defaults to the last 30 days.",
+)
+async def registrations_report(
+    _admin: AdminUser,
+    cache: ReportCache,
+    use_case: Annotated[GetRegistrationsReport, Depends(get_registrations_report_use_case)],
+    start: date | None = None,
+    end: date | None = None,
+) -> Response:
+    return await _cached(
+        cache, f"registrations:{start}:{end}", lambda: use_case.execute(start, end)
+    )
+
+
+@router.get(
+    "/customers",
+    response_model=TopCustomersResponse,
+    summary="Top customers",
+    description="Customers with the highest confirmed revenue, with their order counts.",
+)
+async def top_customers(
+    _admin: AdminUser,
+    cache: ReportCache,
+    use_case: Annotated[GetTopCustomers, Depends(get_top_customers_use_case)],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = 20,
+) -> Response:
+    return await _cached(cache, f"customers:{limit}", lambda: use_case.execute(limit))
@@ -0,0 +1,263 @@
+"""User profile API router."""
+
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, aclosing
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dto.requests.user_request import (
+    BulkRoleChangeRequest,
+    BulkUserUpdateRequest,
+)
+from src.application.dto.responses.auth_response import LoginFailureResponse
+from src.application.dto.responses.user_response import BulkUserUpdateResponse, UserResponse
+from src.application.use_cases.user.bulk_update_users import BulkUpdateUsers
+from src.application.use_cases.user.export_users import MEDIA_TYPES, ExportFormat, ExportUsers
+from src.application.use_cases.user.get_login_failures import GetLoginFailures
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.domain.entities.user import Role, User
+from src.domain.exceptions.user import InvalidUserFilterError
+from src.domain.repositories.user_repository import UserChanges, UserFilter
+from src.infrastructure.database.session import SessionDep, get_session
+from src.infrastructure.repositories.user_loader import UserLoader
+from src.presentation.api.conditional import ConditionalResponse, conditional
+from src.presentation.api.dependencies import AdminUser, CurrentUser, provide, route_timeout
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/users", tags=["Users"])
+
+# Browsers keep the profile but must revalidate it on every use
+ProfileCache = Annotated[ConditionalResponse, Depends(conditional("private, no-cache"))]
+BulkUpdateUseCase = Annotated[BulkUpdateUsers, Depends(provide(BulkUpdateUsers))]
+
+
+async def export_timeout() -> None:
+    """Exports stream for up to USER_EXPORT_TIMEOUT rather than the default deadline."""
+    await route_timeout(get_settings().user_export_timeout)()
+
+
+async def bulk_timeout() -> None:
+    """Bulk updates run for up to USER_BULK_TIMEOUT rather than the default deadline."""
+    await route_timeout(get_settings().user_bulk_timeout)()
+
+
+async def export_cleanup(
+    _session: Annotated[AsyncSession, Depends(get_session)],
+) -> AsyncIterator[AsyncExitStack]:
+    """
+    Closes the export's cursor while its session is still open.
+
+    Starlette abandons the body iterator when the client disconnects; left to
+    the garbage collector, it would close the cursor after the session.
+    """
+    async with AsyncExitStack() as stack:
+        yield stack
+
+
+@router.get(
+    "/me",
+    response_model=UserResponse,
+    summary="Current user",
+    description="Profile of the authenticated user. Supports If-None-Match.",
+)
+async def get_me(user: CurrentUser, cache: ProfileCache) -> UserResponse | Response:
+    return cache.not_modified(user.id, user.updated_at) or UserResponse.model_validate(user)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {media_type: {} for media_type in MEDIA_TYPES.values()}}},
+    summary="Export users",
+    description=(
+        "Stream every matching user as NDJSON or CSV (admin only), in creation "
+        "order. Memory use is the same for any number of users and the export "
+        "goes only as fast as the client reads it. Compressed when the client "
+        "sends Accept-Encoding. `created_from` is inclusive, `created_to` "
+        "exclusive; times without a zone are UTC. Password hashes are not exported."
+    ),
+    dependencies=[Depends(export_timeout)],
+)
+async def export_users(
+    admin: AdminUser,
+    use_case: Annotated[ExportUsers, Depends(provide(ExportUsers))],
+    cleanup: Annotated[AsyncExitStack, Depends(export_cleanup)],
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+    role: Role | None = None,
+    is_active: bool | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+) -> StreamingResponse:
+    try:
+        user_filter = UserFilter(role, is_active, created_from, created_to)
+    except InvalidUserFilterError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=e.message
+        ) from None
+    chunks = await cleanup.enter_async_context(
+        aclosing(use_case.execute(user_filter, export_format))
+    )
+    # Read the first batch before the status is sent, so that a database
+    # failure still gets an error response rather than a truncated 200
+    first = await anext(chunks, b"")
+    logger.info(
+        "User export started",
+        extra={
+            "admin_id": str(admin.id),
+            "format": export_format.value,
+            "filter": repr(user_filter),
+        },
+    )
+    return StreamingResponse(
+        _prepend(first, chunks),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="users.{export_format.value}"',
+            "Cache-Control": "no-store",
+        },
+    )
+
+
+async def _prepend(first: bytes, rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    if first:
+        yield first
+    async for chunk in rest:
+        yield chunk
+
+
+@router.get(
+    "/login-failures",
+    response_model=list[LoginFailureResponse],
+    summary="Failed logins of an account",
+    description=(
+        "Failed logins for an email (admin only), newest first, from the "
+        "authentication event log. `since` defaults to 24 hours ago; times "
+        "without a zone are UTC. Events are written in batches, so the last "
+        "second or so may not be listed yet."
+    ),
+)
+async def get_login_failures(
+    _admin: AdminUser,
+    use_case: Annotated[GetLoginFailures, Depends(provide(GetLoginFailures))],
+    email: Annotated[str, Query(min_length=3, max_length=255)],
+    since: datetime | None = None,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+) -> list[LoginFailureResponse]:
+    return await use_case.execute(email, since, limit)
+
+
+@router.post(
+    "/bulk/deactivate",
+    response_model=BulkUserUpdateResponse,
+    summary="Deactivate users in bulk",
+    description=(
+        "Deactivate every user the filter selects (admin only), e.g. a wave of spam "
+        "sign-ups. They can no longer sign in or use their tokens. "
+        "See POST /users/bulk/role for how the update runs."
+    ),
+    dependencies=[Depends(bulk_timeout)],
+)
+async def deactivate_users(
+    body: BulkUserUpdateRequest,
+    request: Request,
+    admin: AdminUser,
+    use_case: BulkUpdateUseCase,
+    session: SessionDep,
+) -> BulkUserUpdateResponse:
+    changes = UserChanges(is_active=False)
+    return await _bulk_update(body, changes, request, admin, use_case, session)
+
+
+@router.post(
+    "/bulk/verify",
+    response_model=BulkUserUpdateResponse,
+    summary="Verify users in bulk",
+    description=(
+        "Mark the email of every user the filter selects as verified (admin only). "
+        "See POST /users/bulk/role for how the update runs."
+    ),
+    dependencies=[Depends(bulk_timeout)],
+)
+async def verify_users(
+    body: BulkUserUpdateRequest,
+    request: Request,
+    admin: AdminUser,
+    use_case: BulkUpdateUseCase,
+    session: SessionDep,
+) -> BulkUserUpdateResponse:
+    changes = UserChanges(is_verified=True)
+    return await _bulk_update(body, changes, request, admin, use_case, session)
+
+
+@router.post(
+    "/bulk/role",
+    response_model=BulkUserUpdateResponse,
+    summary="Change user roles in bulk",
+    description=(
+        "Give every user the filter selects the role in the body (admin only). "
+        "Users are changed by set-based UPDATEs of USER_BULK_CHUNK_SIZE users, each "
+        "committed before the next, so a failure part-way leaves the chunks done "
+        "so far applied; running the request again finishes the rest. Users already "
+        "in the target state are skipped and the calling admin is never changed. "
+        "At least one filter criterion is required. With `dry_run` nothing is "
+        "changed and the counts are returned."
+    ),
+    dependencies=[Depends(bulk_timeout)],
+)
+async def change_user_roles(
+    body: BulkRoleChangeRequest,
+    request: Request,
+    admin: AdminUser,
+    use_case: BulkUpdateUseCase,
+    session: SessionDep,
+) -> BulkUserUpdateResponse:
+    changes = UserChanges(role=body.role)
+    return await _bulk_update(body, changes, request, admin, use_case, session)
+
+
+async def _bulk_update(
+    body: BulkUserUpdateRequest,
+    changes: UserChanges,
+    request: Request,
+    admin: User,
+    use_case: BulkUpdateUsers,
+    session: AsyncSession,
+) -> BulkUserUpdateResponse:
+    try:
+        user_filter = UserFilter(**body.filter.model_dump())
+        if body.dry_run:
+            matched, updated = await use_case.count(user_filter, changes, admin.id)
+            return BulkUserUpdateResponse(dry_run=True, matched=matched, updated=updated)
+
+        user_loader: UserLoader = request.app.state.user_loader
+        updated = 0
+        while True:
+            user_ids = await use_case.execute(user_filter, changes, admin.id)
+            # Every chunk commits on its own: its row locks are released
+            # before the next, and its events are published with it
+            await session.commit()
+            user_loader.forget(user_ids)
+            updated += len(user_ids)
+            if len(user_ids) < use_case.chunk_size:
+                break
+    except InvalidUserFilterError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=e.message
+        ) from None
+
+    logger.info(
+        "Users updated in bulk",
+        extra={
+            "admin_id": str(admin.id),
+            "changes": repr(changes),
+            "filter": repr(user_filter),
+            "updated": updated,
+        },
+    )
+    return BulkUserUpdateResponse(dry_run=False, updated=updated)
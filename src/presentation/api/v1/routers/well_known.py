@@ -0,0 +1,28 @@
+"""Well-known discovery endpoints (served at the root, not under the API prefix)."""
+
+from fastapi import APIRouter, Request, Response, status
+
+from src.core.config import get_settings
+from src.infrastructure.services.jwt_keys import EMPTY_JWKS, get_key_ring
+from src.presentation.api.conditional import etag_matches
+
+router = APIRouter(prefix="/.well-known", tags=["Discovery"])
+
+
+@router.get(
+    "/jwks.json",
+    summary="JSON Web Key Set",
+    description="Public keys for verifying access tokens locally, selected by `kid`.",
+)
+async def jwks(request: Request) -> Response:
+    key_ring = get_key_ring()
+    document = key_ring.jwks if key_ring else EMPTY_JWKS
+    headers = {
+        "Cache-Control": f"public, max-age={get_settings().jwks_max_age}",
+        "ETag": document.etag,
+    }
+
+    # Compression weakens the ETag, so clients send back W/"..."
+    if etag_matches(request.headers.get("if-none-match"), document.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=document.body, media_type="application/json", headers=headers)
@@ -0,0 +1,160 @@
+"""Registrations of the application's dependency container."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import State
+
+from src.application.interfaces.auth_event_recorder import IAuthEventRecorder
+from src.application.interfaces.email_filter import IRegisteredEmailFilter
+from src.application.interfaces.job_queue import IJobQueue
+from src.application.interfaces.otp_store import IOtpStore, OtpPolicy
+from src.application.interfaces.sms_sender import ISmsSender
+from src.application.interfaces.token_service import ITokenService
+from src.application.use_cases.user.bulk_update_users import BulkUpdateUsers
+from src.application.use_cases.user.check_email_availability import CheckEmailAvailability
+from src.application.use_cases.user.export_users import ExportUsers
+from src.application.use_cases.user.get_login_failures import GetLoginFailures
+from src.application.use_cases.user.login_user import LoginUser
+from src.application.use_cases.user.register_user import RegisterUser
+from src.application.use_cases.user.request_login_otp import RequestLoginOtp
+from src.application.use_cases.user.verify_email import VerifyEmail
+from src.application.use_cases.user.verify_login_otp import VerifyLoginOtp
+from src.core.config import get_settings
+from src.core.container import Container, Lifetime
+from src.domain.repositories.auth_event_repository import IAuthEventRepository
+from src.domain.repositories.outbox_repository import IOutboxRepository
+from src.domain.repositories.user_repository import IUserRepository
+from src.infrastructure.jobs.queue import SQLAlchemyJobQueue
+from src.infrastructure.repositories.coalescing_user_repository import CoalescingUserRepository
+from src.infrastructure.repositories.sqlalchemy.auth_event_repository_impl import (
+    SQLAlchemyAuthEventRepository,
+)
+from src.infrastructure.repositories.sqlalchemy.outbox_repository_impl import (
+    SQLAlchemyOutboxRepository,
+)
+from src.infrastructure.services.jwt_service import JWTService
+
+
+def build_container(state: State) -> Container:
+    """
+    Container for the application whose startup state is `state`.
+
+    Services shared by the lifespan (auth event recorder, OTP store, user
+    loader, ...) are read from `state` when first resolved, so this can run
+    before they are all started. Request scopes are seeded with the
+    request's AsyncSession.
+    """
+    settings = get_settings()
+    container = Container()
+
+    # Stateless services, built once
+    container.register(ITokenService, lambda _: JWTService(), Lifetime.SINGLETON)
+    container.register(
+        OtpPolicy,
+        lambda _: OtpPolicy(
+            secret_key=settings.secret_key,
+            length=settings.otp_length,
+            ttl=settings.otp_ttl,
+            max_attempts=settings.otp_max_attempts,
+            max_sends=settings.otp_max_sends,
+            send_window=settings.otp_send_window,
+        ),
+        Lifetime.SINGLETON,
+    )
+    container.register(IAuthEventRecorder, lambda _: state.auth_event_recorder, Lifetime.SINGLETON)
+    container.register(IOtpStore, lambda _: state.otp_store, Lifetime.SINGLETON)
+    container.register(ISmsSender, lambda _: state.sms_sender, Lifetime.SINGLETON)
+    container.register(IRegisteredEmailFilter, lambda _: state.email_filter, Lifetime.SINGLETON)
+
+    # Bound to the request's session
+    container.register(
+        IUserRepository,
+        lambda scope: CoalescingUserRepository(
+            state.user_repository_factory(scope.resolve(AsyncSession)), state.user_loader
+        ),
+        Lifetime.REQUEST,
+    )
+    container.register(
+        IJobQueue,
+        # Shares the request session, so jobs commit or roll back with the request
+        lambda scope: SQLAlchemyJobQueue(scope.resolve(AsyncSession), settings.job_max_attempts),
+        Lifetime.REQUEST,
+    )
+    container.register(
+        IOutboxRepository,
+        lambda scope: SQLAlchemyOutboxRepository(scope.resolve(AsyncSession)),
+        Lifetime.REQUEST,
+    )
+    container.register(
+        IAuthEventRepository,
+        lambda scope: SQLAlchemyAuthEventRepository(scope.resolve(AsyncSession)),
+        Lifetime.REQUEST,
+    )
+
+    # Use cases hold no state of their own
+    container.register(
+        RegisterUser,
+        lambda scope: RegisterUser(
+            scope.resolve(IUserRepository),
+            scope.resolve(IAuthEventRecorder),
+            scope.resolve(IJobQueue),
+            scope.resolve(IOutboxRepository),
+            scope.resolve(IRegisteredEmailFilter),
+        ),
+    )
+    container.register(
+        CheckEmailAvailability,
+        lambda scope: CheckEmailAvailability(
+            scope.resolve(IUserRepository), scope.resolve(IRegisteredEmailFilter)
+        ),
+    )
+    container.register(
+        LoginUser,
+        lambda scope: LoginUser(
+            scope.resolve(IUserRepository),
+            scope.resolve(ITokenService),
+            scope.resolve(IAuthEventRecorder),
+        ),
+    )
+    container.register(
+        RequestLoginOtp,
+        lambda scope: RequestLoginOtp(
+            scope.resolve(IUserRepository),
+            scope.resolve(IOtpStore),
+            scope.resolve(ISmsSender),
+            scope.resolve(OtpPolicy),
+        ),
+    )
+    container.register(
+        VerifyLoginOtp,
+        lambda scope: VerifyLoginOtp(
+            scope.resolve(IUserRepository),
+            scope.resolve(IOtpStore),
+            scope.resolve(ITokenService),
+            scope.resolve(IAuthEventRecorder),
+            scope.resolve(OtpPolicy),
+        ),
+    )
+    container.register(
+        ExportUsers,
+        lambda scope: ExportUsers(scope.resolve(IUserRepository), settings.user_export_batch_size),
+    )
+    container.register(
+        BulkUpdateUsers,
+        lambda scope: BulkUpdateUsers(
+            scope.resolve(IUserRepository),
+            scope.resolve(IOutboxRepository),
+            settings.user_bulk_chunk_size,
+        ),
+    )
+    container.register(
+        GetLoginFailures, lambda scope: GetLoginFailures(scope.resolve(IAuthEventRepository))
+    )
+    container.register(
+        VerifyEmail,
+        lambda scope: VerifyEmail(
+            scope.resolve(IUserRepository),
+            scope.resolve(ITokenService),
+            scope.resolve(IOutboxRepository),
+        ),
+    )
+    return container
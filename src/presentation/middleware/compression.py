@@ -0,0 +1,269 @@
+"""Response compression negotiated from Accept-Encoding."""
+
+import asyncio
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.logging import get_logger
+from src.core.metrics import Counter
+
+logger = get_logger(__name__)
+
+# Content types worth compressing; anything else (images, archives) passes through
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/xml")
+
+compressed_responses_total = Counter(
+    "http_compressed_responses_total", "Responses compressed, by encoding", ["encoding"]
+)
+compression_input_bytes_total = Counter(
+    "http_compression_input_bytes_total", "Response bytes before compression", ["encoding"]
+)
+compression_output_bytes_total = Counter(
+    "http_compression_output_bytes_total", "Response bytes after compression", ["encoding"]
+)
+
+
+class Encoder(ABC):
+    """Incremental compressor for one response body."""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk, flushed so the client can decode it before the next one."""
+        pass
+
+    @abstractmethod
+    def finish(self, data: bytes = b"") -> bytes:
+        """Compress the last chunk and end the stream."""
+        pass
+
+
+class GzipEncoder(Encoder):
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder(Encoder):
+    def __init__(self, quality: int) -> None:
+        import brotli
+
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._compressor.process(data) + self._compressor.flush())
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return bytes(self._compressor.process(data) + self._compressor.finish())
+
+
+class ZstdEncoder(Encoder):
+    def __init__(self, level: int) -> None:
+        from compression.zstd import ZstdCompressor
+
+        self._mode = ZstdCompressor
+        self._compressor = ZstdCompressor(level=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data, mode=self._mode.FLUSH_BLOCK)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data, mode=self._mode.FLUSH_FRAME)
+
+
+def available_encoders(
+    gzip_level: int = 6, brotli_quality: int = 4, zstd_level: int = 3
+) -> dict[str, Callable[[], Encoder]]:
+    """
+    Encoders this interpreter supports, most preferred first.
+
+    zstd needs Python's compression.zstd and br the optional `brotli`
+    package (`uv sync --extra compression`); gzip is always available.
+    """
+    encoders: dict[str, Callable[[], Encoder]] = {}
+    try:
+        import compression.zstd  # noqa: F401
+
+        encoders["zstd"] = lambda: ZstdEncoder(zstd_level)
+    except ImportError:
+        logger.info("zstd unavailable; not offering it")
+    try:
+        import brotli  # noqa: F401
+
+        encoders["br"] = lambda: BrotliEncoder(brotli_quality)
+    except ImportError:
+        logger.info("brotli package not installed; not offering br")
+    encoders["gzip"] = lambda: GzipEncoder(gzip_level)
+    return encoders
+
+
+def negotiate(accept_encoding: str, offered: list[str]) -> str | None:
+    """
+    Encoding to use for an Accept-Encoding header, or None for identity.
+
+    Takes the highest q-value; ties go to the order of `offered`. A `*`
+    entry covers encodings not listed by name, and q=0 refuses one.
+    """
+    weights: dict[str, float] = {}
+    for entry in accept_encoding.split(","):
+        name, _, params = entry.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+        weights[name.strip().lower()] = quality
+
+    best: str | None = None
+    best_quality = 0.0
+    for encoding in offered:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with the best encoding the client accepts.
+
+    - zstd, br and gzip are negotiated from Accept-Encoding; equal q-values
+      prefer them in that order.
+    - Bodies sent in one message are skipped below `minimum_size`, and
+      compressed in a worker thread from `offload_size` up so large exports
+      do not stall the event loop.
+    - Streaming bodies are compressed chunk by chunk as they are sent, each
+      chunk flushed so the client can decode it immediately; Content-Length
+      is dropped.
+    - Already encoded responses, non-text content types and responses marked
+      `Cache-Control: no-transform` pass through untouched.
+    - Vary: Accept-Encoding is added to every compressible response, and a
+      strong ETag is weakened, since the bytes differ per encoding.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        encoders: dict[str, Callable[[], Encoder]],
+        minimum_size: int = 1024,
+        offload_size: int = 262_144,
+    ) -> None:
+        self.app = app
+        self.encoders = encoders
+        self.offered = list(encoders)
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate(accept_encoding, self.offered) if accept_encoding else None
+        await self.app(scope, receive, _CompressingSend(self, send, encoding))
+
+
+class _CompressingSend:
+    """The `send` callable for one response; holds back its start until the body is seen."""
+
+    def __init__(self, middleware: CompressionMiddleware, send: Send, encoding: str | None) -> None:
+        self._middleware = middleware
+        self._send = send
+        self._encoding = encoding
+        self._start: Message | None = None
+        self._encoder: Encoder | None = None
+        self._passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+        elif message["type"] == "http.response.start":
+            self._start = message
+            if not self._compressible(MutableHeaders(scope=message)):
+                self._passthrough = True
+                await self._send(message)
+        elif message["type"] == "http.response.body":
+            await self._send_body(message)
+        else:
+            await self._send(message)
+
+    def _compressible(self, headers: MutableHeaders) -> bool:
+        assert self._start is not None
+        if self._start["status"] == 304:
+            # Same validators as the 200 this stands for
+            headers.add_vary_header("Accept-Encoding")
+            if self._encoding is not None:
+                self._weaken_etag(headers)
+            return False
+        content_type = headers.get("content-type", "")
+        if (
+            self._start["status"] == 204
+            or "content-encoding" in headers
+            or "no-transform" in headers.get("cache-control", "")
+            or not content_type.startswith(COMPRESSIBLE_TYPES)
+        ):
+            return False
+        # The body could be compressed for some clients: caches must key on it
+        headers.add_vary_header("Accept-Encoding")
+        return self._encoding is not None
+
+    async def _send_body(self, message: Message) -> None:
+        assert self._start is not None and self._encoding is not None
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self._encoder is None:
+            if not more_body and len(body) < self._middleware.minimum_size:
+                self._passthrough = True
+                await self._send(self._start)
+                await self._send(message)
+                return
+            self._encoder = self._middleware.encoders[self._encoding]()
+            headers = MutableHeaders(scope=self._start)
+            headers["Content-Encoding"] = self._encoding
+            if "content-length" in headers:
+                del headers["content-length"]
+            self._weaken_etag(headers)
+            if not more_body:
+                # Whole body known up front: send its compressed length
+                compressed = await self._run(self._encoder.finish, body)
+                headers["Content-Length"] = str(len(compressed))
+                await self._send(self._start)
+                await self._send({"type": "http.response.body", "body": compressed})
+                self._count(len(body), len(compressed))
+                return
+            await self._send(self._start)
+
+        compress = self._encoder.compress if more_body else self._encoder.finish
+        compressed = await self._run(compress, body)
+        await self._send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+        self._count(len(body), len(compressed), finished=not more_body)
+
+    @staticmethod
+    def _weaken_etag(headers: MutableHeaders) -> None:
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    async def _run(self, compress: Callable[[bytes], bytes], data: bytes) -> bytes:
+        if len(data) >= self._middleware.offload_size:
+            return await asyncio.to_thread(compress, data)
+        return compress(data)
+
+    def _count(self, size: int, compressed: int, finished: bool = True) -> None:
+        assert self._encoding is not None
+        compression_input_bytes_total.inc(size, encoding=self._encoding)
+        compression_output_bytes_total.inc(compressed, encoding=self._encoding)
+        if finished:
+            compressed_responses_total.inc(encoding=self._encoding)
@@ -0,0 +1,166 @@
+"""Request deadlines and cancellation on client disconnect."""
+
+import asyncio
+import json
+import math
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.deadline import get_deadline, reset_deadline, start_deadline
+from src.core.metrics import Counter
+
+TIMEOUT_HEADER = b"x-request-timeout"
+
+deadline_exceeded_total = Counter(
+    "http_deadline_exceeded_total", "Requests cancelled because their deadline passed"
+)
+client_disconnect_total = Counter(
+    "http_client_disconnect_cancelled_total",
+    "Requests cancelled because the client disconnected",
+)
+
+
+class DeadlineMiddleware:
+    """
+    Bound every HTTP request by a deadline and stop work the client gave up on.
+
+    The deadline comes from the `X-Request-Timeout` header (seconds, capped at
+    `max_timeout`) or `default_timeout`; routes may override the default with
+    the `route_timeout` dependency. It is stored in a context variable, which
+    the database session turns into `SET LOCAL statement_timeout`.
+
+    The endpoint runs in its own task. If the deadline passes it is cancelled
+    and a 504 is sent (when no response has started). If the client
+    disconnects it is cancelled silently, so its session rolls back and the
+    pooled connection is returned immediately.
+    """
+
+    def __init__(self, app: ASGIApp, *, default_timeout: float, max_timeout: float) -> None:
+        self.app = app
+        self.default_timeout = default_timeout
+        self.max_timeout = max_timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timeout, explicit = self._requested_timeout(scope)
+        token = start_deadline(timeout, explicit=explicit)
+        try:
+            await self._run(scope, receive, send)
+        finally:
+            reset_deadline(token)
+
+    async def _run(self, scope: Scope, receive: Receive, send: Send) -> None:
+        messages: asyncio.Queue[Message] = asyncio.Queue(maxsize=1)
+        disconnected = asyncio.Event()
+        response_complete = asyncio.Event()
+        response_started = False
+
+        async def read_from_server() -> None:
+            # Sole reader of the server's receive: forwards the body, then
+            # keeps listening so a disconnect is noticed even when idle
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    disconnected.set()
+                    return
+                await messages.put(message)
+
+        async def app_receive() -> Message:
+            if messages.empty() and disconnected.is_set():
+                return {"type": "http.disconnect"}
+            getter = asyncio.ensure_future(messages.get())
+            waiter = asyncio.ensure_future(disconnected.wait())
+            try:
+                await asyncio.wait({getter, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                # Also when the app stops listening, e.g. its response failed
+                waiter.cancel()
+                if not getter.done():
+                    getter.cancel()
+            if not getter.cancelled():
+                return getter.result()
+            return {"type": "http.disconnect"}
+
+        async def app_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete.set()
+            await send(message)
+
+        async def run_app() -> None:
+            await self.app(scope, app_receive, app_send)
+
+        app_task: asyncio.Task[None] = asyncio.create_task(run_app())
+        reader = asyncio.create_task(read_from_server())
+        disconnect_waiter: asyncio.Task[bool] = asyncio.create_task(disconnected.wait())
+        deadline = get_deadline()
+        try:
+            while not app_task.done() and not response_complete.is_set():
+                if disconnected.is_set():
+                    break
+                remaining = deadline.remaining() if deadline else None
+                if remaining == 0:
+                    break
+                waiters: set[asyncio.Future[None] | asyncio.Future[bool]] = {
+                    app_task,
+                    disconnect_waiter,
+                }
+                if deadline:
+                    # Wake up if a route changes the deadline
+                    deadline.changed.clear()
+                    changed: asyncio.Task[bool] = asyncio.create_task(deadline.changed.wait())
+                    waiters.add(changed)
+                _, pending = await asyncio.wait(
+                    waiters, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for waiter in pending - {app_task, disconnect_waiter}:
+                    waiter.cancel()
+        finally:
+            reader.cancel()
+            disconnect_waiter.cancel()
+
+        if app_task.done() or response_complete.is_set():
+            # Once the response is sent, let post-response work finish
+            await app_task
+            return
+
+        app_task.cancel()
+        await asyncio.gather(app_task, return_exceptions=True)
+
+        if disconnected.is_set():
+            client_disconnect_total.inc()
+            return
+
+        deadline_exceeded_total.inc()
+        if not response_started:
+            body = json.dumps({"detail": "Request deadline exceeded"}).encode()
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 504,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode()),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+
+    def _requested_timeout(self, scope: Scope) -> tuple[float, bool]:
+        """Timeout from the request header, falling back to the default."""
+        raw = dict(scope["headers"]).get(TIMEOUT_HEADER)
+        if raw is not None:
+            try:
+                timeout = float(raw)
+            except ValueError:
+                pass
+            else:
+                # NaN would slip through the clamp below
+                if math.isfinite(timeout):
+                    return min(max(timeout, 0.0), self.max_timeout), True
+        return self.default_timeout, False
@@ -0,0 +1,198 @@
+"""Idempotency-Key support for unsafe HTTP methods."""
+
+import asyncio
+import hashlib
+import json
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.application.interfaces.idempotency_store import IIdempotencyStore, StoredResponse
+
+IDEMPOTENCY_HEADER = b"idempotency-key"
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyMiddleware:
+    """
+    Replay the first response for requests that repeat an Idempotency-Key.
+
+    Keys are scoped to the caller (Authorization header, or anonymous), the
+    method and the path. The first request with a key runs normally and its
+    response is stored for `ttl` seconds. Later requests with the same key get
+    the stored response without running the endpoint. A duplicate that arrives
+    while the original is still running waits for it rather than running in
+    parallel, and runs itself if the original fails without a stored response.
+    Reusing a key with a different body is rejected with 422.
+
+    A key stays reserved for `reservation_ttl` seconds while its request runs,
+    which must cover the longest deadline a route can set. Request bodies are
+    buffered to fingerprint them, so those above `max_request_bytes` are
+    rejected with 413.
+
+    5xx responses, exceptions and bodies above `max_body_bytes` are not stored,
+    so the client may retry them.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: IIdempotencyStore,
+        *,
+        ttl: int = 86_400,
+        reservation_ttl: int = 60,
+        in_flight_timeout: float = 30.0,
+        max_body_bytes: int = 1_048_576,
+        max_request_bytes: int = 1_048_576,
+        methods: frozenset[str] = frozenset({"POST"}),
+    ) -> None:
+        self.app = app
+        self.store = store
+        self.ttl = ttl
+        self.reservation_ttl = reservation_ttl
+        self.in_flight_timeout = in_flight_timeout
+        self.max_body_bytes = max_body_bytes
+        self.max_request_bytes = max_request_bytes
+        self.methods = methods
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in self.methods:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        idempotency_key = headers.get(IDEMPOTENCY_HEADER)
+        if idempotency_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            await self._send_error(send, 400, "Invalid Idempotency-Key header")
+            return
+
+        body = await self._read_body(receive, headers.get(b"content-length"))
+        if body is None:
+            await self._send_error(send, 413, "Request body too large")
+            return
+        principal = hashlib.sha256(headers.get(b"authorization", b"anonymous")).hexdigest()
+        key = f"{principal}:{scope['method']}:{scope['path']}:{idempotency_key.decode('latin-1')}"
+        fingerprint = hashlib.sha256(body).hexdigest()
+
+        stored = await self.store.get(key)
+        loop = asyncio.get_running_loop()
+        wait_until = loop.time() + self.in_flight_timeout
+        while stored is None and not await self.store.reserve(key, self.reservation_ttl):
+            # Another request with this key is running; wait for its response,
+            # or reserve the key again if it was released without one
+            remaining = wait_until - loop.time()
+            if remaining <= 0:
+                await self._send_error(send, 409, "A request with this key is in progress")
+                return
+            stored = await self.store.wait_for(key, remaining)
+
+        if stored is not None:
+            if stored.fingerprint != fingerprint:
+                await self._send_error(send, 422, "Idempotency-Key reused with a different body")
+                return
+            await self._replay(send, stored)
+            return
+
+        await self._run_and_store(scope, receive, body, send, key, fingerprint)
+
+    async def _run_and_store(
+        self,
+        scope: Scope,
+        receive: Receive,
+        body: bytes,
+        send: Send,
+        key: str,
+        fingerprint: str,
+    ) -> None:
+        status_code = 500
+        response_headers: list[tuple[str, str]] = []
+        chunks: list[bytes] = []
+        size = 0
+
+        body_sent = False
+
+        async def replay_receive() -> Message:
+            # Hand over the buffered body once, then defer to the server (disconnects)
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def capture_send(message: Message) -> None:
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_headers.extend(
+                    (name.decode("latin-1"), value.decode("latin-1"))
+                    for name, value in message.get("headers", [])
+                )
+            elif message["type"] == "http.response.body" and size <= self.max_body_bytes:
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                chunks.append(chunk)
+            await send(message)
+
+        try:
+            await self.app(scope, replay_receive, capture_send)
+        except BaseException:
+            await self.store.release(key)
+            raise
+
+        if status_code >= 500 or size > self.max_body_bytes:
+            await self.store.release(key)
+            return
+        await self.store.save(
+            key,
+            StoredResponse(
+                status_code=status_code,
+                headers=response_headers,
+                body=b"".join(chunks),
+                fingerprint=fingerprint,
+            ),
+            self.ttl,
+        )
+
+    async def _read_body(self, receive: Receive, content_length: bytes | None) -> bytes | None:
+        """The whole request body, or None once it exceeds max_request_bytes."""
+        declared = int(content_length) if content_length and content_length.isdigit() else 0
+        if declared > self.max_request_bytes:
+            return None
+        chunks: list[bytes] = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_request_bytes:
+                return None
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+        return b"".join(chunks)
+
+    async def _replay(self, send: Send, stored: StoredResponse) -> None:
+        headers = [
+            (name.encode("latin-1"), value.encode("latin-1")) for name, value in stored.headers
+        ]
+        headers.append((b"idempotent-replayed", b"true"))
+        await send(
+            {"type": "http.response.start", "status": stored.status_code, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": stored.body})
+
+    async def _send_error(self, send: Send, status_code: int, detail: str) -> None:
+        body = json.dumps({"detail": detail}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,145 @@
+"""
+Shared fixtures.
+
+Database tests use the configured database, migrated to head, or for tests
+that commit a lot of rows a scratch database on the same server.
+"""
+
+import asyncio
+import os
+import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+from sqlalchemy import make_url, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.core.config import get_settings
+from src.infrastructure.database import dispose_engine, get_engine, get_session_maker
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Throwaway customers, one every `:days * 86400 / :users` seconds up to a day
+# ago, with time-ordered (UUIDv7 layout) ids as the app writes them; every
+# other one has a phone number
+SEED_USERS = text(
+    """
+    INSERT INTO users (id, email, hashed_password, full_name, phone, role, is_active,
+                       is_verified, created_at, updated_at)
+    SELECT (lpad(to_hex((extract(epoch FROM ts) * 1000)::bigint), 12, '0') || '7'
+            || substr(md5(n::text), 1, 3) || '8' || substr(md5(n::text), 4, 15))::uuid,
+           format(:email_format, n), '!', 'Test User ' || n,
+           CASE WHEN n % 2 = 0 THEN '+8809' || lpad(n::text, 9, '0') END,
+           'CUSTOMER', n % 10 <> 0, n % 3 = 0, ts, ts
+    FROM (
+        SELECT n, now() - interval '1 day'
+                  - make_interval(secs => (:users - n) * 86400.0 * :days / :users) AS ts
+        FROM generate_series(1, :users) AS n
+    ) AS seeded
+    ORDER BY n
+    """
+)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+async def require_database() -> None:
+    """Skip the test when the configured database cannot be reached."""
+    try:
+        async with get_engine().connect():
+            pass
+    except Exception as e:
+        await dispose_engine()
+        pytest.skip(f"Database unavailable: {e}")
+
+
+@pytest.fixture
+async def connection() -> AsyncIterator[AsyncConnection]:
+    """
+    A connection in a transaction that is rolled back afterwards.
+
+    Skips the test when the database cannot be reached.
+    """
+    await require_database()
+    connection = await get_engine().connect()
+    transaction = await connection.begin()
+    try:
+        yield connection
+    finally:
+        await transaction.rollback()
+        await connection.close()
+        # Pooled connections belong to this test's event loop
+        await dispose_engine()
+
+
+@asynccontextmanager
+async def scratch_database(server_url: str, name: str) -> AsyncIterator[str]:
+    """
+    An empty database `name` on the server at `server_url`, dropped afterwards.
+
+    A database of that name left by an interrupted run is dropped first.
+    Yields its URL.
+    """
+    url = make_url(server_url)
+    engine = create_async_engine(
+        url.set(database="postgres"), isolation_level="AUTOCOMMIT", poolclass=NullPool
+    )
+
+    async def drop() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+
+    try:
+        await drop()
+        async with engine.connect() as connection:
+            await connection.execute(text(f'CREATE DATABASE "{name}"'))
+        yield url.set(database=name).render_as_string(hide_password=False)
+    finally:
+        await drop()
+        await engine.dispose()
+
+
+@asynccontextmanager
+async def scratch_primary(suffix: str) -> AsyncIterator[str]:
+    """
+    The app's database switched to a scratch one migrated to head, for one test.
+
+    Skips the test when the configured database cannot be reached. Yields
+    the scratch database's URL.
+    """
+    await require_database()
+    settings = get_settings()
+    name = f"{settings.database.name}_{suffix}"
+    async with scratch_database(settings.database.url, name) as url:
+        migration = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "alembic",
+            "upgrade",
+            "head",
+            cwd=ROOT,
+            env={**os.environ, "DB_NAME": name},
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        output, _ = await migration.communicate()
+        assert migration.returncode == 0, output.decode()
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setenv("DB_NAME", name)
+            get_settings.cache_clear()
+            await dispose_engine()
+            get_session_maker.cache_clear()
+            try:
+                yield url
+            finally:
+                # Connections to the scratch database must close before it is dropped
+                await dispose_engine()
+                get_session_maker.cache_clear()
+        get_settings.cache_clear()
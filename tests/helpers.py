@@ -0,0 +1,102 @@
+"""Helpers for tests that call the app in process, without a server."""
+
+import asyncio
+import json
+import time
+from dataclasses import replace
+from uuid import UUID
+
+from starlette.types import ASGIApp, Message
+
+from src.domain.entities.user import Role
+from src.infrastructure.database import get_session_maker
+from src.infrastructure.repositories.sharded_user_repository import UserRepositoryFactory
+
+TEST_EMAIL = "test-user-{}@example.com"
+TEST_PASSWORD = "TestUser123"
+
+
+class Client:
+    """Calls the ASGI app directly and returns status, headers and body."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+
+    async def request(
+        self, method: str, path: str, headers: dict[str, str], body: bytes = b""
+    ) -> tuple[int, dict[str, str], bytes]:
+        path, _, query = path.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "headers": [(b"host", b"test")]
+            + [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+            "client": ("127.0.0.1", 0),
+            "server": ("test", 80),
+        }
+        sent = False
+        response: dict[str, object] = {"status": 0, "headers": {}}
+        chunks: list[bytes] = []
+
+        async def receive() -> Message:
+            nonlocal sent
+            if sent:
+                # The client stays connected until the response is complete
+                await asyncio.Event().wait()
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["headers"] = {
+                    name.decode(): value.decode() for name, value in message["headers"]
+                }
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self._app(scope, receive, send)
+        status = response["status"]
+        response_headers = response["headers"]
+        assert isinstance(status, int) and isinstance(response_headers, dict)
+        return status, response_headers, b"".join(chunks)
+
+    async def post_json(
+        self, path: str, payload: object, headers: dict[str, str] | None = None
+    ) -> tuple[int, dict[str, object]]:
+        """POST `payload` as JSON; returns the status and the decoded body."""
+        status, _, body = await self.request(
+            "POST",
+            path,
+            {"content-type": "application/json", **(headers or {})},
+            json.dumps(payload).encode(),
+        )
+        return status, json.loads(body) if body else {}
+
+
+async def log_in(client: Client, prefix: str) -> tuple[UUID, str]:
+    """Register a throwaway user and return its id and an access token."""
+    credentials = {"email": TEST_EMAIL.format(time.time_ns()), "password": TEST_PASSWORD}
+    status, body = await client.post_json(
+        f"{prefix}/auth/register", {**credentials, "full_name": "Test User", "phone": None}
+    )
+    assert status == 201, body
+    user_id = UUID(str(body["id"]))
+    status, body = await client.post_json(f"{prefix}/auth/login", credentials)
+    assert status == 200, body
+    return user_id, str(body["access_token"])
+
+
+async def promote_to_admin(repository_factory: UserRepositoryFactory, user_id: UUID) -> None:
+    async with get_session_maker()() as session:
+        repository = repository_factory(session)
+        user = await repository.get_by_id(user_id)
+        assert user is not None
+        await repository.update(replace(user, role=Role.ADMIN))
+        await session.commit()
@@ -0,0 +1,84 @@
+"""
+The application lifespan starts every background service and stops them all.
+
+Shutdown is unwound from what actually started: a startup step that fails
+stops the services already running, and a stop that raises does not keep
+the ones after it from running. Either way no background task outlives the
+lifespan and the engine is disposed.
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.config import get_settings
+from src.infrastructure.database.connection import get_engine
+from src.infrastructure.events.dispatcher import OutboxDispatcher
+from src.infrastructure.jobs.runner import JobRunner
+from src.main import create_app
+from tests.conftest import require_database
+from tests.helpers import Client
+
+pytestmark = pytest.mark.anyio
+
+
+def running_tasks() -> set[asyncio.Task[object]]:
+    return {task for task in asyncio.all_tasks() if not task.done()}
+
+
+async def fail() -> None:
+    raise RuntimeError("injected failure")
+
+
+async def test_started_app_answers_and_stops_cleanly() -> None:
+    await require_database()
+    before = running_tasks()
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        client = Client(app)
+        assert (await client.request("GET", "/health", {}))[0] == 200
+        products = f"{get_settings().api_prefix}/products?limit=1"
+        assert (await client.request("GET", products, {}))[0] == 200
+        assert running_tasks() - before
+
+    assert running_tasks() - before == set()
+    assert get_engine.cache_info().currsize == 0
+
+
+async def test_failed_startup_stops_the_services_already_started(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    await require_database()
+    # The last service to start
+    monkeypatch.setattr(OutboxDispatcher, "start", lambda _self: fail())
+    before = running_tasks()
+    app = create_app()
+
+    with pytest.raises(RuntimeError, match="injected failure"):
+        async with app.router.lifespan_context(app):
+            pass
+
+    assert running_tasks() - before == set()
+    assert get_engine.cache_info().currsize == 0
+
+
+async def test_failing_stop_does_not_skip_the_other_stops(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    await require_database()
+    stop_job_runner = JobRunner.stop
+
+    async def stop_and_fail(runner: JobRunner) -> None:
+        await stop_job_runner(runner)
+        await fail()
+
+    monkeypatch.setattr(JobRunner, "stop", stop_and_fail)
+    before = running_tasks()
+    app = create_app()
+
+    with pytest.raises(RuntimeError, match="injected failure"):
+        async with app.router.lifespan_context(app):
+            pass
+
+    assert running_tasks() - before == set()
+    assert get_engine.cache_info().currsize == 0
@@ -0,0 +1,169 @@
+"""
+The database circuit breaker under injected faults.
+
+The app reaches Postgres through BrownoutProxy, which can hold back every
+reply from the server. During a brownout the breaker opens once enough
+calls are slow, and requests started after that fail fast with 503s
+instead of waiting on the database. Statements cancelled by a request's own
+tiny deadline are not an outage: however many there are, the breaker stays
+closed.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from src.core.config import get_settings
+from src.core.deadline import start_deadline
+from src.infrastructure.database import SessionDep, dispose_engine, get_session_maker
+from src.infrastructure.database.circuit_breaker import (
+    BREAKERS,
+    CircuitState,
+    DatabaseUnavailableError,
+)
+from src.main import database_error_handler, database_unavailable_handler
+from src.presentation.middleware.deadline import DeadlineMiddleware
+from tests.conftest import require_database
+from tests.helpers import Client
+
+pytestmark = pytest.mark.anyio
+
+REPLY_DELAY = 3.0
+SLOW_CALL_DURATION = 0.3
+MINIMUM_CALLS = 10
+
+
+class BrownoutProxy:
+    """TCP proxy in front of Postgres that can delay everything the server sends."""
+
+    def __init__(self, host: str, port: int) -> None:
+        self._host = host
+        self._port = port
+        self.delay = 0.0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> int:
+        """Start listening on a free local port and return it."""
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port: int = self._server.sockets[0].getsockname()[1]
+        return port
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+
+    async def _handle(self, client: asyncio.StreamReader, to_client: asyncio.StreamWriter) -> None:
+        try:
+            server, to_server = await asyncio.open_connection(self._host, self._port)
+        except OSError:
+            to_client.close()
+            return
+        await asyncio.gather(
+            self._pipe(client, to_server, delayed=False),
+            self._pipe(server, to_client, delayed=True),
+            return_exceptions=True,
+        )
+
+    async def _pipe(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, delayed: bool
+    ) -> None:
+        try:
+            while data := await reader.read(65_536):
+                if delayed and self.delay:
+                    await asyncio.sleep(self.delay)
+                writer.write(data)
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+def create_test_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(DeadlineMiddleware, default_timeout=30.0, max_timeout=60.0)
+    app.add_exception_handler(DBAPIError, database_error_handler)
+    app.add_exception_handler(DatabaseUnavailableError, database_unavailable_handler)
+
+    @app.get("/read")
+    async def read(session: SessionDep) -> dict[str, int]:
+        return {"one": (await session.execute(text("SELECT 1"))).scalar_one()}
+
+    @app.get("/cancelled")
+    async def cancelled(session: SessionDep) -> dict[str, bool]:
+        # As a request sent with a near-zero X-Request-Timeout ends up:
+        # statement_timeout = 1ms
+        start_deadline(0.0)
+        await session.execute(text("SELECT pg_sleep(0.05)"))
+        return {"cancelled": False}
+
+    return app
+
+
+@pytest.fixture
+async def proxy(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[BrownoutProxy]:
+    """A proxy every database connection goes through, with a breaker that trips quickly."""
+    settings = get_settings()
+    proxy = BrownoutProxy(settings.database.host, settings.database.port)
+    monkeypatch.setenv("DB_HOST", "127.0.0.1")
+    monkeypatch.setenv("DB_PORT", str(await proxy.start()))
+    monkeypatch.setenv("DB_BREAKER_ENABLED", "true")
+    monkeypatch.setenv("DB_BREAKER_WINDOW", str(MINIMUM_CALLS))
+    monkeypatch.setenv("DB_BREAKER_MINIMUM_CALLS", str(MINIMUM_CALLS))
+    monkeypatch.setenv("DB_BREAKER_SLOW_CALL_DURATION", str(SLOW_CALL_DURATION))
+    monkeypatch.setenv("DB_BREAKER_OPEN_DURATION", "60")
+    get_settings.cache_clear()
+    await dispose_engine()
+    # Sessions must use the engine (and breaker) built from these settings
+    get_session_maker.cache_clear()
+    try:
+        await require_database()
+        yield proxy
+    finally:
+        proxy.delay = 0.0
+        await dispose_engine()
+        get_session_maker.cache_clear()
+        await proxy.stop()
+        get_settings.cache_clear()
+
+
+async def timed(client: Client, path: str) -> tuple[int, float]:
+    started = time.perf_counter()
+    status, _, _ = await client.request("GET", path, {})
+    return status, time.perf_counter() - started
+
+
+async def test_brownout_latency_is_bounded_once_the_breaker_opens(
+    proxy: BrownoutProxy,
+) -> None:
+    client = Client(create_test_app())
+    for _ in range(MINIMUM_CALLS):
+        assert (await timed(client, "/read"))[0] == 200
+
+    proxy.delay = REPLY_DELAY
+    stuck = [asyncio.create_task(timed(client, "/read")) for _ in range(MINIMUM_CALLS)]
+    # Stalled calls count as slow once they have run this long
+    await asyncio.sleep(SLOW_CALL_DURATION * 2)
+    late = [await timed(client, "/read") for _ in range(50)]
+
+    assert BREAKERS["primary"].state is CircuitState.OPEN
+    assert {status for status, _ in late} == {503}
+    assert max(elapsed for _, elapsed in late) < 0.1
+    # Requests caught by the brownout before the breaker opened still finish
+    assert all(status == 200 for status, _ in await asyncio.gather(*stuck))
+
+
+@pytest.mark.usefixtures("proxy")
+async def test_statements_cancelled_by_their_deadline_keep_the_breaker_closed() -> None:
+    client = Client(create_test_app())
+    statuses = [(await timed(client, "/cancelled"))[0] for _ in range(MINIMUM_CALLS * 3)]
+
+    assert statuses == [504] * len(statuses)
+    breaker = BREAKERS["primary"]
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.snapshot()["failure_rate"] == 0.0
+    assert (await timed(client, "/read"))[0] == 200
@@ -0,0 +1,116 @@
+"""
+Slow queries must not exhaust the connection pool for everyone else.
+
+A two-connection pool serves an app with DeadlineMiddleware. Six requests
+run a slow query while a fast one queues behind them for a connection.
+With a short X-Request-Timeout the slow requests end in 504s at their
+deadline and give their connections back, so the fast request is served
+within a fraction of a second; without one it waits for the slow queries.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from src.core.config import get_settings
+from src.core.deadline import get_deadline
+from src.infrastructure.database import SessionDep, dispose_engine, get_session_maker
+from src.main import database_error_handler
+from src.presentation.middleware.deadline import DeadlineMiddleware
+from tests.conftest import require_database
+from tests.helpers import Client
+
+pytestmark = pytest.mark.anyio
+
+POOL_SIZE = 2
+SLOW_REQUESTS = POOL_SIZE * 3
+SLOW_QUERY_SECONDS = 1.0
+
+
+def create_test_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(DeadlineMiddleware, default_timeout=30.0, max_timeout=60.0)
+    app.add_exception_handler(DBAPIError, database_error_handler)
+
+    @app.get("/slow")
+    async def slow(session: SessionDep) -> dict[str, bool]:
+        await session.execute(text("SELECT pg_sleep(:seconds)"), {"seconds": SLOW_QUERY_SECONDS})
+        return {"slow": True}
+
+    @app.get("/fast")
+    async def fast(session: SessionDep) -> dict[str, int]:
+        return {"one": (await session.execute(text("SELECT 1"))).scalar_one()}
+
+    @app.get("/remaining")
+    async def remaining(session: SessionDep) -> dict[str, float]:
+        await session.execute(text("SELECT 1"))
+        deadline = get_deadline()
+        assert deadline is not None
+        return {"remaining": deadline.remaining()}
+
+    return app
+
+
+@pytest.fixture
+async def client(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[Client]:
+    monkeypatch.setenv("DB_POOL_SIZE", str(POOL_SIZE))
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+    # Only the deadline's effect is under test, not the breaker's
+    monkeypatch.setenv("DB_BREAKER_ENABLED", "false")
+    get_settings.cache_clear()
+    await dispose_engine()
+    # Sessions must use the engine (and pool) built from these settings
+    get_session_maker.cache_clear()
+    await require_database()
+    try:
+        yield Client(create_test_app())
+    finally:
+        await dispose_engine()
+        get_session_maker.cache_clear()
+        get_settings.cache_clear()
+
+
+async def fast_request_under_slow_load(
+    client: Client, slow_headers: dict[str, str]
+) -> tuple[float, list[int]]:
+    """Seconds the fast request took while slow ones held the pool, and the slow statuses."""
+    slow = [
+        asyncio.create_task(client.request("GET", "/slow", slow_headers))
+        for _ in range(SLOW_REQUESTS)
+    ]
+    # Let the slow requests take every connection and queue for more
+    await asyncio.sleep(0.1)
+    started = time.perf_counter()
+    status, _, _ = await client.request("GET", "/fast", {})
+    elapsed = time.perf_counter() - started
+    assert status == 200
+    return elapsed, [status for status, _, _ in await asyncio.gather(*slow)]
+
+
+async def test_deadlines_free_the_pool_for_other_requests(client: Client) -> None:
+    elapsed, statuses = await fast_request_under_slow_load(client, {"x-request-timeout": "0.3"})
+
+    assert statuses == [504] * SLOW_REQUESTS
+    assert elapsed < 0.5
+
+
+async def test_without_deadlines_slow_queries_hold_the_pool(client: Client) -> None:
+    elapsed, statuses = await fast_request_under_slow_load(client, {})
+
+    assert statuses == [200] * SLOW_REQUESTS
+    # Queued until at least one slow query finished
+    assert elapsed > SLOW_QUERY_SECONDS * 0.9
+
+
+@pytest.mark.parametrize("timeout", ["nan", "inf", "-inf", "soon"])
+async def test_unusable_timeouts_fall_back_to_the_default(client: Client, timeout: str) -> None:
+    status, _, body = await client.request("GET", "/remaining", {"x-request-timeout": timeout})
+
+    assert status == 200
+    assert 29.0 < json.loads(body)["remaining"] <= 30.0
@@ -0,0 +1,114 @@
+"""
+The Bloom filter's entry count, which decides when the email filter is
+rebuilt, and the email filter kept current with registrations and email
+changes across workers.
+"""
+
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from src.domain.entities.user import User
+from src.infrastructure.cache.email_filter import (
+    BloomEmailFilter,
+    BloomFilter,
+    read_snapshot,
+    write_snapshot,
+)
+from src.infrastructure.database import get_session_maker
+from src.infrastructure.repositories.sharded_user_repository import user_repository_factory
+from tests.conftest import scratch_primary
+
+CAPACITY = 50_000
+
+
+@pytest.mark.parametrize("fill", [0.5, 1.0, 2.0])
+def test_count_tracks_distinct_keys(fill: float) -> None:
+    bloom = BloomFilter.sized(CAPACITY, 0.01)
+    keys = int(CAPACITY * fill)
+    for n in range(keys):
+        bloom.add(f"user-{n}@example.com")
+        # Refreshes re-read an overlap window, so keys are often added again
+        if n % 3 == 0:
+            bloom.add(f"user-{n}@example.com")
+
+    # Past capacity many new keys are false positives and set no bit
+    assert bloom.count == pytest.approx(keys, rel=0.01)
+
+
+def test_snapshot_keeps_the_count(tmp_path: Path) -> None:
+    bloom = BloomFilter.sized(CAPACITY, 0.01)
+    for n in range(CAPACITY):
+        bloom.add(f"user-{n}@example.com")
+    path = tmp_path / "emails.bloom"
+
+    write_snapshot(path, bloom, CAPACITY, None)
+    loaded, capacity, _ = read_snapshot(path)
+
+    assert capacity == CAPACITY
+    assert loaded.set_bits == bloom.set_bits
+    assert loaded.count == bloom.count
+    assert bloom.copy().count == bloom.count
+
+
+@pytest.fixture
+async def database() -> AsyncIterator[None]:
+    async with scratch_primary("test_email_filter"):
+        yield
+
+
+def worker_filter(tmp_path: Path, name: str) -> BloomEmailFilter:
+    """One worker's filter, refreshed by hand rather than by its background task."""
+    return BloomEmailFilter(
+        get_session_maker(), user_repository_factory(None), str(tmp_path / f"{name}.bloom")
+    )
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("database")
+async def test_changed_email_reaches_this_worker_at_once_and_others_on_refresh(
+    tmp_path: Path,
+) -> None:
+    this, other = worker_filter(tmp_path, "this"), worker_filter(tmp_path, "other")
+    repositories = user_repository_factory(None, this)
+    async with get_session_maker()() as session:
+        user = await repositories(session).create(
+            User(email="before@example.com", hashed_password="!", full_name="Email Change")
+        )
+        await session.commit()
+    await this.refresh()
+    await other.refresh()
+    assert not this.might_be_registered("after@example.com")
+
+    async with get_session_maker()() as session:
+        await repositories(session).update(replace(user, email="After@example.com"))
+        await session.commit()
+
+    assert this.might_be_registered("after@example.com")
+    assert not other.might_be_registered("after@example.com")
+    # Only the changed directory entry is read
+    assert await other.refresh() == 1
+    assert other.might_be_registered("after@example.com")
+    assert other.might_be_registered("before@example.com")
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("database")
+async def test_unchanged_email_is_not_added_again(tmp_path: Path) -> None:
+    this = worker_filter(tmp_path, "this")
+    repositories = user_repository_factory(None, this)
+    async with get_session_maker()() as session:
+        user = await repositories(session).create(
+            User(email="same@example.com", hashed_password="!", full_name="Same Email")
+        )
+        await session.commit()
+    await this.refresh()
+    assert await this.save()
+
+    async with get_session_maker()() as session:
+        await repositories(session).update(replace(user, full_name="Renamed"))
+        await session.commit()
+
+    assert not await this.save()
@@ -0,0 +1,90 @@
+"""Requests repeating an Idempotency-Key: waiters, retries after failures, body limits."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from src.infrastructure.cache.memory_idempotency_store import InMemoryIdempotencyStore
+from src.presentation.middleware.idempotency import IdempotencyMiddleware
+from tests.helpers import Client
+
+pytestmark = pytest.mark.anyio
+
+MAX_REQUEST_BYTES = 100
+
+
+def create_test_app(statuses: list[int]) -> tuple[FastAPI, list[int]]:
+    """An app answering POST /orders with `statuses` in turn; the calls it served."""
+    app = FastAPI()
+    app.add_middleware(
+        IdempotencyMiddleware,
+        store=InMemoryIdempotencyStore(),
+        max_request_bytes=MAX_REQUEST_BYTES,
+    )
+    calls: list[int] = []
+
+    @app.post("/orders")
+    async def create_order() -> JSONResponse:
+        calls.append(len(calls))
+        await asyncio.sleep(0.1)
+        return JSONResponse({"call": len(calls)}, status_code=statuses[len(calls) - 1])
+
+    return app, calls
+
+
+async def test_duplicate_runs_itself_after_the_original_fails() -> None:
+    app, calls = create_test_app([503, 201])
+    client = Client(app)
+    headers = {"idempotency-key": "order-1"}
+
+    original = asyncio.create_task(client.request("POST", "/orders", headers, b"{}"))
+    await asyncio.sleep(0.02)
+    duplicate = await client.request("POST", "/orders", headers, b"{}")
+
+    assert (await original)[0] == 503
+    assert duplicate[0] == 201
+    assert len(calls) == 2
+    replayed = await client.request("POST", "/orders", headers, b"{}")
+    assert replayed[0] == 201
+    assert replayed[1]["idempotent-replayed"] == "true"
+    assert len(calls) == 2
+
+
+async def test_duplicate_waits_for_a_successful_original() -> None:
+    app, calls = create_test_app([201])
+    client = Client(app)
+    headers = {"idempotency-key": "order-2"}
+
+    original = asyncio.create_task(client.request("POST", "/orders", headers, b"{}"))
+    await asyncio.sleep(0.02)
+    duplicate = await client.request("POST", "/orders", headers, b"{}")
+
+    assert (await original)[0] == duplicate[0] == 201
+    assert len(calls) == 1
+
+
+async def test_oversized_body_is_rejected() -> None:
+    app, calls = create_test_app([201])
+    body = b"x" * (MAX_REQUEST_BYTES + 1)
+
+    status, _, _ = await Client(app).request(
+        "POST", "/orders", {"idempotency-key": "order-3"}, body
+    )
+
+    assert status == 413
+    assert not calls
+
+
+async def test_waiters_wake_when_a_reservation_expires() -> None:
+    store = InMemoryIdempotencyStore()
+    assert await store.reserve("order-4", ttl=1)
+
+    started = asyncio.get_running_loop().time()
+    waited = await asyncio.gather(*(store.wait_for("order-4", timeout=10.0) for _ in range(3)))
+
+    assert waited == [None] * 3
+    assert asyncio.get_running_loop().time() - started < 2.0
+    assert not store._events
+    assert await store.reserve("order-4", ttl=1)
@@ -0,0 +1,59 @@
+"""Import-time budget for the application module."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# `import src.main` loads settings, logging, metrics and the lazily created
+# engine; routers, repositories and background services load in create_app
+# and the lifespan.
+MAX_SRC_MODULES = 15
+LAZY_PACKAGES = (
+    "src.presentation",
+    "src.application",
+    "src.domain",
+    "src.infrastructure.cache",
+    "src.infrastructure.events",
+    "src.infrastructure.jobs",
+    "src.infrastructure.orm",
+    "src.infrastructure.repositories",
+    "src.infrastructure.services",
+)
+# Cumulative microseconds for src.main as reported by -X importtime, most of
+# it FastAPI and SQLAlchemy: about 0.5s, against 0.9s with every router,
+# repository and background service imported up front.
+IMPORT_BUDGET_US = 800_000
+
+
+def import_times() -> dict[str, int]:
+    """Cumulative import time in microseconds of each module `import src.main` loads."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_src_main_loads_few_project_modules() -> None:
+    times = import_times()
+    loaded = sorted(module for module in times if module.split(".")[0] == "src")
+
+    assert len(loaded) <= MAX_SRC_MODULES, loaded
+    assert not [module for module in loaded if module.startswith(LAZY_PACKAGES)]
+
+
+def test_src_main_import_time_within_budget() -> None:
+    # The first run may compile bytecode; time the second
+    import_times()
+    assert import_times()["src.main"] <= IMPORT_BUDGET_US
@@ -0,0 +1,168 @@
+"""
+The PostgreSQL job queue and its runner, on a scratch database.
+
+Covers retry backoff, retries running out, a worker whose lock lapsed not
+settling a job another worker claimed again, and the verification email
+handler sending through the in-memory mail sink.
+"""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select
+
+from src.application.use_cases.user.send_verification_email import SEND_VERIFICATION_EMAIL_JOB
+from src.infrastructure.database import get_session_maker
+from src.infrastructure.jobs.handlers import register_job_handlers
+from src.infrastructure.jobs.queue import ClaimedJob, JobStatus, SQLAlchemyJobQueue
+from src.infrastructure.jobs.registry import JobRegistry
+from src.infrastructure.jobs.runner import JobRunner
+from src.infrastructure.orm.job_model import JobModel
+from src.infrastructure.services.email_sender import InMemoryEmailSender
+from tests.conftest import scratch_primary
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def database() -> AsyncIterator[None]:
+    async with scratch_primary("test_jobs"):
+        yield
+
+
+class Tokens:
+    def create_email_verification_token(self, user_id: UUID, email: str) -> str:
+        return f"verify:{user_id}:{email}"
+
+
+def runner(registry: JobRegistry, retry_backoff: float = 0.0) -> JobRunner:
+    return JobRunner(get_session_maker(), registry, retry_backoff=retry_backoff)
+
+
+async def enqueue(name: str, payload: dict[str, Any], max_attempts: int = 5) -> UUID:
+    async with get_session_maker()() as session, session.begin():
+        return await SQLAlchemyJobQueue(session).enqueue(name, payload, max_attempts=max_attempts)
+
+
+async def job_row(job_id: UUID) -> JobModel | None:
+    async with get_session_maker()() as session:
+        return await session.scalar(select(JobModel).where(JobModel.id == job_id))
+
+
+async def claim() -> list[ClaimedJob]:
+    async with get_session_maker()() as session, session.begin():
+        return await SQLAlchemyJobQueue(session).claim(10)
+
+
+def test_backoff_doubles_per_attempt_with_jitter_up_to_the_cap() -> None:
+    jobs = JobRunner(None, JobRegistry(), retry_backoff=2.0, max_retry_backoff=60.0)  # type: ignore[arg-type]
+
+    for attempts, ceiling in [(1, 2.0), (2, 4.0), (3, 8.0), (5, 32.0), (6, 60.0), (20, 60.0)]:
+        delays = [jobs._backoff(attempts) for _ in range(200)]
+        assert all(ceiling / 2 <= delay <= ceiling for delay in delays)
+        # Jittered, so failing jobs spread out
+        assert len(set(delays)) > 1
+
+
+@pytest.mark.usefixtures("database")
+async def test_failing_job_is_retried_until_its_attempts_run_out() -> None:
+    calls: list[dict[str, Any]] = []
+
+    async def always_fails(payload: dict[str, Any]) -> None:
+        calls.append(payload)
+        raise RuntimeError(f"attempt {len(calls)} failed")
+
+    registry = JobRegistry()
+    registry.register("flaky", always_fails)
+    job_id = await enqueue("flaky", {"n": 1}, max_attempts=2)
+    jobs = runner(registry)
+
+    assert await jobs.run_once() == 1
+    row = await job_row(job_id)
+    assert row is not None
+    assert (row.status, row.attempts, row.locked_at) == (JobStatus.PENDING.value, 1, None)
+    assert row.last_error == "RuntimeError: attempt 1 failed"
+
+    assert await jobs.run_once() == 1
+    row = await job_row(job_id)
+    assert row is not None
+    assert (row.status, row.attempts) == (JobStatus.FAILED.value, 2)
+    assert row.last_error == "RuntimeError: attempt 2 failed"
+    # Failed jobs stay for inspection but are not claimed again
+    assert await jobs.run_once() == 0
+    assert calls == [{"n": 1}, {"n": 1}]
+
+
+@pytest.mark.usefixtures("database")
+async def test_backoff_delays_the_retry() -> None:
+    async def fails(_payload: dict[str, Any]) -> None:
+        raise RuntimeError("down")
+
+    registry = JobRegistry()
+    registry.register("flaky", fails)
+    job_id = await enqueue("flaky", {})
+    before = datetime.now(UTC)
+
+    assert await runner(registry, retry_backoff=60.0).run_once() == 1
+    row = await job_row(job_id)
+    assert row is not None and row.status == JobStatus.PENDING.value
+    assert before + timedelta(seconds=30) <= row.run_at <= before + timedelta(seconds=61)
+    assert await runner(registry).run_once() == 0
+
+
+@pytest.mark.usefixtures("database")
+async def test_lapsed_claim_cannot_settle_a_job_claimed_again() -> None:
+    succeeded = await enqueue("job", {})
+    failed = await enqueue("job", {})
+    retried = await enqueue("job", {})
+    first = await claim()
+    # The first worker stalls past lock_timeout; the job is released and claimed again
+    async with get_session_maker()() as session, session.begin():
+        queue = SQLAlchemyJobQueue(session)
+        assert await queue.recover_stale(datetime.now(UTC) + timedelta(seconds=1)) == 3
+    second = await claim()
+    assert {job.id for job in second} == {succeeded, failed, retried}
+
+    by_id = {job.id: job for job in first}
+    async with get_session_maker()() as session, session.begin():
+        queue = SQLAlchemyJobQueue(session)
+        assert await queue.complete([by_id[succeeded]]) == set()
+        assert not await queue.fail(by_id[failed], "late")
+        assert not await queue.retry(by_id[retried], 0, "late")
+
+    for job_id in (succeeded, failed, retried):
+        row = await job_row(job_id)
+        assert row is not None
+        assert (row.status, row.attempts) == (JobStatus.RUNNING.value, 2)
+        assert row.last_error == "Worker lock expired"
+
+    # The current claim still settles them
+    by_id = {job.id: job for job in second}
+    async with get_session_maker()() as session, session.begin():
+        queue = SQLAlchemyJobQueue(session)
+        assert await queue.complete([by_id[succeeded]]) == {succeeded}
+        assert await queue.fail(by_id[failed], "gave up")
+        assert await queue.retry(by_id[retried], 0, "again")
+    assert await job_row(succeeded) is None
+
+
+@pytest.mark.usefixtures("database")
+async def test_verification_email_job_sends_through_the_mail_sink() -> None:
+    user_id = UUID("01900000-0000-7000-8000-000000000001")
+    sender = InMemoryEmailSender()
+    registry = JobRegistry()
+    register_job_handlers(registry, email_sender=sender, token_service=Tokens())  # type: ignore[arg-type]
+    job_id = await enqueue(
+        SEND_VERIFICATION_EMAIL_JOB, {"user_id": str(user_id), "email": "new@example.com"}
+    )
+
+    assert await runner(registry).run_once() == 1
+
+    (email,) = sender.sent
+    assert email.to == "new@example.com"
+    assert email.subject == "Verify your Dhakacart email"
+    assert f"token=verify%3A{user_id}%3Anew%40example.com" in email.body
+    assert await job_row(job_id) is None
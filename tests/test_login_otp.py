@@ -0,0 +1,219 @@
+"""SMS login codes: store expiry on the timer wheel, and requesting and verifying codes."""
+
+import re
+from uuid import UUID
+
+import pytest
+
+from src.application.dto.requests.auth_request import RequestOtpRequest, VerifyOtpRequest
+from src.application.interfaces.otp_store import OtpCheck, OtpPolicy
+from src.application.use_cases.user.request_login_otp import RequestLoginOtp
+from src.application.use_cases.user.verify_login_otp import VerifyLoginOtp
+from src.domain.entities.auth_event import AuthEvent, AuthEventType
+from src.domain.entities.user import User
+from src.domain.exceptions.auth import InvalidCredentialError, OtpRateLimitedError
+from src.infrastructure.cache.memory_otp_store import InMemoryOtpStore
+from src.infrastructure.cache.timer_wheel import TimerWheel
+from src.infrastructure.services.sms_sender import InMemorySmsSender
+
+pytestmark = pytest.mark.anyio
+
+PHONE = "+8801712345678"
+POLICY = OtpPolicy(secret_key="test-secret", ttl=300, max_attempts=3, max_sends=3)
+
+
+class Clock:
+    """A monotonic clock the test moves by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class PhoneUsers:
+    """Users found by phone number, as IUserRepository.get_by_phone would."""
+
+    def __init__(self, *users: User) -> None:
+        self.users = {user.phone: user for user in users}
+
+    async def get_by_phone(self, phone: str) -> User | None:
+        return self.users.get(phone)
+
+
+class Tokens:
+    def create_access_token(self, user_id: UUID, role: str) -> str:
+        return f"access:{user_id}:{role}"
+
+    def create_refresh_token(self, user_id: UUID) -> str:
+        return f"refresh:{user_id}"
+
+
+class Events:
+    def __init__(self) -> None:
+        self.recorded: list[AuthEvent] = []
+
+    async def record(self, event: AuthEvent) -> None:
+        self.recorded.append(event)
+
+
+class Flow:
+    """RequestLoginOtp and VerifyLoginOtp over one store, texting through InMemorySmsSender."""
+
+    def __init__(self, *users: User) -> None:
+        self.clock = Clock()
+        self.store = InMemoryOtpStore(self.clock)
+        self.sms = InMemorySmsSender()
+        self.events = Events()
+        repository = PhoneUsers(*users)
+        self._request = RequestLoginOtp(repository, self.store, self.sms, POLICY)  # type: ignore[arg-type]
+        self._verify = VerifyLoginOtp(repository, self.store, Tokens(), self.events, POLICY)  # type: ignore[arg-type]
+
+    async def request(self, phone: str = PHONE) -> str | None:
+        """Ask for a code; returns the code texted, if any."""
+        sent = len(self.sms.sent)
+        response = await self._request.execute(RequestOtpRequest(phone=phone))
+        assert response.expires_in == POLICY.ttl
+        if len(self.sms.sent) == sent:
+            return None
+        message = self.sms.sent[-1]
+        assert message.to == phone
+        match = re.match(r"(\d+) is your", message.body)
+        assert match is not None
+        return match.group(1)
+
+    async def verify(self, code: str, phone: str = PHONE) -> str:
+        """Log in with a code; returns the access token."""
+        response = await self._verify.execute(VerifyOtpRequest(phone=phone, code=code))
+        return response.access_token
+
+
+def customer(is_active: bool = True) -> User:
+    return User(
+        email="otp@example.com",
+        hashed_password="!",
+        full_name="Otp Test",
+        phone=PHONE,
+        is_active=is_active,
+    )
+
+
+def wrong(code: str) -> str:
+    return f"{(int(code) + 1) % 10 ** len(code):0{len(code)}d}"
+
+
+def test_timer_wheel_expires_keys_at_their_deadline_never_early() -> None:
+    wheel = TimerWheel(now=0.0)
+    wheel.schedule("soon", 5.5)
+    wheel.schedule("later", 70_000.0)
+    wheel.schedule("cancelled", 3.0)
+    wheel.cancel("cancelled")
+
+    assert wheel.advance(5.0) == []
+    assert wheel.advance(6.0) == ["soon"]
+    # Parked in the coarser levels, then cascaded down as time passes
+    assert wheel.advance(69_999.0) == []
+    assert wheel.advance(70_000.0) == ["later"]
+    assert len(wheel) == 0
+
+
+def test_timer_wheel_reschedule_replaces_the_deadline() -> None:
+    wheel = TimerWheel(now=0.0)
+    wheel.schedule("key", 10.0)
+    wheel.schedule("key", 100.0)
+
+    assert wheel.advance(50.0) == []
+    assert wheel.advance(100.0) == ["key"]
+
+
+async def test_codes_and_send_counts_expire_and_are_reclaimed() -> None:
+    clock = Clock()
+    clock.now = 1000.5
+    store = InMemoryOtpStore(clock)
+    await store.save(PHONE, "hash", ttl=300, attempts=3)
+    assert await store.count_send(PHONE, window=900) == 1
+
+    # Past the deadline, but before the wheel's next tick: not served, not yet reclaimed
+    clock.now = 1300.6
+    assert await store.check(PHONE, "hash") is OtpCheck.MISSING
+    assert PHONE in store._codes
+    clock.now = 1301.0
+    assert await store.count_send(PHONE, window=900) == 2
+    assert PHONE not in store._codes
+
+    clock.now = 1901.0
+    assert await store.count_send(PHONE, window=900) == 1
+    clock.now = 2802.0
+    assert await store.check(PHONE, "hash") is OtpCheck.MISSING
+    assert not store._codes and not store._sends
+
+
+async def test_code_logs_in_once() -> None:
+    user = customer()
+    flow = Flow(user)
+    code = await flow.request()
+    assert code is not None and len(code) == POLICY.length
+
+    assert await flow.verify(code) == f"access:{user.id}:{user.role}"
+    assert flow.events.recorded[-1].event_type is AuthEventType.LOGIN_SUCCEEDED
+    with pytest.raises(InvalidCredentialError):
+        await flow.verify(code)
+
+
+async def test_wrong_codes_use_up_the_attempts() -> None:
+    flow = Flow(customer())
+    code = await flow.request()
+    assert code is not None
+
+    for _ in range(POLICY.max_attempts):
+        with pytest.raises(InvalidCredentialError):
+            await flow.verify(wrong(code))
+    # The code was discarded with the last attempt
+    with pytest.raises(InvalidCredentialError):
+        await flow.verify(code)
+    reasons = [event.reason for event in flow.events.recorded]
+    assert reasons == ["otp_invalid"] * (POLICY.max_attempts - 1) + ["otp_exhausted"]
+
+
+async def test_expired_code_is_rejected() -> None:
+    flow = Flow(customer())
+    code = await flow.request()
+    assert code is not None
+
+    flow.clock.now += POLICY.ttl
+    with pytest.raises(InvalidCredentialError):
+        await flow.verify(code)
+
+
+async def test_a_new_code_replaces_the_previous_one() -> None:
+    flow = Flow(customer())
+    first = await flow.request()
+    second = await flow.request()
+    assert first is not None and second is not None
+
+    if first != second:
+        with pytest.raises(InvalidCredentialError):
+            await flow.verify(first)
+    assert await flow.verify(second)
+
+
+async def test_sends_are_limited_per_window() -> None:
+    flow = Flow(customer())
+    for _ in range(POLICY.max_sends):
+        assert await flow.request() is not None
+
+    with pytest.raises(OtpRateLimitedError):
+        await flow.request()
+    assert len(flow.sms.sent) == POLICY.max_sends
+
+    flow.clock.now += POLICY.send_window
+    assert await flow.request() is not None
+
+
+async def test_no_code_for_unknown_or_inactive_numbers() -> None:
+    flow = Flow(customer(is_active=False))
+
+    assert await flow.request() is None
+    assert await flow.request("+8801800000000") is None
+    assert not flow.sms.sent
@@ -0,0 +1,201 @@
+"""
+Users spread over several databases by ShardedUserRepository.
+
+Runs against a scratch primary and two scratch shards. The shards go on
+the servers in DB_USER_SHARD_URLS (`make docker-shards-up` starts two), or
+on the primary's server when none are configured. Slots are spread over
+all three databases round-robin, so every test involves every database.
+"""
+
+import contextlib
+from collections import Counter
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import replace
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Engine, event, func, select, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.cli.reshard_users import USERS, drop_moved, init, move_slot
+from src.core.config import get_settings
+from src.domain.entities.user import User
+from src.infrastructure.database import get_session_maker
+from src.infrastructure.database.sharding import UserShards
+from src.infrastructure.orm.user_directory_model import UserDirectoryModel, UserShardSlotModel
+from src.infrastructure.orm.user_model import SHARD_SLOTS, shard_slot
+from src.infrastructure.repositories.sharded_user_repository import ShardedUserRepository
+from tests.conftest import scratch_database, scratch_primary
+
+pytestmark = pytest.mark.anyio
+
+SHARDS = 3
+
+
+@pytest.fixture
+async def shards() -> AsyncIterator[UserShards]:
+    async with contextlib.AsyncExitStack() as stack:
+        await stack.enter_async_context(scratch_primary("test_shards"))
+        settings = get_settings()
+        servers = settings.database.user_shard_urls or [settings.database.url] * (SHARDS - 1)
+        shard_urls = [
+            await stack.enter_async_context(
+                scratch_database(url, f"{make_url(url).database}_test_shard{shard}")
+            )
+            for shard, url in enumerate(servers[: SHARDS - 1], start=1)
+        ]
+        if len(shard_urls) < SHARDS - 1:
+            pytest.skip(f"DB_USER_SHARD_URLS lists fewer than {SHARDS - 1} shards")
+
+        async with get_session_maker()() as session, session.begin():
+            await session.execute(
+                update(UserShardSlotModel).values(shard=UserShardSlotModel.slot % SHARDS)
+            )
+        shards = UserShards(get_session_maker(), shard_urls)
+        stack.push_async_callback(shards.stop)
+        await init(shards)
+        await shards.start()
+        yield shards
+
+
+@contextlib.contextmanager
+def statements() -> Iterator[Counter[tuple[str, str]]]:
+    """(database, first SQL keyword) of every statement sent meanwhile."""
+    sent: Counter[tuple[str, str]] = Counter()
+
+    def record(conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        sent[(conn.engine.url.database, statement.split(None, 1)[0].upper())] += 1
+
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        yield sent
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+
+
+def database_of(shards: UserShards, shard: int) -> str:
+    engine = shards.session(shard).bind
+    assert isinstance(engine, AsyncEngine)
+    return str(engine.url.database)
+
+
+async def create_users(shards: UserShards, count: int, prefix: str = "shard-test") -> list[User]:
+    created = []
+    for n in range(count):
+        async with get_session_maker()() as session:
+            user = User(
+                email=f"{prefix}-{n}@example.com",
+                hashed_password="!",
+                full_name=f"Shard Test {n}",
+                phone=f"+8801{n:09d}",
+            )
+            created.append(await ShardedUserRepository(session, shards).create(user))
+            await session.commit()
+    return created
+
+
+async def shards_holding(shards: UserShards, user_id: UUID) -> list[int]:
+    """Shards with a row for the user, whatever the slot map says."""
+    holding = []
+    for shard in range(shards.count):
+        async with shards.session(shard) as session:
+            stmt = select(func.count()).select_from(USERS).where(USERS.c.id == user_id)
+            if (await session.execute(stmt)).scalar_one():
+                holding.append(shard)
+    return holding
+
+
+async def test_users_are_written_to_and_read_from_the_shard_of_their_slot(
+    shards: UserShards,
+) -> None:
+    users = await create_users(shards, 30)
+
+    assert {shards.shard_of(user.id) for user in users} == set(range(SHARDS))
+    for user in users:
+        assert shards.shard_of(user.id) == shard_slot(user.id) % SHARDS
+        assert await shards_holding(shards, user.id) == [shards.shard_of(user.id)]
+    async with get_session_maker()() as session:
+        repository = ShardedUserRepository(session, shards)
+        found = await repository.get_many_by_ids([user.id for user in users])
+        assert {user.id for user in found} == {user.id for user in users}
+        one = await repository.get_by_id(users[0].id)
+        assert one is not None and one.email == users[0].email
+
+
+async def test_email_lookup_reads_the_directory_and_one_shard(shards: UserShards) -> None:
+    (user,) = await create_users(shards, 1)
+    shard = database_of(shards, shards.shard_of(user.id))
+    primary = database_of(shards, 0)
+    shards.forget_email(user.email)
+
+    async with get_session_maker()() as session:
+        repository = ShardedUserRepository(session, shards)
+        with statements() as cold:
+            found = await repository.get_by_email(user.email.upper())
+        with statements() as cached:
+            again = await repository.get_by_email(user.email)
+
+    assert found is not None and again is not None and found.id == again.id == user.id
+    # The directory on the primary, then the user's shard (maybe the primary too)
+    assert sum(cold.values()) == 2
+    assert cold[(primary, "SELECT")] >= 1 and cold[(shard, "SELECT")] >= 1
+    # The cached id skips the directory
+    assert cached == Counter({(shard, "SELECT"): 1})
+
+
+async def test_duplicate_email_is_rejected_before_any_shard_write(shards: UserShards) -> None:
+    (existing,) = await create_users(shards, 1)
+    # On a shard database other than the primary and the existing user's
+    duplicate = next(
+        candidate
+        for candidate in (
+            User(email=existing.email.upper(), hashed_password="!", full_name="Duplicate")
+            for _ in range(100)
+        )
+        if shards.shard_of(candidate.id) not in (0, shards.shard_of(existing.id))
+    )
+    shard_databases = {database_of(shards, shard) for shard in range(1, shards.count)}
+
+    async with get_session_maker()() as session:
+        with statements() as sent, pytest.raises(ValueError, match="already exists"):
+            await ShardedUserRepository(session, shards).create(duplicate)
+
+    assert not {database for database, _ in sent} & shard_databases
+    assert await shards_holding(shards, duplicate.id) == []
+    async with get_session_maker()() as session:
+        directory = (await session.execute(select(UserDirectoryModel.user_id))).scalars().all()
+    assert directory == [existing.id]
+
+
+async def test_moving_a_slot_keeps_every_user_reachable_once(shards: UserShards) -> None:
+    users = await create_users(shards, 30)
+    moved = users[0]
+    slot = shard_slot(moved.id)
+    source = shards.shard_of(moved.id)
+    target = (source + 1) % SHARDS
+
+    assert await move_slot(shards, slot, target) == source
+    await shards.refresh()
+    # Within the grace period the source still has the slot's old rows
+    assert sorted(await shards_holding(shards, moved.id)) == sorted([source, target])
+    async with get_session_maker()() as session:
+        repository = ShardedUserRepository(session, shards)
+        deactivated = await repository.update(replace(moved, is_active=False))
+        assert shards.shard_of(moved.id) == target
+        listed = await repository.list_after(limit=SHARD_SLOTS)
+        by_phone = await repository.get_by_phone(moved.phone or "")
+        by_id = await repository.get_by_id(moved.id)
+        await session.commit()
+
+    assert sorted(user.id for user in listed) == sorted(user.id for user in users)
+    assert by_phone is not None and by_id is not None
+    assert by_phone.id == by_id.id == deactivated.id
+    assert not by_phone.is_active and not by_id.is_active
+
+    await drop_moved(shards, [(slot, source)], grace=0)
+    assert await shards_holding(shards, moved.id) == [target]
+    async with get_session_maker()() as session:
+        found = await ShardedUserRepository(session, shards).get_by_id(moved.id)
+    assert found is not None and not found.is_active
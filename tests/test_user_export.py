@@ -0,0 +1,67 @@
+"""CSV user exports quote text a spreadsheet would run as a formula."""
+
+import csv
+import io
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+from uuid import uuid7
+
+import pytest
+
+from src.application.use_cases.user.export_users import ExportFormat, ExportUsers
+from src.domain.repositories.user_repository import UserFilter, UserRow
+
+pytestmark = pytest.mark.anyio
+
+
+class Rows:
+    """Serves fixed rows as IUserRepository.stream would."""
+
+    def __init__(self, rows: list[UserRow]) -> None:
+        self.rows = rows
+
+    async def stream(
+        self, _user_filter: UserFilter, batch_size: int = 1000
+    ) -> AsyncGenerator[list[UserRow]]:
+        for start in range(0, len(self.rows), batch_size):
+            yield self.rows[start : start + batch_size]
+
+
+def row(email: str, full_name: str | None, phone: str | None) -> UserRow:
+    now = datetime.now(UTC)
+    return UserRow(uuid7(), email, full_name, phone, "customer", True, False, now, now)
+
+
+async def export_csv(rows: list[UserRow]) -> list[dict[str, str]]:
+    chunks = ExportUsers(Rows(rows), batch_size=2).execute(UserFilter(), ExportFormat.CSV)  # type: ignore[arg-type]
+    body = b"".join([chunk async for chunk in chunks]).decode()
+    return list(csv.DictReader(io.StringIO(body)))
+
+
+@pytest.mark.parametrize(
+    "value", ['=HYPERLINK("http://x")', "+1+2", "-2+3", "@SUM(A1)", "\tcmd", "\r=1"]
+)
+async def test_formula_cells_are_prefixed_with_a_quote(value: str) -> None:
+    (exported,) = await export_csv([row(f"{value}@example.com", value, value)])
+
+    assert exported["email"] == f"'{value}@example.com"
+    assert exported["full_name"] == f"'{value}"
+    assert exported["phone"] == f"'{value}"
+
+
+async def test_plain_cells_are_exported_as_they_are() -> None:
+    rows = [
+        row("a@example.com", "Rahim Uddin", None),
+        row("b@example.com", "", "01712345678"),
+        row("c@example.com", "Karim = Boss", "017-1234"),
+    ]
+
+    exported = await export_csv(rows)
+
+    assert [(r["email"], r["full_name"], r["phone"]) for r in exported] == [
+        ("a@example.com", "Rahim Uddin", ""),
+        ("b@example.com", "", "01712345678"),
+        ("c@example.com", "Karim = Boss", "017-1234"),
+    ]
+    assert [r["id"] for r in exported] == [str(r.id) for r in rows]
+    assert {r["role"] for r in exported} == {"customer"}
@@ -0,0 +1,161 @@
+"""
+User exports stream in flat memory, whatever the number of users.
+
+Seeds USERS users into a scratch database (committed, since the app reads
+them in its own sessions; the database is dropped afterwards), then
+exports a tenth of them and all of them through GET /users/export, called
+in process. Resident memory may grow by about as much for the full export
+as for the tenth: rows go from the server-side cursor to the response
+without being collected.
+"""
+
+import asyncio
+import os
+import zlib
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from urllib.parse import urlencode
+
+import pytest
+from sqlalchemy import text
+from starlette.types import ASGIApp, Message
+
+from src.core.config import get_settings
+from src.infrastructure.database import get_session_maker
+from src.main import create_app
+from tests.conftest import SEED_USERS, scratch_primary
+from tests.helpers import Client, log_in, promote_to_admin
+
+pytestmark = [pytest.mark.anyio, pytest.mark.slow]
+
+USERS = 3_000_000
+DAYS = 365
+SEEDED_EMAIL = "export-test-%s@example.com"
+MIB = 2**20
+# What a full export may use beyond an export of a tenth of the users; the
+# rows alone are several hundred MiB as NDJSON
+MAX_EXTRA_GROWTH = 32 * MIB
+
+
+@dataclass
+class Pass:
+    """Rows and bytes of one export, and how far resident memory grew meanwhile."""
+
+    rows: int = 0
+    body_bytes: int = 0
+    rss_growth: int = 0
+
+
+class RssSampler:
+    """Highest resident set size seen since entering, sampled every few milliseconds."""
+
+    def __init__(self) -> None:
+        self._page_size = os.sysconf("SC_PAGE_SIZE")
+        self.baseline = 0
+        self.peak = 0
+        self._task: asyncio.Task[None] | None = None
+
+    def rss(self) -> int:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * self._page_size
+
+    async def __aenter__(self) -> RssSampler:
+        self.baseline = self.peak = self.rss()
+        self._task = asyncio.create_task(self._sample())
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        assert self._task is not None
+        self._task.cancel()
+        self.peak = max(self.peak, self.rss())
+
+    async def _sample(self) -> None:
+        while True:
+            self.peak = max(self.peak, self.rss())
+            await asyncio.sleep(0.005)
+
+
+async def export_pass(app: ASGIApp, query: dict[str, str], token: str, gzipped: bool) -> Pass:
+    """GET /users/export, counting lines and bytes without keeping the body."""
+    path = f"{get_settings().api_prefix}/users/export"
+    headers = [(b"host", b"test"), (b"authorization", f"Bearer {token}".encode())]
+    if gzipped:
+        headers.append((b"accept-encoding", b"gzip"))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": urlencode(query).encode(),
+        "headers": headers,
+        "client": ("127.0.0.1", 0),
+        "server": ("test", 80),
+    }
+    result = Pass()
+    statuses: list[int] = []
+    decompressor: zlib._Decompress | None = None
+    complete = asyncio.Event()
+
+    async def receive() -> Message:
+        # The client stays connected until the response is complete
+        await complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal decompressor
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+            if (b"content-encoding", b"gzip") in message["headers"]:
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            return
+        body = message.get("body", b"")
+        result.body_bytes += len(body)
+        plain = decompressor.decompress(body) if decompressor else body
+        result.rows += plain.count(b"\n")
+        if not message.get("more_body", False):
+            complete.set()
+
+    async with RssSampler() as sampler:
+        await app(scope, receive, send)
+    assert statuses == [200]
+    if query.get("format") == "csv":
+        result.rows -= 1  # Header line
+    result.rss_growth = sampler.peak - sampler.baseline
+    return result
+
+
+@pytest.fixture
+async def seeded() -> AsyncIterator[None]:
+    async with scratch_primary("test_export"):
+        async with get_session_maker()() as session, session.begin():
+            await session.execute(
+                SEED_USERS, {"email_format": SEEDED_EMAIL, "users": USERS, "days": DAYS}
+            )
+        async with get_session_maker()() as session:
+            await session.execute(text("ANALYZE users"))
+        yield
+
+
+@pytest.mark.usefixtures("seeded")
+async def test_export_memory_stays_flat() -> None:
+    app = create_app()
+    recent = {"created_from": (datetime.now(UTC) - timedelta(days=1 + DAYS / 10)).isoformat()}
+    async with app.router.lifespan_context(app):
+        user_id, token = await log_in(Client(app), get_settings().api_prefix)
+        await promote_to_admin(app.state.user_repository_factory, user_id)
+        # Warms up whatever is allocated once, such as the first connection
+        await export_pass(app, recent, token, gzipped=False)
+        tenth = await export_pass(app, recent, token, gzipped=False)
+        everyone = await export_pass(app, {}, token, gzipped=False)
+        compressed = await export_pass(app, {"format": "csv"}, token, gzipped=True)
+
+    assert tenth.rows >= USERS // 10
+    assert everyone.rows >= USERS
+    assert compressed.rows >= USERS
+    assert everyone.body_bytes > 10 * MAX_EXTRA_GROWTH
+    assert everyone.rss_growth - tenth.rss_growth < MAX_EXTRA_GROWTH
+    assert compressed.rss_growth - tenth.rss_growth < MAX_EXTRA_GROWTH
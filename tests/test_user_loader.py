@@ -0,0 +1,110 @@
+"""Shared user lookups run under the latest deadline of their callers."""
+
+import asyncio
+from contextlib import nullcontext
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.core.deadline import get_deadline, start_deadline
+from src.domain.entities.user import User
+from src.infrastructure.repositories.user_loader import UserLoader
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingRepository:
+    """Finds no users; records the time left before the deadline of each query."""
+
+    remaining: list[float | None]
+
+    def __init__(self, remaining: list[float | None], delay: float) -> None:
+        self.remaining = remaining
+        self.delay = delay
+
+    async def _query(self) -> None:
+        deadline = get_deadline()
+        self.remaining.append(deadline.remaining() if deadline is not None else None)
+        await asyncio.sleep(self.delay)
+
+    async def get_many_by_ids(self, _user_ids: list[UUID]) -> list[User]:
+        await self._query()
+        return []
+
+    async def get_by_email(self, _email: str) -> User | None:
+        await self._query()
+        return None
+
+
+def make_loader(remaining: list[float | None], delay: float = 0.0) -> UserLoader:
+    def session_maker() -> Any:
+        return nullcontext()
+
+    return UserLoader(
+        session_maker,  # type: ignore[arg-type]
+        repository_factory=lambda _session: RecordingRepository(remaining, delay),  # type: ignore[arg-type,return-value]
+    )
+
+
+async def load(loader: UserLoader, user_id: UUID, timeout: float | None) -> User | None:
+    if timeout is not None:
+        start_deadline(timeout)
+    return await loader.load(user_id)
+
+
+async def test_batch_runs_under_the_latest_caller_deadline() -> None:
+    remaining: list[float | None] = []
+    loader = make_loader(remaining)
+    await asyncio.gather(
+        asyncio.create_task(load(loader, uuid4(), 0.001)),
+        asyncio.create_task(load(loader, uuid4(), 30)),
+    )
+    assert len(remaining) == 1
+    assert remaining[0] is not None and remaining[0] > 29
+
+
+async def test_batch_with_a_caller_without_deadline_has_none() -> None:
+    remaining: list[float | None] = []
+    loader = make_loader(remaining)
+    await asyncio.gather(
+        asyncio.create_task(load(loader, uuid4(), 0.001)),
+        asyncio.create_task(load(loader, uuid4(), None)),
+    )
+    assert remaining == [None]
+
+
+async def test_lookup_about_to_expire_is_not_joined() -> None:
+    remaining: list[float | None] = []
+    loader = make_loader(remaining, delay=0.05)
+    user_id = uuid4()
+    first = asyncio.create_task(load(loader, user_id, 0.5))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(load(loader, user_id, 30))
+    # An earlier deadline joins the lookup in flight
+    third = asyncio.create_task(load(loader, user_id, 0.2))
+    await asyncio.gather(first, second, third)
+    assert len(remaining) == 2
+    assert remaining[1] is not None and remaining[1] > 29
+
+
+async def test_lookup_with_time_left_is_joined() -> None:
+    remaining: list[float | None] = []
+    loader = make_loader(remaining, delay=0.05)
+    user_id = uuid4()
+    first = asyncio.create_task(load(loader, user_id, 10))
+    await asyncio.sleep(0.01)
+    await asyncio.gather(first, asyncio.create_task(load(loader, user_id, 30)))
+    assert len(remaining) == 1
+
+
+async def test_email_lookup_ignores_the_caller_context() -> None:
+    remaining: list[float | None] = []
+    loader = make_loader(remaining)
+
+    async def by_email(timeout: float) -> User | None:
+        start_deadline(timeout)
+        return await loader.load_by_email("a@example.com")
+
+    await asyncio.create_task(by_email(30))
+    assert remaining[0] is not None and 29 < remaining[0] <= 30
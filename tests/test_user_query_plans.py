@@ -0,0 +1,144 @@
+"""
+Every user repository query must be answered from an index.
+
+Each case calls a repository method against seeded users, captures the SQL
+it sent and runs EXPLAIN on it with the same parameters; a sequential scan
+of users anywhere in a plan fails the test. Queries meant to read the whole
+table (counting or streaming every user) are not listed.
+"""
+
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.domain.entities.user import Role
+from src.domain.repositories.user_repository import UserChanges, UserFilter
+from src.infrastructure.repositories.sqlalchemy.user_repository_impl import (
+    SQLAlchemyUserRepository,
+)
+from tests.conftest import SEED_USERS
+
+pytestmark = pytest.mark.anyio
+
+USERS = 50_000
+DAYS = 365
+SEEDED_EMAIL = "plan-test-%s@example.com"
+
+
+@dataclass
+class Run:
+    """What a case runs against: the repository and the seeded ids in creation order."""
+
+    repository: SQLAlchemyUserRepository
+    ids: list[UUID]
+
+
+Case = Callable[[Run], Awaitable[object]]
+
+
+def days_ago(days: float) -> datetime:
+    return datetime.now(UTC) - timedelta(days=days)
+
+
+async def collect(
+    repository: SQLAlchemyUserRepository, user_filter: UserFilter, slots: list[int] | None = None
+) -> int:
+    return sum([len(batch) async for batch in repository.stream(user_filter, 500, slots=slots)])
+
+
+async def update_one(repository: SQLAlchemyUserRepository, user_id: UUID) -> object:
+    user = await repository.get_by_id(user_id)
+    assert user is not None
+    return await repository.update(replace(user, full_name="Renamed User"))
+
+
+# One day of the seeded year
+NARROW = UserFilter(created_from=days_ago(30), created_to=days_ago(29))
+
+CASES: dict[str, Case] = {
+    "get_by_id": lambda run: run.repository.get_by_id(run.ids[0]),
+    "get_many_by_ids": lambda run: run.repository.get_many_by_ids(run.ids[:50]),
+    "get_by_email": lambda run: run.repository.get_by_email((SEEDED_EMAIL % 7).upper()),
+    "exists_by_email": lambda run: run.repository.exists_by_email(SEEDED_EMAIL % 7),
+    "get_by_phone": lambda run: run.repository.get_by_phone("+880 9000 000 008"),
+    "list_after": lambda run: run.repository.list_after(run.ids[USERS // 2], 20),
+    "list_first_page": lambda run: run.repository.list_after(None, 20),
+    "update": lambda run: update_one(run.repository, run.ids[1]),
+    "delete": lambda run: run.repository.delete(run.ids[2]),
+    "stream_created_range": lambda run: collect(run.repository, NARROW),
+    "stream_shard_slots": lambda run: collect(run.repository, UserFilter(), [5, 6]),
+    "count_matching_created_range": lambda run: run.repository.count_matching(
+        NARROW, UserChanges(is_active=False)
+    ),
+    "count_matching_role": lambda run: run.repository.count_matching(
+        UserFilter(role=Role.ADMIN), UserChanges(is_active=False)
+    ),
+    "update_matching": lambda run: run.repository.update_matching(
+        NARROW, UserChanges(is_active=False), limit=100
+    ),
+}
+
+
+@contextmanager
+def captured(connection: AsyncConnection) -> Iterator[list[tuple[str, Any]]]:
+    """Statements and parameters sent on the connection meanwhile."""
+    statements: list[tuple[str, Any]] = []
+
+    def record(*args: Any) -> None:
+        _, _, statement, parameters, _, _ = args
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", record)
+
+
+def nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from nodes(child)
+
+
+@pytest.fixture
+async def seeded(connection: AsyncConnection) -> list[UUID]:
+    """Ids of USERS seeded users, in creation order, with fresh planner statistics."""
+    await connection.execute(
+        SEED_USERS, {"email_format": SEEDED_EMAIL, "users": USERS, "days": DAYS}
+    )
+    await connection.execute(text("ANALYZE users"))
+    result = await connection.execute(
+        text("SELECT id FROM users WHERE email LIKE 'plan-test-%' ORDER BY id")
+    )
+    return list(result.scalars())
+
+
+@pytest.mark.parametrize("case", CASES)
+async def test_query_uses_an_index(
+    connection: AsyncConnection, seeded: list[UUID], case: str
+) -> None:
+    session = AsyncSession(bind=connection, join_transaction_mode="create_savepoint")
+    repository = SQLAlchemyUserRepository(session)
+    with captured(connection) as statements:
+        await CASES[case](Run(repository, seeded))
+
+    assert statements
+    sequential = []
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        plan = result.scalar_one()[0]["Plan"]
+        if any(
+            node["Node Type"] == "Seq Scan" and node.get("Relation Name") == "users"
+            for node in nodes(plan)
+        ):
+            sequential.append(statement)
+    assert not sequential, f"{case} scans users sequentially:\n" + "\n\n".join(sequential)